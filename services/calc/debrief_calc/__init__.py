@@ -4,32 +4,54 @@ debrief-calc: Context-sensitive analysis tools for Debrief maritime tactical ana
 This package provides:
 - Tool registry for discovering available analysis tools
 - Tool execution engine with provenance tracking
-- Built-in representative tools (track-stats, range-bearing, area-summary)
+- Batch execution over a process pool (run_batch)
+- Memoizing result cache for repeated runs (ResultCache)
+- Multi-step tool pipelines with concurrent branches (Pipeline)
+- Async execution with cancellation, deadlines and progress (run_async)
+- Per-phase execution profiles and process-wide tool metrics (debrief_calc.profiling)
+- Streaming execution over chunked inputs (run_stream, StreamingContext)
+- Array-backed track features passed to tools without copying (TrackArray)
+- Built-in representative tools (track-stats, range-bearing, cpa, area-summary)
+- Vectorized geodesy kernels shared by the tools (debrief_calc.geodesy)
 - MCP wrapper for remote tool access (optional)
 """
 
 # Import tools to register them with the registry
 from debrief_calc import tools as _tools  # noqa: F401
+from debrief_calc.cache import ResultCache
+from debrief_calc.cancellation import CancellationToken, check_cancelled, report_progress
 from debrief_calc.exceptions import (
     DebriefCalcError,
     ExecutionError,
     InvalidContextError,
     KindMismatchError,
+    ToolCancelledError,
     ToolNotFoundError,
+    ToolTimeoutError,
     ValidationError,
 )
-from debrief_calc.executor import run
+from debrief_calc.executor import run, run_async, run_batch, run_stream
 from debrief_calc.models import (
+    BatchJob,
+    BatchSummary,
+    CacheStats,
     ContextType,
+    ExecutionProfile,
+    PipelineResult,
+    PipelineStep,
     Provenance,
     SelectionContext,
     SourceRef,
     Tool,
     ToolError,
+    ToolMetrics,
     ToolParameter,
     ToolResult,
 )
+from debrief_calc.pipeline import Pipeline
 from debrief_calc.registry import registry, tool
+from debrief_calc.streaming import FeatureStream, StreamingContext
+from debrief_calc.tracks import TrackArray
 
 __version__ = "0.1.0"
 
@@ -43,6 +65,13 @@ __all__ = [
     "ToolError",
     "Provenance",
     "SourceRef",
+    "BatchJob",
+    "BatchSummary",
+    "CacheStats",
+    "PipelineStep",
+    "PipelineResult",
+    "ExecutionProfile",
+    "ToolMetrics",
     # Exceptions
     "DebriefCalcError",
     "ToolNotFoundError",
@@ -50,9 +79,27 @@ __all__ = [
     "KindMismatchError",
     "ValidationError",
     "ExecutionError",
+    "ToolCancelledError",
+    "ToolTimeoutError",
     # Registry
     "registry",
     "tool",
     # Executor
     "run",
+    "run_async",
+    "run_batch",
+    "run_stream",
+    # Cache
+    "ResultCache",
+    # Pipeline
+    "Pipeline",
+    # Streaming
+    "FeatureStream",
+    "StreamingContext",
+    # Tracks
+    "TrackArray",
+    # Cancellation
+    "CancellationToken",
+    "check_cancelled",
+    "report_progress",
 ]
@@ -0,0 +1,161 @@
+"""
+Time alignment of tracks for debrief-calc.
+
+Two tracks recorded at different rates are compared by putting them on a
+shared time base: either every epoch at which either track has a fix
+(within the period both cover), or a regular grid. Each track is then
+linearly interpolated at those epochs, giving position arrays that the
+geodesy kernels can process in one call.
+
+Track coordinates are GeoJSON positions ``[lon, lat, elevation, time]``
+with time in milliseconds since the epoch.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import numpy as np
+from numpy.typing import NDArray
+
+from debrief_calc.geodesy import coordinate_column
+
+# Index of the timestamp within a track position
+TIME_INDEX = 3
+
+
+def track_arrays(coordinates: Sequence[Sequence[float]]) -> tuple[NDArray, NDArray, NDArray]:
+    """Split a timed track into time, longitude and latitude arrays, in time order.
+
+    Args:
+        coordinates: GeoJSON positions with a timestamp as the 4th element,
+            or a 2-D position array (such as a TrackArray's)
+
+    Returns:
+        Tuple of (times in ms, longitudes, latitudes); views of a position
+        array that is already in time order
+
+    Raises:
+        ValueError: If any position has no timestamp
+    """
+    if isinstance(coordinates, np.ndarray):
+        untimed = coordinates.ndim != 2 or coordinates.shape[1] <= TIME_INDEX
+    else:
+        untimed = any(len(c) <= TIME_INDEX for c in coordinates)
+    if untimed:
+        raise ValueError("Track positions must have timestamps ([lon, lat, elevation, time])")
+
+    times = coordinate_column(coordinates, TIME_INDEX)
+    lons = coordinate_column(coordinates, 0)
+    lats = coordinate_column(coordinates, 1)
+    if times.size > 1 and (np.diff(times) < 0).any():
+        order = np.argsort(times, kind="stable")
+        times, lons, lats = times[order], lons[order], lats[order]
+    return times, lons, lats
+
+
+def merge_epochs(times1: NDArray, times2: NDArray) -> NDArray:
+    """Return every distinct epoch of either track within the period both cover.
+
+    Both inputs are sorted, so the concatenation is two sorted runs and
+    the stable sort merges them in a single linear pass.
+
+    Args:
+        times1: Sorted timestamps of the first track
+        times2: Sorted timestamps of the second track
+
+    Returns:
+        Sorted, distinct timestamps (empty if the tracks do not overlap)
+    """
+    start, end = _overlap(times1, times2)
+    if start > end:
+        return np.empty(0)
+    merged = np.sort(np.concatenate((times1, times2)), kind="stable")
+    merged = merged[(merged >= start) & (merged <= end)]
+    if merged.size:
+        merged = merged[np.concatenate(([True], np.diff(merged) > 0))]
+    return merged
+
+
+def resample_epochs(times1: NDArray, times2: NDArray, interval_ms: float) -> NDArray:
+    """Return a regular grid of epochs over the period both tracks cover.
+
+    Args:
+        times1: Sorted timestamps of the first track
+        times2: Sorted timestamps of the second track
+        interval_ms: Grid spacing in milliseconds
+
+    Returns:
+        Timestamps from the start of the overlap at the given spacing
+        (empty if the tracks do not overlap)
+
+    Raises:
+        ValueError: If the interval is not positive
+    """
+    if interval_ms <= 0:
+        raise ValueError(f"Resample interval must be positive, got {interval_ms}")
+    start, end = _overlap(times1, times2)
+    if start > end:
+        return np.empty(0)
+    return start + np.arange(int((end - start) // interval_ms) + 1) * interval_ms
+
+
+def interpolate_track(
+    times: NDArray, lons: NDArray, lats: NDArray, epochs: NDArray
+) -> tuple[NDArray, NDArray]:
+    """Linearly interpolate a track's position at the given epochs.
+
+    Longitudes are unwrapped first so a track crossing the antimeridian
+    is not interpolated the long way round.
+
+    Args:
+        times: Sorted timestamps of the track
+        lons: Longitudes of the track fixes
+        lats: Latitudes of the track fixes
+        epochs: Timestamps to interpolate at (within the track's period)
+
+    Returns:
+        Tuple of (longitudes, latitudes) at the epochs
+    """
+    unwrapped = np.degrees(np.unwrap(np.radians(lons)))
+    lon = np.interp(epochs, times, unwrapped)
+    return (lon + 180) % 360 - 180, np.interp(epochs, times, lats)
+
+
+def align_tracks(
+    coords1: Sequence[Sequence[float]],
+    coords2: Sequence[Sequence[float]],
+    interval_ms: float | None = None,
+) -> tuple[NDArray, NDArray, NDArray, NDArray, NDArray]:
+    """Put two timed tracks on a shared time base.
+
+    Args:
+        coords1: GeoJSON positions of the first track, with timestamps
+        coords2: GeoJSON positions of the second track, with timestamps
+        interval_ms: Grid spacing in milliseconds, or None to use every
+            epoch at which either track has a fix
+
+    Returns:
+        Tuple of (epochs, lon1, lat1, lon2, lat2); all empty if the tracks
+        do not overlap in time
+
+    Raises:
+        ValueError: If a track has no timestamps or the interval is not positive
+    """
+    times1, lons1, lats1 = track_arrays(coords1)
+    times2, lons2, lats2 = track_arrays(coords2)
+    if interval_ms is None:
+        epochs = merge_epochs(times1, times2)
+    else:
+        epochs = resample_epochs(times1, times2, interval_ms)
+
+    lon1, lat1 = interpolate_track(times1, lons1, lats1, epochs)
+    lon2, lat2 = interpolate_track(times2, lons2, lats2, epochs)
+    return epochs, lon1, lat1, lon2, lat2
+
+
+def _overlap(times1: NDArray, times2: NDArray) -> tuple[float, float]:
+    """Return the (start, end) of the period both tracks cover; start > end if none."""
+    if not times1.size or not times2.size:
+        return 1.0, 0.0
+    return max(times1[0], times2[0]), min(times1[-1], times2[-1])
@@ -0,0 +1,268 @@
+"""
+Result cache for tool executions.
+
+Re-running a tool on an unchanged selection with the same parameters
+gives the same output, so run() can return a stored result instead. A
+result is keyed by the tool name and version, a content hash of the
+selection (type, features and bounds) and the canonicalized parameters,
+so any change to the tool or its input misses the cache. TrackArray
+positions, and the coordinates of GeoJSON geometries, are hashed as the
+bytes of a float array rather than serialized value by value.
+
+The cache has an in-memory LRU tier and an optional on-disk tier, each
+with a size limit. Cached results are returned with the provenance of the
+run that produced them. Only results whose output passed validation are
+stored.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from debrief_calc.models import CacheStats, SelectionContext, Tool, ToolResult
+from debrief_calc.tracks import TrackArray
+
+
+def cache_key(tool: Tool, context: SelectionContext, params: dict[str, Any]) -> str:
+    """
+    Compute the cache key of a tool run.
+
+    Parameters left out take the tool's declared defaults, so a run with
+    explicit default values shares its key with one that omits them.
+
+    Args:
+        tool: Tool being run
+        context: Selection the tool is run on
+        params: Parameters passed to the tool
+
+    Returns:
+        Hex SHA-256 digest identifying the run
+    """
+    defaults = {p.name: p.default for p in tool.parameters if p.default is not None}
+    payload = {
+        "tool": tool.name,
+        "version": tool.version,
+        "context": context.type.value,
+        "features": context.features,
+        "bounds": context.bounds,
+        "params": {**defaults, **params},
+    }
+    digest = hashlib.sha256()
+    digest.update(
+        json.dumps(_canonical(payload), sort_keys=True, separators=(",", ":"), default=str).encode()
+    )
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """
+    Two-tier store of successful tool results.
+
+    Args:
+        max_entries: Results kept in memory (least recently used are dropped)
+        directory: Directory for the on-disk tier (None for memory only)
+        max_disk_bytes: Size limit of the on-disk tier; least recently used
+            files are removed to stay under it
+
+    Example:
+        >>> cache = ResultCache(directory="~/.cache/debrief-calc")
+        >>> result = run("track-stats", context, cache=cache)
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        directory: str | Path | None = None,
+        max_disk_bytes: int = 256 * 1024 * 1024,
+    ):
+        if max_entries < 0 or max_disk_bytes < 0:
+            raise ValueError("Cache size limits must not be negative")
+        self.max_entries = max_entries
+        self.max_disk_bytes = max_disk_bytes
+        self.directory = Path(directory).expanduser() if directory is not None else None
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+
+        self._memory: OrderedDict[str, ToolResult] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._memory_hits = 0
+        self._disk_hits = 0
+        self._evictions = 0
+
+    def get(self, key: str) -> ToolResult | None:
+        """
+        Look up a result, promoting disk hits into memory.
+
+        Returns:
+            Copy of the stored result marked as cached, or None on a miss
+        """
+        with self._lock:
+            result = self._memory.get(key)
+            if result is not None:
+                self._memory.move_to_end(key)
+                self._memory_hits += 1
+            else:
+                result = self._read(key)
+                if result is not None:
+                    self._remember(key, result)
+                    self._disk_hits += 1
+
+            if result is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+            return result.model_copy(update={"cached": True}, deep=True)
+
+    def put(self, key: str, result: ToolResult) -> None:
+        """
+        Store a result; failed results are not cached.
+        """
+        if not result.success:
+            return
+        stored = result.model_copy(update={"cached": False}, deep=True)
+        with self._lock:
+            self._remember(key, stored)
+            self._write(key, stored)
+
+    def clear(self) -> None:
+        """Remove every stored result from both tiers."""
+        with self._lock:
+            self._memory.clear()
+            for path in self._disk_files():
+                path.unlink(missing_ok=True)
+
+    def stats(self) -> CacheStats:
+        """Return hit and miss counts and the size of each tier."""
+        with self._lock:
+            files = self._disk_files()
+            lookups = self._hits + self._misses
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                memory_hits=self._memory_hits,
+                disk_hits=self._disk_hits,
+                hit_rate=self._hits / lookups if lookups else 0.0,
+                evictions=self._evictions,
+                memory_entries=len(self._memory),
+                disk_entries=len(files),
+                disk_bytes=sum(_size(path) for path in files),
+            )
+
+    def _remember(self, key: str, result: ToolResult) -> None:
+        self._memory[key] = result
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self._evictions += 1
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def _disk_files(self) -> list[Path]:
+        if self.directory is None:
+            return []
+        return list(self.directory.glob("*.json"))
+
+    def _read(self, key: str) -> ToolResult | None:
+        if self.directory is None:
+            return None
+        path = self._path(key)
+        try:
+            result = ToolResult.model_validate_json(path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except ValueError:
+            # Unreadable (e.g. partly written or from an old version); drop it
+            path.unlink(missing_ok=True)
+            return None
+        # Reads count as use for the least-recently-used order
+        os.utime(path)
+        return result
+
+    def _write(self, key: str, result: ToolResult) -> None:
+        if self.directory is None:
+            return
+        data = result.model_dump_json().encode()
+        if len(data) > self.max_disk_bytes:
+            return
+        path = self._path(key)
+        partial = path.with_suffix(".tmp")
+        partial.write_bytes(data)
+        os.replace(partial, path)
+        self._trim_disk()
+
+    def _trim_disk(self) -> None:
+        files = sorted(self._disk_files(), key=_mtime)
+        total = sum(_size(path) for path in files)
+        for path in files:
+            if total <= self.max_disk_bytes:
+                break
+            total -= _size(path)
+            path.unlink(missing_ok=True)
+            self._evictions += 1
+
+
+def _canonical(value: Any) -> Any:
+    """Normalise values that compare equal but serialise differently (2 vs 2.0)."""
+    if isinstance(value, TrackArray):
+        return {
+            "type": "Feature",
+            "id": value.id,
+            "properties": _canonical(value.properties),
+            "positions": _array_digest(value.positions),
+        }
+    if isinstance(value, dict):
+        if "coordinates" in value and "type" in value:
+            return {
+                str(k): _coordinates_digest(v) if k == "coordinates" else _canonical(v)
+                for k, v in value.items()
+            }
+        return {str(k): _canonical(v) for k, v in value.items()}
+    if isinstance(value, list | tuple):
+        return [_canonical(v) for v in value]
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def _coordinates_digest(coordinates: Any) -> Any:
+    """Hash a geometry's coordinates as a float array (canonicalising ragged ones instead)."""
+    try:
+        array = np.asarray(coordinates, dtype=float)
+    except (TypeError, ValueError):
+        return _canonical(coordinates)
+    if array.ndim == 2:
+        return _array_digest(array)
+    return [list(array.shape), hashlib.sha256(np.ascontiguousarray(array).data).hexdigest()]
+
+
+def _array_digest(array: np.ndarray) -> list[Any]:
+    """Hash a position array column by column, so its memory layout does not matter."""
+    digest = hashlib.sha256()
+    for column in array.T:
+        digest.update(np.ascontiguousarray(column).data)
+    return [list(array.shape), digest.hexdigest()]
+
+
+def _size(path: Path) -> int:
+    try:
+        return path.stat().st_size
+    except FileNotFoundError:
+        return 0
+
+
+def _mtime(path: Path) -> float:
+    try:
+        return path.stat().st_mtime
+    except FileNotFoundError:
+        return 0.0
@@ -0,0 +1,131 @@
+"""
+Cooperative cancellation, deadlines and progress for tool runs.
+
+A CancellationToken is passed to run() (or created by run_async()) and
+is made current while the tool handler executes. Long-running handlers
+poll it with check_cancelled(), which raises once the run is cancelled
+or its deadline has passed, so an abandoned analysis stops at its next
+poll instead of running to completion. Handlers report how far they
+have got with report_progress(). Both functions do nothing when the
+handler runs without a token, so tools work the same either way.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from debrief_calc.exceptions import ToolCancelledError, ToolTimeoutError
+
+# Receives (fraction complete in [0, 1], optional message)
+ProgressCallback = Callable[[float, str | None], None]
+
+_current: ContextVar[CancellationToken | None] = ContextVar("debrief_calc_token", default=None)
+
+
+class CancellationToken:
+    """
+    Cancellation flag, optional deadline and progress sink for one tool run.
+
+    Tokens are thread-safe: cancel() may be called from any thread (e.g.
+    an event loop) while the handler polls from a worker thread.
+
+    Args:
+        timeout: Seconds from now after which the run is cancelled
+        progress: Callback receiving (fraction, message) progress reports
+    """
+
+    def __init__(self, timeout: float | None = None, progress: ProgressCallback | None = None):
+        self._cancelled = threading.Event()
+        self.deadline: float | None = None
+        self.progress = progress
+        if timeout is not None:
+            self.set_timeout(timeout)
+
+    def set_timeout(self, timeout: float) -> None:
+        """Set the deadline to timeout seconds from now."""
+        self.deadline = time.monotonic() + timeout
+
+    def cancel(self) -> None:
+        """Request that the run stops at its next poll."""
+        self._cancelled.set()
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether the run has been cancelled or its deadline has passed."""
+        return self._cancelled.is_set() or self.expired
+
+    @property
+    def expired(self) -> bool:
+        """Whether the deadline has passed."""
+        return self.deadline is not None and time.monotonic() >= self.deadline
+
+    def remaining(self) -> float | None:
+        """Seconds left before the deadline (None if there is none)."""
+        if self.deadline is None:
+            return None
+        return max(self.deadline - time.monotonic(), 0.0)
+
+    def raise_if_cancelled(self) -> None:
+        """
+        Raise if the run should stop.
+
+        Raises:
+            ToolCancelledError: If cancel() has been called
+            ToolTimeoutError: If the deadline has passed
+        """
+        if self._cancelled.is_set():
+            raise ToolCancelledError()
+        if self.expired:
+            raise ToolTimeoutError()
+
+    def report(self, fraction: float, message: str | None = None) -> None:
+        """Pass a progress report to the callback, if there is one."""
+        if self.progress is not None:
+            self.progress(min(max(float(fraction), 0.0), 1.0), message)
+
+
+def current_token() -> CancellationToken | None:
+    """Return the token of the tool run executing in this context, if any."""
+    return _current.get()
+
+
+def check_cancelled() -> None:
+    """
+    Stop the current tool run if it has been cancelled or timed out.
+
+    Call this periodically from long-running tool handlers.
+
+    Raises:
+        ToolCancelledError: If the run has been cancelled
+        ToolTimeoutError: If the run's deadline has passed
+    """
+    token = _current.get()
+    if token is not None:
+        token.raise_if_cancelled()
+
+
+def report_progress(fraction: float, message: str | None = None) -> None:
+    """
+    Report the progress of the current tool run.
+
+    Args:
+        fraction: Fraction of the work done, from 0 to 1
+        message: Optional description of the current stage
+    """
+    token = _current.get()
+    if token is not None:
+        token.report(fraction, message)
+
+
+@contextmanager
+def active_token(token: CancellationToken | None) -> Iterator[None]:
+    """Make a token current for the duration of a tool handler."""
+    reset = _current.set(token)
+    try:
+        yield
+    finally:
+        _current.reset(reset)
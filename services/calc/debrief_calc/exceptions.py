@@ -121,3 +121,28 @@ class ExecutionError(DebriefCalcError):
             "message": self.message,
             "details": self.details,
         }
+
+
+class ToolCancelledError(DebriefCalcError):
+    """Raised inside a tool run when its cancellation token has been cancelled."""
+
+    code = "CANCELLED"
+
+    def __init__(self, message: str = "Tool run was cancelled"):
+        super().__init__(message)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "code": self.code,
+            "message": self.message,
+            "details": self.details,
+        }
+
+
+class ToolTimeoutError(ToolCancelledError):
+    """Raised inside a tool run when its deadline has passed."""
+
+    code = "TIMEOUT"
+
+    def __init__(self, message: str = "Tool run exceeded its deadline"):
+        super().__init__(message)
@@ -6,29 +6,51 @@ Provides the main entry point for running analysis tools with:
 - Provenance tracking
 - Output validation
 - Error handling
+- Optional result caching
+- Batches of runs spread over a process pool
+- Async execution with cancellation, deadlines and progress
+- Streaming execution for inputs and outputs larger than memory
 """
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import functools
+import math
+import os
 import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Executor, ProcessPoolExecutor, wait
 from typing import Any
 
+from debrief_calc.cache import ResultCache, cache_key
+from debrief_calc.cancellation import CancellationToken, ProgressCallback, active_token
 from debrief_calc.exceptions import (
+    DebriefCalcError,
     ExecutionError,
     InvalidContextError,
     KindMismatchError,
+    ToolCancelledError,
     ToolNotFoundError,
+    ToolTimeoutError,
     ValidationError,
 )
 from debrief_calc.models import (
+    BatchJob,
+    BatchSummary,
     ContextType,
+    ExecutionProfile,
+    Provenance,
     SelectionContext,
     Tool,
     ToolError,
     ToolResult,
 )
+from debrief_calc.profiling import Profiler, count_vertices, metrics
 from debrief_calc.provenance import attach_provenance, create_provenance, set_output_kind
 from debrief_calc.registry import registry
+from debrief_calc.streaming import DEFAULT_CHUNK_SIZE, StreamingContext
 from debrief_calc.validation import validate_tool_output
 
 
@@ -37,6 +59,9 @@ def run(
     context: SelectionContext,
     params: dict[str, Any] | None = None,
     validate_output: bool = True,
+    cache: ResultCache | None = None,
+    token: CancellationToken | None = None,
+    trace_memory: bool = False,
 ) -> ToolResult:
     """
     Execute a tool on the given selection context.
@@ -46,6 +71,13 @@ def run(
         context: SelectionContext with the user's selection
         params: Optional parameters for the tool
         validate_output: Whether to validate output (default: True)
+        cache: Optional ResultCache; a stored result for the same tool
+            version, selection and parameters is returned instead of
+            running the tool, and successful results are stored
+        token: Optional CancellationToken, current while the handler runs;
+            a cancelled or timed-out run fails with CANCELLED or TIMEOUT
+        trace_memory: Whether to record the handler's peak memory in the
+            profile (slows the run)
 
     Returns:
         ToolResult with either features (on success) or error (on failure)
@@ -56,44 +88,81 @@ def run(
     - duration_ms: Execution time in milliseconds
     - features: Output GeoJSON features (if success)
     - error: Error details (if failure)
+    - cached: Whether the result came from the cache
+    - profile: Phase timings and feature/vertex counts
+
+    Every result is also recorded in debrief_calc.profiling.metrics.
     """
-    params = params or {}
-    start_time = time.perf_counter()
+    profiler = Profiler(trace_memory)
+    result = _run(tool_name, context, params or {}, validate_output, cache, token, profiler)
+    result.profile = profiler.profile(context.features, result.features)
+    metrics.record(result)
+    return result
 
-    try:
-        # Get the tool from registry
-        tool = registry.get_tool(tool_name)
 
-        # Validate context type
-        _validate_context_type(tool, context)
+def _run(
+    tool_name: str,
+    context: SelectionContext,
+    params: dict[str, Any],
+    validate_output: bool,
+    cache: ResultCache | None,
+    token: CancellationToken | None,
+    profiler: Profiler,
+) -> ToolResult:
+    """Execute a tool, timing each phase, and map failures to error results."""
+    start_time = time.perf_counter()
 
-        # Validate feature kinds
-        _validate_kinds(tool, context)
+    try:
+        # Get the tool from registry and validate the selection against it
+        with profiler.phase("validate_input"):
+            tool = registry.get_tool(tool_name)
+            _validate_context_type(tool, context)
+            _validate_kinds(tool, context)
+
+        key = None
+        if cache is not None:
+            with profiler.phase("cache_lookup"):
+                key = cache_key(tool, context, params)
+                cached = cache.get(key)
+            if cached is not None:
+                cached.duration_ms = (time.perf_counter() - start_time) * 1000
+                return cached
 
         # Execute the tool handler
-        output_features = _execute_handler(tool, context, params)
+        if token is not None:
+            token.raise_if_cancelled()
+        with profiler.phase("handler"), active_token(token):
+            output_features = _execute_handler(tool, context, params)
 
         # Attach provenance to output features
-        provenance = create_provenance(
-            tool_name=tool.name,
-            tool_version=tool.version,
-            source_features=context.features,
-            parameters=params,
-        )
+        with profiler.phase("provenance"):
+            provenance = create_provenance(
+                tool_name=tool.name,
+                tool_version=tool.version,
+                source_features=context.features,
+                parameters=params,
+            )
 
-        for feature in output_features:
-            set_output_kind(feature, tool.output_kind)
-            attach_provenance(feature, provenance)
+            for feature in output_features:
+                set_output_kind(feature, tool.output_kind)
+                attach_provenance(feature, provenance)
 
         # Validate output if requested
         if validate_output:
-            validate_tool_output(output_features, tool.output_kind, tool.name)
+            with profiler.phase("validate_output"):
+                validate_tool_output(output_features, tool.output_kind, tool.name)
 
         duration_ms = (time.perf_counter() - start_time) * 1000
 
-        return ToolResult(
+        result = ToolResult(
             tool=tool_name, success=True, features=output_features, duration_ms=duration_ms
         )
+        # Unvalidated output is not stored, so it is never served to a validating run
+        if key is not None and validate_output:
+            # A failed cache write (e.g. a full disk) does not fail the run
+            with contextlib.suppress(OSError):
+                cache.put(key, result)
+        return result
 
     except ToolNotFoundError as e:
         duration_ms = (time.perf_counter() - start_time) * 1000
@@ -131,6 +200,15 @@ def run(
             duration_ms=duration_ms,
         )
 
+    except ToolCancelledError as e:
+        duration_ms = (time.perf_counter() - start_time) * 1000
+        return ToolResult(
+            tool=tool_name,
+            success=False,
+            error=ToolError(code=e.code, message=e.message, details=e.details),
+            duration_ms=duration_ms,
+        )
+
     except Exception as e:
         duration_ms = (time.perf_counter() - start_time) * 1000
         return ToolResult(
@@ -145,13 +223,452 @@ def run(
         )
 
 
-def _validate_context_type(tool: Tool, context: SelectionContext) -> None:
+async def run_async(
+    tool_name: str,
+    context: SelectionContext,
+    params: dict[str, Any] | None = None,
+    validate_output: bool = True,
+    cache: ResultCache | None = None,
+    timeout: float | None = None,
+    token: CancellationToken | None = None,
+    progress: ProgressCallback | None = None,
+    executor: Executor | None = None,
+) -> ToolResult:
+    """
+    Execute a tool without blocking the event loop.
+
+    The run executes in a worker thread (or the given executor) under a
+    CancellationToken. If the awaiting task is cancelled, the token is
+    cancelled too, so the handler stops at its next check_cancelled().
+    When the timeout passes, a TIMEOUT result is returned straight away
+    and the handler is stopped the same way.
+
+    Args:
+        tool_name: Name of the tool to execute
+        context: SelectionContext with the user's selection
+        params: Optional parameters for the tool
+        validate_output: Whether to validate output (default: True)
+        cache: Optional ResultCache
+        timeout: Seconds allowed for the run (default: no limit)
+        token: Token to cancel the run from elsewhere (default: a new one)
+        progress: Callback for the handler's progress reports, called on
+            the event loop thread
+        executor: Executor to run in (default: the loop's default executor)
+
+    Returns:
+        ToolResult, as from run()
+
+    Example:
+        >>> result = await run_async("cpa", context, timeout=30, progress=on_progress)
+    """
+    loop = asyncio.get_running_loop()
+    token = token or CancellationToken()
+    if timeout is not None:
+        token.set_timeout(timeout)
+    if progress is not None:
+        token.progress = lambda fraction, message: loop.call_soon_threadsafe(
+            progress, fraction, message
+        )
+
+    start_time = time.perf_counter()
+    future = loop.run_in_executor(
+        executor, functools.partial(run, tool_name, context, params, validate_output, cache, token)
+    )
+    try:
+        return await asyncio.wait_for(asyncio.shield(future), token.remaining())
+    except TimeoutError:
+        token.cancel()
+        error = ToolTimeoutError()
+        return ToolResult(
+            tool=tool_name,
+            success=False,
+            error=ToolError(code=error.code, message=error.message, details={"timeout": timeout}),
+            duration_ms=(time.perf_counter() - start_time) * 1000,
+        )
+    except asyncio.CancelledError:
+        token.cancel()
+        raise
+
+
+def run_batch(
+    jobs: Iterable[BatchJob | tuple[str, SelectionContext] | tuple[str, SelectionContext, dict]],
+    workers: int | None = None,
+    chunk_size: int | None = None,
+    validate_output: bool = True,
+) -> BatchRun:
+    """
+    Execute many tool runs, spread over a process pool.
+
+    Each job is executed exactly as run() would, with the same validation
+    and provenance. Jobs are sent to worker processes in chunks to keep
+    the per-job overhead low; results come back as each chunk completes.
+    Worker processes look tools up by name, so tools must be registered
+    when their module is imported (as the built-in tools are).
+
+    Args:
+        jobs: BatchJob instances, or (tool name, context[, params]) tuples
+        workers: Number of worker processes (default: CPU count); 1 runs
+            the batch in this process
+        chunk_size: Jobs per chunk (default: about four chunks per worker)
+        validate_output: Whether to validate output (default: True)
+
+    Returns:
+        BatchRun yielding (job index, ToolResult) pairs as jobs complete;
+        its summary reports throughput and failures
+
+    Example:
+        >>> batch = run_batch(("track-stats", ctx) for ctx in contexts)
+        >>> for index, result in batch:
+        ...     print(index, result.success)
+        >>> print(batch.summary.jobs_per_second)
+    """
+    return BatchRun(
+        [_as_job(job) for job in jobs],
+        workers=workers or os.cpu_count() or 1,
+        chunk_size=chunk_size,
+        validate_output=validate_output,
+    )
+
+
+class BatchRun:
+    """
+    A batch of tool runs started by run_batch().
+
+    Iterating yields (job index, ToolResult) pairs in completion order and
+    can only be done once; results() collects them in job order instead.
+    The summary is updated as results arrive.
+    """
+
+    def __init__(
+        self, jobs: list[BatchJob], workers: int, chunk_size: int | None, validate_output: bool
+    ):
+        self.jobs = jobs
+        self._workers = max(1, min(workers, len(jobs)))
+        self._chunk_size = chunk_size or max(1, math.ceil(len(jobs) / (self._workers * 4)))
+        if self._chunk_size < 1:
+            raise ValueError(f"chunk_size must be positive, got {self._chunk_size}")
+        self._validate_output = validate_output
+        self._summary = BatchSummary()
+        self._started: float | None = None
+        self._finished: float | None = None
+        self._consumed = False
+
+    @property
+    def summary(self) -> BatchSummary:
+        """Aggregate counts, failures and throughput of the results so far."""
+        if self._started is not None:
+            elapsed = (self._finished or time.perf_counter()) - self._started
+            self._summary.duration_ms = elapsed * 1000
+            self._summary.jobs_per_second = self._summary.total / elapsed if elapsed > 0 else 0.0
+        return self._summary
+
+    def results(self) -> list[ToolResult]:
+        """Run the whole batch and return its results in job order."""
+        results: list[ToolResult | None] = [None] * len(self.jobs)
+        for index, result in self:
+            results[index] = result
+        return results  # type: ignore[return-value]
+
+    def __iter__(self) -> Iterator[tuple[int, ToolResult]]:
+        if self._consumed:
+            raise RuntimeError("A batch can only be iterated once")
+        self._consumed = True
+        self._started = time.perf_counter()
+
+        indexed = list(enumerate(self.jobs))
+        chunks = [
+            indexed[i : i + self._chunk_size] for i in range(0, len(indexed), self._chunk_size)
+        ]
+        try:
+            yield from self._execute(chunks)
+        finally:
+            self._finished = time.perf_counter()
+
+    def _execute(
+        self, chunks: list[list[tuple[int, BatchJob]]]
+    ) -> Iterator[tuple[int, ToolResult]]:
+        if self._workers == 1:
+            for chunk in chunks:
+                yield from self._record(_run_chunk(chunk, self._validate_output))
+            return
+
+        with ProcessPoolExecutor(max_workers=self._workers) as executor:
+            pending = {
+                executor.submit(_run_chunk, chunk, self._validate_output): chunk for chunk in chunks
+            }
+            try:
+                while pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        chunk = pending.pop(future)
+                        try:
+                            completed = future.result()
+                        except Exception as e:
+                            # The worker itself failed (e.g. it died); fail its jobs
+                            completed = [(i, _failed_result(job.tool, e)) for i, job in chunk]
+                        # Workers record metrics in their own process; record them here too
+                        for _, result in completed:
+                            metrics.record(result)
+                        yield from self._record(completed)
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def _record(self, completed: list[tuple[int, ToolResult]]) -> Iterator[tuple[int, ToolResult]]:
+        summary = self._summary
+        for index, result in completed:
+            summary.total += 1
+            summary.tool_ms += result.duration_ms
+            if result.success:
+                summary.succeeded += 1
+            else:
+                summary.failed += 1
+                summary.errors[result.error.code] = summary.errors.get(result.error.code, 0) + 1
+            yield index, result
+
+
+def _as_job(job: BatchJob | tuple) -> BatchJob:
+    """Normalise a job given as a (tool, context[, params]) tuple."""
+    if isinstance(job, BatchJob):
+        return job
+    tool_name, context, *rest = job
+    return BatchJob(tool=tool_name, context=context, params=rest[0] if rest else {})
+
+
+def _run_chunk(
+    chunk: list[tuple[int, BatchJob]], validate_output: bool
+) -> list[tuple[int, ToolResult]]:
+    """Execute a chunk of batch jobs (runs in worker processes)."""
+    return [(i, run(job.tool, job.context, job.params, validate_output)) for i, job in chunk]
+
+
+def _failed_result(tool_name: str, error: Exception) -> ToolResult:
+    return ToolResult(
+        tool=tool_name,
+        success=False,
+        error=ToolError(
+            code="EXECUTION_ERROR",
+            message=f"Tool '{tool_name}' execution failed: {error}",
+            details={"error_type": type(error).__name__, "error_message": str(error)},
+        ),
+        duration_ms=0.0,
+    )
+
+
+def run_stream(
+    tool_name: str,
+    context: SelectionContext | StreamingContext,
+    params: dict[str, Any] | None = None,
+    validate_output: bool = True,
+    token: CancellationToken | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> ToolStream:
+    """
+    Execute a tool, yielding output features as they are produced.
+
+    Input is streamed to the tool's streaming handler in chunks, and each
+    output feature gets its kind and provenance and is validated as it
+    is yielded, so neither the input nor the output has to fit in memory.
+    Tools without a streaming handler are run on the selection read
+    into memory, with their output yielded one feature at a time.
+
+    Args:
+        tool_name: Name of the tool to execute
+        context: StreamingContext, or a SelectionContext to stream
+        params: Optional parameters for the tool
+        validate_output: Whether to validate each output feature (default: True)
+        token: Optional CancellationToken, current while the handler runs
+        chunk_size: Positions per chunk when streaming a SelectionContext
+
+    Returns:
+        ToolStream yielding output features; once exhausted, its success,
+        error and count describe the run
+
+    Example:
+        >>> stream = run_stream("track-stats", StreamingContext(type=..., features=[track]))
+        >>> for feature in stream:
+        ...     sink.write(feature)
+        >>> stream.success
+    """
+    if isinstance(context, SelectionContext):
+        context = StreamingContext.from_selection(context, chunk_size)
+    return ToolStream(tool_name, context, params or {}, validate_output, token)
+
+
+class ToolStream:
+    """
+    Output features of a run_stream() call, produced as they are iterated.
+
+    Failures do not raise: iteration stops, and ``error`` holds the same
+    ToolError that run() would have returned. A stream closed before its
+    end (e.g. by breaking out of a loop over it) fails with the error code
+    CANCELLED. The stream can only be iterated once.
+    """
+
+    def __init__(
+        self,
+        tool_name: str,
+        context: StreamingContext,
+        params: dict[str, Any],
+        validate_output: bool,
+        token: CancellationToken | None,
+    ):
+        self.tool_name = tool_name
+        self.context = context
+        self.params = params
+        self.validate_output = validate_output
+        self.token = token
+        self.count = 0
+        self.error: ToolError | None = None
+        self.duration_ms = 0.0
+        self.profile: ExecutionProfile | None = None
+        self._profiler = Profiler()
+        self._output_vertices = 0
+        self._started = False
+        self._finished = False
+
+    @property
+    def success(self) -> bool:
+        """Whether the stream has been read to the end without error."""
+        return self._finished and self.error is None
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        if self._started:
+            raise RuntimeError("A tool stream can only be iterated once")
+        self._started = True
+        start_time = time.perf_counter()
+        try:
+            yield from self._features()
+        except GeneratorExit:
+            self.error = _tool_error(
+                self.tool_name,
+                ToolCancelledError("Tool stream was closed before it was read to the end"),
+            )
+            raise
+        except DebriefCalcError as e:
+            self.error = _tool_error(self.tool_name, e)
+        except Exception as e:
+            self.error = _tool_error(self.tool_name, ExecutionError(self.tool_name, e))
+        finally:
+            self._finished = True
+            self.duration_ms = (time.perf_counter() - start_time) * 1000
+            self._record()
+
+    def _features(self) -> Iterator[dict[str, Any]]:
+        profiler = self._profiler
+        with profiler.phase("validate_input"):
+            tool = registry.get_tool(self.tool_name)
+            _validate_context_type(tool, self.context)
+            _validate_kinds(tool, self.context)
+
+        # Provenance is the same for every output, so it is built once
+        with profiler.phase("provenance"):
+            provenance = create_provenance(
+                tool_name=tool.name,
+                tool_version=tool.version,
+                source_features=[
+                    {"id": stream.id, "properties": stream.properties}
+                    for stream in self.context.features
+                ],
+                parameters=self.params,
+            )
+
+        if self.token is not None:
+            self.token.raise_if_cancelled()
+        with profiler.phase("handler"), active_token(self.token):
+            outputs = iter(self._handler_output(tool))
+        try:
+            yield from self._validated(tool, outputs, provenance)
+        finally:
+            # Let a handler abandoned part-way release what it holds
+            close = getattr(outputs, "close", None)
+            if close is not None:
+                close()
+
+    def _validated(
+        self, tool: Tool, outputs: Iterator[dict[str, Any]], provenance: Provenance
+    ) -> Iterator[dict[str, Any]]:
+        profiler = self._profiler
+        while True:
+            with profiler.phase("handler"), active_token(self.token):
+                try:
+                    feature = next(outputs)
+                except StopIteration:
+                    break
+                except (ExecutionError, ToolCancelledError):
+                    raise
+                except Exception as e:
+                    raise ExecutionError(tool.name, e) from e
+
+            with profiler.phase("provenance"):
+                set_output_kind(feature, tool.output_kind)
+                attach_provenance(feature, provenance)
+            if self.validate_output:
+                with profiler.phase("validate_output"):
+                    validate_tool_output([feature], tool.output_kind, tool.name)
+
+            self.count += 1
+            self._output_vertices += count_vertices([feature])
+            yield feature
+
+    def _handler_output(self, tool: Tool) -> Iterable[dict[str, Any]]:
+        if tool.stream_handler is not None:
+            return tool.stream_handler(self.context, self.params)
+        if tool.handler is None:
+            raise ExecutionError(tool.name, ValueError("Tool has no handler"))
+        # Classic tool: it needs the whole selection in memory
+        return _execute_handler(tool, self.context.to_selection(), self.params)
+
+    def _record(self) -> None:
+        self.profile = ExecutionProfile(
+            phases_ms=self._profiler.phases_ms,
+            input_features=len(self.context.features),
+            input_vertices=sum(stream.positions_read for stream in self.context.features),
+            output_features=self.count,
+            output_vertices=self._output_vertices,
+        )
+        if self.error is None:
+            result = ToolResult(
+                tool=self.tool_name, success=True, features=[], duration_ms=self.duration_ms
+            )
+        else:
+            result = ToolResult(
+                tool=self.tool_name, success=False, error=self.error, duration_ms=self.duration_ms
+            )
+        result.profile = self.profile
+        metrics.record(result)
+
+
+def _tool_error(tool_name: str, error: DebriefCalcError) -> ToolError:
+    """Map a debrief-calc exception to the ToolError reported for it."""
+    if isinstance(error, ToolCancelledError):
+        code = error.code
+    elif isinstance(error, ExecutionError):
+        return ToolError(
+            code="EXECUTION_ERROR",
+            message=f"Tool '{tool_name}' execution failed: {error.original_error}",
+            details={
+                "error_type": type(error.original_error).__name__,
+                "error_message": str(error.original_error),
+            },
+        )
+    else:
+        code = {
+            ToolNotFoundError: "TOOL_NOT_FOUND",
+            InvalidContextError: "INVALID_CONTEXT",
+            KindMismatchError: "KIND_MISMATCH",
+            ValidationError: "VALIDATION_FAILED",
+        }.get(type(error), "EXECUTION_ERROR")
+    return ToolError(code=code, message=error.message, details=error.details)
+
+
+def _validate_context_type(tool: Tool, context: SelectionContext | StreamingContext) -> None:
     """Validate that context type matches tool requirements."""
     if tool.context_type != context.type:
         raise InvalidContextError(tool.name, tool.context_type.value, context.type.value)
 
 
-def _validate_kinds(tool: Tool, context: SelectionContext) -> None:
+def _validate_kinds(tool: Tool, context: SelectionContext | StreamingContext) -> None:
     """Validate that feature kinds are accepted by the tool."""
     # Skip kind validation for NONE and REGION context types
     if context.type in (ContextType.NONE, ContextType.REGION):
@@ -177,11 +694,15 @@ def _execute_handler(
     tool: Tool, context: SelectionContext, params: dict[str, Any]
 ) -> list[dict[str, Any]]:
     """Execute the tool handler and return output features."""
-    if tool.handler is None:
+    if tool.handler is None and tool.stream_handler is None:
         raise ExecutionError(tool.name, ValueError("Tool has no handler"))
 
     try:
-        result = tool.handler(context, params)
+        if tool.handler is None:
+            # Streaming-only tool: stream the in-memory selection through it
+            result = list(tool.stream_handler(StreamingContext.from_selection(context), params))
+        else:
+            result = tool.handler(context, params)
 
         if not isinstance(result, list):
             raise ExecutionError(
@@ -191,6 +712,6 @@ def _execute_handler(
         return result
 
     except Exception as e:
-        if isinstance(e, ExecutionError):
+        if isinstance(e, ExecutionError | ToolCancelledError):
             raise
         raise ExecutionError(tool.name, e) from e
@@ -0,0 +1,169 @@
+"""
+Vectorized geodesy kernels shared by the calc tools.
+
+All functions work on a spherical Earth with distances in nautical miles
+and angles in degrees. Arguments may be scalars or NumPy arrays (or
+anything array-like) and broadcast against each other, so a whole track
+is processed in one call instead of one Python call per coordinate pair.
+Scalar inputs give NumPy float results, which behave as plain floats.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+# Mean Earth radius in nautical miles
+EARTH_RADIUS_NM = 3440.065
+
+
+def haversine_distance(
+    lon1: ArrayLike, lat1: ArrayLike, lon2: ArrayLike, lat2: ArrayLike
+) -> NDArray:
+    """Calculate the great circle distance between points in nautical miles.
+
+    Args:
+        lon1: Longitude(s) of the first point(s)
+        lat1: Latitude(s) of the first point(s)
+        lon2: Longitude(s) of the second point(s)
+        lat2: Latitude(s) of the second point(s)
+
+    Returns:
+        Distance(s) in nautical miles
+    """
+    lon1, lat1, lon2, lat2 = _radians(lon1, lat1, lon2, lat2)
+    return _angular_distance(lon1, lat1, lon2, lat2) * EARTH_RADIUS_NM
+
+
+def initial_bearing(lon1: ArrayLike, lat1: ArrayLike, lon2: ArrayLike, lat2: ArrayLike) -> NDArray:
+    """Calculate the initial bearing from point 1 to point 2.
+
+    Args:
+        lon1: Longitude(s) of the start point(s)
+        lat1: Latitude(s) of the start point(s)
+        lon2: Longitude(s) of the end point(s)
+        lat2: Latitude(s) of the end point(s)
+
+    Returns:
+        Bearing(s) in degrees clockwise from true north, in [0, 360)
+    """
+    lon1, lat1, lon2, lat2 = _radians(lon1, lat1, lon2, lat2)
+    return np.degrees(_bearing(lon1, lat1, lon2, lat2)) % 360
+
+
+def destination_point(
+    lon: ArrayLike, lat: ArrayLike, bearing: ArrayLike, distance_nm: ArrayLike
+) -> tuple[NDArray, NDArray]:
+    """Calculate the point reached by travelling along a great circle.
+
+    Args:
+        lon: Longitude(s) of the start point(s)
+        lat: Latitude(s) of the start point(s)
+        bearing: Initial bearing(s) in degrees
+        distance_nm: Distance(s) travelled in nautical miles
+
+    Returns:
+        Tuple of (longitude(s), latitude(s)) of the destination; longitudes
+        are normalised to [-180, 180)
+    """
+    lon, lat, bearing = _radians(lon, lat, bearing)
+    delta = np.asarray(distance_nm, dtype=float) / EARTH_RADIUS_NM
+
+    sin_lat2 = np.sin(lat) * np.cos(delta) + np.cos(lat) * np.sin(delta) * np.cos(bearing)
+    lat2 = np.arcsin(np.clip(sin_lat2, -1.0, 1.0))
+    lon2 = lon + np.arctan2(
+        np.sin(bearing) * np.sin(delta) * np.cos(lat), np.cos(delta) - np.sin(lat) * sin_lat2
+    )
+
+    lon2 = (np.degrees(lon2) + 540) % 360 - 180
+    return lon2, np.degrees(lat2)
+
+
+def cross_track_distance(
+    lon: ArrayLike,
+    lat: ArrayLike,
+    start_lon: ArrayLike,
+    start_lat: ArrayLike,
+    end_lon: ArrayLike,
+    end_lat: ArrayLike,
+) -> NDArray:
+    """Calculate the distance of points from the great circle through a path.
+
+    Args:
+        lon: Longitude(s) of the point(s)
+        lat: Latitude(s) of the point(s)
+        start_lon: Longitude(s) of the path start
+        start_lat: Latitude(s) of the path start
+        end_lon: Longitude(s) of the path end
+        end_lat: Latitude(s) of the path end
+
+    Returns:
+        Signed distance(s) in nautical miles; positive to the right of the
+        path (looking from start to end), negative to the left
+    """
+    lon, lat, start_lon, start_lat, end_lon, end_lat = _radians(
+        lon, lat, start_lon, start_lat, end_lon, end_lat
+    )
+    d13 = _angular_distance(start_lon, start_lat, lon, lat)
+    theta13 = _bearing(start_lon, start_lat, lon, lat)
+    theta12 = _bearing(start_lon, start_lat, end_lon, end_lat)
+    return np.arcsin(np.clip(np.sin(d13) * np.sin(theta13 - theta12), -1.0, 1.0)) * EARTH_RADIUS_NM
+
+
+def path_length(lons: ArrayLike, lats: ArrayLike) -> float:
+    """Calculate the total great circle length of a path in nautical miles.
+
+    Args:
+        lons: Longitudes of the path vertices, in order
+        lats: Latitudes of the path vertices, in order
+
+    Returns:
+        Sum of the leg distances (0 for fewer than two vertices)
+    """
+    lons = np.asarray(lons, dtype=float)
+    lats = np.asarray(lats, dtype=float)
+    if lons.size < 2:
+        return 0.0
+    return float(haversine_distance(lons[:-1], lats[:-1], lons[1:], lats[1:]).sum())
+
+
+def coordinate_column(coordinates: Sequence[Sequence[float]], index: int) -> NDArray:
+    """Extract one ordinate of a GeoJSON coordinate list as a float array.
+
+    GeoJSON positions may have different lengths (e.g. some with a
+    timestamp), so the list is read column by column rather than
+    converted as a whole.
+
+    Args:
+        coordinates: GeoJSON positions ([lon, lat, ...])
+        index: Ordinate to extract (0 for longitude, 1 for latitude)
+
+    Returns:
+        1-D array of the ordinate values
+    """
+    if isinstance(coordinates, np.ndarray):
+        return coordinates[:, index].astype(float, copy=False)
+    return np.fromiter((c[index] for c in coordinates), dtype=float, count=len(coordinates))
+
+
+def _radians(*values: ArrayLike) -> list[NDArray]:
+    return [np.radians(np.asarray(value, dtype=float)) for value in values]
+
+
+def _angular_distance(lon1: NDArray, lat1: NDArray, lon2: NDArray, lat2: NDArray) -> NDArray:
+    """Haversine central angle between points given in radians."""
+    a = (
+        np.sin((lat2 - lat1) / 2) ** 2
+        + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    )
+    return 2 * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+def _bearing(lon1: NDArray, lat1: NDArray, lon2: NDArray, lat2: NDArray) -> NDArray:
+    """Initial bearing in radians (in (-pi, pi]) between points given in radians."""
+    dlon = lon2 - lon1
+    x = np.sin(dlon) * np.cos(lat2)
+    y = np.cos(lat1) * np.sin(lat2) - np.sin(lat1) * np.cos(lat2) * np.cos(dlon)
+    return np.arctan2(x, y)
@@ -11,6 +11,8 @@ from __future__ import annotations
 
 import json
 
+from debrief_calc.cache import ResultCache
+
 # MCP SDK import is optional
 try:
     from mcp.server import Server
@@ -31,11 +33,18 @@ ERROR_INVALID_CONTEXT = "INVALID_CONTEXT"
 ERROR_KIND_MISMATCH = "KIND_MISMATCH"
 ERROR_EXECUTION_FAILED = "EXECUTION_FAILED"
 
+# MCP tool reporting the process-wide tool metrics
+METRICS_TOOL = "calc_metrics"
+
 
-def create_server() -> Server:
+def create_server(cache: ResultCache | None = None) -> Server:
     """
     Create and configure the MCP server with debrief-calc tools.
 
+    Args:
+        cache: Result cache for tool runs (default: a new in-memory cache),
+            so repeated requests for the same selection are not recomputed
+
     Returns:
         Configured MCP Server instance
 
@@ -46,6 +55,8 @@ def create_server() -> Server:
         raise ImportError("MCP SDK not installed. Install with: pip install mcp")
 
     server = Server("debrief-calc")
+    if cache is None:
+        cache = ResultCache()
 
     @server.list_tools()
     async def list_tools() -> list[Tool]:
@@ -83,13 +94,46 @@ def create_server() -> Server:
                 )
             )
 
+        tools.append(
+            Tool(
+                name=METRICS_TOOL,
+                description=(
+                    "Report run counts, failures and duration percentiles (overall and per "
+                    "execution phase) of the debrief-calc tools run by this server"
+                ),
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "tool": {
+                            "type": "string",
+                            "description": "Only report this tool (default: all tools)",
+                        },
+                    },
+                },
+            )
+        )
         return tools
 
     @server.call_tool()
     async def call_tool(name: str, arguments: dict) -> list[TextContent]:
         """Execute a debrief-calc tool via MCP."""
-        from debrief_calc import registry, run
+        from debrief_calc import registry, run_async
         from debrief_calc.models import ContextType, SelectionContext
+        from debrief_calc.profiling import metrics
+
+        if name == METRICS_TOOL:
+            summary = metrics.summary(arguments.get("tool"))
+            return [
+                TextContent(
+                    type="text",
+                    text=json.dumps(
+                        {
+                            "success": True,
+                            "metrics": {k: m.model_dump() for k, m in summary.items()},
+                        }
+                    ),
+                )
+            ]
 
         # Convert MCP tool name back to calc tool name
         tool_name = name.replace("calc_", "").replace("_", "-")
@@ -131,7 +175,7 @@ def create_server() -> Server:
                 context = SelectionContext(type=ContextType.NONE)
 
             # Execute tool
-            result = run(tool_name, context, params)
+            result = await run_async(tool_name, context, params, cache=cache)
 
             if result.success:
                 return [
@@ -142,6 +186,7 @@ def create_server() -> Server:
                                 "success": True,
                                 "features": result.features,
                                 "duration_ms": result.duration_ms,
+                                "profile": result.profile.model_dump(),
                             }
                         ),
                     )
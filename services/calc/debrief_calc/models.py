@@ -8,7 +8,14 @@ Defines the entities used throughout the tool registry and execution system:
 - ToolParameter: Configurable parameter for a tool
 - ToolResult: Output of tool execution
 - ToolError: Structured error information
+- ExecutionProfile: Phase timings and data sizes of a run
 - Provenance: Lineage tracking for outputs
+- BatchJob: One tool run in a batch
+- BatchSummary: Aggregate throughput and failures of a batch
+- CacheStats: Hit and miss counts of a result cache
+- PipelineStep: One tool invocation in a pipeline
+- PipelineResult: Outcome of a pipeline run
+- ToolMetrics: Aggregated profile of a tool's runs
 """
 
 from __future__ import annotations
@@ -21,6 +28,8 @@ from typing import Any
 
 from pydantic import BaseModel, Field, field_validator, model_validator
 
+from debrief_calc.tracks import TrackArray
+
 
 class ContextType(str, Enum):
     """
@@ -44,6 +53,9 @@ class SourceRef(BaseModel):
 
     id: str = Field(..., description="Source feature ID")
     kind: str = Field(..., description="Source feature kind")
+    tool: str | None = Field(
+        default=None, description="Tool that produced the source, if it is a derived feature"
+    )
 
 
 class Provenance(BaseModel):
@@ -112,6 +124,23 @@ class ToolError(BaseModel):
     )
 
 
+class ExecutionProfile(BaseModel):
+    """
+    Where the time of a tool run went, and how much data it handled.
+    """
+
+    phases_ms: dict[str, float] = Field(
+        default_factory=dict, description="Milliseconds spent in each execution phase"
+    )
+    input_features: int = Field(default=0, ge=0, description="Features in the selection")
+    input_vertices: int = Field(default=0, ge=0, description="Positions in the selection")
+    output_features: int = Field(default=0, ge=0, description="Features produced")
+    output_vertices: int = Field(default=0, ge=0, description="Positions produced")
+    peak_memory_bytes: int | None = Field(
+        default=None, description="Peak memory traced during the handler, if requested"
+    )
+
+
 class ToolResult(BaseModel):
     """
     The output of a tool execution.
@@ -127,6 +156,10 @@ class ToolResult(BaseModel):
     )
     error: ToolError | None = Field(default=None, description="Error details if not success")
     duration_ms: float = Field(..., description="Execution time in milliseconds")
+    cached: bool = Field(default=False, description="Whether the result came from a cache")
+    profile: ExecutionProfile | None = Field(
+        default=None, description="Phase timings and feature counts of the run"
+    )
 
     @model_validator(mode="after")
     def validate_result_consistency(self) -> ToolResult:
@@ -148,8 +181,9 @@ class SelectionContext(BaseModel):
     """
 
     type: ContextType = Field(..., description="The context classification")
-    features: list[dict[str, Any]] = Field(
-        default_factory=list, description="Selected GeoJSON features"
+    features: list[TrackArray | dict[str, Any]] = Field(
+        default_factory=list,
+        description="Selected GeoJSON features; TrackArrays are kept as-is, not copied",
     )
     bounds: list[float] | None = Field(
         default=None, description="Geographic bounds [minx, miny, maxx, maxy]"
@@ -204,6 +238,11 @@ class Tool(BaseModel):
     handler: Callable | None = Field(
         default=None, exclude=True, description="Python function implementing the tool"
     )
+    stream_handler: Callable | None = Field(
+        default=None,
+        exclude=True,
+        description="Python function implementing the tool on streamed input",
+    )
 
     model_config = {"arbitrary_types_allowed": True}
 
@@ -239,4 +278,99 @@ class Tool(BaseModel):
             "output_kind": self.output_kind,
             "context_type": self.context_type.value,
             "parameters": [p.model_dump() for p in self.parameters],
+            "streaming": self.stream_handler is not None,
         }
+
+
+class BatchJob(BaseModel):
+    """
+    One tool run submitted to run_batch().
+    """
+
+    tool: str = Field(..., description="Name of the tool to execute")
+    context: SelectionContext = Field(..., description="Selection to run the tool on")
+    params: dict[str, Any] = Field(default_factory=dict, description="Tool parameters")
+
+
+class BatchSummary(BaseModel):
+    """
+    Aggregate outcome of a batch of tool runs.
+    """
+
+    total: int = Field(default=0, ge=0, description="Jobs completed")
+    succeeded: int = Field(default=0, ge=0, description="Jobs that succeeded")
+    failed: int = Field(default=0, ge=0, description="Jobs that failed")
+    errors: dict[str, int] = Field(
+        default_factory=dict, description="Number of failures per error code"
+    )
+    duration_ms: float = Field(default=0.0, ge=0, description="Wall-clock time of the batch")
+    tool_ms: float = Field(default=0.0, ge=0, description="Sum of the jobs' execution times")
+    jobs_per_second: float = Field(default=0.0, ge=0, description="Completed jobs per second")
+
+
+class CacheStats(BaseModel):
+    """
+    Hit and miss counts and tier sizes of a ResultCache.
+    """
+
+    hits: int = Field(default=0, ge=0, description="Lookups answered from the cache")
+    misses: int = Field(default=0, ge=0, description="Lookups not found in the cache")
+    memory_hits: int = Field(default=0, ge=0, description="Hits answered from memory")
+    disk_hits: int = Field(default=0, ge=0, description="Hits answered from disk")
+    hit_rate: float = Field(default=0.0, ge=0, le=1, description="Share of lookups that hit")
+    evictions: int = Field(default=0, ge=0, description="Results dropped to stay in limits")
+    memory_entries: int = Field(default=0, ge=0, description="Results held in memory")
+    disk_entries: int = Field(default=0, ge=0, description="Results held on disk")
+    disk_bytes: int = Field(default=0, ge=0, description="Size of the on-disk tier")
+
+
+class PipelineStep(BaseModel):
+    """
+    One tool invocation in a Pipeline.
+    """
+
+    name: str = Field(..., min_length=1, description="Unique step name")
+    tool: str = Field(..., description="Name of the tool to execute")
+    inputs: list[str] = Field(
+        default_factory=lambda: ["input"],
+        description="Steps whose output features are the tool's input ('input' for the selection)",
+    )
+    params: dict[str, Any] = Field(default_factory=dict, description="Tool parameters")
+
+
+class PipelineResult(BaseModel):
+    """
+    The outcome of running a Pipeline.
+    """
+
+    success: bool = Field(..., description="Whether every step succeeded")
+    steps: dict[str, ToolResult] = Field(..., description="Result of each step, by step name")
+    duration_ms: float = Field(..., description="Wall-clock time of the pipeline")
+
+
+class ToolMetrics(BaseModel):
+    """
+    Aggregated profile of the runs of one tool.
+
+    Duration summaries map "p50", "p90", "p99", "mean" and "max" to
+    milliseconds.
+    """
+
+    tool: str = Field(..., description="Tool name")
+    runs: int = Field(default=0, ge=0, description="Runs recorded")
+    failures: int = Field(default=0, ge=0, description="Runs that failed")
+    cache_hits: int = Field(default=0, ge=0, description="Runs answered from a cache")
+    errors: dict[str, int] = Field(
+        default_factory=dict, description="Number of failures per error code"
+    )
+    duration_ms: dict[str, float] = Field(
+        default_factory=dict, description="Summary of total run durations"
+    )
+    phases_ms: dict[str, dict[str, float]] = Field(
+        default_factory=dict, description="Summary of durations per execution phase"
+    )
+    mean_input_vertices: float = Field(default=0.0, ge=0, description="Mean positions in")
+    mean_output_vertices: float = Field(default=0.0, ge=0, description="Mean positions out")
+    peak_memory_bytes: int | None = Field(
+        default=None, description="Largest traced peak memory of any run"
+    )
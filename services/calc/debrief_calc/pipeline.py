@@ -0,0 +1,250 @@
+"""
+Multi-step tool pipelines for debrief-calc.
+
+A pipeline is a DAG of tool invocations. Each step runs one tool on the
+features produced by the steps it names as inputs, or on the pipeline's
+own selection (the ``"input"`` step). Steps whose inputs are ready run
+concurrently in a thread pool, so independent branches overlap, and
+features pass from step to step as the same in-memory objects rather
+than being copied or re-validated as a new selection.
+
+A single-feature tool given several features runs once per feature
+(e.g. statistics for every selected track) and its outputs are concatenated.
+
+With a ResultCache, each step is looked up by the content of its inputs,
+so re-running a pipeline after a change only re-runs the steps
+downstream of that change. Output provenance names the source features
+and the tool that produced each one, so lineage can be followed back
+through the DAG to the original selection.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Iterable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any
+
+from debrief_calc.cache import ResultCache
+from debrief_calc.exceptions import ToolNotFoundError
+from debrief_calc.executor import run
+from debrief_calc.models import (
+    ContextType,
+    PipelineResult,
+    PipelineStep,
+    SelectionContext,
+    Tool,
+    ToolError,
+    ToolResult,
+)
+from debrief_calc.registry import registry
+
+# Name by which steps refer to the pipeline's selection
+SOURCE = "input"
+
+
+class Pipeline:
+    """
+    A DAG of tool invocations.
+
+    Example:
+        >>> pipeline = (
+        ...     Pipeline()
+        ...     .add("cpa", "cpa", params={"threshold_nm": 1.0})
+        ...     .add("ranges", "range-bearing", params={"sample_points": "time-aligned"})
+        ...     .add("stats", "track-stats")
+        ... )
+        >>> result = pipeline.run(context, cache=cache)
+        >>> result.steps["cpa"].features
+    """
+
+    def __init__(self, steps: Iterable[PipelineStep] = ()):
+        self.steps: dict[str, PipelineStep] = {}
+        for step in steps:
+            self.add_step(step)
+
+    def add(
+        self,
+        name: str,
+        tool: str,
+        inputs: list[str] | None = None,
+        params: dict[str, Any] | None = None,
+    ) -> Pipeline:
+        """
+        Add a step and return the pipeline, for chaining.
+
+        Args:
+            name: Unique step name
+            tool: Name of the tool the step runs
+            inputs: Steps whose output features the tool runs on
+                (default: the pipeline's selection)
+            params: Tool parameters
+        """
+        return self.add_step(
+            PipelineStep(name=name, tool=tool, inputs=inputs or [SOURCE], params=params or {})
+        )
+
+    def add_step(self, step: PipelineStep) -> Pipeline:
+        """
+        Add a step and return the pipeline, for chaining.
+
+        Raises:
+            ValueError: If the name is taken or an input is not an earlier step
+        """
+        if step.name == SOURCE or step.name in self.steps:
+            raise ValueError(f"Step name '{step.name}' is already in use")
+        unknown = [name for name in step.inputs if name != SOURCE and name not in self.steps]
+        if unknown:
+            raise ValueError(f"Step '{step.name}' has unknown inputs: {unknown}")
+        self.steps[step.name] = step
+        return self
+
+    def run(
+        self,
+        context: SelectionContext,
+        max_workers: int | None = None,
+        cache: ResultCache | None = None,
+        validate_output: bool = True,
+    ) -> PipelineResult:
+        """
+        Execute every step, each as soon as its inputs are available.
+
+        A step whose input failed is not run, and fails with the error
+        code UPSTREAM_FAILED.
+
+        Args:
+            context: Selection the pipeline starts from
+            max_workers: Threads for concurrent steps (default: ThreadPoolExecutor's)
+            cache: Optional ResultCache for the step results
+            validate_output: Whether to validate each step's output
+
+        Returns:
+            PipelineResult with the ToolResult of every step
+        """
+        start_time = time.perf_counter()
+        results: dict[str, ToolResult] = {}
+        waiting = dict(self.steps)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            running: dict[Future, str] = {}
+            while waiting or running:
+                for name, step in list(waiting.items()):
+                    if not all(i == SOURCE or i in results for i in step.inputs):
+                        continue
+                    del waiting[name]
+                    failed = [i for i in step.inputs if i != SOURCE and not results[i].success]
+                    if failed:
+                        results[name] = _failure(
+                            step.tool,
+                            "UPSTREAM_FAILED",
+                            f"Step '{name}' was not run because its inputs failed",
+                            {"steps": failed},
+                        )
+                        continue
+                    features = _gather(step, context, results)
+                    future = executor.submit(
+                        _run_step, step, features, context, cache, validate_output
+                    )
+                    running[future] = name
+
+                if not running:
+                    continue
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    results[running.pop(future)] = future.result()
+
+        return PipelineResult(
+            success=all(result.success for result in results.values()),
+            steps={name: results[name] for name in self.steps},
+            duration_ms=(time.perf_counter() - start_time) * 1000,
+        )
+
+
+def _gather(
+    step: PipelineStep, context: SelectionContext, results: dict[str, ToolResult]
+) -> list[dict[str, Any]]:
+    """Collect a step's input features, without copying them."""
+    features: list[dict[str, Any]] = []
+    for name in step.inputs:
+        features.extend(context.features if name == SOURCE else results[name].features)
+    return features
+
+
+def _run_step(
+    step: PipelineStep,
+    features: list[dict[str, Any]],
+    source: SelectionContext,
+    cache: ResultCache | None,
+    validate_output: bool,
+) -> ToolResult:
+    """Run one step, once per feature for single-feature tools."""
+    try:
+        tool = registry.get_tool(step.tool)
+    except ToolNotFoundError as e:
+        return _failure(step.tool, "TOOL_NOT_FOUND", e.message, e.details)
+
+    if tool.context_type == ContextType.SINGLE and len(features) > 1:
+        contexts = [_context(tool, [feature], source) for feature in features]
+    else:
+        contexts = [_context(tool, features, source)]
+    if any(context is None for context in contexts):
+        return _failure(
+            step.tool,
+            "INVALID_CONTEXT",
+            f"Step '{step.name}' has {len(features)} input features, which do not "
+            f"suit a {tool.context_type.value} tool",
+            {"step": step.name, "feature_count": len(features)},
+        )
+
+    step_results = [
+        run(step.tool, context, step.params, validate_output, cache=cache) for context in contexts
+    ]
+    return _merge(step.tool, step_results)
+
+
+def _context(
+    tool: Tool, features: list[dict[str, Any]], source: SelectionContext
+) -> SelectionContext | None:
+    """Build the selection a tool runs on, or None if the features do not suit it.
+
+    The context is constructed without validation, so the features are
+    the upstream objects rather than validated copies.
+    """
+    if tool.context_type == ContextType.SINGLE and len(features) != 1:
+        return None
+    if tool.context_type == ContextType.MULTI and len(features) < 2:
+        return None
+    if tool.context_type == ContextType.REGION:
+        if source.bounds is None:
+            return None
+        return SelectionContext.model_construct(
+            type=ContextType.REGION, features=features, bounds=source.bounds
+        )
+    if tool.context_type == ContextType.NONE:
+        features = []
+    return SelectionContext.model_construct(type=tool.context_type, features=features, bounds=None)
+
+
+def _merge(tool_name: str, results: list[ToolResult]) -> ToolResult:
+    """Combine the per-feature runs of a step into one result."""
+    if len(results) == 1:
+        return results[0]
+    for result in results:
+        if not result.success:
+            return result
+    return ToolResult(
+        tool=tool_name,
+        success=True,
+        features=[feature for result in results for feature in result.features],
+        duration_ms=sum(result.duration_ms for result in results),
+        cached=all(result.cached for result in results),
+    )
+
+
+def _failure(tool_name: str, code: str, message: str, details: dict[str, Any] | None) -> ToolResult:
+    return ToolResult(
+        tool=tool_name,
+        success=False,
+        error=ToolError(code=code, message=message, details=details),
+        duration_ms=0.0,
+    )
@@ -0,0 +1,216 @@
+"""
+Execution profiling and tool metrics for debrief-calc.
+
+run() times each phase of a tool execution (input validation, cache
+lookup, the handler, provenance, output validation), counts the
+features and vertices going in and out, and optionally traces peak
+memory. The resulting ExecutionProfile is attached to the ToolResult
+and recorded in the process-wide ``metrics`` registry, which reports
+per-tool run counts, failures and duration percentiles.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+import tracemalloc
+from collections import deque
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from typing import Any
+
+import numpy as np
+
+from debrief_calc.models import ExecutionProfile, ToolMetrics, ToolResult
+
+# Phase names, in execution order
+PHASES = ("validate_input", "cache_lookup", "handler", "provenance", "validate_output")
+
+# Percentiles reported for durations
+PERCENTILES = (50, 90, 99)
+
+
+def count_vertices(features: list[Mapping[str, Any]]) -> int:
+    """Count the positions in the geometries of GeoJSON features."""
+    return sum(_geometry_vertices(feature.get("geometry")) for feature in features)
+
+
+def _geometry_vertices(geometry: dict[str, Any] | None) -> int:
+    if not geometry:
+        return 0
+    if geometry.get("type") == "GeometryCollection":
+        return sum(_geometry_vertices(g) for g in geometry.get("geometries", []))
+    depth = {
+        "Point": 0,
+        "MultiPoint": 1,
+        "LineString": 1,
+        "MultiLineString": 2,
+        "Polygon": 2,
+        "MultiPolygon": 3,
+    }.get(geometry.get("type"))
+    coordinates = geometry.get("coordinates")
+    if depth is None or coordinates is None:
+        return 0
+    return _count_positions(coordinates, depth)
+
+
+def _count_positions(coordinates: list, depth: int) -> int:
+    if depth == 0:
+        return 1
+    if depth == 1:
+        return len(coordinates)
+    return sum(_count_positions(part, depth - 1) for part in coordinates)
+
+
+class Profiler:
+    """
+    Collects the phase timings of one tool run.
+
+    Args:
+        trace_memory: Whether to trace peak memory during the handler
+            (tracemalloc slows allocation-heavy code noticeably)
+    """
+
+    def __init__(self, trace_memory: bool = False):
+        self.trace_memory = trace_memory
+        self.phases_ms: dict[str, float] = {}
+        self.peak_memory_bytes: int | None = None
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time a phase, adding to its total; tracing memory as well for the handler."""
+        tracing = self.trace_memory and name == "handler"
+        if tracing:
+            was_tracing = tracemalloc.is_tracing()
+            if was_tracing:
+                tracemalloc.reset_peak()
+            else:
+                tracemalloc.start()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            self.phases_ms[name] = self.phases_ms.get(name, 0.0) + elapsed_ms
+            if tracing:
+                self.peak_memory_bytes = tracemalloc.get_traced_memory()[1]
+                if not was_tracing:
+                    tracemalloc.stop()
+
+    def profile(
+        self, input_features: list[dict[str, Any]], output_features: list[dict[str, Any]] | None
+    ) -> ExecutionProfile:
+        """Build the profile of the run."""
+        output_features = output_features or []
+        return ExecutionProfile(
+            phases_ms=self.phases_ms,
+            input_features=len(input_features),
+            input_vertices=count_vertices(input_features),
+            output_features=len(output_features),
+            output_vertices=count_vertices(output_features),
+            peak_memory_bytes=self.peak_memory_bytes,
+        )
+
+
+class MetricsRegistry:
+    """
+    Process-wide aggregate of tool run profiles.
+
+    Counts are cumulative; percentiles are computed over the most recent
+    runs of each tool (``window`` of them), so memory use stays bounded
+    in long-lived processes such as the MCP server.
+    """
+
+    def __init__(self, window: int = 1000):
+        self.window = window
+        self._lock = threading.Lock()
+        self._tools: dict[str, _ToolRecord] = {}
+
+    def record(self, result: ToolResult) -> None:
+        """Add a tool result to the metrics."""
+        with self._lock:
+            record = self._tools.get(result.tool)
+            if record is None:
+                record = self._tools[result.tool] = _ToolRecord(self.window)
+            record.add(result)
+
+    def summary(self, tool: str | None = None) -> dict[str, ToolMetrics]:
+        """
+        Summarise the runs of every tool, or of one tool.
+
+        Returns:
+            Tool name -> ToolMetrics, for tools that have run
+        """
+        with self._lock:
+            names = sorted(self._tools) if tool is None else [tool]
+            return {name: self._tools[name].metrics(name) for name in names if name in self._tools}
+
+    def reset(self) -> None:
+        """Discard all recorded runs."""
+        with self._lock:
+            self._tools.clear()
+
+
+class _ToolRecord:
+    def __init__(self, window: int):
+        self.runs = 0
+        self.failures = 0
+        self.cache_hits = 0
+        self.errors: dict[str, int] = {}
+        self.durations: deque[float] = deque(maxlen=window)
+        self.phases: dict[str, deque[float]] = {}
+        self.input_vertices: deque[int] = deque(maxlen=window)
+        self.output_vertices: deque[int] = deque(maxlen=window)
+        self.peak_memory_bytes: int | None = None
+
+    def add(self, result: ToolResult) -> None:
+        self.runs += 1
+        self.durations.append(result.duration_ms)
+        if result.cached:
+            self.cache_hits += 1
+        if not result.success:
+            self.failures += 1
+            self.errors[result.error.code] = self.errors.get(result.error.code, 0) + 1
+
+        profile = result.profile
+        if profile is None:
+            return
+        for name, ms in profile.phases_ms.items():
+            self.phases.setdefault(name, deque(maxlen=self.durations.maxlen)).append(ms)
+        self.input_vertices.append(profile.input_vertices)
+        self.output_vertices.append(profile.output_vertices)
+        if profile.peak_memory_bytes is not None:
+            self.peak_memory_bytes = max(self.peak_memory_bytes or 0, profile.peak_memory_bytes)
+
+    def metrics(self, name: str) -> ToolMetrics:
+        return ToolMetrics(
+            tool=name,
+            runs=self.runs,
+            failures=self.failures,
+            cache_hits=self.cache_hits,
+            errors=dict(self.errors),
+            duration_ms=_percentiles(self.durations),
+            phases_ms={
+                phase: _percentiles(self.phases[phase]) for phase in PHASES if phase in self.phases
+            },
+            mean_input_vertices=float(np.mean(self.input_vertices)) if self.input_vertices else 0.0,
+            mean_output_vertices=(
+                float(np.mean(self.output_vertices)) if self.output_vertices else 0.0
+            ),
+            peak_memory_bytes=self.peak_memory_bytes,
+        )
+
+
+def _percentiles(values: deque[float]) -> dict[str, float]:
+    if not values:
+        return {}
+    array = np.fromiter(values, dtype=float, count=len(values))
+    values_at = np.percentile(array, PERCENTILES)
+    summary = {f"p{p}": float(v) for p, v in zip(PERCENTILES, values_at, strict=True)}
+    summary["mean"] = float(array.mean())
+    summary["max"] = float(array.max())
+    return summary
+
+
+# Process-wide metrics, recorded by run()
+metrics = MetricsRegistry()
@@ -38,7 +38,9 @@ def create_provenance(
         feature_id = feature.get("id", "unknown")
         props = feature.get("properties", {})
         kind = props.get("kind", "unknown")
-        sources.append(SourceRef(id=str(feature_id), kind=kind))
+        # Derived sources name the tool that produced them, chaining the lineage
+        tool = (props.get("provenance") or {}).get("tool")
+        sources.append(SourceRef(id=str(feature_id), kind=kind, tool=tool))
 
     return Provenance(
         tool=tool_name,
@@ -70,13 +72,19 @@ def attach_provenance(feature: dict[str, Any], provenance: Provenance) -> dict[s
         "tool": provenance.tool,
         "version": provenance.version,
         "timestamp": provenance.timestamp.isoformat() + "Z",
-        "sources": [{"id": s.id, "kind": s.kind} for s in provenance.sources],
+        "sources": [_source_dict(s) for s in provenance.sources],
         "parameters": provenance.parameters,
     }
 
     return feature
 
 
+def _source_dict(source: SourceRef) -> dict[str, str]:
+    if source.tool is None:
+        return {"id": source.id, "kind": source.kind}
+    return {"id": source.id, "kind": source.kind, "tool": source.tool}
+
+
 def set_output_kind(feature: dict[str, Any], kind: str) -> dict[str, Any]:
     """
     Set the kind attribute on a feature's properties.
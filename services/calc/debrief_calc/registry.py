@@ -181,6 +181,7 @@ def tool(
     context_type: ContextType,
     version: str = "1.0.0",
     parameters: list[ToolParameter] | None = None,
+    streaming: bool = False,
 ) -> Callable:
     """
     Decorator to register a function as a tool.
@@ -191,6 +192,13 @@ def tool(
 
     And return a list of GeoJSON Feature dictionaries.
 
+    With streaming=True the function is a streaming handler instead: it
+    receives a StreamingContext, whose features are read in chunks, and
+    yields output features one at a time. A classic tool can also be
+    given a streaming handler with the ``.streaming`` decorator of the
+    registered function; the executor uses whichever handler suits the
+    call (run() or run_stream()) and adapts the other.
+
     Example:
         @tool(
             name="track-stats",
@@ -212,6 +220,7 @@ def tool(
         context_type: Required selection context
         version: Semantic version (default: "1.0.0")
         parameters: Optional list of configurable parameters
+        streaming: Whether the function is a streaming handler
 
     Returns:
         Decorator function that registers the tool
@@ -227,7 +236,8 @@ def tool(
             output_kind=output_kind,
             context_type=context_type,
             parameters=parameters or [],
-            handler=func,
+            handler=None if streaming else func,
+            stream_handler=func if streaming else None,
         )
 
         # Register in the global registry
@@ -240,6 +250,12 @@ def tool(
         # Attach tool metadata to the wrapper
         wrapper.tool = tool_instance
 
+        def add_stream_handler(stream_func: Callable) -> Callable:
+            tool_instance.stream_handler = stream_func
+            return stream_func
+
+        wrapper.streaming = add_stream_handler
+
         return wrapper
 
     return decorator
@@ -0,0 +1,198 @@
+"""
+Streaming inputs for debrief-calc tools.
+
+Classic tool handlers take a SelectionContext whose features are fully
+in memory and return a complete list of output features. Streaming
+handlers instead take a StreamingContext, whose features are
+FeatureStreams that read their positions in chunks, and yield output
+features one at a time. Neither side needs the whole dataset in memory,
+so tools can process tracks larger than RAM.
+
+A FeatureStream is built either from an in-memory GeoJSON feature
+(``FeatureStream.from_feature``) or from any source that can produce
+position chunks on demand, such as a chunked file store:
+
+    >>> stream = FeatureStream("track-1", {"kind": "track"}, lambda: read_chunks(path))
+
+Chunks are 2-D float arrays with one row per position
+(``[lon, lat, elevation, time]``); shorter positions are padded with NaN.
+A stream can be read any number of times; each call to ``chunks()``
+starts from the beginning.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from typing import Any
+
+import numpy as np
+from numpy.typing import NDArray
+from pydantic import BaseModel, Field, model_validator
+
+from debrief_calc.models import ContextType, SelectionContext
+
+# Positions per chunk when streaming an in-memory feature
+DEFAULT_CHUNK_SIZE = 65_536
+
+# Geometry types whose coordinates are a flat list of positions
+_STREAMABLE_GEOMETRIES = ("LineString", "MultiPoint")
+
+
+class FeatureStream:
+    """
+    A feature whose positions are read in chunks.
+
+    Args:
+        id: Feature identifier
+        properties: Feature properties (kind, name, ...)
+        chunks: Callable returning a fresh iterable of position chunks
+        geometry_type: GeoJSON type of the positions (default: LineString)
+    """
+
+    def __init__(
+        self,
+        id: str,
+        properties: dict[str, Any],
+        chunks: Callable[[], Iterable[Sequence[Sequence[float]] | NDArray]],
+        geometry_type: str = "LineString",
+    ):
+        if geometry_type not in _STREAMABLE_GEOMETRIES:
+            raise ValueError(f"Cannot stream {geometry_type} geometries")
+        self.id = id
+        self.properties = properties
+        self.geometry_type = geometry_type
+        self._chunks = chunks
+        self.positions_read = 0
+
+    @classmethod
+    def from_feature(
+        cls, feature: Mapping[str, Any], chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> FeatureStream:
+        """
+        Stream the positions of an in-memory GeoJSON feature.
+
+        The chunks of a TrackArray are views of its position array.
+
+        Raises:
+            ValueError: If the geometry is not a LineString or MultiPoint
+        """
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+        geometry = feature.get("geometry") or {}
+        coordinates = geometry.get("coordinates")
+        if coordinates is None:
+            coordinates = []
+
+        def chunks() -> Iterator[Sequence[Sequence[float]]]:
+            for start in range(0, len(coordinates), chunk_size):
+                yield coordinates[start : start + chunk_size]
+
+        return cls(
+            str(feature.get("id", "unknown")),
+            feature.get("properties") or {},
+            chunks,
+            geometry.get("type", "LineString"),
+        )
+
+    @property
+    def kind(self) -> str | None:
+        """The feature kind, from its properties."""
+        return self.properties.get("kind")
+
+    def chunks(self) -> Iterator[NDArray]:
+        """Read the positions from the start, one 2-D float array at a time."""
+        for chunk in self._chunks():
+            array = position_array(chunk)
+            if array.shape[0]:
+                self.positions_read += array.shape[0]
+                yield array
+
+    def to_feature(self) -> dict[str, Any]:
+        """Read the whole stream into an in-memory GeoJSON feature."""
+        coordinates = []
+        for chunk in self.chunks():
+            for row in chunk.tolist():
+                # Drop the NaN padding of shorter positions
+                while row and row[-1] != row[-1]:
+                    row.pop()
+                coordinates.append(row)
+        return {
+            "type": "Feature",
+            "id": self.id,
+            "properties": self.properties,
+            "geometry": {"type": self.geometry_type, "coordinates": coordinates},
+        }
+
+
+class StreamingContext(BaseModel):
+    """
+    A selection whose features are streamed.
+
+    The streaming counterpart of SelectionContext, passed to streaming
+    tool handlers.
+    """
+
+    type: ContextType = Field(..., description="The context classification")
+    features: list[FeatureStream] = Field(
+        default_factory=list, description="Selected features, as position streams"
+    )
+    bounds: list[float] | None = Field(
+        default=None, description="Geographic bounds [minx, miny, maxx, maxy]"
+    )
+
+    model_config = {"arbitrary_types_allowed": True}
+
+    @model_validator(mode="after")
+    def validate_context_requirements(self) -> StreamingContext:
+        if self.type == ContextType.SINGLE and len(self.features) != 1:
+            raise ValueError("features must have exactly 1 item when type is 'single'")
+        if self.type == ContextType.MULTI and len(self.features) < 2:
+            raise ValueError("features must have 2+ items when type is 'multi'")
+        if self.type == ContextType.REGION and self.bounds is None:
+            raise ValueError("bounds is required when type is 'region'")
+        return self
+
+    @classmethod
+    def from_selection(
+        cls, context: SelectionContext, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> StreamingContext:
+        """Stream the features of an in-memory selection."""
+        return cls(
+            type=context.type,
+            features=[FeatureStream.from_feature(f, chunk_size) for f in context.features],
+            bounds=context.bounds,
+        )
+
+    def to_selection(self) -> SelectionContext:
+        """Read every stream into an in-memory selection."""
+        return SelectionContext(
+            type=self.type,
+            features=[stream.to_feature() for stream in self.features],
+            bounds=self.bounds,
+        )
+
+    def get_kinds(self) -> set[str]:
+        """Extract unique kinds from the streamed features."""
+        return {stream.kind for stream in self.features if stream.kind}
+
+
+def position_array(positions: Sequence[Sequence[float]] | NDArray) -> NDArray:
+    """
+    Convert a chunk of positions to a 2-D float array.
+
+    Positions of different lengths (e.g. only some with a timestamp) are
+    padded with NaN to the longest.
+    """
+    if isinstance(positions, np.ndarray):
+        array = positions.astype(float, copy=False)
+        return array.reshape(0, 2) if array.size == 0 else array
+    if not len(positions):
+        return np.empty((0, 2))
+    try:
+        return np.asarray(positions, dtype=float)
+    except ValueError:
+        width = max(len(p) for p in positions)
+        array = np.full((len(positions), width), np.nan)
+        for row, position in enumerate(positions):
+            array[row, : len(position)] = position
+        return array
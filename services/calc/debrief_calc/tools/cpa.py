@@ -0,0 +1,347 @@
+"""
+Closest point of approach (CPA) tool.
+
+Finds, for every pair among N tracks, the time, range and bearing of their
+closest approach, and every episode during which they were within a
+threshold range of each other.
+
+All tracks are sampled on one regular time grid. The grid is cut into time
+buckets; within each bucket every track is reduced to the bounding box of
+its positions, and a sweep over the boxes sorted by longitude yields the
+pairs that could be within the search range. Only those pairs are
+measured, so tracks that stay far apart are never compared point by
+point. Each bucket is projected with the east-west scale of its highest
+latitude, so box distances are never overstated, and its longitudes are
+cut in their widest gap, with the boxes repeated one turn east, so pairs
+either side of the cut (e.g. the antimeridian) are still found. The
+sampled minimum is then refined assuming linear relative motion between
+samples.
+"""
+
+from __future__ import annotations
+
+import math
+import uuid
+from collections import defaultdict
+from typing import Any
+
+import numpy as np
+from numpy.typing import NDArray
+
+from debrief_calc.alignment import interpolate_track, track_arrays
+from debrief_calc.cancellation import check_cancelled, report_progress
+from debrief_calc.geodesy import haversine_distance, initial_bearing
+from debrief_calc.models import ContextType, SelectionContext, ToolParameter
+from debrief_calc.registry import tool
+
+# Nautical miles per degree of latitude
+_NM_PER_DEGREE = 60.0
+
+# Grid samples per pruning bucket
+_BUCKET_SAMPLES = 32
+
+# Margin on the search range when pruning, for the flat-earth box approximation
+_PRUNE_MARGIN = 1.1
+
+
+def _sample_tracks(
+    tracks: list[tuple[NDArray, NDArray, NDArray]], interval_ms: float
+) -> tuple[NDArray, NDArray, NDArray]:
+    """Interpolate all tracks on a shared time grid.
+
+    Returns:
+        Tuple of (epochs, lons, lats); lons and lats have one row per track
+        and are NaN at epochs outside that track's period
+    """
+    start = min(times[0] for times, _, _ in tracks)
+    end = max(times[-1] for times, _, _ in tracks)
+    epochs = start + np.arange(int((end - start) // interval_ms) + 1) * interval_ms
+
+    lons = np.full((len(tracks), epochs.size), np.nan)
+    lats = np.full((len(tracks), epochs.size), np.nan)
+    for row, (times, track_lons, track_lats) in enumerate(tracks):
+        first = np.searchsorted(epochs, times[0], side="left")
+        last = np.searchsorted(epochs, times[-1], side="right")
+        if first < last:
+            lon, lat = interpolate_track(times, track_lons, track_lats, epochs[first:last])
+            lons[row, first:last] = lon
+            lats[row, first:last] = lat
+    return epochs, lons, lats
+
+
+def _bucket_plane(lons: NDArray, lats: NDArray) -> tuple[NDArray, NDArray, float]:
+    """Project one bucket's positions onto a plane for pruning.
+
+    The east-west scale is that of the bucket's highest latitude, where a
+    degree of longitude is shortest, and longitudes are measured east from
+    the middle of their widest gap, so no track is split across the cut.
+
+    Returns:
+        Tuple of (x, y, period): easting and northing in nm, and the
+        easting of one full turn of longitude
+    """
+    scale = _NM_PER_DEGREE * math.cos(math.radians(min(float(np.nanmax(np.abs(lats))), 90.0)))
+    ordered = np.sort(lons[~np.isnan(lons)] % 360)
+    gaps = np.diff(ordered, append=ordered[0] + 360)
+    widest = int(gaps.argmax())
+    cut = ordered[widest] + gaps[widest] / 2
+    x = ((lons - cut) % 360) * scale
+    return x, lats * _NM_PER_DEGREE, 360 * scale
+
+
+def _candidate_pairs(
+    x: NDArray, y: NDArray, search_nm: float, period: float | None = None
+) -> list[tuple[int, int]]:
+    """Sweep the tracks' bounding boxes in one bucket for pairs within search_nm.
+
+    Args:
+        x: Easting in nm, one row per track (NaN where inactive)
+        y: Northing in nm, one row per track (NaN where inactive)
+        search_nm: Largest range of interest
+        period: Easting of one full turn of longitude, if x wraps around;
+            boxes are then also compared one period apart
+
+    Returns:
+        (row, row) pairs whose boxes, grown by search_nm, overlap
+    """
+    active = np.flatnonzero(~np.isnan(x).all(axis=1))
+    if active.size < 2:
+        return []
+    xmin, xmax = np.nanmin(x[active], axis=1), np.nanmax(x[active], axis=1)
+    ymin, ymax = np.nanmin(y[active], axis=1), np.nanmax(y[active], axis=1)
+
+    rows = np.arange(active.size)
+    if period is not None:
+        # Repeat every box one turn east, so pairs across the cut meet
+        rows = np.concatenate([rows, rows])
+        xmin, xmax = np.concatenate([xmin, xmin + period]), np.concatenate([xmax, xmax + period])
+
+    order = np.argsort(xmin, kind="stable")
+    sorted_xmin = xmin[order]
+    pairs = set()
+    for n, box in enumerate(order):
+        # Boxes starting beyond this one's reach along x cannot overlap it
+        stop = np.searchsorted(sorted_xmin, xmax[box] + search_nm, side="right")
+        i = rows[box]
+        for j in rows[order[n + 1 : stop]]:
+            if i != j and ymin[j] <= ymax[i] + search_nm and ymin[i] <= ymax[j] + search_nm:
+                a, b = sorted((active[i], active[j]))
+                pairs.add((int(a), int(b)))
+    return sorted(pairs)
+
+
+def _pair_ranges(
+    epochs: NDArray, lons: NDArray, lats: NDArray, search_nm: float
+) -> dict[tuple[int, int], tuple[NDArray, NDArray]]:
+    """Measure the range of every candidate pair at the grid epochs where it is close.
+
+    Returns:
+        (row, row) -> (sample indexes, ranges in nm), for pairs that come
+        within search_nm; samples not listed are further apart than that
+    """
+    chunks: dict[tuple[int, int], list[tuple[NDArray, NDArray]]] = defaultdict(list)
+    for start in range(0, epochs.size, _BUCKET_SAMPLES):
+        check_cancelled()
+        report_progress(0.9 * start / epochs.size, "Comparing tracks")
+        window = slice(start, start + _BUCKET_SAMPLES)
+        if np.isnan(lons[:, window]).all():
+            continue
+        x, y, period = _bucket_plane(lons[:, window], lats[:, window])
+        pairs = _candidate_pairs(x, y, search_nm * _PRUNE_MARGIN, period)
+        if not pairs:
+            continue
+        a, b = np.array(pairs).T
+        ranges = haversine_distance(
+            lons[a, window], lats[a, window], lons[b, window], lats[b, window]
+        )
+        indexes = np.arange(start, min(start + _BUCKET_SAMPLES, epochs.size))
+        for pair, pair_ranges in zip(pairs, ranges, strict=True):
+            both = ~np.isnan(pair_ranges)
+            if both.any():
+                chunks[pair].append((indexes[both], pair_ranges[both]))
+
+    measured = {}
+    for pair, parts in chunks.items():
+        indexes = np.concatenate([part[0] for part in parts])
+        ranges = np.concatenate([part[1] for part in parts])
+        if ranges.min() <= search_nm:
+            measured[pair] = (indexes, ranges)
+    return measured
+
+
+def _refine_cpa(
+    pair: tuple[int, int],
+    indexes: NDArray,
+    ranges: NDArray,
+    epochs: NDArray,
+    lons: NDArray,
+    lats: NDArray,
+) -> tuple[float, NDArray, NDArray]:
+    """Refine a pair's sampled closest approach between neighbouring samples.
+
+    Relative motion is taken as linear between consecutive samples, on a
+    local flat plane, and the closest point on each neighbouring leg is
+    checked with the exact range.
+
+    Returns:
+        Tuple of (CPA time, [lon, lat] of the first track, [lon, lat] of the second)
+    """
+    a, b = pair
+    k = int(ranges.argmin())
+    best = (ranges[k], float(epochs[indexes[k]]), indexes[k], 0.0)
+
+    for lo, hi in ((k - 1, k), (k, k + 1)):
+        if lo < 0 or hi >= indexes.size or indexes[hi] != indexes[lo] + 1:
+            continue
+        i, j = indexes[lo], indexes[hi]
+        scale = math.cos(math.radians(lats[a, i]))
+        d0 = np.array([_dlon(lons[a, i], lons[b, i]) * scale, lats[b, i] - lats[a, i]])
+        d1 = np.array([_dlon(lons[a, j], lons[b, j]) * scale, lats[b, j] - lats[a, j]])
+        dv = d1 - d0
+        denominator = float(dv @ dv)
+        if denominator == 0:
+            continue
+        s = min(max(-float(d0 @ dv) / denominator, 0.0), 1.0)
+        lon_a, lat_a = _lerp(lons[a, i], lats[a, i], lons[a, j], lats[a, j], s)
+        lon_b, lat_b = _lerp(lons[b, i], lats[b, i], lons[b, j], lats[b, j], s)
+        refined = float(haversine_distance(lon_a, lat_a, lon_b, lat_b))
+        if refined < best[0]:
+            best = (refined, float(epochs[i] + s * (epochs[j] - epochs[i])), i, s)
+
+    _, cpa_time, i, s = best
+    j = min(i + 1, epochs.size - 1)
+    first = np.array(_lerp(lons[a, i], lats[a, i], lons[a, j], lats[a, j], s))
+    second = np.array(_lerp(lons[b, i], lats[b, i], lons[b, j], lats[b, j], s))
+    return cpa_time, first, second
+
+
+def _has_positions(feature: dict[str, Any]) -> bool:
+    """Whether a feature has any positions (a list or, for a TrackArray, an array)."""
+    coordinates = (feature.get("geometry") or {}).get("coordinates")
+    return coordinates is not None and len(coordinates) > 0
+
+
+def _dlon(lon0: float, lon1: float) -> float:
+    """Return the shortest signed longitude difference from lon0 to lon1."""
+    return (lon1 - lon0 + 180) % 360 - 180
+
+
+def _lerp(lon0: float, lat0: float, lon1: float, lat1: float, s: float) -> tuple[float, float]:
+    if s == 0:
+        return float(lon0), float(lat0)
+    lon = lon0 + s * _dlon(lon0, lon1)
+    return float((lon + 180) % 360 - 180), float(lat0 + s * (lat1 - lat0))
+
+
+def _episodes(
+    indexes: NDArray, ranges: NDArray, epochs: NDArray, threshold_nm: float
+) -> list[dict[str, Any]]:
+    """Find the runs of consecutive samples at or under the threshold range."""
+    close = ranges <= threshold_nm
+    if not close.any():
+        return []
+
+    # A run breaks where a sample is not close or the next sample is not adjacent
+    positions = np.flatnonzero(close)
+    breaks = np.flatnonzero(np.diff(indexes[positions]) != 1) + 1
+    episodes = []
+    for run in np.split(positions, breaks):
+        k = run[ranges[run].argmin()]
+        episodes.append(
+            {
+                "start_time": int(epochs[indexes[run[0]]]),
+                "end_time": int(epochs[indexes[run[-1]]]),
+                "min_range_nm": round(float(ranges[k]), 2),
+                "min_range_time": int(epochs[indexes[k]]),
+            }
+        )
+    return episodes
+
+
+@tool(
+    name="cpa",
+    description=(
+        "Find the closest point of approach between every pair of tracks, "
+        "and the episodes when they were within a threshold range"
+    ),
+    input_kinds=["track"],
+    output_kind="cpa",
+    context_type=ContextType.MULTI,
+    parameters=[
+        ToolParameter(
+            name="threshold_nm",
+            type="number",
+            description="Report episodes when a pair is within this range (nm)",
+            default=2.0,
+        ),
+        ToolParameter(
+            name="max_range_nm",
+            type="number",
+            description="Only report pairs whose CPA is within this range (nm)",
+            default=20.0,
+        ),
+        ToolParameter(
+            name="interval_seconds",
+            type="number",
+            description="Time step at which the tracks are compared",
+            default=60,
+        ),
+    ],
+)
+def cpa(context: SelectionContext, params: dict[str, Any]) -> list[dict[str, Any]]:
+    """
+    Calculate the closest point of approach between every pair of tracks.
+
+    Args:
+        context: SelectionContext with two or more timed track features
+        params: Optional parameters (threshold_nm, max_range_nm, interval_seconds)
+
+    Returns:
+        List containing one Feature per pair that comes within max_range_nm,
+        nearest first, drawn as a LineString between the tracks at CPA
+
+    Raises:
+        ValueError: If a track has no timestamps or a parameter is out of range
+    """
+    threshold_nm = float(params.get("threshold_nm", 2.0))
+    max_range_nm = max(float(params.get("max_range_nm", 20.0)), threshold_nm)
+    interval_seconds = float(params.get("interval_seconds", 60))
+    if threshold_nm < 0 or interval_seconds <= 0:
+        raise ValueError("threshold_nm must be >= 0 and interval_seconds > 0")
+
+    features = [f for f in context.features if _has_positions(f)]
+    if len(features) < 2:
+        return []
+
+    tracks = [track_arrays(f["geometry"]["coordinates"]) for f in features]
+    epochs, lons, lats = _sample_tracks(tracks, interval_seconds * 1000)
+    measured = _pair_ranges(epochs, lons, lats, max_range_nm)
+
+    results = []
+    for pair, (indexes, ranges) in measured.items():
+        check_cancelled()
+        cpa_time, first, second = _refine_cpa(pair, indexes, ranges, epochs, lons, lats)
+        track1, track2 = features[pair[0]], features[pair[1]]
+        results.append(
+            {
+                "type": "Feature",
+                "id": f"cpa-{uuid.uuid4().hex[:8]}",
+                "properties": {
+                    "from_track": track1.get("id", f"track-{pair[0] + 1}"),
+                    "to_track": track2.get("id", f"track-{pair[1] + 1}"),
+                    "cpa_time": int(round(cpa_time)),
+                    "cpa_range_nm": round(float(haversine_distance(*first, *second)), 2),
+                    "cpa_bearing_deg": round(float(initial_bearing(*first, *second)), 1),
+                    "threshold_nm": threshold_nm,
+                    "episodes": _episodes(indexes, ranges, epochs, threshold_nm),
+                },
+                "geometry": {
+                    "type": "LineString",
+                    "coordinates": [first.tolist(), second.tolist()],
+                },
+            }
+        )
+
+    results.sort(key=lambda f: f["properties"]["cpa_range_nm"])
+    report_progress(1.0)
+    return results
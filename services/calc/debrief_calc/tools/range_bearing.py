@@ -1,51 +1,39 @@
 """
 Range and bearing tool.
 
-Calculates range and bearing between two tracks at corresponding time points.
+Calculates range and bearing between two tracks at corresponding time points:
+either at sampled fixes (start, midpoint, end), or as a full time series with
+the tracks aligned on time and interpolated.
 """
 
 from __future__ import annotations
 
-import math
 import uuid
 from typing import Any
 
+import numpy as np
+
+from debrief_calc.alignment import align_tracks
+from debrief_calc.geodesy import haversine_distance, initial_bearing
 from debrief_calc.models import ContextType, SelectionContext, ToolParameter
 from debrief_calc.registry import tool
 
+# Result feature ID prefix for each measurement type
+_ID_PREFIXES = {"start": "start", "midpoint": "mid", "end": "end"}
+
 
 def _calculate_bearing(lon1: float, lat1: float, lon2: float, lat2: float) -> float:
     """
     Calculate the initial bearing from point 1 to point 2 in degrees.
     """
-    lon1, lat1, lon2, lat2 = map(math.radians, [lon1, lat1, lon2, lat2])
-
-    dlon = lon2 - lon1
-    x = math.sin(dlon) * math.cos(lat2)
-    y = math.cos(lat1) * math.sin(lat2) - math.sin(lat1) * math.cos(lat2) * math.cos(dlon)
-
-    bearing = math.atan2(x, y)
-    bearing = math.degrees(bearing)
-    bearing = (bearing + 360) % 360
-
-    return bearing
+    return float(initial_bearing(lon1, lat1, lon2, lat2))
 
 
 def _calculate_range(lon1: float, lat1: float, lon2: float, lat2: float) -> float:
     """
     Calculate the great circle distance between two points in nautical miles.
     """
-    lon1, lat1, lon2, lat2 = map(math.radians, [lon1, lat1, lon2, lat2])
-
-    dlon = lon2 - lon1
-    dlat = lat2 - lat1
-    a = math.sin(dlat / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin(dlon / 2) ** 2
-    c = 2 * math.asin(math.sqrt(a))
-
-    # Earth radius in nautical miles
-    r = 3440.065
-
-    return c * r
+    return float(haversine_distance(lon1, lat1, lon2, lat2))
 
 
 def _find_closest_point(target_time: float, coordinates: list[list[float]]) -> list[float]:
@@ -71,7 +59,10 @@ def _find_closest_point(target_time: float, coordinates: list[list[float]]) -> l
 
 @tool(
     name="range-bearing",
-    description="Calculate range and bearing between two tracks at their start, midpoint, and end",
+    description=(
+        "Calculate range and bearing between two tracks at their start, midpoint, and end, "
+        "or throughout the period both cover"
+    ),
     input_kinds=["track"],
     output_kind="range-bearing",
     context_type=ContextType.MULTI,
@@ -80,9 +71,17 @@ def _find_closest_point(target_time: float, coordinates: list[list[float]]) -> l
             name="sample_points",
             type="enum",
             description="Where to calculate range/bearing",
-            choices=["endpoints", "midpoint", "all"],
+            choices=["endpoints", "midpoint", "all", "time-aligned"],
             default="all",
-        )
+        ),
+        ToolParameter(
+            name="interval_seconds",
+            type="number",
+            description=(
+                "For time-aligned sampling, resample both tracks at this interval "
+                "(default: every time either track has a fix)"
+            ),
+        ),
     ],
 )
 def range_bearing(context: SelectionContext, params: dict[str, Any]) -> list[dict[str, Any]]:
@@ -91,10 +90,12 @@ def range_bearing(context: SelectionContext, params: dict[str, Any]) -> list[dic
 
     Args:
         context: SelectionContext with exactly two track features
-        params: Optional parameters (sample_points)
+        params: Optional parameters (sample_points, interval_seconds)
 
     Returns:
-        List containing Features with range/bearing data as LineStrings
+        List containing Features with range/bearing data as LineStrings; for
+        time-aligned sampling, one Feature holding the range and bearing
+        series, drawn at the closest approach
     """
     if len(context.features) < 2:
         return []
@@ -105,87 +106,94 @@ def range_bearing(context: SelectionContext, params: dict[str, Any]) -> list[dic
     coords1 = track1.get("geometry", {}).get("coordinates", [])
     coords2 = track2.get("geometry", {}).get("coordinates", [])
 
-    if not coords1 or not coords2:
+    if len(coords1) == 0 or len(coords2) == 0:
         return []
 
-    results = []
     sample_points = params.get("sample_points", "all")
+    if sample_points == "time-aligned":
+        return _time_aligned(track1, track2, coords1, coords2, params.get("interval_seconds"))
 
-    # Calculate at start
+    # Pick the sample pairs first, then measure them all in one kernel call
+    samples = []
     if sample_points in ("endpoints", "all"):
-        start1 = coords1[0]
-        start2 = coords2[0]
-        range_nm = _calculate_range(start1[0], start1[1], start2[0], start2[1])
-        bearing = _calculate_bearing(start1[0], start1[1], start2[0], start2[1])
-
-        results.append(
-            {
-                "type": "Feature",
-                "id": f"rb-start-{uuid.uuid4().hex[:8]}",
-                "properties": {
-                    "measurement_type": "start",
-                    "range_nm": round(range_nm, 2),
-                    "bearing_deg": round(bearing, 1),
-                    "from_track": track1.get("id", "track-1"),
-                    "to_track": track2.get("id", "track-2"),
-                },
-                "geometry": {
-                    "type": "LineString",
-                    "coordinates": [[start1[0], start1[1]], [start2[0], start2[1]]],
-                },
-            }
-        )
-
-    # Calculate at midpoint
+        samples.append(("start", coords1[0], coords2[0]))
     if sample_points in ("midpoint", "all"):
-        mid_idx1 = len(coords1) // 2
-        mid_idx2 = len(coords2) // 2
-        mid1 = coords1[mid_idx1]
-        mid2 = coords2[mid_idx2]
-        range_nm = _calculate_range(mid1[0], mid1[1], mid2[0], mid2[1])
-        bearing = _calculate_bearing(mid1[0], mid1[1], mid2[0], mid2[1])
-
-        results.append(
-            {
-                "type": "Feature",
-                "id": f"rb-mid-{uuid.uuid4().hex[:8]}",
-                "properties": {
-                    "measurement_type": "midpoint",
-                    "range_nm": round(range_nm, 2),
-                    "bearing_deg": round(bearing, 1),
-                    "from_track": track1.get("id", "track-1"),
-                    "to_track": track2.get("id", "track-2"),
-                },
-                "geometry": {
-                    "type": "LineString",
-                    "coordinates": [[mid1[0], mid1[1]], [mid2[0], mid2[1]]],
-                },
-            }
-        )
-
-    # Calculate at end
+        samples.append(("midpoint", coords1[len(coords1) // 2], coords2[len(coords2) // 2]))
     if sample_points in ("endpoints", "all"):
-        end1 = coords1[-1]
-        end2 = coords2[-1]
-        range_nm = _calculate_range(end1[0], end1[1], end2[0], end2[1])
-        bearing = _calculate_bearing(end1[0], end1[1], end2[0], end2[1])
+        samples.append(("end", coords1[-1], coords2[-1]))
+    if not samples:
+        return []
+
+    lon1 = [p1[0] for _, p1, _ in samples]
+    lat1 = [p1[1] for _, p1, _ in samples]
+    lon2 = [p2[0] for _, _, p2 in samples]
+    lat2 = [p2[1] for _, _, p2 in samples]
+    ranges = haversine_distance(lon1, lat1, lon2, lat2)
+    bearings = initial_bearing(lon1, lat1, lon2, lat2)
 
+    results = []
+    for (measurement, p1, p2), range_nm, bearing in zip(samples, ranges, bearings, strict=True):
         results.append(
             {
                 "type": "Feature",
-                "id": f"rb-end-{uuid.uuid4().hex[:8]}",
+                "id": f"rb-{_ID_PREFIXES[measurement]}-{uuid.uuid4().hex[:8]}",
                 "properties": {
-                    "measurement_type": "end",
-                    "range_nm": round(range_nm, 2),
-                    "bearing_deg": round(bearing, 1),
+                    "measurement_type": measurement,
+                    "range_nm": round(float(range_nm), 2),
+                    "bearing_deg": round(float(bearing), 1),
                     "from_track": track1.get("id", "track-1"),
                     "to_track": track2.get("id", "track-2"),
                 },
                 "geometry": {
                     "type": "LineString",
-                    "coordinates": [[end1[0], end1[1]], [end2[0], end2[1]]],
+                    "coordinates": [
+                        [float(p1[0]), float(p1[1])],
+                        [float(p2[0]), float(p2[1])],
+                    ],
                 },
             }
         )
 
     return results
+
+
+def _time_aligned(
+    track1: dict[str, Any],
+    track2: dict[str, Any],
+    coords1: list[list[float]],
+    coords2: list[list[float]],
+    interval_seconds: float | None,
+) -> list[dict[str, Any]]:
+    """Measure range and bearing at every shared epoch of two timed tracks."""
+    interval_ms = interval_seconds * 1000 if interval_seconds else None
+    epochs, lon1, lat1, lon2, lat2 = align_tracks(coords1, coords2, interval_ms)
+    if not epochs.size:
+        return []
+
+    ranges = haversine_distance(lon1, lat1, lon2, lat2)
+    bearings = initial_bearing(lon1, lat1, lon2, lat2)
+    closest = int(ranges.argmin())
+
+    return [
+        {
+            "type": "Feature",
+            "id": f"rb-series-{uuid.uuid4().hex[:8]}",
+            "properties": {
+                "measurement_type": "time-series",
+                "times": epochs.astype(np.int64).tolist(),
+                "range_nm": np.round(ranges, 2).tolist(),
+                "bearing_deg": np.round(bearings, 1).tolist(),
+                "min_range_nm": round(float(ranges[closest]), 2),
+                "min_range_time": int(epochs[closest]),
+                "from_track": track1.get("id", "track-1"),
+                "to_track": track2.get("id", "track-2"),
+            },
+            "geometry": {
+                "type": "LineString",
+                "coordinates": [
+                    [float(lon1[closest]), float(lat1[closest])],
+                    [float(lon2[closest]), float(lat2[closest])],
+                ],
+            },
+        }
+    ]
@@ -6,59 +6,59 @@ Calculates statistics for a single track including:
 - Duration
 - Total distance
 - Average speed
+
+The tool also has a streaming handler, which reads the track in chunks
+and so works on tracks too large to hold in memory.
 """
 
 from __future__ import annotations
 
 import math
 import uuid
+from collections.abc import Iterator
 from typing import Any
 
+from numpy.typing import NDArray
+
+from debrief_calc.cancellation import check_cancelled
+from debrief_calc.geodesy import coordinate_column, haversine_distance, path_length
 from debrief_calc.models import ContextType, SelectionContext, ToolParameter
 from debrief_calc.registry import tool
+from debrief_calc.streaming import StreamingContext
 
 
 def _haversine_distance(lon1: float, lat1: float, lon2: float, lat2: float) -> float:
     """
     Calculate the great circle distance between two points in nautical miles.
     """
-    # Convert to radians
-    lon1, lat1, lon2, lat2 = map(math.radians, [lon1, lat1, lon2, lat2])
-
-    # Haversine formula
-    dlon = lon2 - lon1
-    dlat = lat2 - lat1
-    a = math.sin(dlat / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin(dlon / 2) ** 2
-    c = 2 * math.asin(math.sqrt(a))
+    return float(haversine_distance(lon1, lat1, lon2, lat2))
 
-    # Earth radius in nautical miles
-    r = 3440.065
 
-    return c * r
-
-
-def _calculate_track_stats(coordinates: list[list[float]]) -> dict[str, Any]:
+def _calculate_track_stats(coordinates: list[list[float]] | NDArray) -> dict[str, Any]:
     """Calculate statistics from track coordinates."""
-    if not coordinates:
+    if len(coordinates) == 0:
         return {"point_count": 0, "duration_hours": 0, "distance_nm": 0, "average_speed_kts": 0}
 
     point_count = len(coordinates)
 
-    # Calculate total distance
-    total_distance = 0.0
-    for i in range(1, len(coordinates)):
-        prev = coordinates[i - 1]
-        curr = coordinates[i]
-        # Coordinates are [lon, lat, elevation?, time?]
-        total_distance += _haversine_distance(prev[0], prev[1], curr[0], curr[1])
+    # Calculate total distance over all legs at once
+    # Coordinates are [lon, lat, elevation?, time?]
+    total_distance = path_length(
+        coordinate_column(coordinates, 0), coordinate_column(coordinates, 1)
+    )
 
     # Calculate duration if timestamps available (4th element)
     duration_hours = 0.0
     if len(coordinates[0]) >= 4 and len(coordinates[-1]) >= 4:
-        start_time = coordinates[0][3]  # timestamp in ms
-        end_time = coordinates[-1][3]
+        start_time = float(coordinates[0][3])  # timestamp in ms
+        end_time = float(coordinates[-1][3])
         duration_hours = (end_time - start_time) / (1000 * 60 * 60)
 
+    return _stats(point_count, duration_hours, total_distance)
+
+
+def _stats(point_count: int, duration_hours: float, total_distance: float) -> dict[str, Any]:
+    """Round the statistics and derive the average speed."""
     # Calculate average speed
     average_speed = 0.0
     if duration_hours > 0:
@@ -72,6 +72,21 @@ def _calculate_track_stats(coordinates: list[list[float]]) -> dict[str, Any]:
     }
 
 
+def _result_feature(
+    source_track: str, source_name: str, stats: dict[str, Any], centroid: list[float]
+) -> dict[str, Any]:
+    return {
+        "type": "Feature",
+        "id": f"stats-{uuid.uuid4().hex[:8]}",
+        "properties": {
+            "source_track": source_track,
+            "source_name": source_name,
+            "statistics": stats,
+        },
+        "geometry": {"type": "Point", "coordinates": centroid},
+    }
+
+
 @tool(
     name="track-stats",
     description="Calculate statistics for a single track including point count, duration, distance, and average speed",
@@ -106,22 +121,74 @@ def track_stats(context: SelectionContext, params: dict[str, Any]) -> list[dict[
     stats = _calculate_track_stats(coordinates)
 
     # Get the track's bounding box for the result geometry
-    if coordinates:
-        lons = [c[0] for c in coordinates]
-        lats = [c[1] for c in coordinates]
-        centroid = [sum(lons) / len(lons), sum(lats) / len(lats)]
+    if len(coordinates):
+        centroid = [
+            float(coordinate_column(coordinates, 0).mean()),
+            float(coordinate_column(coordinates, 1).mean()),
+        ]
     else:
         centroid = [0, 0]
 
-    result_feature = {
-        "type": "Feature",
-        "id": f"stats-{uuid.uuid4().hex[:8]}",
-        "properties": {
-            "source_track": feature.get("id", "unknown"),
-            "source_name": feature.get("properties", {}).get("name", "unknown"),
-            "statistics": stats,
-        },
-        "geometry": {"type": "Point", "coordinates": centroid},
-    }
+    result_feature = _result_feature(
+        feature.get("id", "unknown"),
+        feature.get("properties", {}).get("name", "unknown"),
+        stats,
+        centroid,
+    )
 
     return [result_feature]
+
+
+@track_stats.streaming
+def track_stats_stream(
+    context: StreamingContext, params: dict[str, Any]
+) -> Iterator[dict[str, Any]]:
+    """
+    Calculate statistics for a single track, reading it chunk by chunk.
+
+    Only running totals and the last position are kept between chunks,
+    so memory use does not grow with the length of the track.
+
+    Args:
+        context: StreamingContext with exactly one track stream
+        params: Optional parameters (distance_unit)
+
+    Yields:
+        One Feature with track statistics
+    """
+    stream = context.features[0]
+    point_count = 0
+    total_distance = 0.0
+    lon_sum = lat_sum = 0.0
+    first = last = None
+
+    for chunk in stream.chunks():
+        check_cancelled()
+        lons, lats = chunk[:, 0], chunk[:, 1]
+        if last is None:
+            first = chunk[0]
+        else:
+            # The leg joining this chunk to the previous one
+            total_distance += float(haversine_distance(last[0], last[1], lons[0], lats[0]))
+        total_distance += path_length(lons, lats)
+        lon_sum += float(lons.sum())
+        lat_sum += float(lats.sum())
+        point_count += chunk.shape[0]
+        last = chunk[-1]
+
+    duration_hours = 0.0
+    if point_count and _has_time(first) and _has_time(last):
+        duration_hours = (last[3] - first[3]) / (1000 * 60 * 60)
+
+    if point_count:
+        stats = _stats(point_count, float(duration_hours), total_distance)
+        centroid = [lon_sum / point_count, lat_sum / point_count]
+    else:
+        stats = {"point_count": 0, "duration_hours": 0, "distance_nm": 0, "average_speed_kts": 0}
+        centroid = [0, 0]
+
+    yield _result_feature(stream.id, stream.properties.get("name", "unknown"), stats, centroid)
+
+
+def _has_time(position: Any) -> bool:
+    return len(position) >= 4 and not math.isnan(position[3])
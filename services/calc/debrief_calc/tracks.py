@@ -0,0 +1,191 @@
+"""
+Array-backed track features for debrief-calc.
+
+A GeoJSON track holds its positions as a list of lists, which a
+SelectionContext validates and copies and which tools then read back
+into arrays one ordinate at a time. A TrackArray instead holds the
+positions as one 2-D float array, one row per ``[lon, lat, elevation,
+time]`` position. It is passed through a SelectionContext as the same
+object, without validation or copying, and tools read the time,
+longitude and latitude columns as NumPy views of that array.
+
+A TrackArray is a read-only mapping with the keys of a GeoJSON feature
+(``type``, ``id``, ``properties``, ``geometry``), so tools written for
+dict features work on it unchanged; the coordinates of its geometry are
+the position array itself.
+
+    >>> track = TrackArray.from_columns(lons, lats, times, id="track-1")
+    >>> context = SelectionContext(type=ContextType.SINGLE, features=[track])
+    >>> run("track-stats", context)
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping
+from typing import Any
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+from pydantic_core import core_schema
+
+# Columns of a position row
+LON, LAT, ELEVATION, TIME = 0, 1, 2, 3
+
+
+class TrackArray(Mapping[str, Any]):
+    """
+    A LineString feature whose positions are a 2-D float array.
+
+    The array is used as given when it is already float64, so wrapping an
+    existing array copies nothing.
+
+    Args:
+        positions: Array of shape (n, 2), (n, 3) or (n, 4), one row per
+            position ([lon, lat, elevation, time], time in ms since the epoch)
+        id: Feature identifier
+        properties: Feature properties (default: ``{"kind": "track"}``)
+
+    Raises:
+        ValueError: If positions is not a 2-D array of 2 to 4 columns
+    """
+
+    def __init__(
+        self,
+        positions: ArrayLike,
+        id: str | None = None,
+        properties: dict[str, Any] | None = None,
+    ):
+        positions = np.asarray(positions, dtype=float)
+        if positions.ndim != 2 or not 2 <= positions.shape[1] <= 4:
+            raise ValueError(f"Track positions must have shape (n, 2..4), got {positions.shape}")
+        self.positions = positions
+        self.id = id
+        self.properties = properties if properties is not None else {"kind": "track"}
+
+    @classmethod
+    def from_columns(
+        cls,
+        lons: ArrayLike,
+        lats: ArrayLike,
+        times: ArrayLike | None = None,
+        elevations: ArrayLike | None = None,
+        id: str | None = None,
+        properties: dict[str, Any] | None = None,
+    ) -> TrackArray:
+        """
+        Build a track from separate ordinate arrays.
+
+        The columns are copied once into a column-major array, so each
+        column view the tools read is contiguous. Elevation defaults to 0
+        when only times are given.
+
+        Raises:
+            ValueError: If the columns differ in length
+        """
+        columns = [lons, lats]
+        if times is not None or elevations is not None:
+            columns.append(elevations if elevations is not None else 0.0)
+        if times is not None:
+            columns.append(times)
+        length = len(np.asarray(lons))
+        positions = np.empty((length, len(columns)), dtype=float, order="F")
+        for index, column in enumerate(columns):
+            column = np.asarray(column, dtype=float)
+            if column.ndim and column.shape != (length,):
+                raise ValueError(f"Track columns must all have {length} values")
+            positions[:, index] = column
+        return cls(positions, id, properties)
+
+    @classmethod
+    def from_feature(cls, feature: Mapping[str, Any]) -> TrackArray:
+        """
+        Convert a GeoJSON LineString feature, copying its positions once.
+
+        Raises:
+            ValueError: If the geometry is not a LineString, or its
+                positions differ in length
+        """
+        geometry = feature.get("geometry") or {}
+        if geometry.get("type") != "LineString":
+            raise ValueError(f"Cannot convert {geometry.get('type')} geometries to a track")
+        coordinates = geometry.get("coordinates")
+        if coordinates is None or len(coordinates) == 0:
+            positions = np.empty((0, 2))
+        else:
+            positions = np.asarray(coordinates, dtype=float)
+        return cls(positions, feature.get("id"), dict(feature.get("properties") or {}))
+
+    @property
+    def point_count(self) -> int:
+        """The number of positions."""
+        return self.positions.shape[0]
+
+    @property
+    def lons(self) -> NDArray:
+        """Longitudes, as a view of the positions."""
+        return self.positions[:, LON]
+
+    @property
+    def lats(self) -> NDArray:
+        """Latitudes, as a view of the positions."""
+        return self.positions[:, LAT]
+
+    @property
+    def elevations(self) -> NDArray | None:
+        """Elevations, as a view of the positions (None if there are none)."""
+        return self.positions[:, ELEVATION] if self.positions.shape[1] > ELEVATION else None
+
+    @property
+    def times(self) -> NDArray | None:
+        """Timestamps in ms, as a view of the positions (None if untimed)."""
+        return self.positions[:, TIME] if self.positions.shape[1] > TIME else None
+
+    @property
+    def geometry(self) -> dict[str, Any]:
+        """The GeoJSON geometry, with the position array as its coordinates."""
+        return {"type": "LineString", "coordinates": self.positions}
+
+    def to_feature(self) -> dict[str, Any]:
+        """Convert to a plain GeoJSON feature (copying the positions into lists)."""
+        feature = {
+            "type": "Feature",
+            "properties": self.properties,
+            "geometry": {"type": "LineString", "coordinates": self.positions.tolist()},
+        }
+        if self.id is not None:
+            feature["id"] = self.id
+        return feature
+
+    def __getitem__(self, key: str) -> Any:
+        if key == "type":
+            return "Feature"
+        if key == "properties":
+            return self.properties
+        if key == "geometry":
+            return self.geometry
+        if key == "id" and self.id is not None:
+            return self.id
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        yield "type"
+        if self.id is not None:
+            yield "id"
+        yield "properties"
+        yield "geometry"
+
+    def __len__(self) -> int:
+        return 3 if self.id is None else 4
+
+    def __repr__(self) -> str:
+        return f"TrackArray(id={self.id!r}, point_count={self.point_count})"
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source: Any, handler: Any) -> core_schema.CoreSchema:
+        # Carried through models as the same object; dumped as a GeoJSON feature
+        return core_schema.is_instance_schema(
+            cls,
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                lambda track: track.to_feature()
+            ),
+        )
@@ -1,8 +1,10 @@
 """
 Catalog commands for debrief-cli.
 
-Provides access to STAC catalog browsing functionality.
+Provides access to STAC catalog browsing and bulk import functionality.
 Note: Full implementation requires debrief-stac and debrief-config packages.
+The import and verify commands need the ``catalog`` extra
+(``pip install 'debrief-cli[catalog]'``).
 """
 
 from __future__ import annotations
@@ -28,6 +30,16 @@ def _get_config_path() -> Path:
     return Path(xdg_config) / "debrief" / "config.json"
 
 
+def _missing_catalog_extra(formatter, error: ImportError) -> None:
+    """Report that the optional catalog dependencies are not installed."""
+    formatter.error(
+        f"This command needs the catalog extra: pip install 'debrief-cli[catalog]' ({error})",
+        "MISSING_DEPENDENCY",
+    )
+    formatter.finish()
+    sys.exit(4)
+
+
 def _load_stores() -> dict[str, dict]:
     """Load store configuration from XDG config."""
     config_path = _get_config_path()
@@ -41,6 +53,24 @@ def _load_stores() -> dict[str, dict]:
     return {}
 
 
+def _resolve_catalog_path(formatter, store: str | None, catalog_path: str | None) -> str:
+    """Resolve --store/--path to a catalog directory, exiting on invalid input."""
+    if (store is None) == (catalog_path is None):
+        formatter.error("Specify exactly one of --store or --path", "INVALID_ARGS")
+        formatter.finish()
+        sys.exit(2)
+
+    if store is not None:
+        stores = _load_stores()
+        if store not in stores or "path" not in stores[store]:
+            formatter.error(f"Store '{store}' not found", "STORE_NOT_FOUND")
+            formatter.finish()
+            sys.exit(5)
+        catalog_path = stores[store]["path"]
+
+    return catalog_path
+
+
 @click.group()
 def catalog():
     """Browse STAC catalogs."""
@@ -165,3 +195,148 @@ def get_item(ctx: Context, store: str, item: str):
         formatter.error(str(e), "GET_ERROR")
         formatter.finish()
         sys.exit(4)
+
+
+@catalog.command("import")
+@click.argument("sources", nargs=-1, required=True, type=click.Path(exists=True))
+@click.option("--store", help="Store name (from configuration)")
+@click.option("--path", "catalog_path", type=click.Path(), help="Catalog directory")
+@click.option("--workers", type=int, help="Parser processes (default: CPU count)")
+@click.option("--batch-size", type=int, default=50, show_default=True, help="Files per commit")
+@click.option("--no-resume", is_flag=True, help="Ignore the checkpoint of a previous import")
+@pass_context
+def import_files(
+    ctx: Context,
+    sources: tuple[str, ...],
+    store: str | None,
+    catalog_path: str | None,
+    workers: int | None,
+    batch_size: int,
+    no_resume: bool,
+):
+    """
+    Bulk import source files into a STAC catalog.
+
+    SOURCES are files or directories (searched recursively for supported
+    formats). Each file becomes a plot. Progress is checkpointed, so an
+    interrupted import can be re-run to resume.
+    """
+    formatter = ctx.get_formatter()
+    catalog_path = _resolve_catalog_path(formatter, store, catalog_path)
+
+    try:
+        from debrief_stac.exceptions import CatalogNotFoundError
+        from debrief_stac.ingest import import_sources
+    except ImportError as e:
+        _missing_catalog_extra(formatter, e)
+
+    try:
+
+        def report_progress(report) -> None:
+            if not ctx.json_mode:
+                done = report.files_imported + report.files_skipped + report.files_failed
+                formatter.info(
+                    f"{done}/{report.files_total} files, "
+                    f"{report.positions_per_second:,.0f} positions/s"
+                )
+
+        try:
+            report = import_sources(
+                catalog_path,
+                sources,
+                workers=workers,
+                batch_size=batch_size,
+                resume=not no_resume,
+                progress=report_progress,
+            )
+        except ImportError as e:
+            _missing_catalog_extra(formatter, e)
+        except CatalogNotFoundError as e:
+            formatter.error(str(e), "STORE_NOT_FOUND")
+            formatter.finish()
+            sys.exit(5)
+
+        if ctx.json_mode:
+            formatter.json_output(report.model_dump(mode="json"))
+        else:
+            formatter.success(
+                f"Imported {report.files_imported} files ({report.positions:,} positions) "
+                f"in {report.elapsed_seconds:.1f}s, {report.positions_per_second:,.0f} positions/s"
+            )
+            if report.files_skipped:
+                formatter.info(f"Skipped {report.files_skipped} already-imported files")
+            for failure in report.failures:
+                formatter.error(f"{failure.source_path}: {failure.message}")
+
+        formatter.finish()
+
+    except Exception as e:
+        formatter.error(str(e), "IMPORT_ERROR")
+        formatter.finish()
+        sys.exit(4)
+
+
+@catalog.command("verify")
+@click.option("--store", help="Store name (from configuration)")
+@click.option("--path", "catalog_path", type=click.Path(), help="Catalog directory")
+@click.option("--workers", type=int, help="Checking threads (default: CPU count + 4)")
+@click.option("--full", is_flag=True, help="Check every plot, including unchanged ones")
+@click.option("--repair", is_flag=True, help="Fix links, bboxes, sidecars and damaged assets")
+@pass_context
+def verify(
+    ctx: Context,
+    store: str | None,
+    catalog_path: str | None,
+    workers: int | None,
+    full: bool,
+    repair: bool,
+):
+    """
+    Verify the integrity of a STAC catalog.
+
+    Checks catalog links, asset checksums, item bboxes and position
+    sidecars. By default plots unchanged since their last clean check are
+    skipped; use --full to check everything. Exits with status 3 if
+    unrepaired issues remain.
+    """
+    formatter = ctx.get_formatter()
+    catalog_path = _resolve_catalog_path(formatter, store, catalog_path)
+
+    try:
+        from debrief_stac.exceptions import CatalogNotFoundError
+        from debrief_stac.verify import verify_catalog
+    except ImportError as e:
+        _missing_catalog_extra(formatter, e)
+
+    try:
+        try:
+            report = verify_catalog(
+                catalog_path, workers=workers, incremental=not full, repair=repair
+            )
+        except CatalogNotFoundError as e:
+            formatter.error(str(e), "STORE_NOT_FOUND")
+            formatter.finish()
+            sys.exit(5)
+
+        if ctx.json_mode:
+            formatter.json_output(report.model_dump(mode="json"))
+        else:
+            formatter.info(
+                f"Checked {report.items_checked} plots ({report.items_skipped} unchanged), "
+                f"hashed {report.assets_hashed} files in {report.elapsed_seconds:.1f}s"
+            )
+            for issue in report.issues:
+                status = "repaired" if issue.repaired else issue.kind
+                formatter.error(f"{issue.plot_id}: {issue.message} [{status}]")
+            if report.ok:
+                formatter.success("Catalog OK")
+
+        formatter.finish()
+
+    except Exception as e:
+        formatter.error(str(e), "VERIFY_ERROR")
+        formatter.finish()
+        sys.exit(4)
+
+    if not report.ok:
+        sys.exit(3)
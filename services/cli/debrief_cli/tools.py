@@ -8,12 +8,15 @@ from __future__ import annotations
 
 import json
 import sys
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import click
 
 from debrief_cli.main import Context, pass_context
-from debrief_cli.output import format_tool_metadata
+from debrief_cli.output import OutputFormatter, format_tool_metadata
+
+if TYPE_CHECKING:
+    from debrief_calc.models import SelectionContext, Tool
 
 
 @click.group()
@@ -134,50 +137,12 @@ def run_tool(ctx: Context, tool_name: str, input_file: str, params: tuple):
 
     try:
         from debrief_calc import registry, run
-        from debrief_calc.models import ContextType, SelectionContext
-
-        # Load input file
-        with open(input_file) as f:
-            data = json.load(f)
 
-        # Convert to features list
-        if data.get("type") == "FeatureCollection":
-            features = data["features"]
-        elif data.get("type") == "Feature":
-            features = [data]
-        else:
-            formatter.error("Input must be a GeoJSON Feature or FeatureCollection", "INVALID_INPUT")
-            formatter.finish()
-            sys.exit(2)
+        features = _load_features(formatter, input_file)
 
         # Get tool to determine context type
         tool = registry.get_tool(tool_name)
-
-        # Build context based on tool requirements
-        if tool.context_type == ContextType.SINGLE:
-            if len(features) != 1:
-                formatter.error(
-                    f"Tool '{tool_name}' requires exactly 1 feature, got {len(features)}",
-                    "INVALID_CONTEXT",
-                )
-                formatter.finish()
-                sys.exit(2)
-            context = SelectionContext(type=ContextType.SINGLE, features=features)
-        elif tool.context_type == ContextType.MULTI:
-            if len(features) < 2:
-                formatter.error(
-                    f"Tool '{tool_name}' requires 2+ features, got {len(features)}",
-                    "INVALID_CONTEXT",
-                )
-                formatter.finish()
-                sys.exit(2)
-            context = SelectionContext(type=ContextType.MULTI, features=features)
-        elif tool.context_type == ContextType.REGION:
-            # For region context, extract bounds from geometry
-            bounds = _extract_bounds(features)
-            context = SelectionContext(type=ContextType.REGION, bounds=bounds)
-        else:
-            context = SelectionContext(type=ContextType.NONE)
+        context = _build_context(formatter, tool, features)
 
         # Convert params to dict
         params_dict = dict(params) if params else {}
@@ -200,6 +165,128 @@ def run_tool(ctx: Context, tool_name: str, input_file: str, params: tuple):
         sys.exit(4)
 
 
+@tools.command("profile")
+@click.argument("tool_name")
+@click.option(
+    "--input", "input_file", type=click.Path(exists=True), required=True, help="Input GeoJSON file"
+)
+@click.option(
+    "--param",
+    "-p",
+    "params",
+    multiple=True,
+    type=(str, str),
+    help="Tool parameter as key value pair",
+)
+@click.option(
+    "--repeat", "-n", type=click.IntRange(min=1), default=10, help="Number of runs (default: 10)"
+)
+@click.option("--memory", is_flag=True, help="Also trace the peak memory of the tool")
+@pass_context
+def profile_tool(
+    ctx: Context, tool_name: str, input_file: str, params: tuple, repeat: int, memory: bool
+):
+    """
+    Profile an analysis tool on input data.
+
+    TOOL_NAME is the name of the tool to run. The tool is run repeatedly
+    and duration percentiles are reported for the whole run and for each
+    execution phase, with the amount of data processed.
+    """
+    formatter = ctx.get_formatter()
+
+    try:
+        from debrief_calc import registry, run
+        from debrief_calc.profiling import metrics
+
+        features = _load_features(formatter, input_file)
+        tool = registry.get_tool(tool_name)
+        context = _build_context(formatter, tool, features)
+        params_dict = dict(params) if params else {}
+
+        metrics.reset()
+        for _ in range(repeat):
+            result = run(tool_name, context, params_dict, trace_memory=memory)
+            if not result.success:
+                formatter.error(result.error.message, result.error.code)
+                formatter.finish()
+                sys.exit(4)
+        summary = metrics.summary(tool_name)[tool_name]
+
+        if ctx.json_mode:
+            formatter.json_output(summary.model_dump())
+        else:
+            rows = [["total", *_percentile_cells(summary.duration_ms)]]
+            rows.extend(
+                [phase, *_percentile_cells(values)] for phase, values in summary.phases_ms.items()
+            )
+            formatter.table(["Phase", "p50 ms", "p90 ms", "p99 ms", "max ms"], rows)
+            formatter.info(
+                f"{summary.runs} runs; {result.profile.input_features} features "
+                f"({result.profile.input_vertices} vertices) in, "
+                f"{result.profile.output_features} features "
+                f"({result.profile.output_vertices} vertices) out"
+            )
+            if summary.peak_memory_bytes is not None:
+                formatter.info(f"Peak memory: {summary.peak_memory_bytes / 1024:.1f} KiB")
+
+        formatter.finish()
+
+    except Exception as e:
+        formatter.error(str(e), "EXECUTION_FAILED")
+        formatter.finish()
+        sys.exit(4)
+
+
+def _percentile_cells(values: dict[str, float]) -> list[str]:
+    return [f"{values.get(key, 0.0):.3f}" for key in ("p50", "p90", "p99", "max")]
+
+
+def _load_features(formatter: OutputFormatter, input_file: str) -> list[dict[str, Any]]:
+    """Load the features of a GeoJSON file, exiting if it is not GeoJSON."""
+    with open(input_file) as f:
+        data = json.load(f)
+
+    if data.get("type") == "FeatureCollection":
+        return data["features"]
+    if data.get("type") == "Feature":
+        return [data]
+    formatter.error("Input must be a GeoJSON Feature or FeatureCollection", "INVALID_INPUT")
+    formatter.finish()
+    sys.exit(2)
+
+
+def _build_context(
+    formatter: OutputFormatter, tool: Tool, features: list[dict[str, Any]]
+) -> SelectionContext:
+    """Build the selection context a tool requires, exiting if the features do not suit it."""
+    from debrief_calc.models import ContextType, SelectionContext
+
+    if tool.context_type == ContextType.SINGLE:
+        if len(features) != 1:
+            formatter.error(
+                f"Tool '{tool.name}' requires exactly 1 feature, got {len(features)}",
+                "INVALID_CONTEXT",
+            )
+            formatter.finish()
+            sys.exit(2)
+        return SelectionContext(type=ContextType.SINGLE, features=features)
+    if tool.context_type == ContextType.MULTI:
+        if len(features) < 2:
+            formatter.error(
+                f"Tool '{tool.name}' requires 2+ features, got {len(features)}",
+                "INVALID_CONTEXT",
+            )
+            formatter.finish()
+            sys.exit(2)
+        return SelectionContext(type=ContextType.MULTI, features=features)
+    if tool.context_type == ContextType.REGION:
+        # For region context, extract bounds from geometry
+        bounds = _extract_bounds(features)
+        return SelectionContext(type=ContextType.REGION, bounds=bounds)
+    return SelectionContext(type=ContextType.NONE)
+
+
 def _extract_kinds(data: dict[str, Any]) -> set[str]:
     """Extract unique kinds from GeoJSON data."""
     kinds = set()
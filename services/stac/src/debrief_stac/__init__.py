@@ -12,6 +12,7 @@ from debrief_stac.exceptions import (
     CatalogExistsError,
     CatalogNotFoundError,
     DebriefStacError,
+    FeatureNotFoundError,
     PlotNotFoundError,
     ValidationError,
 )
@@ -21,6 +22,7 @@ __all__ = [
     "DebriefStacError",
     "CatalogExistsError",
     "CatalogNotFoundError",
+    "FeatureNotFoundError",
     "PlotNotFoundError",
     "ValidationError",
 ]
@@ -6,15 +6,18 @@ with provenance tracking per Constitution Article III.
 """
 
 import mimetypes
-import shutil
 from pathlib import Path
 
+from debrief_stac.blobstore import link_file, sha256_multihash, store_blob
+from debrief_stac.locks import plot_lock
 from debrief_stac.models import AssetProvenance
-from debrief_stac.plot import _save_plot, read_plot
+from debrief_stac.plot import _load_plot, _save_plot
 from debrief_stac.types import (
     ASSET_ROLE_SOURCE,
+    STAC_EXTENSION_FILE,
     AssetPath,
     CatalogPath,
+    STACItem,
 )
 
 
@@ -27,9 +30,12 @@ def add_asset(
 ) -> str:
     """Add a source file as an asset to a plot.
 
-    Copies the source file to the plot's assets directory and records
-    it as a STAC asset with provenance metadata (source path, timestamp,
-    tool version) per Constitution Article III.
+    Stores the source file once in the catalog's content-addressed blob
+    store and links it into the plot's assets directory (reflink or
+    hardlink where the filesystem allows, otherwise a copy). The file is
+    recorded as a STAC asset with its SHA-256 checksum and provenance
+    metadata (source path, timestamp, tool version) per Constitution
+    Article III.
 
     Args:
         catalog_path: Path to the catalog directory
@@ -55,21 +61,54 @@ def add_asset(
     if not source_path.exists():
         raise FileNotFoundError(f"Source file not found: {source_path}")
 
-    # Read current plot
-    item = read_plot(catalog_path, plot_id)
-    plot_dir = catalog_path / plot_id
+    with plot_lock(catalog_path, plot_id):
+        # Read current plot
+        item = _load_plot(catalog_path, plot_id)
 
-    # Create assets directory
-    assets_dir = plot_dir / "assets"
-    assets_dir.mkdir(exist_ok=True)
+        # Store content once per catalog, then link into the assets directory
+        asset_key, blob, dest_path = _stage_asset(
+            catalog_path, item, source_path, asset_key, media_type
+        )
+        dest_path.parent.mkdir(exist_ok=True)
+        link_file(blob, dest_path)
 
+        # Save updated item
+        _save_plot(catalog_path, plot_id, item)
+
+    return asset_key
+
+
+def _stage_asset(
+    catalog_path: Path,
+    item: STACItem,
+    source_path: Path,
+    asset_key: str | None,
+    media_type: str | None,
+    digest: str | None = None,
+) -> tuple[str, Path, Path]:
+    """Store a source file in the blob store and record it in an item's assets.
+
+    Internal function shared by add_asset() and write sessions. The blob is
+    written immediately (it is immutable and content-addressed); linking it
+    into the plot's assets directory is left to the caller.
+
+    Args:
+        catalog_path: Path to the catalog directory
+        item: STAC Item dictionary (modified in place)
+        source_path: Path to the source file
+        asset_key: Optional key for the asset (defaults to "source-{filename}")
+        media_type: Optional MIME type (auto-detected if not provided)
+        digest: SHA-256 digest of the source, if already known
+
+    Returns:
+        Tuple of (asset key, blob path, destination path in the plot's assets)
+    """
     # Generate asset key if not provided
     if asset_key is None:
         asset_key = f"source-{source_path.stem}"
 
-    # Copy file to assets directory
-    dest_path = assets_dir / source_path.name
-    shutil.copy2(source_path, dest_path)
+    digest, blob = store_blob(catalog_path, source_path, digest)
+    dest_path = catalog_path / item["id"] / "assets" / source_path.name
 
     # Detect media type
     if media_type is None:
@@ -78,7 +117,7 @@ def add_asset(
             media_type = "application/octet-stream"
 
     # Create provenance metadata
-    provenance = AssetProvenance(source_path=str(source_path.absolute()))
+    provenance = AssetProvenance(source_path=str(source_path.absolute()), sha256=digest)
 
     # Create STAC asset entry
     item["assets"][asset_key] = {
@@ -86,10 +125,11 @@ def add_asset(
         "type": media_type,
         "title": source_path.name,
         "roles": [ASSET_ROLE_SOURCE],
+        "file:checksum": sha256_multihash(digest),
+        "file:size": blob.stat().st_size,
         "debrief:provenance": provenance.model_dump(mode="json"),
     }
+    if STAC_EXTENSION_FILE not in item.setdefault("stac_extensions", []):
+        item["stac_extensions"].append(STAC_EXTENSION_FILE)
 
-    # Save updated item
-    _save_plot(catalog_path, plot_id, item)
-
-    return asset_key
+    return asset_key, blob, dest_path
@@ -0,0 +1,258 @@
+"""
+Content-addressed blob store for debrief-stac.
+
+Source files added as plot assets are stored once per catalog under
+``.blobs/sha256/<xx>/<digest>``, keyed by their SHA-256 digest. Each plot's
+``assets/`` directory then receives a reflink (copy-on-write clone) or
+hardlink of the blob, falling back to a plain copy only when the
+filesystem supports neither. Importing the same recording into several
+plots therefore stores its bytes once.
+
+A small stat cache maps source paths (with size and mtime) to digests so
+re-adding an unchanged file does not need to re-hash it. New entries are
+merged into the cache file under the catalog lock, once per add_asset()
+call or per write session.
+"""
+
+import errno
+import hashlib
+import os
+import shutil
+import stat
+from pathlib import Path
+
+from debrief_stac.locks import catalog_lock
+from debrief_stac.storage import _temp_path, read_json, write_json_atomic
+from debrief_stac.types import AssetPath, CatalogPath
+
+# Catalog-relative directory holding the blob store
+BLOBS_DIR = ".blobs"
+
+# Bytes read per iteration when hashing
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# Linux FICLONE ioctl request number (_IOW(0x94, 9, int))
+_FICLONE = 0x40049409
+
+_STAT_CACHE_FILE = "stat-cache.json"
+
+LINK_REFLINK = "reflink"
+LINK_HARDLINK = "hardlink"
+LINK_COPY = "copy"
+
+
+def hash_file(path: AssetPath, chunk_size: int = HASH_CHUNK_SIZE) -> str:
+    """Compute the SHA-256 digest of a file, reading it in chunks.
+
+    Args:
+        path: Path to the file to hash
+        chunk_size: Number of bytes to read per iteration
+
+    Returns:
+        Hex-encoded SHA-256 digest
+    """
+    sha256 = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+def sha256_multihash(digest: str) -> str:
+    """Encode a hex SHA-256 digest as a multihash for ``file:checksum``."""
+    return f"1220{digest}"
+
+
+def blob_path(catalog_path: CatalogPath, digest: str) -> Path:
+    """Return the location of a blob in the catalog's blob store.
+
+    Args:
+        catalog_path: Path to the catalog directory
+        digest: Hex-encoded SHA-256 digest
+
+    Returns:
+        Path where the blob with this digest is (or would be) stored
+    """
+    return Path(catalog_path) / BLOBS_DIR / "sha256" / digest[:2] / digest
+
+
+def store_blob(
+    catalog_path: CatalogPath, source_path: AssetPath, digest: str | None = None
+) -> tuple[str, Path]:
+    """Ingest a file into the catalog's blob store.
+
+    If a blob with the same content already exists, nothing is copied.
+    Unchanged files (same path, size and mtime) are recognised from the
+    stat cache without being re-hashed.
+
+    Args:
+        catalog_path: Path to the catalog directory
+        source_path: File to ingest
+        digest: SHA-256 digest of the file, if the caller has already
+            computed it (skips hashing and the stat cache)
+
+    Returns:
+        Tuple of (hex SHA-256 digest, path to the stored blob)
+
+    Raises:
+        FileNotFoundError: If the source file doesn't exist
+    """
+    catalog_path = Path(catalog_path)
+    source_path = Path(source_path).absolute()
+
+    if digest is None:
+        stat_cache = _StatCache(catalog_path)
+        digest = stat_cache.digest(source_path)
+        stat_cache.save()
+
+    blob = blob_path(catalog_path, digest)
+    if not blob.exists():
+        blob.parent.mkdir(parents=True, exist_ok=True)
+        temp = _temp_path(blob)
+        try:
+            if link_file(source_path, temp) == LINK_HARDLINK:
+                # Never share an inode with the user's original file
+                temp.unlink()
+                shutil.copy2(source_path, temp)
+            # Blobs are immutable; hardlinks to them must not be edited in place
+            temp.chmod(stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
+            temp.replace(blob)
+        finally:
+            temp.unlink(missing_ok=True)
+
+    return digest, blob
+
+
+class _StatCache:
+    """Looks up and records source digests in a catalog's stat cache.
+
+    Internal helper shared by store_blob() and write sessions. The cache
+    file is read once, on the first lookup; digests computed on a miss are
+    kept in memory until save(), which takes the catalog lock and merges
+    them into the current file, so a batch of files costs one write and
+    concurrent writers never drop each other's entries.
+    """
+
+    def __init__(self, catalog_path: Path):
+        self.catalog_path = catalog_path
+        self._entries: dict | None = None
+        self._pending: dict = {}
+
+    def digest(self, source_path: Path) -> str:
+        """Return a file's digest from the stat cache, hashing it on a miss."""
+        source_path = source_path.absolute()
+        source_stat = source_path.stat()
+        stat_key = [source_stat.st_size, source_stat.st_mtime_ns]
+
+        if self._entries is None:
+            self._entries = _load_stat_cache(self.catalog_path)
+        cached = self._entries.get(str(source_path))
+        if cached is not None and cached.get("stat") == stat_key:
+            digest = cached["sha256"]
+            if blob_path(self.catalog_path, digest).exists():
+                return digest
+
+        digest = hash_file(source_path)
+        entry = {"stat": stat_key, "sha256": digest}
+        self._entries[str(source_path)] = entry
+        self._pending[str(source_path)] = entry
+        return digest
+
+    def save(self) -> None:
+        """Merge the digests recorded since the last save into the cache file."""
+        if not self._pending:
+            return
+        with catalog_lock(self.catalog_path):
+            cache = _load_stat_cache(self.catalog_path)
+            cache.update(self._pending)
+            _save_stat_cache(self.catalog_path, cache)
+        self._pending.clear()
+
+
+def link_file(source: Path, dest: Path) -> str:
+    """Materialise source at dest using the cheapest available method.
+
+    Tries a reflink (copy-on-write clone), then a hardlink, then a full copy.
+    An existing dest is replaced atomically.
+
+    Args:
+        source: Existing file
+        dest: Path to create
+
+    Returns:
+        The method used: "reflink", "hardlink" or "copy"
+    """
+    if dest.exists():
+        try:
+            if os.path.samefile(source, dest):
+                return LINK_HARDLINK
+        except OSError:
+            pass
+        temp = _temp_path(dest)
+        temp.unlink(missing_ok=True)
+        try:
+            method = link_file(source, temp)
+            temp.replace(dest)
+        finally:
+            temp.unlink(missing_ok=True)
+        return method
+
+    if _reflink(source, dest):
+        return LINK_REFLINK
+
+    try:
+        os.link(source, dest)
+        return LINK_HARDLINK
+    except OSError:
+        pass
+
+    shutil.copy2(source, dest)
+    return LINK_COPY
+
+
+def _reflink(source: Path, dest: Path) -> bool:
+    """Attempt a copy-on-write clone of source to dest (Linux only)."""
+    try:
+        import fcntl
+    except ImportError:
+        return False
+
+    try:
+        with open(source, "rb") as src, open(dest, "xb") as dst:
+            try:
+                fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+            except OSError as e:
+                if e.errno not in (errno.EOPNOTSUPP, errno.EXDEV, errno.EINVAL, errno.ENOTTY):
+                    raise
+                cloned = False
+            else:
+                cloned = True
+    except OSError:
+        cloned = False
+
+    if not cloned:
+        dest.unlink(missing_ok=True)
+        return False
+
+    shutil.copystat(source, dest)
+    return True
+
+
+def _stat_cache_path(catalog_path: Path) -> Path:
+    return catalog_path / BLOBS_DIR / _STAT_CACHE_FILE
+
+
+def _load_stat_cache(catalog_path: Path) -> dict:
+    """Load the source stat cache, treating a missing or corrupt file as empty."""
+    path = _stat_cache_path(catalog_path)
+    try:
+        return read_json(path)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_stat_cache(catalog_path: Path, cache: dict) -> None:
+    """Write the stat cache atomically."""
+    path = _stat_cache_path(catalog_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    write_json_atomic(path, cache, indent=None)
@@ -0,0 +1,156 @@
+"""
+In-process read cache for debrief-stac.
+
+Parsed catalog.json, item.json and FeatureCollection files are kept in a
+least-recently-used cache shared by the whole process, so long-running
+servers answer repeated reads of an unchanged plot from memory.
+
+An entry is reused only while the file's stat (mtime, size, inode) and
+its write generation are unchanged. The write generation is bumped by
+every write_json_atomic() call in this process, so our own writes are
+always seen; changes made by other processes are detected through the
+stat. The cache is bounded by the total (uncompressed) size of the
+cached files.
+
+Cached values are shared between callers and must not be modified.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from debrief_stac.storage import content_size, read_json, write_generation
+
+# Default cache budget, in bytes of cached file content
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# Files larger than this fraction of the budget are never cached
+MAX_ENTRY_FRACTION = 0.25
+
+# Nominal cost of a small derived value (e.g. a feature count)
+DERIVED_VALUE_COST = 64
+
+
+@dataclass
+class _Entry:
+    validator: tuple[int, int, int, int]
+    value: Any
+    cost: int
+
+
+class ReadCache:
+    """Thread-safe LRU cache of values derived from files.
+
+    Values are keyed by file path and a tag naming the derivation (for
+    example "json" for the parsed file, "count" for a feature count).
+
+    Attributes:
+        max_bytes: Total cost budget of cached entries
+        hits: Number of lookups answered from the cache
+        misses: Number of lookups that loaded the file
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple[str, str], _Entry] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        """Total cost of the cached entries."""
+        return self._size
+
+    def fits(self, nbytes: int) -> bool:
+        """Return True if a file of this size may be cached."""
+        return nbytes <= self.max_bytes * MAX_ENTRY_FRACTION
+
+    def get(
+        self,
+        path: Path,
+        loader: Callable[[Path], Any] = read_json,
+        tag: str = "json",
+        cost: int | None = None,
+    ) -> Any:
+        """Return the value derived from a file, loading it on a miss.
+
+        Args:
+            path: File to read
+            loader: Function deriving the value from the file
+            tag: Name of the derivation, distinguishing values of one file
+            cost: Budget charged for the entry (defaults to the file's
+                estimated uncompressed size)
+
+        Returns:
+            The cached or freshly loaded value
+
+        Raises:
+            FileNotFoundError: If the file doesn't exist
+        """
+        key = (os.path.abspath(path), tag)
+        st = os.stat(path)
+        validator = (st.st_mtime_ns, st.st_size, st.st_ino, write_generation(path))
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.validator == validator:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry.value
+            self.misses += 1
+
+        value = loader(path)
+        if cost is None:
+            cost = content_size(path, st.st_size)
+        if self.fits(cost):
+            self._put(key, _Entry(validator, value, cost))
+        return value
+
+    def clear(self) -> None:
+        """Drop all cached entries and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+            self.hits = 0
+            self.misses = 0
+
+    def _put(self, key: tuple[str, str], entry: _Entry) -> None:
+        """Insert an entry, evicting least-recently-used entries over budget."""
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= previous.cost
+            self._entries[key] = entry
+            self._size += entry.cost
+            while self._size > self.max_bytes and self._entries:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= evicted.cost
+
+
+_cache = ReadCache()
+
+
+def get_cache() -> ReadCache:
+    """Return the process-wide read cache."""
+    return _cache
+
+
+def read_json_cached(path: Path) -> Any:
+    """Read and parse a JSON file through the process-wide cache.
+
+    Args:
+        path: File to read
+
+    Returns:
+        The parsed JSON data, shared with other callers (do not modify)
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+    """
+    return _cache.get(path)
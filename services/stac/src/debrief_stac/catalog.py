@@ -4,35 +4,84 @@ STAC Catalog operations for debrief-stac.
 This module provides functions for creating and managing local STAC catalogs.
 """
 
-import json
+import contextlib
+import hashlib
+import os
+from collections.abc import Iterator
 from datetime import datetime
 from pathlib import Path
 
+from debrief_stac.cache import DERIVED_VALUE_COST, get_cache, read_json_cached
 from debrief_stac.exceptions import CatalogExistsError, CatalogNotFoundError
+from debrief_stac.locks import catalog_lock
 from debrief_stac.models import PlotSummary
+from debrief_stac.storage import (
+    COMPRESSION_NONE,
+    check_compression,
+    read_json,
+    write_json_atomic,
+)
 from debrief_stac.types import (
+    MEDIA_TYPE_JSON,
     STAC_VERSION,
     CatalogPath,
     STACCatalog,
+    STACItem,
 )
 
+# Catalog layouts: item links directly in catalog.json, or in hash-prefix sub-catalogs
+LAYOUT_FLAT = "flat"
+LAYOUT_SHARDED = "sharded"
+
+# Directory holding sub-catalogs of a sharded catalog
+SHARDS_DIR = "shards"
+
+# Number of hex digits of the plot ID hash used as the shard key (16**2 shards)
+SHARD_PREFIX_LENGTH = 2
+
 
 def create_catalog(
     path: CatalogPath,
     catalog_id: str | None = None,
     title: str | None = None,
     description: str = "Debrief analysis catalog",
+    layout: str = LAYOUT_FLAT,
+    compression: str = COMPRESSION_NONE,
+    compression_level: int | None = None,
+    thumbnails: bool = False,
+    chunk_size: int | None = None,
 ) -> Path:
     """Create a new local STAC catalog at the specified path.
 
     Creates the directory structure and a valid catalog.json file
     with the correct STAC specification version.
 
+    With the sharded layout, item links are kept in sub-catalogs
+    (``shards/<xx>/catalog.json``) keyed by a hash prefix of the plot ID,
+    so catalog.json stays small and plot creation only rewrites one small
+    sub-catalog, however large the store grows.
+
+    With compression set to "gzip" or "zstd", plot FeatureCollections are
+    stored compressed (``features.geojson.gz`` / ``features.geojson.zst``).
+
+    With thumbnails enabled, each plot's track overview is also rendered
+    to a small PNG thumbnail asset.
+
+    With a chunk size, plot FeatureCollections are stored as chunks of at
+    most that many features (``features/chunks.json``), so a single
+    feature can be updated or removed by rewriting only its chunk.
+
     Args:
         path: Directory path where the catalog will be created
         catalog_id: Unique identifier for the catalog (defaults to directory name)
         title: Human-readable title for the catalog (optional, for display)
         description: Human-readable description of the catalog
+        layout: "flat" (item links in catalog.json) or "sharded"
+        compression: Feature storage codec: "none", "gzip" or "zstd"
+        compression_level: Codec compression level (codec default if None)
+        thumbnails: Render a PNG thumbnail of each plot's tracks
+        chunk_size: Features per chunk, or None to store each plot's
+            FeatureCollection as a single file
 
     Returns:
         Path to the created catalog directory
@@ -40,6 +89,8 @@ def create_catalog(
     Raises:
         CatalogExistsError: If a catalog already exists at the path
         PermissionError: If the path is not writable
+        ValueError: If the layout, compression or chunk size is not valid
+        ImportError: If the compression codec is not installed
 
     Example:
         >>> catalog_path = create_catalog("/data/analysis", title="My Analysis Store")
@@ -47,6 +98,11 @@ def create_catalog(
     """
     catalog_path = Path(path)
 
+    if layout not in (LAYOUT_FLAT, LAYOUT_SHARDED):
+        raise ValueError(f"Unknown catalog layout: {layout}")
+    check_compression(compression)
+    _check_chunk_size(chunk_size)
+
     # Check if catalog already exists
     catalog_json_path = catalog_path / "catalog.json"
     if catalog_json_path.exists():
@@ -75,9 +131,20 @@ def create_catalog(
     if title:
         catalog_data["title"] = title
 
+    if layout != LAYOUT_FLAT:
+        catalog_data["debrief:layout"] = layout
+
+    if compression != COMPRESSION_NONE:
+        catalog_data["debrief:storage"] = _storage_options(compression, compression_level)
+
+    if thumbnails:
+        catalog_data["debrief:thumbnails"] = True
+
+    if chunk_size is not None:
+        catalog_data["debrief:chunk_size"] = chunk_size
+
     # Write catalog.json
-    with open(catalog_json_path, "w") as f:
-        json.dump(catalog_data, f, indent=2)
+    write_json_atomic(catalog_json_path, catalog_data)
 
     return catalog_path
 
@@ -88,6 +155,10 @@ def open_catalog(path: CatalogPath) -> STACCatalog:
     Args:
         path: Path to the catalog directory
 
+    The result is served from the process-wide read cache while
+    catalog.json is unchanged, and is shared with other callers: copy it
+    before modifying it.
+
     Returns:
         Dictionary containing the parsed catalog.json data
 
@@ -99,15 +170,30 @@ def open_catalog(path: CatalogPath) -> STACCatalog:
         >>> print(f"Opened catalog: {catalog['id']}")
     """
     catalog_path = Path(path)
+
+    try:
+        catalog_data: STACCatalog = read_json_cached(catalog_path / "catalog.json")
+    except FileNotFoundError:
+        raise CatalogNotFoundError(str(catalog_path)) from None
+
+    return catalog_data
+
+
+def _load_catalog(path: CatalogPath) -> STACCatalog:
+    """Read catalog.json from disk, bypassing the read cache.
+
+    Internal function for callers that modify the returned data.
+
+    Raises:
+        CatalogNotFoundError: If no catalog exists at the path
+    """
+    catalog_path = Path(path)
     catalog_json_path = catalog_path / "catalog.json"
 
     if not catalog_json_path.exists():
         raise CatalogNotFoundError(str(catalog_path))
 
-    with open(catalog_json_path) as f:
-        catalog_data: STACCatalog = json.load(f)
-
-    return catalog_data
+    return read_json(catalog_json_path)
 
 
 def _save_catalog(path: CatalogPath, catalog_data: STACCatalog) -> None:
@@ -122,28 +208,358 @@ def _save_catalog(path: CatalogPath, catalog_data: STACCatalog) -> None:
     catalog_path = Path(path)
     catalog_json_path = catalog_path / "catalog.json"
 
-    with open(catalog_json_path, "w") as f:
-        json.dump(catalog_data, f, indent=2)
+    write_json_atomic(catalog_json_path, catalog_data)
+
+
+def set_feature_compression(
+    path: CatalogPath, compression: str, compression_level: int | None = None
+) -> None:
+    """Change how a catalog stores plot FeatureCollections.
+
+    Applies to FeatureCollections written from now on; each existing plot
+    is converted the next time features are added to it.
+
+    Args:
+        path: Path to the catalog directory
+        compression: Feature storage codec: "none", "gzip" or "zstd"
+        compression_level: Codec compression level (codec default if None)
+
+    Raises:
+        CatalogNotFoundError: If no catalog exists at the path
+        ValueError: If the compression is not recognised
+        ImportError: If the compression codec is not installed
+
+    Example:
+        >>> set_feature_compression("/data/analysis", "zstd", compression_level=9)
+    """
+    check_compression(compression)
+    with catalog_lock(path):
+        catalog_data = _load_catalog(path)
+        if compression == COMPRESSION_NONE:
+            catalog_data.pop("debrief:storage", None)
+        else:
+            catalog_data["debrief:storage"] = _storage_options(compression, compression_level)
+        _save_catalog(path, catalog_data)
+
+
+def feature_storage(catalog_data: STACCatalog) -> tuple[str, int | None]:
+    """Return a catalog's feature compression codec and level.
+
+    Args:
+        catalog_data: Parsed catalog.json data
+
+    Returns:
+        Tuple of (compression codec, level or None for the codec default)
+    """
+    storage = catalog_data.get("debrief:storage", {})
+    return storage.get("compression", COMPRESSION_NONE), storage.get("level")
+
+
+def set_thumbnails(path: CatalogPath, enabled: bool) -> None:
+    """Enable or disable PNG thumbnails for a catalog's plots.
+
+    Applies to plots whose features change from now on.
+
+    Args:
+        path: Path to the catalog directory
+        enabled: Whether to render thumbnails
+
+    Raises:
+        CatalogNotFoundError: If no catalog exists at the path
+    """
+    with catalog_lock(path):
+        catalog_data = _load_catalog(path)
+        if enabled:
+            catalog_data["debrief:thumbnails"] = True
+        else:
+            catalog_data.pop("debrief:thumbnails", None)
+        _save_catalog(path, catalog_data)
+
+
+def thumbnails_enabled(catalog_data: STACCatalog) -> bool:
+    """Return whether a catalog renders PNG thumbnails of its plots.
+
+    Args:
+        catalog_data: Parsed catalog.json data
+    """
+    return bool(catalog_data.get("debrief:thumbnails", False))
+
+
+def set_feature_chunking(path: CatalogPath, chunk_size: int | None) -> None:
+    """Change whether a catalog stores plot FeatureCollections in chunks.
+
+    Applies to FeatureCollections written from now on; each existing plot
+    is converted the next time its features change.
+
+    Args:
+        path: Path to the catalog directory
+        chunk_size: Features per chunk, or None to store single files
+
+    Raises:
+        CatalogNotFoundError: If no catalog exists at the path
+        ValueError: If the chunk size is not a positive integer
 
+    Example:
+        >>> set_feature_chunking("/data/analysis", 500)
+    """
+    _check_chunk_size(chunk_size)
+    with catalog_lock(path):
+        catalog_data = _load_catalog(path)
+        if chunk_size is None:
+            catalog_data.pop("debrief:chunk_size", None)
+        else:
+            catalog_data["debrief:chunk_size"] = chunk_size
+        _save_catalog(path, catalog_data)
 
-def _add_item_link(catalog_data: STACCatalog, item_id: str, item_href: str) -> None:
-    """Add a link to a STAC Item in the catalog.
 
-    Internal function used when creating plots.
+def feature_chunk_size(catalog_data: STACCatalog) -> int | None:
+    """Return a catalog's features per chunk, or None if it stores single files.
 
     Args:
-        catalog_data: Catalog data dictionary (modified in place)
-        item_id: ID of the item being linked
-        item_href: Relative path to the item
+        catalog_data: Parsed catalog.json data
     """
-    # Check if link already exists
-    for link in catalog_data["links"]:
-        if link.get("rel") == "item" and link.get("href") == item_href:
-            return  # Already exists
+    return catalog_data.get("debrief:chunk_size")
+
+
+def _check_chunk_size(chunk_size: int | None) -> None:
+    if chunk_size is not None and (not isinstance(chunk_size, int) or chunk_size < 1):
+        raise ValueError(f"Chunk size must be a positive integer, got {chunk_size!r}")
+
+
+def _storage_options(compression: str, level: int | None) -> dict:
+    options: dict = {"compression": compression}
+    if level is not None:
+        options["level"] = level
+    return options
 
-    catalog_data["links"].append(
-        {"rel": "item", "href": item_href, "type": "application/geo+json", "title": item_id}
-    )
+
+def _catalog_layout(catalog_data: STACCatalog) -> str:
+    """Return the link layout of a catalog ("flat" for catalogs without one)."""
+    return catalog_data.get("debrief:layout", LAYOUT_FLAT)
+
+
+def _shard_key(plot_id: str) -> str:
+    """Return the shard a plot's item link belongs to in a sharded catalog."""
+    return hashlib.sha1(plot_id.encode("utf-8")).hexdigest()[:SHARD_PREFIX_LENGTH]
+
+
+class _CatalogLinks:
+    """Loads and updates the catalog files that hold item links.
+
+    Internal helper shared by create_plot() and write sessions. For a flat
+    catalog only catalog.json is involved; for a sharded catalog each plot's
+    link goes into its shard's sub-catalog, and catalog.json only changes
+    when a new shard is created. Membership checks use a set of linked
+    hrefs per catalog file, so linking is O(1) once a file is loaded.
+
+    Link changes are recorded as well as applied. save() takes the catalog
+    lock and, if another writer has replaced any file loaded here in the
+    meantime, replays them onto the current files before writing, so
+    concurrent writers never drop each other's links.
+    """
+
+    def __init__(self, catalog_path: CatalogPath):
+        self.catalog_path = Path(catalog_path)
+        self._stamps: dict[str, tuple[int, int] | None] = {}
+        self.root = self._read("", self.catalog_path / "catalog.json")
+        self.layout = _catalog_layout(self.root)
+        self._shards: dict[str, STACCatalog] = {}
+        self._members: dict[str, set[str]] = {}
+        self._dirty: set[str] = set()
+        self._changes: list[tuple[str, str]] = []
+
+    def add_item(self, plot_id: str) -> str:
+        """Link a plot's item and return the item's parent href.
+
+        Args:
+            plot_id: ID of the plot being linked
+
+        Returns:
+            Href of the catalog holding the link, relative to the plot directory
+        """
+        self._changes.append(("add", plot_id))
+        if self.layout == LAYOUT_FLAT:
+            self._link("", self.root, plot_id, f"./{plot_id}/item.json")
+            return "../catalog.json"
+
+        shard = _shard_key(plot_id)
+        self._link(shard, self._load_shard(shard), plot_id, f"../../{plot_id}/item.json")
+        return f"../{SHARDS_DIR}/{shard}/catalog.json"
+
+    def _link(self, key: str, catalog_data: STACCatalog, plot_id: str, item_href: str) -> None:
+        """Append an item link unless present, using a cached set of linked hrefs."""
+        members = self._members.get(key)
+        if members is None:
+            members = {
+                link.get("href") for link in catalog_data["links"] if link.get("rel") == "item"
+            }
+            self._members[key] = members
+        if item_href in members:
+            return
+
+        catalog_data["links"].append(
+            {"rel": "item", "href": item_href, "type": "application/geo+json", "title": plot_id}
+        )
+        members.add(item_href)
+        self._dirty.add(key)
+
+    def remove_item(self, plot_id: str) -> bool:
+        """Remove every item link pointing at a plot's item.json.
+
+        Args:
+            plot_id: ID of the plot being unlinked
+
+        Returns:
+            True if any link was removed
+        """
+        self._changes.append(("remove", plot_id))
+        target = os.path.normpath(self.catalog_path / plot_id / "item.json")
+        holders = [("", self.root, self.catalog_path)]
+        if self.layout != LAYOUT_FLAT:
+            shard = _shard_key(plot_id)
+            shard_json = self.catalog_path / SHARDS_DIR / shard / "catalog.json"
+            if shard in self._shards or shard_json.exists():
+                shard_dir = self.catalog_path / SHARDS_DIR / shard
+                holders.append((shard, self._load_shard(shard), shard_dir))
+
+        removed = False
+        for key, catalog_data, base in holders:
+            kept = [
+                link
+                for link in catalog_data["links"]
+                if link.get("rel") != "item"
+                or os.path.normpath(base / link.get("href", "")) != target
+            ]
+            if len(kept) != len(catalog_data["links"]):
+                catalog_data["links"] = kept
+                self._members.pop(key, None)
+                self._dirty.add(key)
+                removed = True
+        return removed
+
+    def save(self) -> None:
+        """Write modified sub-catalogs, then catalog.json if it changed."""
+        if not self._dirty:
+            self._changes.clear()
+            return
+
+        with catalog_lock(self.catalog_path):
+            links = self if not self._stale() else self._replay()
+            for shard in sorted(links._dirty - {""}):
+                shard_dir = self.catalog_path / SHARDS_DIR / shard
+                shard_dir.mkdir(parents=True, exist_ok=True)
+                links._write(shard, shard_dir / "catalog.json", links._shards[shard])
+            if "" in links._dirty:
+                links._write("", self.catalog_path / "catalog.json", links.root)
+
+        if links is not self:
+            self.root, self._shards, self._members = links.root, links._shards, links._members
+            self._stamps = links._stamps
+        self._dirty.clear()
+        self._changes.clear()
+
+    def _stale(self) -> bool:
+        """Return True if a file loaded here has since been replaced on disk."""
+        for key, stamp in self._stamps.items():
+            shard_dir = self.catalog_path / SHARDS_DIR / key if key else self.catalog_path
+            if _stamp(shard_dir / "catalog.json") != stamp:
+                return True
+        return False
+
+    def _replay(self) -> "_CatalogLinks":
+        """Apply this object's link changes to freshly loaded catalog files."""
+        links = _CatalogLinks(self.catalog_path)
+        for change, plot_id in self._changes:
+            if change == "add":
+                links.add_item(plot_id)
+            else:
+                links.remove_item(plot_id)
+        return links
+
+    def _read(self, key: str, path: Path) -> STACCatalog:
+        """Read a catalog file from disk, recording its stamp."""
+        stamp = _stamp(path)
+        if stamp is None and key == "":
+            raise CatalogNotFoundError(str(self.catalog_path))
+        self._stamps[key] = stamp
+        return read_json(path)
+
+    def _write(self, key: str, path: Path, catalog_data: STACCatalog) -> None:
+        write_json_atomic(path, catalog_data)
+        self._stamps[key] = _stamp(path)
+
+    def _load_shard(self, shard: str) -> STACCatalog:
+        """Load a shard sub-catalog, creating (and linking) it if needed."""
+        if shard in self._shards:
+            return self._shards[shard]
+
+        shard_json = self.catalog_path / SHARDS_DIR / shard / "catalog.json"
+        if shard_json.exists():
+            shard_data = self._read(shard, shard_json)
+        else:
+            self._stamps[shard] = None
+            shard_data = {
+                "type": "Catalog",
+                "stac_version": STAC_VERSION,
+                "id": f"{self.root['id']}-{shard}",
+                "description": f"Plots with ID hash prefix {shard}",
+                "links": [
+                    {"rel": "root", "href": "../../catalog.json", "type": MEDIA_TYPE_JSON},
+                    {"rel": "parent", "href": "../../catalog.json", "type": MEDIA_TYPE_JSON},
+                    {"rel": "self", "href": "./catalog.json", "type": MEDIA_TYPE_JSON},
+                ],
+            }
+            child_href = f"./{SHARDS_DIR}/{shard}/catalog.json"
+            if not any(link.get("href") == child_href for link in self.root["links"]):
+                self.root["links"].append(
+                    {"rel": "child", "href": child_href, "type": MEDIA_TYPE_JSON}
+                )
+                self._dirty.add("")
+
+        self._shards[shard] = shard_data
+        return shard_data
+
+
+def _stamp(path: Path) -> tuple[int, int] | None:
+    """Identify a file version; atomic replacement always changes the inode."""
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return st.st_ino, st.st_mtime_ns
+
+
+def iter_item_paths(path: CatalogPath, catalog_data: STACCatalog | None = None) -> Iterator[Path]:
+    """Yield the item.json path of every plot linked from a catalog.
+
+    Follows child links into sub-catalogs, so flat and sharded catalogs
+    are handled alike.
+
+    Args:
+        path: Path to the catalog directory
+        catalog_data: Already-loaded catalog.json data (read from disk if omitted)
+
+    Yields:
+        Path to each linked item.json (which may not exist if the link is stale)
+
+    Raises:
+        CatalogNotFoundError: If no catalog exists at the path
+    """
+    catalog_path = Path(path)
+    if catalog_data is None:
+        catalog_data = open_catalog(catalog_path)
+    yield from _iter_item_paths(catalog_path / "catalog.json", catalog_data)
+
+
+def _iter_item_paths(catalog_json: Path, catalog_data: STACCatalog) -> Iterator[Path]:
+    for link in catalog_data.get("links", []):
+        rel = link.get("rel")
+        if rel == "item":
+            yield Path(os.path.normpath(catalog_json.parent / link.get("href", "")))
+        elif rel == "child":
+            child_json = Path(os.path.normpath(catalog_json.parent / link.get("href", "")))
+            if child_json.exists():
+                yield from _iter_item_paths(child_json, read_json_cached(child_json))
 
 
 def list_plots(path: CatalogPath) -> list[PlotSummary]:
@@ -170,21 +586,12 @@ def list_plots(path: CatalogPath) -> list[PlotSummary]:
 
     summaries: list[PlotSummary] = []
 
-    # Find all item links
-    for link in catalog_data.get("links", []):
-        if link.get("rel") != "item":
+    for item_path in iter_item_paths(catalog_path, catalog_data):
+        try:
+            item_data = read_json_cached(item_path)
+        except FileNotFoundError:
             continue
 
-        # Load the item
-        item_href = link.get("href", "")
-        item_path = catalog_path / item_href
-
-        if not item_path.exists():
-            continue
-
-        with open(item_path) as f:
-            item_data = json.load(f)
-
         # Extract summary info
         properties = item_data.get("properties", {})
         dt_str = properties.get("datetime")
@@ -192,21 +599,11 @@ def list_plots(path: CatalogPath) -> list[PlotSummary]:
         # Parse datetime
         dt = datetime.fromisoformat(dt_str.replace("Z", "+00:00")) if dt_str else datetime.now()
 
-        # Count features if available
-        feature_count = 0
-        if "features" in item_data.get("assets", {}):
-            features_href = item_data["assets"]["features"].get("href", "")
-            features_path = item_path.parent / features_href
-            if features_path.exists():
-                with open(features_path) as f:
-                    fc = json.load(f)
-                    feature_count = len(fc.get("features", []))
-
         summary = PlotSummary(
             id=item_data.get("id", ""),
             title=properties.get("title", "Untitled"),
             timestamp=dt,
-            feature_count=feature_count,
+            feature_count=_feature_count(item_path.parent, _features_href(item_data)),
         )
         summaries.append(summary)
 
@@ -214,3 +611,23 @@ def list_plots(path: CatalogPath) -> list[PlotSummary]:
     summaries.sort(key=lambda s: s.timestamp, reverse=True)
 
     return summaries
+
+
+def _features_href(item_data: STACItem) -> str | None:
+    """Return the href of a plot's FeatureCollection asset, if it has one."""
+    asset = item_data.get("assets", {}).get("features")
+    return asset.get("href", "") if asset else None
+
+
+def _feature_count(plot_dir: Path, features_href: str | None) -> int:
+    """Count a plot's features, cached while its FeatureCollection is unchanged."""
+    # Deferred import: reader depends on plot, which depends on this module
+    from debrief_stac.reader import count_features
+
+    if features_href is None:
+        return 0
+    with contextlib.suppress(FileNotFoundError):
+        return get_cache().get(
+            plot_dir / features_href, count_features, tag="count", cost=DERIVED_VALUE_COST
+        )
+    return 0
@@ -0,0 +1,229 @@
+"""
+Chunked FeatureCollection storage for debrief-stac.
+
+When a catalog has a chunk size (``create_catalog(..., chunk_size=N)``),
+each plot's features are stored as a series of small FeatureCollections
+in ``features/`` rather than one ``features.geojson``. A manifest,
+``features/chunks.json``, lists the chunks in order with their feature
+counts and bboxes, and maps feature IDs to the chunk holding them, so
+updating or removing one feature rewrites only that chunk and the
+manifest. Appending rewrites only the last, partly filled chunk.
+
+Chunk files are never modified in place: a changed chunk is written
+under a new name, the manifest is replaced atomically to point at it,
+and only then is the old file deleted, so the manifest always names a
+complete set of chunks. Chunks are compressed with the catalog's
+feature compression setting.
+"""
+
+from collections.abc import Collection, Sequence
+from pathlib import Path
+from typing import Any
+
+from debrief_stac.cache import read_json_cached
+from debrief_stac.storage import COMPRESSION_SUFFIXES, read_json, write_json_atomic
+from debrief_stac.types import BoundingBox, GeoJSONFeature
+
+# Plot-relative directory holding the chunks, and the manifest within it
+CHUNKS_DIR = "features"
+CHUNK_MANIFEST = "chunks.json"
+
+
+def is_chunked(features_path: Path) -> bool:
+    """Return whether a plot's features asset path is a chunk manifest."""
+    return features_path.name == CHUNK_MANIFEST
+
+
+def feature_files(features_path: Path, feature_ids: Collection[str] | None = None) -> list[Path]:
+    """Return the FeatureCollection files holding a plot's features, in order.
+
+    Args:
+        features_path: Path of the plot's features asset (a FeatureCollection
+            file or a chunk manifest)
+        feature_ids: If given, only the chunks holding these feature IDs
+            are needed
+
+    Returns:
+        The file itself, or the chunk files listed in the manifest
+    """
+    if not is_chunked(features_path):
+        return [features_path]
+    manifest = read_json_cached(features_path)
+    chunks = manifest["chunks"]
+    if feature_ids is not None:
+        wanted = {manifest["ids"].get(str(i)) for i in feature_ids}
+        chunks = [chunk for chunk in chunks if chunk["id"] in wanted]
+    return [features_path.parent / chunk["href"] for chunk in chunks]
+
+
+def manifest_count(manifest: dict[str, Any]) -> int:
+    """Return the total number of features in a chunk manifest."""
+    return sum(chunk["count"] for chunk in manifest["chunks"])
+
+
+def manifest_bbox(manifest: dict[str, Any]) -> BoundingBox | None:
+    """Return the bbox of all chunks in a manifest, or None if none has geometry."""
+    boxes = [chunk["bbox"] for chunk in manifest["chunks"] if chunk.get("bbox")]
+    if not boxes:
+        return None
+    return (
+        min(b[0] for b in boxes),
+        min(b[1] for b in boxes),
+        max(b[2] for b in boxes),
+        max(b[3] for b in boxes),
+    )
+
+
+def _write_chunks(
+    manifest_path: Path,
+    features: Sequence[GeoJSONFeature],
+    chunk_size: int,
+    compression: str,
+    level: int | None = None,
+) -> dict[str, Any]:
+    """Store features as a fresh set of chunks, replacing any existing ones.
+
+    Returns:
+        The new manifest
+    """
+    old = read_json(manifest_path) if manifest_path.exists() else None
+    manifest: dict[str, Any] = {
+        "chunk_size": chunk_size,
+        "revision": old["revision"] + 1 if old else 1,
+        "next_chunk": 0,
+        "chunks": [],
+        "ids": {},
+    }
+    manifest_path.parent.mkdir(exist_ok=True)
+    for start in range(0, len(features), chunk_size):
+        chunk = _new_chunk(manifest)
+        batch = features[start : start + chunk_size]
+        _fill_chunk(manifest_path.parent, manifest, chunk, batch, compression, level)
+
+    superseded = [manifest_path.parent / c["href"] for c in old["chunks"]] if old else []
+    _save_manifest(manifest_path, manifest, superseded)
+    return manifest
+
+
+def _append_chunks(
+    manifest_path: Path,
+    features: Sequence[GeoJSONFeature],
+    chunk_size: int,
+    compression: str,
+    level: int | None = None,
+) -> dict[str, Any]:
+    """Append features, topping up the last chunk and adding new ones as needed.
+
+    Returns:
+        The updated manifest
+    """
+    manifest = read_json(manifest_path)
+    manifest["revision"] += 1
+    chunks_dir = manifest_path.parent
+    superseded = []
+
+    remaining = list(features)
+    if manifest["chunks"] and remaining:
+        last = manifest["chunks"][-1]
+        room = chunk_size - last["count"]
+        if room > 0:
+            last_path = chunks_dir / last["href"]
+            existing = read_json(last_path)["features"]
+            _fill_chunk(chunks_dir, manifest, last, existing + remaining[:room], compression, level)
+            superseded.append(last_path)
+            remaining = remaining[room:]
+
+    for start in range(0, len(remaining), chunk_size):
+        chunk = _new_chunk(manifest)
+        batch = remaining[start : start + chunk_size]
+        _fill_chunk(chunks_dir, manifest, chunk, batch, compression, level)
+
+    _save_manifest(manifest_path, manifest, superseded)
+    return manifest
+
+
+def _edit_chunk(
+    manifest_path: Path,
+    feature_id: str | int,
+    replacement: GeoJSONFeature | None,
+    compression: str,
+    level: int | None = None,
+) -> tuple[GeoJSONFeature | None, dict[str, Any]]:
+    """Replace or remove one feature, rewriting only the chunk that holds it.
+
+    Args:
+        manifest_path: Path to the chunk manifest
+        feature_id: ID of the feature to change
+        replacement: New feature, or None to remove it
+        compression: Codec for the rewritten chunk
+        level: Compression level (codec default if None)
+
+    Returns:
+        Tuple of (previous feature or None if the ID was not found, manifest)
+    """
+    manifest = read_json(manifest_path)
+    key = str(feature_id)
+    chunk_id = manifest["ids"].get(key)
+    chunk = next((c for c in manifest["chunks"] if c["id"] == chunk_id), None)
+    if chunk is None:
+        return None, manifest
+
+    chunk_path = manifest_path.parent / chunk["href"]
+    features = read_json(chunk_path)["features"]
+    index = next((i for i, f in enumerate(features) if str(f.get("id")) == key), None)
+    if index is None:
+        return None, manifest
+
+    manifest["revision"] += 1
+    previous = features[index]
+    if replacement is None:
+        del features[index]
+        del manifest["ids"][key]
+    else:
+        features[index] = replacement
+
+    if features:
+        _fill_chunk(manifest_path.parent, manifest, chunk, features, compression, level)
+    else:
+        manifest["chunks"].remove(chunk)
+    _save_manifest(manifest_path, manifest, [chunk_path])
+    return previous, manifest
+
+
+def _new_chunk(manifest: dict[str, Any]) -> dict[str, Any]:
+    chunk = {"id": manifest["next_chunk"]}
+    manifest["next_chunk"] += 1
+    manifest["chunks"].append(chunk)
+    return chunk
+
+
+def _fill_chunk(
+    chunks_dir: Path,
+    manifest: dict[str, Any],
+    chunk: dict[str, Any],
+    features: Sequence[GeoJSONFeature],
+    compression: str,
+    level: int | None,
+) -> None:
+    """Write a chunk's features under a new file name and update its manifest entry."""
+    # Deferred import: features depends on this module
+    from debrief_stac.features import _calculate_bbox
+
+    features = list(features)
+    href = f"{chunk['id']:05d}.{manifest['revision']}.geojson"
+    href += COMPRESSION_SUFFIXES.get(compression, "")
+    fc = {"type": "FeatureCollection", "features": features}
+    write_json_atomic(chunks_dir / href, fc, indent=None, level=level)
+
+    bbox = _calculate_bbox(features)
+    chunk.update(href=href, count=len(features), bbox=list(bbox) if bbox else None)
+    for feature in features:
+        if feature.get("id") is not None:
+            manifest["ids"][str(feature["id"])] = chunk["id"]
+
+
+def _save_manifest(manifest_path: Path, manifest: dict[str, Any], superseded: list[Path]) -> None:
+    """Write the manifest, then delete the chunk files it no longer names."""
+    write_json_atomic(manifest_path, manifest, indent=None)
+    for path in superseded:
+        path.unlink(missing_ok=True)
@@ -10,15 +10,20 @@ import sys
 from typing import Any
 
 from debrief_stac.assets import add_asset
-from debrief_stac.catalog import create_catalog, list_plots
+from debrief_stac.catalog import LAYOUT_FLAT, create_catalog
 from debrief_stac.exceptions import (
     CatalogExistsError,
     CatalogNotFoundError,
+    FeatureNotFoundError,
     PlotNotFoundError,
 )
-from debrief_stac.features import add_features
+from debrief_stac.features import add_features, remove_feature, update_feature
+from debrief_stac.index import DEFAULT_SORT, list_plots_page
 from debrief_stac.models import PlotMetadata
 from debrief_stac.plot import create_plot
+from debrief_stac.reader import read_features
+from debrief_stac.storage import COMPRESSION_NONE
+from debrief_stac.tiles import DEFAULT_MAX_ZOOM, generate_tiles
 
 # Configured store paths (set by configure method)
 _configured_stores: list[str] = []
@@ -42,17 +47,38 @@ def handle_configure(params: dict[str, Any]) -> dict[str, Any]:
 def handle_list_plots(params: dict[str, Any]) -> dict[str, Any]:
     """Handle list_plots method.
 
+    Served from the catalog's plot index, one page at a time. Omit "limit"
+    to list every plot.
+
     Args:
-        params: {"store_path": str}
+        params: {
+            "store_path": str,
+            "limit": int | None,
+            "cursor": str | None,
+            "sort": "datetime" | "title" | "id", "-" prefix for descending
+                    (default "-datetime"),
+            "title": str | None,
+            "since": str | None,
+            "until": str | None
+        }
 
     Returns:
-        {"plots": [...]}
+        {"plots": [...], "next_cursor": str | None}
     """
     store_path = params.get("store_path")
     if not store_path:
         raise ValueError("Missing required parameter: store_path")
 
-    plots = list_plots(store_path)
+    page = list_plots_page(
+        store_path,
+        limit=params.get("limit"),
+        cursor=params.get("cursor"),
+        sort=params.get("sort", DEFAULT_SORT),
+        title=params.get("title"),
+        since=params.get("since"),
+        until=params.get("until"),
+    )
+    plots = page.plots
 
     return {
         "plots": [
@@ -65,7 +91,8 @@ def handle_list_plots(params: dict[str, Any]) -> dict[str, Any]:
                 "feature_count": p.feature_count,
             }
             for p in plots
-        ]
+        ],
+        "next_cursor": page.next_cursor,
     }
 
 
@@ -143,6 +170,130 @@ def handle_add_features(params: dict[str, Any]) -> dict[str, Any]:
     }
 
 
+def handle_update_feature(params: dict[str, Any]) -> dict[str, Any]:
+    """Handle update_feature method.
+
+    Args:
+        params: {"store_path": str, "plot_id": str, "feature": dict}
+
+    Returns:
+        {"plot_id": str, "feature_id": str | int, "updated": bool}
+    """
+    store_path = params.get("store_path")
+    plot_id = params.get("plot_id")
+    feature = params.get("feature")
+
+    if not store_path:
+        raise ValueError("Missing required parameter: store_path")
+    if not plot_id:
+        raise ValueError("Missing required parameter: plot_id")
+    if not feature:
+        raise ValueError("Missing required parameter: feature")
+
+    update_feature(store_path, plot_id, feature)
+
+    return {"plot_id": plot_id, "feature_id": feature["id"], "updated": True}
+
+
+def handle_remove_feature(params: dict[str, Any]) -> dict[str, Any]:
+    """Handle remove_feature method.
+
+    Args:
+        params: {"store_path": str, "plot_id": str, "feature_id": str | int}
+
+    Returns:
+        {"plot_id": str, "feature_id": str | int, "feature_count": int}
+    """
+    store_path = params.get("store_path")
+    plot_id = params.get("plot_id")
+    feature_id = params.get("feature_id")
+
+    if not store_path:
+        raise ValueError("Missing required parameter: store_path")
+    if not plot_id:
+        raise ValueError("Missing required parameter: plot_id")
+    if feature_id is None:
+        raise ValueError("Missing required parameter: feature_id")
+
+    count = remove_feature(store_path, plot_id, feature_id)
+
+    return {"plot_id": plot_id, "feature_id": feature_id, "feature_count": count}
+
+
+def handle_read_features(params: dict[str, Any]) -> dict[str, Any]:
+    """Handle read_features method.
+
+    Streams the plot's FeatureCollection, applying filters and projection
+    so that large arrays (e.g. track positions) are not sent when unused.
+
+    Args:
+        params: {
+            "store_path": str,
+            "plot_id": str,
+            "kinds": list[str] | None,
+            "platform_ids": list[str] | None,
+            "feature_ids": list[str] | None,
+            "include_properties": list[str] | None,
+            "exclude_properties": list[str] | None,
+            "include_geometry": bool
+        }
+
+    Returns:
+        {"plot_id": str, "features": [...], "count": int}
+    """
+    store_path = params.get("store_path")
+    plot_id = params.get("plot_id")
+
+    if not store_path:
+        raise ValueError("Missing required parameter: store_path")
+    if not plot_id:
+        raise ValueError("Missing required parameter: plot_id")
+
+    features = read_features(
+        store_path,
+        plot_id,
+        kinds=params.get("kinds"),
+        platform_ids=params.get("platform_ids"),
+        feature_ids=params.get("feature_ids"),
+        include_properties=params.get("include_properties"),
+        exclude_properties=params.get("exclude_properties"),
+        include_geometry=params.get("include_geometry", True),
+    )
+
+    return {
+        "plot_id": plot_id,
+        "features": features,
+        "count": len(features),
+    }
+
+
+def handle_generate_tiles(params: dict[str, Any]) -> dict[str, Any]:
+    """Handle generate_tiles method.
+
+    Args:
+        params: {"store_path": str, "plot_id": str, "max_zoom": int}
+
+    Returns:
+        {"plot_id": str, "tile_count": int, "max_zoom": int}
+    """
+    store_path = params.get("store_path")
+    plot_id = params.get("plot_id")
+    max_zoom = params.get("max_zoom", DEFAULT_MAX_ZOOM)
+
+    if not store_path:
+        raise ValueError("Missing required parameter: store_path")
+    if not plot_id:
+        raise ValueError("Missing required parameter: plot_id")
+
+    count = generate_tiles(store_path, plot_id, max_zoom)
+
+    return {
+        "plot_id": plot_id,
+        "tile_count": count,
+        "max_zoom": max_zoom,
+    }
+
+
 def handle_copy_asset(params: dict[str, Any]) -> dict[str, Any]:
     """Handle copy_asset method.
 
@@ -192,13 +343,18 @@ def handle_init_catalog(params: dict[str, Any]) -> dict[str, Any]:
     """Handle init_catalog method.
 
     Args:
-        params: {"path": str, "name": str}
+        params: {"path": str, "name": str, "layout": "flat" | "sharded",
+                 "compression": "none" | "gzip" | "zstd", "compression_level": int,
+                 "thumbnails": bool, "chunk_size": int}
 
     Returns:
         {"path": str, "created": bool}
     """
     path = params.get("path")
     name = params.get("name")
+    layout = params.get("layout", LAYOUT_FLAT)
+    compression = params.get("compression", COMPRESSION_NONE)
+    compression_level = params.get("compression_level")
 
     if not path:
         raise ValueError("Missing required parameter: path")
@@ -206,7 +362,15 @@ def handle_init_catalog(params: dict[str, Any]) -> dict[str, Any]:
         raise ValueError("Missing required parameter: name")
 
     # Use directory name as catalog_id (default), user's name as title
-    create_catalog(path, title=name)
+    create_catalog(
+        path,
+        title=name,
+        layout=layout,
+        compression=compression,
+        compression_level=compression_level,
+        thumbnails=params.get("thumbnails", False),
+        chunk_size=params.get("chunk_size"),
+    )
 
     return {
         "path": path,
@@ -232,6 +396,10 @@ def handle_request(request: dict[str, Any]) -> dict[str, Any]:
         "list_plots": handle_list_plots,
         "create_plot": handle_create_plot,
         "add_features": handle_add_features,
+        "update_feature": handle_update_feature,
+        "remove_feature": handle_remove_feature,
+        "read_features": handle_read_features,
+        "generate_tiles": handle_generate_tiles,
         "copy_asset": handle_copy_asset,
         "init_catalog": handle_init_catalog,
     }
@@ -285,6 +453,16 @@ def handle_request(request: dict[str, Any]) -> dict[str, Any]:
                 "data": {"type": "PlotNotFoundError"},
             },
         }
+    except FeatureNotFoundError as e:
+        return {
+            "jsonrpc": "2.0",
+            "id": request_id,
+            "error": {
+                "code": -32004,
+                "message": str(e),
+                "data": {"type": "FeatureNotFoundError"},
+            },
+        }
     except FileNotFoundError as e:
         return {
             "jsonrpc": "2.0",
@@ -0,0 +1,423 @@
+"""
+Columnar position sidecar for debrief-stac plots.
+
+Alongside its FeatureCollection, each plot with track positions keeps a
+``positions/`` directory holding one row per position in separate column
+files: track, time, lon, lat, course, speed and depth. Columns are stored
+in the NumPy ``.npy`` format (written here with the standard library), so
+they can be memory-mapped and read without parsing any JSON, either with
+read_positions() or with ``numpy.load(path, mmap_mode="r")``.
+
+A ``manifest.json`` describes the columns, names the file holding each
+one and maps the integer track codes in the ``track`` column to feature
+IDs. The sidecar is registered as the plot's ``positions`` asset and is
+rebuilt whenever the track positions change.
+
+Column files are never modified in place: each rebuild writes a new
+generation of them (``lat.3.npy``, ...) and replaces the manifest
+atomically to point at it, so the manifest always names a complete,
+consistent set of columns. The previous generation is kept until the
+next rebuild, so a reader that has just read the old manifest can still
+open its columns; a reader that finds its columns gone re-reads the
+manifest.
+"""
+
+import ast
+import contextlib
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Collection, Iterator, Sequence
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from debrief_stac.cache import read_json_cached
+from debrief_stac.catalog import iter_item_paths
+from debrief_stac.plot import read_plot
+from debrief_stac.storage import _temp_path, read_json, write_json_atomic
+from debrief_stac.types import (
+    ASSET_ROLE_DATA,
+    MEDIA_TYPE_JSON,
+    CatalogPath,
+    GeoJSONFeature,
+    STACItem,
+)
+
+# Plot-relative directory holding the column files
+POSITIONS_DIR = "positions"
+
+# Manifest describing the columns
+MANIFEST_FILENAME = "manifest.json"
+
+# Column name -> array typecode (int32 track code, int64 epoch ms, float64 values)
+COLUMNS = {
+    "track": "i",
+    "time": "q",
+    "lon": "d",
+    "lat": "d",
+    "course": "d",
+    "speed": "d",
+    "depth": "d",
+}
+
+_NPY_MAGIC = b"\x93NUMPY\x01\x00"
+_NPY_DTYPES = {"i": "<i4", "q": "<i8", "d": "<f8"}
+_NPY_ALIGNMENT = 64
+_NAN = float("nan")
+
+# Times a reader re-reads the manifest when its column files have been replaced
+_MAP_ATTEMPTS = 3
+
+
+def build_columns(features: Sequence[GeoJSONFeature]) -> tuple[list[str], dict[str, array]]:
+    """Flatten the track positions of features into columns.
+
+    Features without a ``positions`` list are skipped, as are positions
+    without a parseable ``time`` or a location (``coordinates`` or
+    ``lon``/``lat``). Missing optional values (course, speed, depth) are
+    stored as NaN.
+
+    Args:
+        features: GeoJSON features, in FeatureCollection order
+
+    Returns:
+        Tuple of (track feature IDs, column name -> array of values);
+        the ``track`` column holds indexes into the track ID list
+    """
+    tracks: list[str] = []
+    columns = {name: array(typecode) for name, typecode in COLUMNS.items()}
+    track_col, time_col = columns["track"], columns["time"]
+    lon_col, lat_col = columns["lon"], columns["lat"]
+    course_col, speed_col, depth_col = columns["course"], columns["speed"], columns["depth"]
+
+    for feature in features:
+        positions = (feature.get("properties") or {}).get("positions")
+        if not isinstance(positions, list) or not positions:
+            continue
+
+        code, start = len(tracks), len(track_col)
+        for position in positions:
+            row = _position_row(position)
+            if row is None:
+                continue
+            time, lon, lat, course, speed, depth = row
+            track_col.append(code)
+            time_col.append(time)
+            lon_col.append(lon)
+            lat_col.append(lat)
+            course_col.append(course)
+            speed_col.append(speed)
+            depth_col.append(depth)
+        if len(track_col) > start:
+            tracks.append(str(feature.get("id", code)))
+
+    return tracks, columns
+
+
+def count_rows(positions: Any) -> int:
+    """Return the number of column rows a ``positions`` property yields."""
+    if not isinstance(positions, list):
+        return 0
+    return sum(1 for position in positions if _position_row(position) is not None)
+
+
+def _write_positions(plot_dir: Path, item: STACItem, features: Sequence[GeoJSONFeature]) -> bool:
+    """Build a plot's position columns and write them as its sidecar.
+
+    Internal function called after the FeatureCollection changes. Does
+    nothing if no feature has positions.
+
+    Args:
+        plot_dir: The plot's directory
+        item: STAC Item dictionary (modified in place)
+        features: All features of the plot
+
+    Returns:
+        True if the sidecar was written
+    """
+    return _write_columns(plot_dir, item, *build_columns(features))
+
+
+def _write_columns(
+    plot_dir: Path, item: STACItem, tracks: list[str], columns: dict[str, array]
+) -> bool:
+    """Write columns from build_columns() as a plot's sidecar and register it as an item asset.
+
+    Returns:
+        True if the sidecar was written (False if there are no tracks)
+    """
+    if not tracks:
+        return False
+
+    positions_dir = plot_dir / POSITIONS_DIR
+    manifest_path = positions_dir / MANIFEST_FILENAME
+    positions_dir.mkdir(exist_ok=True)
+    old = read_json(manifest_path) if manifest_path.exists() else None
+    revision = old.get("revision", 0) + 1 if old else 1
+
+    manifest = {
+        "format": "npy",
+        "revision": revision,
+        "rows": len(columns["time"]),
+        "tracks": tracks,
+        "columns": {},
+    }
+    for name, values in columns.items():
+        href = f"./{name}.{revision}.npy"
+        _write_npy(positions_dir / href, values)
+        manifest["columns"][name] = {"href": href, "dtype": _NPY_DTYPES[values.typecode]}
+    write_json_atomic(manifest_path, manifest)
+
+    # Keep the generation the old manifest names; drop any older ones
+    kept = {Path(column["href"]).name for column in manifest["columns"].values()}
+    if old:
+        kept.update(Path(column["href"]).name for column in old["columns"].values())
+    for path in positions_dir.glob("*.npy"):
+        if path.name not in kept:
+            # Still mapped by a reader on Windows; retried on the next rebuild
+            with contextlib.suppress(OSError):
+                path.unlink()
+
+    item["assets"]["positions"] = {
+        "href": f"./{POSITIONS_DIR}/{MANIFEST_FILENAME}",
+        "type": MEDIA_TYPE_JSON,
+        "title": "Track positions (columnar)",
+        "roles": [ASSET_ROLE_DATA],
+    }
+    return True
+
+
+class PositionColumns(dict[str, Any]):
+    """Position columns read from a sidecar, backed by memory maps.
+
+    A dict with "tracks" and one sequence per column. The column files
+    stay mapped until close() is called (or the ``with`` block using the
+    columns exits); the columns must not be used after that. Maps not
+    closed explicitly are closed when the columns are garbage collected.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._maps: list[mmap.mmap] = []
+
+    def close(self) -> None:
+        """Release the column views and unmap the column files.
+
+        Raises:
+            BufferError: If a column is still exported, e.g. wrapped by a
+                NumPy array
+        """
+        for values in self.values():
+            if isinstance(values, memoryview):
+                values.release()
+        for mapped in self._maps:
+            mapped.close()
+        self._maps.clear()
+
+    def __enter__(self) -> "PositionColumns":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+def read_positions(
+    catalog_path: CatalogPath, plot_id: str, columns: Collection[str] | None = None
+) -> PositionColumns:
+    """Read a plot's position columns via memory maps.
+
+    Only the requested columns are opened. On little-endian hosts the
+    returned memoryviews share memory with the mapped files, so no data
+    is copied until it is accessed. Close the result when done with it
+    to unmap the files (see PositionColumns).
+
+    Args:
+        catalog_path: Path to the catalog directory
+        plot_id: ID of the plot to read
+        columns: Column names to read (defaults to all)
+
+    Returns:
+        PositionColumns with "tracks" (list of track feature IDs, indexed
+        by the track column) and one sequence per requested column; empty
+        if the plot has no position sidecar
+
+    Raises:
+        PlotNotFoundError: If the plot doesn't exist
+        ValueError: If an unknown column is requested
+
+    Example:
+        >>> with read_positions("/data/catalog", "my-plot", columns=["speed"]) as cols:
+        ...     top_speed = max(cols["speed"])
+    """
+    item = read_plot(catalog_path, plot_id)
+    asset = item.get("assets", {}).get("positions")
+    if asset is None:
+        return PositionColumns()
+    return _read_manifest_columns(Path(catalog_path) / plot_id / asset["href"], columns)
+
+
+def iter_positions(
+    catalog_path: CatalogPath, columns: Collection[str] | None = None
+) -> Iterator[tuple[str, PositionColumns]]:
+    """Scan the position columns of every plot in a catalog.
+
+    Each plot's columns are mapped as it is reached; close them when done
+    with them, before moving on if scanning a large catalog.
+
+    Args:
+        catalog_path: Path to the catalog directory
+        columns: Column names to read (defaults to all)
+
+    Yields:
+        Tuple of (plot ID, columns as returned by read_positions()) for
+        each plot that has a position sidecar
+
+    Raises:
+        CatalogNotFoundError: If no catalog exists at the path
+        ValueError: If an unknown column is requested
+    """
+    for item_path in iter_item_paths(catalog_path):
+        try:
+            item = read_json_cached(item_path)
+        except FileNotFoundError:
+            continue
+        asset = item.get("assets", {}).get("positions")
+        if asset is not None:
+            manifest_path = item_path.parent / asset["href"]
+            yield item["id"], _read_manifest_columns(manifest_path, columns)
+
+
+def _read_manifest_columns(manifest_path: Path, columns: Collection[str] | None) -> PositionColumns:
+    if columns is None:
+        columns = list(COLUMNS)
+    unknown = set(columns) - set(COLUMNS)
+    if unknown:
+        raise ValueError(f"Unknown position columns: {sorted(unknown)}")
+
+    # A rebuild may delete the columns of a manifest read just before it;
+    # the manifest read again names the current ones
+    attempts = _MAP_ATTEMPTS
+    while True:
+        try:
+            return _map_columns(manifest_path, columns)
+        except FileNotFoundError:
+            attempts -= 1
+            if not attempts:
+                raise
+
+
+def _map_columns(manifest_path: Path, columns: Collection[str]) -> PositionColumns:
+    """Map the columns named by the current manifest."""
+    manifest = read_json_cached(manifest_path)
+    rows = manifest["rows"]
+    result = PositionColumns()
+    result["tracks"] = manifest["tracks"]
+    try:
+        for name in columns:
+            href = manifest["columns"][name]["href"]
+            values, mapped = _map_npy(manifest_path.parent / href, COLUMNS[name])
+            if mapped is not None:
+                result._maps.append(mapped)
+            result[name] = values[:rows]
+    except BaseException:
+        result.close()
+        raise
+    return result
+
+
+def _write_npy(path: Path, values: array) -> None:
+    """Write a 1-D array in NumPy .npy (version 1.0) format, atomically."""
+    header = (
+        f"{{'descr': '{_NPY_DTYPES[values.typecode]}', "
+        f"'fortran_order': False, 'shape': ({len(values)},), }}"
+    ).encode("latin-1")
+    padding = -(len(_NPY_MAGIC) + 2 + len(header) + 1) % _NPY_ALIGNMENT
+    header += b" " * padding + b"\n"
+
+    if sys.byteorder != "little":
+        values = array(values.typecode, values)
+        values.byteswap()
+
+    temp = _temp_path(path)
+    try:
+        with open(temp, "wb") as f:
+            f.write(_NPY_MAGIC)
+            f.write(struct.pack("<H", len(header)))
+            f.write(header)
+            values.tofile(f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp, path)
+    finally:
+        temp.unlink(missing_ok=True)
+
+
+def _map_npy(path: Path, typecode: str) -> tuple[Any, mmap.mmap | None]:
+    """Memory-map a 1-D .npy file written by _write_npy().
+
+    Returns:
+        Tuple of (the values, the map they are a view of, or None if they
+        were copied out of it)
+    """
+    with open(path, "rb") as f:
+        prefix = f.read(len(_NPY_MAGIC) + 2)
+        if not prefix.startswith(_NPY_MAGIC):
+            raise ValueError(f"Not a version 1.0 .npy file: {path}")
+        (header_len,) = struct.unpack("<H", prefix[-2:])
+        header = ast.literal_eval(f.read(header_len).decode("latin-1"))
+        if header["descr"] != _NPY_DTYPES[typecode]:
+            raise ValueError(f"Unexpected dtype {header['descr']} in {path}")
+
+        offset = len(prefix) + header_len
+        if header["shape"][0] == 0:
+            return array(typecode), None
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    if sys.byteorder != "little":
+        with mapped:
+            values = array(typecode, mapped[offset:])
+        values.byteswap()
+        return values, None
+    return memoryview(mapped)[offset:].cast(typecode), mapped
+
+
+def _position_row(position: Any) -> tuple[int, float, float, float, float, float] | None:
+    """Return a position's (time, lon, lat, course, speed, depth) column values.
+
+    None if the position has no parseable time or location.
+    """
+    try:
+        lon, lat = _lon_lat(position)
+        return (
+            _epoch_ms(position["time"]),
+            lon,
+            lat,
+            _float(position.get("course")),
+            _float(position.get("speed")),
+            _float(position.get("depth")),
+        )
+    except (AttributeError, IndexError, KeyError, TypeError, ValueError):
+        return None
+
+
+def _lon_lat(position: dict[str, Any]) -> tuple[float, float]:
+    """Return (lon, lat) from either a coordinates pair or lon/lat keys."""
+    coordinates = position.get("coordinates")
+    if coordinates is not None:
+        return float(coordinates[0]), float(coordinates[1])
+    return float(position["lon"]), float(position["lat"])
+
+
+def _epoch_ms(value: str) -> int:
+    """Convert an ISO8601 timestamp to milliseconds since the Unix epoch."""
+    dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=UTC)
+    return round(dt.timestamp() * 1000)
+
+
+def _float(value: Any) -> float:
+    return _NAN if value is None else float(value)
@@ -48,6 +48,26 @@ class PlotExistsError(DebriefStacError):
         super().__init__(f"Plot already exists with ID: {plot_id}")
 
 
+class PlotLockedError(DebriefStacError):
+    """Raised when a write session finds a plot locked out of lock order."""
+
+    def __init__(self, plot_id: str):
+        self.plot_id = plot_id
+        super().__init__(
+            f"Plot is locked by another writer: {plot_id} "
+            "(pass it to session() to wait for it in lock order)"
+        )
+
+
+class FeatureNotFoundError(DebriefStacError):
+    """Raised when a feature cannot be found in a plot."""
+
+    def __init__(self, plot_id: str, feature_id: str | int):
+        self.plot_id = plot_id
+        self.feature_id = feature_id
+        super().__init__(f"Feature not found: {feature_id} in plot: {plot_id}")
+
+
 class ValidationError(DebriefStacError):
     """Raised when data validation fails."""
 
@@ -5,20 +5,64 @@ This module provides functions for adding and managing GeoJSON features
 within plot FeatureCollection assets.
 """
 
-import json
-from collections.abc import Sequence
+import shutil
+from collections.abc import Iterable, Sequence
 from pathlib import Path
 
-from debrief_stac.plot import _save_plot, read_plot
+from debrief_stac.catalog import (
+    feature_chunk_size,
+    feature_storage,
+    open_catalog,
+    thumbnails_enabled,
+)
+from debrief_stac.chunks import (
+    CHUNK_MANIFEST,
+    CHUNKS_DIR,
+    _append_chunks,
+    _edit_chunk,
+    _write_chunks,
+    feature_files,
+    is_chunked,
+    manifest_bbox,
+    manifest_count,
+)
+from debrief_stac.columnar import (
+    POSITIONS_DIR,
+    _write_columns,
+    _write_positions,
+    build_columns,
+)
+from debrief_stac.exceptions import FeatureNotFoundError
+from debrief_stac.locks import plot_lock
+from debrief_stac.overview import (
+    _OVERVIEW_PROPERTIES,
+    OVERVIEW_FILENAME,
+    THUMBNAIL_FILENAME,
+    _write_overview,
+)
+from debrief_stac.plot import _load_plot, _save_plot
+from debrief_stac.storage import (
+    COMPRESSION_NONE,
+    COMPRESSION_SUFFIXES,
+    compression_for,
+    read_json,
+    write_json_atomic,
+)
+from debrief_stac.tiles import _update_tiles
 from debrief_stac.types import (
     ASSET_ROLE_DATA,
     MEDIA_TYPE_GEOJSON,
+    MEDIA_TYPE_JSON,
     BoundingBox,
     CatalogPath,
     GeoJSONFeature,
     GeoJSONFeatureCollection,
+    STACItem,
 )
 
+# Filename of a plot's FeatureCollection asset
+FEATURES_FILENAME = "features.geojson"
+
 
 def add_features(
     catalog_path: CatalogPath,
@@ -29,7 +73,11 @@ def add_features(
 
     If the plot doesn't have a FeatureCollection asset yet, one is created.
     Otherwise, features are appended to the existing collection.
-    The plot's bbox is updated to encompass all features.
+    The plot's bbox is updated to encompass all features. The collection
+    is written with the catalog's feature compression and chunking
+    settings. The plot's position columns and track overview are rebuilt
+    if any of the new features has positions or a line geometry, and its
+    vector tile pyramid (if it has one) is updated.
 
     Args:
         catalog_path: Path to the catalog directory
@@ -54,48 +102,343 @@ def add_features(
     for feature in features:
         _validate_feature(feature)
 
-    # Read current plot
-    item = read_plot(catalog_path, plot_id)
-    plot_dir = catalog_path / plot_id
+    catalog_data = open_catalog(catalog_path)
+    compression, level = feature_storage(catalog_data)
+    chunk_size = feature_chunk_size(catalog_data)
+
+    with plot_lock(catalog_path, plot_id):
+        # Read current plot
+        item = _load_plot(catalog_path, plot_id)
+        stored_path = _stored_features_path(catalog_path, item)
+
+        # Get or create FeatureCollection, then append
+        fc = _load_feature_collection(stored_path)
+        _merge_features(item, fc, features, compression, chunk_size)
+        features_path = _stored_features_path(catalog_path, item)
+
+        # Build the position columns before anything is written
+        derived = _affects_derived(features)
+        if derived:
+            tracks, columns = build_columns(fc["features"])
+
+        # Write updated FeatureCollection and derived assets, then the item
+        plot_dir = catalog_path / plot_id
+        _store_features(stored_path, features_path, fc, features, compression, level, chunk_size)
+        if derived:
+            _write_columns(plot_dir, item, tracks, columns)
+            _write_overview(plot_dir, item, fc["features"], thumbnails_enabled(catalog_data))
+        _update_tiles(plot_dir, item, fc["features"], features)
+        _save_plot(catalog_path, plot_id, item)
+
+        # Drop the previous store if the catalog's storage settings changed
+        if stored_path != features_path:
+            _remove_stored_features(stored_path)
+
+    return len(fc["features"])
+
+
+def update_feature(catalog_path: CatalogPath, plot_id: str, feature: GeoJSONFeature) -> None:
+    """Replace one feature of a plot, matched by its ``id``.
+
+    In a chunked catalog only the chunk holding the feature is rewritten.
+    The plot's bbox is recalculated; its position columns and track
+    overview are rebuilt only if the feature's geometry, positions or
+    overview properties changed, and only the vector tiles (if any) the
+    old and new versions touch are rebuilt.
+
+    Args:
+        catalog_path: Path to the catalog directory
+        plot_id: ID of the plot holding the feature
+        feature: Replacement GeoJSON Feature, with the ``id`` of the
+            feature to replace
+
+    Raises:
+        PlotNotFoundError: If the plot doesn't exist
+        FeatureNotFoundError: If the plot has no feature with the ID
+        ValueError: If the feature is invalid GeoJSON or has no ``id``
+
+    Example:
+        >>> feature["properties"]["color"] = "#ff0000"
+        >>> update_feature("/data/catalog", "my-plot", feature)
+    """
+    _validate_feature(feature)
+    if feature.get("id") is None:
+        raise ValueError("Feature must have an 'id' to be updated")
+    _edit_feature(Path(catalog_path), plot_id, feature["id"], feature)
+
+
+def remove_feature(catalog_path: CatalogPath, plot_id: str, feature_id: str | int) -> int:
+    """Remove one feature from a plot.
+
+    In a chunked catalog only the chunk holding the feature is rewritten.
+    Derived assets are kept consistent as for update_feature().
+
+    Args:
+        catalog_path: Path to the catalog directory
+        plot_id: ID of the plot holding the feature
+        feature_id: ID of the feature to remove
+
+    Returns:
+        Number of features left in the plot
+
+    Raises:
+        PlotNotFoundError: If the plot doesn't exist
+        FeatureNotFoundError: If the plot has no feature with the ID
+
+    Example:
+        >>> remaining = remove_feature("/data/catalog", "my-plot", "track-001")
+    """
+    return _edit_feature(Path(catalog_path), plot_id, feature_id, None)
+
+
+def _edit_feature(
+    catalog_path: Path,
+    plot_id: str,
+    feature_id: str | int,
+    replacement: GeoJSONFeature | None,
+) -> int:
+    """Replace or remove one feature and bring the item and derived assets up to date.
+
+    Returns:
+        Number of features left in the plot
+    """
+    catalog_data = open_catalog(catalog_path)
+    compression, level = feature_storage(catalog_data)
+    chunk_size = feature_chunk_size(catalog_data)
+
+    with plot_lock(catalog_path, plot_id):
+        item = _load_plot(catalog_path, plot_id)
+        stored_path = _stored_features_path(catalog_path, item)
+        plot_dir = catalog_path / plot_id
+        features_path = plot_dir / _features_asset_path(compression, chunk_size)
+
+        if is_chunked(stored_path) and stored_path == features_path and stored_path.exists():
+            previous, manifest = _edit_chunk(
+                stored_path, feature_id, replacement, compression, level
+            )
+            if previous is None:
+                raise FeatureNotFoundError(plot_id, feature_id)
+            bbox, count, all_features = manifest_bbox(manifest), manifest_count(manifest), None
+        else:
+            # Single files are rewritten whole, in the catalog's current layout
+            fc = _load_feature_collection(stored_path)
+            key = str(feature_id)
+            index = next((i for i, f in enumerate(fc["features"]) if str(f.get("id")) == key), None)
+            if index is None:
+                raise FeatureNotFoundError(plot_id, feature_id)
+            previous = fc["features"][index]
+            if replacement is None:
+                del fc["features"][index]
+            else:
+                fc["features"][index] = replacement
+            _set_features_asset(item, compression, chunk_size)
+            _store_features(stored_path, features_path, fc, None, compression, level, chunk_size)
+            all_features = fc["features"]
+            bbox, count = _calculate_bbox(all_features), len(all_features)
+
+        item["bbox"] = list(bbox) if bbox else None
+        item["geometry"] = _bbox_to_polygon(bbox) if bbox else None
+
+        stale: list[Path] = []
+        derived_changed = _derived_inputs(previous) != _derived_inputs(replacement)
+        if derived_changed or "tiles" in item["assets"]:
+            if all_features is None:
+                all_features = _load_feature_collection(features_path)["features"]
+            if derived_changed:
+                thumbnail = thumbnails_enabled(catalog_data)
+                stale = _rewrite_derived(plot_dir, item, all_features, thumbnail)
+            _update_tiles(
+                plot_dir, item, all_features, [replacement] if replacement else [], [previous]
+            )
+        _save_plot(catalog_path, plot_id, item)
+
+        # Derived files the saved item no longer names
+        for path in stale:
+            if path.is_dir():
+                shutil.rmtree(path, ignore_errors=True)
+            else:
+                path.unlink(missing_ok=True)
+
+        if stored_path != features_path:
+            _remove_stored_features(stored_path)
+
+    return count
+
+
+def _derived_inputs(feature: GeoJSONFeature | None) -> tuple | None:
+    """Return the parts of a feature the position columns and overview depend on.
+
+    None means the feature contributes to neither.
+    """
+    if feature is None:
+        return None
+    geometry = feature.get("geometry") or {}
+    line = geometry if geometry.get("type") in ("LineString", "MultiLineString") else None
+    properties = feature.get("properties") or {}
+    positions = properties.get("positions") or None
+    if line is None and positions is None:
+        return None
+    return line, positions, [properties.get(k) for k in _OVERVIEW_PROPERTIES]
+
+
+def _affects_derived(features: Iterable[GeoJSONFeature]) -> bool:
+    """Whether appending the features changes the position columns or overview."""
+    return any(_derived_inputs(feature) is not None for feature in features)
+
+
+def _rewrite_derived(
+    plot_dir: Path, item: STACItem, features: Sequence[GeoJSONFeature], thumbnail: bool
+) -> list[Path]:
+    """Rebuild the position columns and overview, dropping the assets no longer needed.
+
+    Returns:
+        Paths of the dropped assets' files, to delete once the item is saved
+    """
+    stale = []
+    if not _write_positions(plot_dir, item, features):
+        item["assets"].pop("positions", None)
+        stale.append(plot_dir / POSITIONS_DIR)
+    if not _write_overview(plot_dir, item, features, thumbnail):
+        for key, filename in (("overview", OVERVIEW_FILENAME), ("thumbnail", THUMBNAIL_FILENAME)):
+            item["assets"].pop(key, None)
+            stale.append(plot_dir / filename)
+    return stale
+
+
+def _features_filename(compression: str) -> str:
+    """Return the FeatureCollection filename for a compression codec."""
+    return FEATURES_FILENAME + COMPRESSION_SUFFIXES.get(compression, "")
+
+
+def _features_asset_path(compression: str, chunk_size: int | None) -> str:
+    """Return the plot-relative path of the features asset for the storage settings."""
+    if chunk_size:
+        return f"{CHUNKS_DIR}/{CHUNK_MANIFEST}"
+    return _features_filename(compression)
+
+
+def _stored_features_path(catalog_path: Path, item: STACItem) -> Path:
+    """Return the path of a plot's FeatureCollection (which may not exist yet)."""
+    asset = item.get("assets", {}).get("features")
+    href = asset.get("href", FEATURES_FILENAME) if asset else FEATURES_FILENAME
+    return Path(catalog_path) / item["id"] / href
+
+
+def _write_feature_collection(
+    features_path: Path, fc: GeoJSONFeatureCollection, level: int | None = None
+) -> None:
+    """Write a FeatureCollection, compact when compressed and indented otherwise."""
+    compressed = compression_for(features_path) != COMPRESSION_NONE
+    write_json_atomic(features_path, fc, indent=None if compressed else 2, level=level)
+
+
+def _load_feature_collection(features_path: Path) -> GeoJSONFeatureCollection:
+    """Load a plot's FeatureCollection, or return an empty one if none exists yet.
+
+    Args:
+        features_path: Path to the FeatureCollection file or chunk manifest
+
+    Returns:
+        FeatureCollection dictionary
+    """
+    if not features_path.exists():
+        return {"type": "FeatureCollection", "features": []}
+    if not is_chunked(features_path):
+        return read_json(features_path)
+    features = [f for path in feature_files(features_path) for f in read_json(path)["features"]]
+    return {"type": "FeatureCollection", "features": features}
+
+
+def _store_features(
+    stored_path: Path,
+    features_path: Path,
+    fc: GeoJSONFeatureCollection,
+    appended: Sequence[GeoJSONFeature] | None,
+    compression: str = COMPRESSION_NONE,
+    level: int | None = None,
+    chunk_size: int | None = None,
+) -> None:
+    """Write a plot's features to features_path in the catalog's storage layout.
+
+    Internal function shared by add_features(), feature edits and write
+    sessions. An existing chunked store at the same path only has the
+    appended features added; otherwise the whole collection is written.
+
+    Args:
+        stored_path: Where the features are currently stored
+        features_path: Where they are to be stored (a file or chunk manifest)
+        fc: The complete FeatureCollection
+        appended: Features added to fc since it was stored, or None if it
+            was changed in some other way
+        compression: Codec for chunk files (single files take theirs from
+            the path's suffix)
+        level: Compression level (codec default if None)
+        chunk_size: Features per chunk, or None to write a single file
+    """
+    if not is_chunked(features_path):
+        _write_feature_collection(features_path, fc, level)
+        return
+
+    if appended is not None and stored_path == features_path and features_path.exists():
+        _append_chunks(features_path, appended, chunk_size, compression, level)
+    else:
+        _write_chunks(features_path, fc["features"], chunk_size, compression, level)
 
-    # Get or create FeatureCollection
-    features_filename = "features.geojson"
-    features_path = plot_dir / features_filename
 
-    if features_path.exists():
-        # Load existing
-        with open(features_path) as f:
-            fc: GeoJSONFeatureCollection = json.load(f)
+def _remove_stored_features(stored_path: Path) -> None:
+    """Delete a features store superseded by a change of storage settings."""
+    if is_chunked(stored_path):
+        shutil.rmtree(stored_path.parent, ignore_errors=True)
     else:
-        # Create new
-        fc = {"type": "FeatureCollection", "features": []}
+        stored_path.unlink(missing_ok=True)
 
-    # Append new features
-    fc["features"].extend(features)
 
-    # Write updated FeatureCollection
-    with open(features_path, "w") as f:
-        json.dump(fc, f, indent=2)
+def _merge_features(
+    item: STACItem,
+    fc: GeoJSONFeatureCollection,
+    features: Sequence[GeoJSONFeature],
+    compression: str = COMPRESSION_NONE,
+    chunk_size: int | None = None,
+) -> None:
+    """Append features to a FeatureCollection and update the item to match.
 
-    # Update item assets
-    item["assets"]["features"] = {
-        "href": f"./{features_filename}",
-        "type": MEDIA_TYPE_GEOJSON,
-        "title": "GeoJSON Features",
-        "roles": [ASSET_ROLE_DATA],
-    }
+    Internal function shared by add_features() and write sessions. Sets the
+    item's features asset and recalculates its bbox and geometry.
 
-    # Update bbox
-    bbox = _calculate_bbox(fc["features"])
+    Args:
+        item: STAC Item dictionary (modified in place)
+        fc: FeatureCollection dictionary (modified in place)
+        features: Validated GeoJSON features to append
+        compression: Codec the FeatureCollection will be stored with
+        chunk_size: Features per chunk, or None if stored as a single file
+    """
+    fc["features"].extend(features)
+    _set_features_asset(item, compression, chunk_size)
+
+    # Update bbox - merging only appends, so extend the existing one
+    bbox = _calculate_bbox(features)
+    if bbox and item.get("bbox"):
+        bbox = _union_bbox(tuple(item["bbox"]), bbox)
     if bbox:
         item["bbox"] = list(bbox)
         # Update geometry to bounding box polygon
         item["geometry"] = _bbox_to_polygon(bbox)
 
-    # Save updated item
-    _save_plot(catalog_path, plot_id, item)
 
-    return len(fc["features"])
+def _set_features_asset(item: STACItem, compression: str, chunk_size: int | None) -> None:
+    """Point the item's features asset at the store for the storage settings."""
+    item["assets"]["features"] = {
+        "href": f"./{_features_asset_path(compression, chunk_size)}",
+        # A chunk manifest is plain JSON listing GeoJSON chunk files
+        "type": MEDIA_TYPE_JSON if chunk_size else MEDIA_TYPE_GEOJSON,
+        "title": "GeoJSON Features",
+        "roles": [ASSET_ROLE_DATA],
+    }
+
+
+def _union_bbox(a: BoundingBox, b: BoundingBox) -> BoundingBox:
+    """Return the smallest bounding box containing both a and b."""
+    return (min(a[0], b[0]), min(a[1], b[1]), max(a[2], b[2]), max(a[3], b[3]))
 
 
 def _validate_feature(feature: GeoJSONFeature) -> None:
@@ -120,7 +463,7 @@ def _validate_feature(feature: GeoJSONFeature) -> None:
         raise ValueError("Feature must have a 'properties' field")
 
 
-def _calculate_bbox(features: Sequence[GeoJSONFeature]) -> BoundingBox | None:
+def _calculate_bbox(features: Iterable[GeoJSONFeature]) -> BoundingBox | None:
     """Calculate bounding box encompassing all features.
 
     Args:
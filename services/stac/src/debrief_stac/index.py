@@ -0,0 +1,357 @@
+"""
+Plot listing index for debrief-stac.
+
+list_plots() reads every item.json in a catalog. For large stores,
+list_plots_page() serves sorted, filtered pages from a SQLite index in
+``.debrief/index.sqlite`` instead, using keyset pagination: each page is
+one indexed range scan, and only the items on the page are counted.
+
+The index is built on first use. Plot writes made through this package
+keep it current; changes to the catalog links (plots added or removed
+by other means) are detected from the catalog files' stat and
+reconciled on the next query. rebuild_index() re-reads every item, for
+items edited outside the package.
+
+Listing never needs write access: if the index cannot be created or
+updated (a read-only or archived store), each query scans the items into
+an in-memory index instead.
+"""
+
+import base64
+import binascii
+import contextlib
+import json
+import os
+import sqlite3
+from collections.abc import Iterable, Iterator
+from datetime import UTC, datetime
+from pathlib import Path
+
+from debrief_stac.cache import read_json_cached
+from debrief_stac.catalog import (
+    SHARDS_DIR,
+    _feature_count,
+    _features_href,
+    iter_item_paths,
+    open_catalog,
+)
+from debrief_stac.models import PlotPage, PlotSummary
+from debrief_stac.storage import STATE_DIR
+from debrief_stac.types import CatalogPath, STACItem
+
+# Catalog-relative path of the index database
+INDEX_FILE = "index.sqlite"
+
+# Sort keys accepted by list_plots_page() (prefix with "-" for descending)
+SORT_KEYS = ("datetime", "title", "id")
+DEFAULT_SORT = "-datetime"
+
+# Bumped whenever the schema changes; older indexes are rebuilt
+_SCHEMA_VERSION = 1
+
+_SORT_COLUMNS = {"datetime": "sort_time", "title": "title_key", "id": "id"}
+
+_SCHEMA = """
+CREATE TABLE plots (
+    id TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    title_key TEXT NOT NULL,
+    datetime TEXT NOT NULL,
+    sort_time TEXT NOT NULL,
+    features_href TEXT
+);
+CREATE INDEX plots_by_time ON plots (sort_time, id);
+CREATE INDEX plots_by_title ON plots (title_key, id);
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+"""
+
+_UPSERT = (
+    "INSERT OR REPLACE INTO plots (id, title, title_key, datetime, sort_time, features_href)"
+    " VALUES (?, ?, ?, ?, ?, ?)"
+)
+
+
+def list_plots_page(
+    path: CatalogPath,
+    *,
+    limit: int | None = None,
+    cursor: str | None = None,
+    sort: str = DEFAULT_SORT,
+    title: str | None = None,
+    since: datetime | str | None = None,
+    until: datetime | str | None = None,
+) -> PlotPage:
+    """List one page of plots, sorted and filtered via the catalog index.
+
+    Args:
+        path: Path to the catalog directory
+        limit: Maximum number of plots to return (None for all)
+        cursor: next_cursor from the previous page (None for the first page)
+        sort: "datetime", "title" or "id", prefixed with "-" for descending
+            (default: newest first)
+        title: Only plots whose title contains this text (case-insensitive)
+        since: Only plots at or after this time
+        until: Only plots at or before this time
+
+    Returns:
+        PlotPage with the plots and the cursor for the next page
+
+    Raises:
+        CatalogNotFoundError: If no catalog exists at the path
+        ValueError: If the limit, sort key or cursor is invalid
+
+    Example:
+        >>> page = list_plots_page("/data/analysis", limit=50)
+        >>> while page.next_cursor:
+        ...     page = list_plots_page("/data/analysis", limit=50, cursor=page.next_cursor)
+    """
+    if limit is not None and limit < 1:
+        raise ValueError(f"limit must be at least 1, got {limit}")
+    descending = sort.startswith("-")
+    key = sort.lstrip("-")
+    if key not in SORT_KEYS:
+        raise ValueError(f"Unknown sort key {sort!r}: expected one of {', '.join(SORT_KEYS)}")
+    column = _SORT_COLUMNS[key]
+
+    catalog_path = Path(path)
+    open_catalog(catalog_path)
+
+    where: list[str] = []
+    args: list[object] = []
+    if title:
+        where.append("title_key LIKE ? ESCAPE '\\'")
+        args.append(f"%{_escape_like(title.casefold())}%")
+    if since is not None:
+        where.append("sort_time >= ?")
+        args.append(_sort_time(since))
+    if until is not None:
+        where.append("sort_time <= ?")
+        args.append(_sort_time(until))
+    if cursor is not None:
+        value, last_id = _decode_cursor(cursor, sort)
+        where.append(f"({column}, id) {'<' if descending else '>'} (?, ?)")
+        args.extend([value, last_id])
+
+    direction = "DESC" if descending else "ASC"
+    query = (
+        f"SELECT id, title, datetime, features_href, {column} FROM plots"
+        f"{' WHERE ' + ' AND '.join(where) if where else ''}"
+        f" ORDER BY {column} {direction}, id {direction}"
+    )
+    if limit is not None:
+        query += " LIMIT ?"
+        args.append(limit + 1)
+
+    with _open_index(catalog_path) as db:
+        rows = db.execute(query, args).fetchall()
+
+    next_cursor = None
+    if limit is not None and len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = _encode_cursor(sort, rows[-1][4], rows[-1][0])
+
+    plots = [
+        PlotSummary(
+            id=plot_id,
+            title=plot_title,
+            timestamp=_parse_time(dt_str),
+            feature_count=_feature_count(catalog_path / plot_id, features_href),
+        )
+        for plot_id, plot_title, dt_str, features_href, _ in rows
+    ]
+    return PlotPage(plots=plots, next_cursor=next_cursor)
+
+
+def rebuild_index(path: CatalogPath) -> int:
+    """Rebuild a catalog's plot index from its items.
+
+    Args:
+        path: Path to the catalog directory
+
+    Returns:
+        Number of plots indexed
+
+    Raises:
+        CatalogNotFoundError: If no catalog exists at the path
+    """
+    catalog_path = Path(path)
+    open_catalog(catalog_path)
+    _remove_index(_index_path(catalog_path))
+    with _open_index(catalog_path) as db:
+        return db.execute("SELECT COUNT(*) FROM plots").fetchone()[0]
+
+
+def _index_items(catalog_path: CatalogPath, items: Iterable[STACItem]) -> None:
+    """Update the index rows of plots that were just written.
+
+    Internal function called by the plot write paths. Does nothing if the
+    catalog has no index yet (it is built in full on first query).
+    """
+    index_path = _index_path(Path(catalog_path))
+    if not index_path.exists():
+        return
+    try:
+        with contextlib.closing(_connect(index_path)) as db, db:
+            db.executemany(_UPSERT, [_row(item) for item in items])
+    except sqlite3.DatabaseError:
+        # A damaged index is rebuilt on next query
+        _remove_index(index_path)
+
+
+def _index_path(catalog_path: Path) -> Path:
+    return catalog_path / STATE_DIR / INDEX_FILE
+
+
+def _connect(index_path: Path | str) -> sqlite3.Connection:
+    db = sqlite3.connect(index_path, timeout=30)
+    try:
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+    except sqlite3.DatabaseError:
+        db.close()
+        raise
+    return db
+
+
+def _remove_index(index_path: Path) -> None:
+    """Delete the index database along with its WAL files."""
+    for suffix in ("", "-wal", "-shm"):
+        index_path.with_name(index_path.name + suffix).unlink(missing_ok=True)
+
+
+@contextlib.contextmanager
+def _open_index(catalog_path: Path) -> Iterator[sqlite3.Connection]:
+    """Open the index, creating or reconciling it as needed.
+
+    Falls back to an in-memory index of a full scan if the store cannot
+    be written.
+    """
+    try:
+        db = _open_stored_index(catalog_path)
+    except (OSError, sqlite3.DatabaseError):
+        db = _create_index(":memory:")
+        _reconcile(catalog_path, db)
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def _open_stored_index(catalog_path: Path) -> sqlite3.Connection:
+    """Open the index in the state directory, bringing it up to date."""
+    index_path = _index_path(catalog_path)
+    index_path.parent.mkdir(exist_ok=True)
+    db = None
+    if index_path.exists():
+        with contextlib.suppress(sqlite3.DatabaseError):
+            db = _connect(index_path)
+        if db is not None and _schema_version(db) != _SCHEMA_VERSION:
+            db.close()
+            db = None
+    if db is None:
+        _remove_index(index_path)
+        db = _create_index(index_path)
+
+    try:
+        _reconcile(catalog_path, db)
+    except BaseException:
+        db.close()
+        raise
+    return db
+
+
+def _schema_version(db: sqlite3.Connection) -> int | None:
+    try:
+        return db.execute("PRAGMA user_version").fetchone()[0]
+    except sqlite3.DatabaseError:
+        return None
+
+
+def _create_index(index_path: Path | str) -> sqlite3.Connection:
+    db = _connect(index_path)
+    with db:
+        db.executescript(_SCHEMA)
+        db.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+    return db
+
+
+def _reconcile(catalog_path: Path, db: sqlite3.Connection) -> None:
+    """Add and drop index rows if the catalog links changed since last indexed."""
+    signature = json.dumps(_links_signature(catalog_path))
+    stored = db.execute("SELECT value FROM meta WHERE key = 'links'").fetchone()
+    if stored is not None and stored[0] == signature:
+        return
+
+    linked = {item_path.parent.name: item_path for item_path in iter_item_paths(catalog_path)}
+    indexed = {row[0] for row in db.execute("SELECT id FROM plots")}
+
+    rows = []
+    for plot_id in linked.keys() - indexed:
+        with contextlib.suppress(FileNotFoundError):
+            rows.append(_row(read_json_cached(linked[plot_id])))
+
+    with db:
+        db.executemany("DELETE FROM plots WHERE id = ?", [(i,) for i in indexed - linked.keys()])
+        db.executemany(_UPSERT, rows)
+        db.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('links', ?)", (signature,))
+
+
+def _links_signature(catalog_path: Path) -> list:
+    """Stat fingerprint of the files that hold a catalog's item links."""
+    paths = [catalog_path / "catalog.json"]
+    shards_dir = catalog_path / SHARDS_DIR
+    if shards_dir.is_dir():
+        paths.extend(sorted(shards_dir.glob("*/catalog.json")))
+    signature = []
+    for p in paths:
+        st = os.stat(p)
+        signature.append([p.parent.name, st.st_size, st.st_mtime_ns, st.st_ino])
+    return signature
+
+
+def _row(item: STACItem) -> tuple:
+    properties = item.get("properties", {})
+    title = properties.get("title", "Untitled")
+    dt_str = properties.get("datetime") or datetime.now(UTC).isoformat()
+    return (
+        item.get("id", ""),
+        title,
+        title.casefold(),
+        dt_str,
+        _sort_time(dt_str),
+        _features_href(item),
+    )
+
+
+def _parse_time(value: datetime | str) -> datetime:
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    return value
+
+
+def _sort_time(value: datetime | str) -> str:
+    """Normalise a timestamp to a UTC string that sorts chronologically."""
+    dt = _parse_time(value)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=UTC)
+    return dt.astimezone(UTC).isoformat(timespec="microseconds")
+
+
+def _escape_like(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _encode_cursor(sort: str, value: str, plot_id: str) -> str:
+    payload = json.dumps([sort, value, plot_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str, sort: str) -> tuple[str, str]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        cursor_sort, value, plot_id = json.loads(base64.urlsafe_b64decode(padded))
+    except (binascii.Error, ValueError, TypeError):
+        raise ValueError("Invalid cursor") from None
+    if cursor_sort != sort:
+        raise ValueError(f"Cursor was issued for sort {cursor_sort!r}, not {sort!r}")
+    return value, plot_id
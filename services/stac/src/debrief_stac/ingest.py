@@ -0,0 +1,357 @@
+"""
+Bulk import of source files into a STAC catalog.
+
+Parses recordings in parallel worker processes with debrief-io and writes
+them from a single writer in batched sessions, so each catalog file is
+rewritten once per batch rather than once per operation. Source files are
+stored in the catalog's content-addressed blob store; identical files are
+imported once. Progress is checkpointed after every batch, so an
+interrupted import resumes where it stopped.
+
+Usage:
+    report = import_sources("/data/catalog", ["/archive/2024"])
+    print(f"{report.positions_per_second:.0f} positions/s")
+
+Requires the optional debrief-io dependency (``pip install debrief-stac[io]``).
+"""
+
+import os
+import re
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from itertools import islice
+from pathlib import Path
+from typing import Any
+
+from debrief_stac.blobstore import hash_file
+from debrief_stac.catalog import open_catalog
+from debrief_stac.locks import catalog_lock
+from debrief_stac.models import ImportFailure, ImportReport, PlotMetadata
+from debrief_stac.session import CatalogSession
+from debrief_stac.storage import STATE_DIR, read_json, write_json_atomic
+from debrief_stac.types import CatalogPath, GeoJSONFeature
+
+# Catalog-relative path of the import checkpoint
+CHECKPOINT_FILE = "import-checkpoint.json"
+
+# Files committed per write session
+DEFAULT_BATCH_SIZE = 50
+
+# Parse results queued ahead of the writer, per worker
+_PARSE_WINDOW = 4
+
+# Checkpoint entry statuses
+STATUS_IMPORTED = "imported"
+STATUS_DUPLICATE = "duplicate"
+STATUS_EMPTY = "empty"
+
+
+@dataclass
+class _ParsedSource:
+    """Result of parsing one source file in a worker process."""
+
+    path: str
+    stat: list[int]
+    sha256: str = ""
+    features: list[GeoJSONFeature] = field(default_factory=list)
+    error: str | None = None
+
+
+def discover_sources(
+    sources: Iterable[str | Path], extensions: Iterable[str] | None = None
+) -> list[Path]:
+    """Expand files and directories into a sorted list of importable files.
+
+    Directories are searched recursively for files with a supported
+    extension; files named explicitly are always included.
+
+    Args:
+        sources: Files and/or directories to import
+        extensions: File extensions to collect from directories (defaults
+            to those with a registered debrief-io handler)
+
+    Returns:
+        Sorted, de-duplicated list of absolute file paths
+
+    Raises:
+        FileNotFoundError: If a source does not exist
+    """
+    if extensions is None:
+        extensions = _require_debrief_io().registry.get_supported_extensions()
+    suffixes = {ext.lower() for ext in extensions}
+
+    found: set[Path] = set()
+    for source in sources:
+        path = Path(source).absolute()
+        if path.is_dir():
+            found.update(p for p in path.rglob("*") if p.is_file() and p.suffix.lower() in suffixes)
+        elif path.is_file():
+            found.add(path)
+        else:
+            raise FileNotFoundError(f"Source not found: {path}")
+    return sorted(found)
+
+
+def import_sources(
+    catalog_path: CatalogPath,
+    sources: Iterable[str | Path],
+    *,
+    workers: int | None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    resume: bool = True,
+    progress: Callable[[ImportReport], None] | None = None,
+) -> ImportReport:
+    """Import source files into a catalog, one plot per file.
+
+    Each file becomes a plot whose ID is derived from its name and content
+    hash, holding the parsed features and the file itself as a source
+    asset. Files that fail to parse or to stage (for example with invalid
+    features) are reported, left out of the catalog and retried on the
+    next run; files that are unchanged since a checkpointed import, or whose
+    content has already been imported, are skipped.
+
+    Args:
+        catalog_path: Path to the catalog directory
+        sources: Files and/or directories to import
+        workers: Number of parser processes (defaults to the CPU count;
+            1 parses in-process)
+        batch_size: Number of files committed per write session
+        resume: Skip files recorded in the checkpoint of a previous run
+        progress: Optional callback invoked with the report after each batch
+
+    Returns:
+        ImportReport with counts, created plot IDs and throughput
+
+    Raises:
+        CatalogNotFoundError: If the catalog doesn't exist
+        FileNotFoundError: If a source does not exist
+        ImportError: If debrief-io is not installed
+
+    Example:
+        >>> report = import_sources("/data/catalog", ["/archive"], workers=8)
+        >>> print(f"{report.files_imported} plots, {report.positions_per_second:.0f} positions/s")
+    """
+    catalog_path = Path(catalog_path)
+    open_catalog(catalog_path)
+    _require_debrief_io()
+
+    started = time.perf_counter()
+    paths = discover_sources(sources)
+    checkpoint = _load_checkpoint(catalog_path) if resume else {}
+    digests = {
+        entry["sha256"]: entry.get("plot_id")
+        for entry in checkpoint.values()
+        if entry.get("plot_id") is not None
+    }
+
+    pending = [p for p in paths if not _is_checkpointed(checkpoint, p)]
+    report = ImportReport(files_total=len(paths), files_skipped=len(paths) - len(pending))
+
+    writer: CatalogSession | None = CatalogSession(catalog_path)
+    batch: dict[str, dict[str, Any]] = {}
+
+    def flush(final: bool = False) -> None:
+        nonlocal writer
+        writer.commit()
+        writer = None if final else CatalogSession(catalog_path)
+        checkpoint.update(batch)
+        _save_checkpoint(catalog_path, batch)
+        batch.clear()
+        report.elapsed_seconds = time.perf_counter() - started
+        if progress is not None:
+            progress(report)
+
+    def fail(path: str, message: str) -> None:
+        report.files_failed += 1
+        report.failures.append(ImportFailure(source_path=path, message=message))
+
+    try:
+        for parsed in _parse_all(pending, workers):
+            if parsed.error is not None:
+                fail(parsed.path, parsed.error)
+                continue
+
+            entry: dict[str, Any] = {"stat": parsed.stat, "sha256": parsed.sha256}
+            plot_id = _plot_id(Path(parsed.path), parsed.sha256)
+            if parsed.sha256 in digests:
+                entry.update(status=STATUS_DUPLICATE, plot_id=digests[parsed.sha256])
+                report.files_skipped += 1
+            elif not parsed.features:
+                entry.update(status=STATUS_EMPTY, plot_id=None)
+                report.files_skipped += 1
+            elif (catalog_path / plot_id / "item.json").exists():
+                # Written by a run that stopped before checkpointing it
+                entry.update(status=STATUS_IMPORTED, plot_id=plot_id)
+                digests[parsed.sha256] = plot_id
+                report.files_skipped += 1
+            else:
+                try:
+                    _stage_source(writer, parsed, plot_id)
+                except Exception as e:
+                    # Drop whatever the file staged, so the rest of the batch still commits
+                    writer.discard(plot_id)
+                    fail(parsed.path, f"{type(e).__name__}: {e}")
+                    continue
+                entry.update(status=STATUS_IMPORTED, plot_id=plot_id)
+                digests[parsed.sha256] = plot_id
+                report.files_imported += 1
+                report.plot_ids.append(plot_id)
+                report.features += len(parsed.features)
+                report.positions += sum(_count_positions(f) for f in parsed.features)
+
+            batch[parsed.path] = entry
+            if len(batch) >= batch_size:
+                flush()
+
+        flush(final=True)
+    finally:
+        if writer is not None:
+            writer.rollback()
+
+    return report
+
+
+def _stage_source(writer: CatalogSession, parsed: _ParsedSource, plot_id: str) -> None:
+    """Stage a parsed file as a new plot in the writer session."""
+    path = Path(parsed.path)
+    metadata = PlotMetadata(title=path.stem, description=f"Imported from {path.name}")
+    timestamp = _earliest_time(parsed.features)
+    if timestamp is not None:
+        metadata.timestamp = timestamp
+
+    writer.create_plot(metadata, plot_id=plot_id)
+    writer.add_features(plot_id, parsed.features)
+    writer.add_asset(plot_id, path, sha256=parsed.sha256)
+
+
+def _parse_all(paths: list[Path], workers: int | None) -> Iterator[_ParsedSource]:
+    """Parse files in worker processes, yielding results in input order.
+
+    At most ``workers * _PARSE_WINDOW`` files are in flight, bounding the
+    memory held by parsed results waiting for the writer.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1 or len(paths) <= 1:
+        for path in paths:
+            yield _parse_source(str(path))
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        remaining = (str(path) for path in paths)
+        window = deque(
+            executor.submit(_parse_source, path)
+            for path in islice(remaining, workers * _PARSE_WINDOW)
+        )
+        while window:
+            result = window.popleft().result()
+            for path in islice(remaining, 1):
+                window.append(executor.submit(_parse_source, path))
+            yield result
+
+
+def _parse_source(path: str) -> _ParsedSource:
+    """Hash and parse one source file (runs in a worker process)."""
+    debrief_io = _require_debrief_io()
+    try:
+        source_stat = os.stat(path)
+        parsed = _ParsedSource(
+            path=path,
+            stat=[source_stat.st_size, source_stat.st_mtime_ns],
+            sha256=hash_file(path),
+        )
+        result = debrief_io.parse(path)
+    except Exception as e:
+        return _ParsedSource(path=path, stat=[], error=f"{type(e).__name__}: {e}")
+
+    parsed.features = [
+        f if isinstance(f, dict) else f.model_dump(mode="json", exclude_none=True)
+        for f in result.features
+    ]
+    return parsed
+
+
+def _require_debrief_io() -> Any:
+    """Import debrief-io, which bulk import depends on."""
+    try:
+        import debrief_io
+    except ImportError as e:
+        raise ImportError(
+            "Bulk import requires debrief-io. Install with: pip install debrief-stac[io]"
+        ) from e
+    return debrief_io
+
+
+def _plot_id(path: Path, sha256: str) -> str:
+    """Derive a stable plot ID from a file's name and content hash."""
+    slug = re.sub(r"[^a-z0-9]+", "-", path.stem.lower()).strip("-") or "plot"
+    return f"{slug}-{sha256[:12]}"
+
+
+def _earliest_time(features: list[GeoJSONFeature]) -> datetime | None:
+    """Return the earliest start_time among features, if any.
+
+    Times without a UTC offset are taken as UTC, so naive and aware times
+    compare.
+    """
+    times = []
+    for feature in features:
+        value = feature.get("properties", {}).get("start_time")
+        if value:
+            dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+            times.append(dt if dt.tzinfo is not None else dt.replace(tzinfo=UTC))
+    return min(times, default=None)
+
+
+def _count_positions(feature: GeoJSONFeature) -> int:
+    """Count the positions a feature carries (track points or vertices)."""
+    positions = feature.get("properties", {}).get("positions")
+    if isinstance(positions, list):
+        return len(positions)
+    geometry = feature.get("geometry") or {}
+    if geometry.get("type") == "Point":
+        return 1
+    if geometry.get("type") in ("LineString", "MultiPoint"):
+        return len(geometry.get("coordinates", []))
+    return 0
+
+
+def _checkpoint_path(catalog_path: Path) -> Path:
+    return catalog_path / STATE_DIR / CHECKPOINT_FILE
+
+
+def _load_checkpoint(catalog_path: Path) -> dict[str, dict[str, Any]]:
+    """Load the per-source checkpoint, treating a missing or corrupt file as empty."""
+    try:
+        return read_json(_checkpoint_path(catalog_path)).get("sources", {})
+    except (OSError, ValueError, AttributeError):
+        return {}
+
+
+def _save_checkpoint(catalog_path: Path, entries: dict[str, dict[str, Any]]) -> None:
+    """Merge entries into the per-source checkpoint and write it atomically.
+
+    The merge runs under the catalog lock, so concurrent imports into the
+    same store keep each other's entries.
+    """
+    path = _checkpoint_path(catalog_path)
+    with catalog_lock(catalog_path):
+        checkpoint = _load_checkpoint(catalog_path)
+        checkpoint.update(entries)
+        write_json_atomic(path, {"sources": checkpoint}, indent=None)
+
+
+def _is_checkpointed(checkpoint: dict[str, dict[str, Any]], path: Path) -> bool:
+    """Return True if a file is unchanged since it was checkpointed."""
+    entry = checkpoint.get(str(path))
+    if entry is None:
+        return False
+    try:
+        source_stat = path.stat()
+    except OSError:
+        return False
+    return entry.get("stat") == [source_stat.st_size, source_stat.st_mtime_ns]
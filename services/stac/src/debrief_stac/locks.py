@@ -0,0 +1,91 @@
+"""
+Inter-process locks for debrief-stac writers.
+
+Every file is written atomically (temp file + rename), so readers never
+see a partial file; these locks stop concurrent writers losing each
+other's updates to the same file. Two levels are used:
+
+- a per-plot lock, held while a plot's item, FeatureCollection and
+  derived assets are read, modified and written
+- a catalog lock, held only for the short merge-and-write of the catalog
+  files that hold item links (and other catalog-wide state)
+
+Writers working on different plots therefore only contend briefly on the
+catalog lock. Locks are files under ``.debrief/locks`` locked with
+``filelock``, so they work across threads and processes. A writer that
+needs both takes the plot lock first, and a writer holding several plot
+locks waits for them in ascending plot ID order (see CatalogSession).
+"""
+
+import threading
+import weakref
+from pathlib import Path
+
+from filelock import FileLock
+
+from debrief_stac.exceptions import CatalogNotFoundError
+from debrief_stac.storage import STATE_DIR
+from debrief_stac.types import CatalogPath
+
+# Catalog-relative directory holding lock files
+LOCKS_DIR = "locks"
+
+# Seconds to wait for a lock before raising filelock.Timeout
+LOCK_TIMEOUT = 30.0
+
+_CATALOG_LOCK = "catalog.lock"
+
+# One FileLock per lock file per process, so acquisition is reentrant
+# within a thread and exclusive between threads
+_locks: weakref.WeakValueDictionary[str, FileLock] = weakref.WeakValueDictionary()
+_locks_lock = threading.Lock()
+
+
+def catalog_lock(catalog_path: CatalogPath) -> FileLock:
+    """Return the lock guarding a catalog's link files and settings.
+
+    Args:
+        catalog_path: Path to the catalog directory
+
+    Returns:
+        Reentrant FileLock, used as a context manager
+
+    Raises:
+        CatalogNotFoundError: If no catalog exists at the path
+
+    Example:
+        >>> with catalog_lock("/data/catalog"):
+        ...     ...
+    """
+    return _lock(Path(catalog_path), _CATALOG_LOCK)
+
+
+def plot_lock(catalog_path: CatalogPath, plot_id: str) -> FileLock:
+    """Return the lock guarding a plot's files.
+
+    Args:
+        catalog_path: Path to the catalog directory
+        plot_id: ID of the plot
+
+    Returns:
+        Reentrant FileLock, used as a context manager
+
+    Raises:
+        CatalogNotFoundError: If no catalog exists at the path
+    """
+    return _lock(Path(catalog_path), f"plot-{plot_id}.lock")
+
+
+def _lock(catalog_path: Path, name: str) -> FileLock:
+    lock_path = catalog_path / STATE_DIR / LOCKS_DIR / name
+    key = str(lock_path.absolute())
+    with _locks_lock:
+        lock = _locks.get(key)
+        if lock is None:
+            if not lock_path.parent.is_dir():
+                if not (catalog_path / "catalog.json").exists():
+                    raise CatalogNotFoundError(str(catalog_path))
+                lock_path.parent.mkdir(parents=True, exist_ok=True)
+            lock = FileLock(lock_path, timeout=LOCK_TIMEOUT, thread_local=True)
+            _locks[key] = lock
+        return lock
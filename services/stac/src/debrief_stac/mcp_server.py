@@ -4,6 +4,11 @@ MCP Server for debrief-stac operations.
 This module exposes all core debrief-stac operations as MCP tools
 for VS Code extension and AI orchestration.
 
+The registered tools are coroutines: each runs its blocking file I/O on a
+bounded worker pool, so a slow call on one plot does not stall the
+server. Writes to the same plot are queued one at a time before they
+reach the pool; reads, and writes to other plots, run in parallel.
+
 Usage:
     Run as MCP server:
         python -m debrief_stac.mcp_server
@@ -12,17 +17,25 @@ Usage:
         debrief-stac-mcp
 """
 
-from typing import Any
+import asyncio
+import functools
+import threading
+import weakref
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, TypeVar
 
 from mcp.server.fastmcp import FastMCP
 
-from debrief_stac.catalog import create_catalog, list_plots
+from debrief_stac.catalog import LAYOUT_FLAT, create_catalog
 from debrief_stac.exceptions import (
     CatalogExistsError,
     CatalogNotFoundError,
     PlotNotFoundError,
 )
 from debrief_stac.features import add_features
+from debrief_stac.index import DEFAULT_SORT, list_plots_page
 from debrief_stac.models import PlotMetadata
 from debrief_stac.plot import create_plot, read_plot
 
@@ -36,14 +49,59 @@ TOOL_NAMES = [
     "list_plots",
 ]
 
+# Maximum number of tool calls doing file I/O at once
+TOOL_WORKERS = 4
+
 # Create FastMCP server
 mcp = FastMCP("debrief-stac")
 
+_T = TypeVar("_T")
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+# One asyncio lock per plot being written, dropped once no call holds or awaits it
+_plot_locks: weakref.WeakValueDictionary[tuple[str, str], asyncio.Lock] = (
+    weakref.WeakValueDictionary()
+)
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Return the worker pool shared by all tool calls, creating it on first use."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=TOOL_WORKERS, thread_name_prefix="debrief-stac-mcp"
+            )
+        return _executor
+
+
+async def _run(func: Callable[..., _T], *args: Any) -> _T:
+    """Run a blocking function on the worker pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_executor(), functools.partial(func, *args))
+
+
+async def _run_write(catalog_path: str, plot_id: str, func: Callable[..., _T], *args: Any) -> _T:
+    """Run a blocking write to a plot on the worker pool, one write per plot at a time.
+
+    Queued writes wait here rather than in a worker thread (on the plot's
+    file lock), so they never tie up the pool while other calls wait.
+    """
+    key = (str(Path(catalog_path).absolute()), plot_id)
+    lock = _plot_locks.get(key)
+    if lock is None:
+        lock = _plot_locks[key] = asyncio.Lock()
+    async with lock:
+        return await _run(func, *args)
+
 
 def mcp_create_catalog(
     path: str,
     catalog_id: str | None = None,
     description: str = "Debrief analysis catalog",
+    layout: str = LAYOUT_FLAT,
 ) -> dict[str, Any]:
     """Create a new local STAC catalog.
 
@@ -51,12 +109,13 @@ def mcp_create_catalog(
         path: Directory path where the catalog will be created
         catalog_id: Unique identifier for the catalog (defaults to directory name)
         description: Human-readable description of the catalog
+        layout: "flat" or "sharded" (for stores expected to hold many plots)
 
     Returns:
         Dictionary with 'path' key on success, 'error' key on failure
     """
     try:
-        catalog_path = create_catalog(path, catalog_id, description)
+        catalog_path = create_catalog(path, catalog_id, description, layout=layout)
         return {"path": str(catalog_path), "catalog_id": catalog_id or catalog_path.name}
     except CatalogExistsError as e:
         return {"error": f"Catalog already exists at {e.path}"}
@@ -175,17 +234,27 @@ def mcp_add_asset(
         return {"error": str(e)}
 
 
-def mcp_list_plots(catalog_path: str) -> dict[str, Any]:
-    """List all plots in a catalog with summary information.
+def mcp_list_plots(
+    catalog_path: str,
+    limit: int | None = None,
+    cursor: str | None = None,
+    sort: str = DEFAULT_SORT,
+    title: str | None = None,
+) -> dict[str, Any]:
+    """List plots in a catalog with summary information, a page at a time.
 
     Args:
         catalog_path: Path to the catalog directory
+        limit: Maximum number of plots to return (all if omitted)
+        cursor: 'next_cursor' from the previous page
+        sort: "datetime", "title" or "id", "-" prefix for descending
+        title: Only plots whose title contains this text
 
     Returns:
-        Dictionary with 'plots' list on success, 'error' key on failure
+        Dictionary with 'plots' list and 'next_cursor' on success, 'error' key on failure
     """
     try:
-        summaries = list_plots(catalog_path)
+        page = list_plots_page(catalog_path, limit=limit, cursor=cursor, sort=sort, title=title)
         plots = [
             {
                 "id": s.id,
@@ -193,9 +262,9 @@ def mcp_list_plots(catalog_path: str) -> dict[str, Any]:
                 "datetime": s.timestamp.isoformat(),
                 "feature_count": s.feature_count,
             }
-            for s in summaries
+            for s in page.plots
         ]
-        return {"plots": plots, "count": len(plots)}
+        return {"plots": plots, "count": len(plots), "next_cursor": page.next_cursor}
     except CatalogNotFoundError as e:
         return {"error": f"Catalog not found at {e.path}"}
     except Exception as e:
@@ -204,10 +273,11 @@ def mcp_list_plots(catalog_path: str) -> dict[str, Any]:
 
 # Register tools with FastMCP using decorators
 @mcp.tool()
-def create_catalog_tool(
+async def create_catalog_tool(
     path: str,
     catalog_id: str | None = None,
     description: str = "Debrief analysis catalog",
+    layout: str = LAYOUT_FLAT,
 ) -> dict[str, Any]:
     """Create a new local STAC catalog at the specified path.
 
@@ -215,15 +285,16 @@ def create_catalog_tool(
         path: Directory path where the catalog will be created
         catalog_id: Unique identifier for the catalog (defaults to directory name)
         description: Human-readable description of the catalog
+        layout: "flat", or "sharded" for stores expected to hold many plots
 
     Returns:
         Dictionary with catalog path and ID on success, error details on failure
     """
-    return mcp_create_catalog(path, catalog_id, description)
+    return await _run(mcp_create_catalog, path, catalog_id, description, layout)
 
 
 @mcp.tool()
-def create_plot_tool(
+async def create_plot_tool(
     catalog_path: str,
     title: str,
     description: str | None = None,
@@ -240,11 +311,15 @@ def create_plot_tool(
     Returns:
         Dictionary with plot ID on success, error details on failure
     """
-    return mcp_create_plot(catalog_path, title, description, plot_id)
+    if plot_id is None:
+        return await _run(mcp_create_plot, catalog_path, title, description, plot_id)
+    return await _run_write(
+        catalog_path, plot_id, mcp_create_plot, catalog_path, title, description, plot_id
+    )
 
 
 @mcp.tool()
-def read_plot_tool(
+async def read_plot_tool(
     catalog_path: str,
     plot_id: str,
 ) -> dict[str, Any]:
@@ -257,11 +332,11 @@ def read_plot_tool(
     Returns:
         Dictionary with STAC Item data on success, error details on failure
     """
-    return mcp_read_plot(catalog_path, plot_id)
+    return await _run(mcp_read_plot, catalog_path, plot_id)
 
 
 @mcp.tool()
-def add_features_tool(
+async def add_features_tool(
     catalog_path: str,
     plot_id: str,
     features: list[dict[str, Any]],
@@ -276,11 +351,13 @@ def add_features_tool(
     Returns:
         Dictionary with feature count on success, error details on failure
     """
-    return mcp_add_features(catalog_path, plot_id, features)
+    return await _run_write(
+        catalog_path, plot_id, mcp_add_features, catalog_path, plot_id, features
+    )
 
 
 @mcp.tool()
-def add_asset_tool(
+async def add_asset_tool(
     catalog_path: str,
     plot_id: str,
     source_path: str,
@@ -299,20 +376,39 @@ def add_asset_tool(
     Returns:
         Dictionary with asset key on success, error details on failure
     """
-    return mcp_add_asset(catalog_path, plot_id, source_path, asset_key, media_type)
+    return await _run_write(
+        catalog_path,
+        plot_id,
+        mcp_add_asset,
+        catalog_path,
+        plot_id,
+        source_path,
+        asset_key,
+        media_type,
+    )
 
 
 @mcp.tool()
-def list_plots_tool(catalog_path: str) -> dict[str, Any]:
-    """List all plots in a catalog with summary information.
+async def list_plots_tool(
+    catalog_path: str,
+    limit: int | None = None,
+    cursor: str | None = None,
+    sort: str = DEFAULT_SORT,
+    title: str | None = None,
+) -> dict[str, Any]:
+    """List plots in a catalog with summary information.
 
     Args:
         catalog_path: Path to the catalog directory
+        limit: Maximum number of plots per page (all if omitted)
+        cursor: 'next_cursor' returned with the previous page
+        sort: "datetime", "title" or "id", "-" prefix for descending (default newest first)
+        title: Only plots whose title contains this text (case-insensitive)
 
     Returns:
-        Dictionary with list of plot summaries sorted by datetime (newest first)
+        Dictionary with a page of plot summaries and the cursor for the next page
     """
-    return mcp_list_plots(catalog_path)
+    return await _run(mcp_list_plots, catalog_path, limit, cursor, sort, title)
 
 
 def main() -> None:
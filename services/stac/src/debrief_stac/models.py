@@ -8,7 +8,7 @@ and managing STAC Items (plots) within catalogs.
 from datetime import UTC
 from datetime import datetime as dt
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, computed_field
 
 
 class PlotMetadata(BaseModel):
@@ -60,6 +60,18 @@ class PlotSummary(BaseModel):
     model_config = {"populate_by_name": True}
 
 
+class PlotPage(BaseModel):
+    """One page of a plot listing.
+
+    Attributes:
+        plots: Plot summaries on this page, in the requested order
+        next_cursor: Opaque cursor for the next page, or None on the last page
+    """
+
+    plots: list[PlotSummary] = Field(default_factory=list, description="Plots on this page")
+    next_cursor: str | None = Field(default=None, description="Cursor for the next page")
+
+
 class AssetProvenance(BaseModel):
     """Provenance metadata for source file assets.
 
@@ -69,6 +81,7 @@ class AssetProvenance(BaseModel):
         source_path: Original file path before copy
         load_timestamp: When the file was loaded
         tool_version: Version of debrief-stac that loaded the file
+        sha256: SHA-256 digest of the file content
     """
 
     source_path: str = Field(..., description="Original source file path")
@@ -76,3 +89,92 @@ class AssetProvenance(BaseModel):
         default_factory=lambda: dt.now(UTC), description="When the asset was loaded"
     )
     tool_version: str = Field(default="0.1.0", description="debrief-stac version")
+    sha256: str | None = Field(default=None, description="SHA-256 digest of the content")
+
+
+class ImportFailure(BaseModel):
+    """A source file that could not be imported.
+
+    Attributes:
+        source_path: Path of the file that failed
+        message: Description of the error
+    """
+
+    source_path: str = Field(..., description="Source file path")
+    message: str = Field(..., description="Error description")
+
+
+class ImportReport(BaseModel):
+    """Progress and outcome of a bulk import.
+
+    Attributes:
+        files_total: Number of source files discovered
+        files_imported: Files written to the catalog as new plots
+        files_skipped: Files already imported (checkpointed) or duplicates
+        files_failed: Files that could not be parsed or written
+        plot_ids: IDs of the plots created
+        features: Number of features written
+        positions: Number of track positions written
+        elapsed_seconds: Wall-clock time spent so far
+        failures: Details of each failed file
+    """
+
+    files_total: int = Field(default=0, ge=0, description="Source files discovered")
+    files_imported: int = Field(default=0, ge=0, description="Files imported as plots")
+    files_skipped: int = Field(default=0, ge=0, description="Files skipped")
+    files_failed: int = Field(default=0, ge=0, description="Files that failed")
+    plot_ids: list[str] = Field(default_factory=list, description="Plots created")
+    features: int = Field(default=0, ge=0, description="Features written")
+    positions: int = Field(default=0, ge=0, description="Track positions written")
+    elapsed_seconds: float = Field(default=0.0, ge=0, description="Elapsed time")
+    failures: list[ImportFailure] = Field(default_factory=list, description="Failed files")
+
+    @computed_field
+    @property
+    def positions_per_second(self) -> float:
+        """Import throughput in track positions per second."""
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.positions / self.elapsed_seconds
+
+
+class VerifyIssue(BaseModel):
+    """A problem found while verifying a catalog.
+
+    Attributes:
+        plot_id: ID of the affected plot
+        kind: Issue kind (e.g. "missing_asset", "bbox_mismatch")
+        message: Human-readable description
+        repaired: Whether the issue was fixed by a repair run
+    """
+
+    plot_id: str = Field(..., description="Affected plot ID")
+    kind: str = Field(..., description="Issue kind")
+    message: str = Field(..., description="Issue description")
+    repaired: bool = Field(default=False, description="Whether the issue was repaired")
+
+
+class VerifyReport(BaseModel):
+    """Outcome of a catalog verification.
+
+    Attributes:
+        items_checked: Plots verified in this run
+        items_skipped: Plots skipped as unchanged since their last clean verification
+        assets_hashed: Distinct asset files re-hashed
+        bytes_hashed: Bytes read while re-hashing
+        elapsed_seconds: Wall-clock duration
+        issues: Problems found
+    """
+
+    items_checked: int = Field(default=0, ge=0, description="Plots verified")
+    items_skipped: int = Field(default=0, ge=0, description="Unchanged plots skipped")
+    assets_hashed: int = Field(default=0, ge=0, description="Asset files re-hashed")
+    bytes_hashed: int = Field(default=0, ge=0, description="Bytes re-hashed")
+    elapsed_seconds: float = Field(default=0.0, ge=0, description="Elapsed time")
+    issues: list[VerifyIssue] = Field(default_factory=list, description="Problems found")
+
+    @computed_field
+    @property
+    def ok(self) -> bool:
+        """True if no unrepaired issues remain."""
+        return all(issue.repaired for issue in self.issues)
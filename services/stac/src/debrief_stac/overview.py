@@ -0,0 +1,310 @@
+"""
+Overview geometry and thumbnails for debrief-stac plots.
+
+Each plot with tracks keeps an ``overview.geojson`` asset: its track
+polylines simplified to a fixed total vertex budget, so a plot browser
+can draw a preview from a few KB rather than the full FeatureCollection.
+Vertices are ranked by Visvalingam-Whyatt effective area and the most
+significant are kept across all tracks, so long, winding tracks get
+more of the budget than short, straight ones.
+
+When the catalog is created with ``thumbnails=True``, the overview is
+also rendered to a small PNG (``thumbnail.png``) by a pure-Python
+rasterizer. Both assets are rebuilt whenever features are added.
+"""
+
+import heapq
+import math
+import struct
+import zlib
+from collections.abc import Sequence
+from pathlib import Path
+
+from debrief_stac.storage import write_bytes_atomic, write_json_atomic
+from debrief_stac.types import (
+    ASSET_ROLE_OVERVIEW,
+    ASSET_ROLE_THUMBNAIL,
+    MEDIA_TYPE_GEOJSON,
+    MEDIA_TYPE_PNG,
+    GeoJSONFeature,
+    GeoJSONFeatureCollection,
+    STACItem,
+)
+
+# Plot-relative filenames of the overview assets
+OVERVIEW_FILENAME = "overview.geojson"
+THUMBNAIL_FILENAME = "thumbnail.png"
+
+# Maximum number of vertices across all overview polylines
+OVERVIEW_VERTEX_BUDGET = 256
+
+# Longest side of a thumbnail, in pixels
+THUMBNAIL_SIZE = 128
+
+# Decimal places kept in overview coordinates (~1 m)
+_COORDINATE_PRECISION = 5
+
+# Feature properties copied into the overview
+_OVERVIEW_PROPERTIES = ("kind", "platform_id", "platform_name", "name")
+
+# Track colours (RGB), assigned in feature order
+_PALETTE = [
+    (31, 119, 180),
+    (214, 39, 40),
+    (44, 160, 44),
+    (255, 127, 14),
+    (148, 103, 189),
+    (23, 190, 207),
+    (140, 86, 75),
+    (227, 119, 194),
+]
+
+_PADDING = 4
+
+
+def build_overview(
+    features: Sequence[GeoJSONFeature], budget: int = OVERVIEW_VERTEX_BUDGET
+) -> GeoJSONFeatureCollection:
+    """Simplify the track polylines of features to a total vertex budget.
+
+    Every kept track retains its end points. If there are more tracks
+    than the budget allows end points for, the tracks with the largest
+    extent are kept.
+
+    Args:
+        features: GeoJSON features; LineString and MultiLineString
+            geometries are treated as tracks, others are ignored
+        budget: Maximum total number of vertices
+
+    Returns:
+        FeatureCollection of simplified LineString features
+    """
+    lines: list[tuple[GeoJSONFeature, list[list[float]]]] = []
+    for feature in features:
+        geometry = feature.get("geometry") or {}
+        if geometry.get("type") == "LineString":
+            parts = [geometry.get("coordinates", [])]
+        elif geometry.get("type") == "MultiLineString":
+            parts = geometry.get("coordinates", [])
+        else:
+            continue
+        lines.extend((feature, part) for part in parts if len(part) >= 2)
+
+    if len(lines) > budget // 2:
+        lines = sorted(lines, key=lambda line: _extent(line[1]), reverse=True)[: budget // 2]
+
+    # Rank interior vertices of all lines together by significance
+    ranked: list[tuple[float, int, int]] = []
+    for n, (_, coords) in enumerate(lines):
+        for i, significance in enumerate(_significance(coords)):
+            if 0 < i < len(coords) - 1:
+                ranked.append((significance, n, i))
+    spare = budget - 2 * len(lines)
+    kept = {(n, i) for _, n, i in heapq.nlargest(spare, ranked)} if spare > 0 else set()
+
+    overview = []
+    for n, (feature, coords) in enumerate(lines):
+        last = len(coords) - 1
+        simplified = [
+            [round(c[0], _COORDINATE_PRECISION), round(c[1], _COORDINATE_PRECISION)]
+            for i, c in enumerate(coords)
+            if i in (0, last) or (n, i) in kept
+        ]
+        properties = feature.get("properties") or {}
+        overview_feature: GeoJSONFeature = {
+            "type": "Feature",
+            "geometry": {"type": "LineString", "coordinates": simplified},
+            "properties": {k: properties[k] for k in _OVERVIEW_PROPERTIES if k in properties},
+        }
+        if "id" in feature:
+            overview_feature["id"] = feature["id"]
+        overview.append(overview_feature)
+
+    return {"type": "FeatureCollection", "features": overview}
+
+
+def render_thumbnail(overview: GeoJSONFeatureCollection, size: int = THUMBNAIL_SIZE) -> bytes:
+    """Rasterize overview polylines to a PNG image.
+
+    The image has a transparent background, its longest side is ``size``
+    pixels, and its aspect ratio follows the tracks' extent (longitude
+    scaled by the cosine of the mid latitude). Each track is drawn in its
+    own colour.
+
+    Args:
+        overview: FeatureCollection from build_overview()
+        size: Longest side of the image in pixels
+
+    Returns:
+        PNG file content
+    """
+    lines = [f["geometry"]["coordinates"] for f in overview["features"]]
+    points = [c for line in lines for c in line]
+    if not points:
+        return _encode_png(1, 1, bytearray(4))
+
+    min_lon = min(c[0] for c in points)
+    max_lon = max(c[0] for c in points)
+    min_lat = min(c[1] for c in points)
+    max_lat = max(c[1] for c in points)
+    x_scale = math.cos(math.radians((min_lat + max_lat) / 2))
+    span_x = (max_lon - min_lon) * x_scale
+    span_y = max_lat - min_lat
+    span = max(span_x, span_y) or 1.0
+
+    drawable = max(size - 2 * _PADDING, 1)
+    width = max(round(drawable * span_x / span), 1) + 2 * _PADDING
+    height = max(round(drawable * span_y / span), 1) + 2 * _PADDING
+    scale = drawable / span
+
+    pixels = bytearray(width * height * 4)
+    for n, line in enumerate(lines):
+        colour = _PALETTE[n % len(_PALETTE)]
+        xy = [
+            (
+                _PADDING + round((c[0] - min_lon) * x_scale * scale),
+                height - 1 - _PADDING - round((c[1] - min_lat) * scale),
+            )
+            for c in line
+        ]
+        for (x0, y0), (x1, y1) in zip(xy, xy[1:], strict=False):
+            _draw_line(pixels, width, x0, y0, x1, y1, colour)
+
+    return _encode_png(width, height, pixels)
+
+
+def _write_overview(
+    plot_dir: Path, item: STACItem, features: Sequence[GeoJSONFeature], thumbnail: bool = False
+) -> bool:
+    """Write a plot's overview (and optionally its thumbnail) and register them as assets.
+
+    Internal function called by add_features() and write sessions after
+    the FeatureCollection changes. Does nothing if no feature is a track.
+
+    Args:
+        plot_dir: The plot's directory
+        item: STAC Item dictionary (modified in place)
+        features: All features of the plot
+        thumbnail: Also render the overview to a PNG thumbnail
+
+    Returns:
+        True if the overview was written
+    """
+    overview = build_overview(features)
+    if not overview["features"]:
+        return False
+
+    write_json_atomic(plot_dir / OVERVIEW_FILENAME, overview, indent=None)
+    item["assets"]["overview"] = {
+        "href": f"./{OVERVIEW_FILENAME}",
+        "type": MEDIA_TYPE_GEOJSON,
+        "title": "Simplified track overview",
+        "roles": [ASSET_ROLE_OVERVIEW],
+    }
+
+    if thumbnail:
+        write_bytes_atomic(plot_dir / THUMBNAIL_FILENAME, render_thumbnail(overview))
+        item["assets"]["thumbnail"] = {
+            "href": f"./{THUMBNAIL_FILENAME}",
+            "type": MEDIA_TYPE_PNG,
+            "title": "Track thumbnail",
+            "roles": [ASSET_ROLE_THUMBNAIL],
+        }
+    return True
+
+
+def _significance(coords: Sequence[Sequence[float]]) -> list[float]:
+    """Significance of each vertex of a lon/lat polyline (see _planar_significance)."""
+    cos_lat = math.cos(math.radians(coords[0][1]))
+    return _planar_significance([(c[0] * cos_lat, c[1]) for c in coords])
+
+
+def _planar_significance(xy: Sequence[tuple[float, float]]) -> list[float]:
+    """Visvalingam-Whyatt effective area of each vertex of a polyline.
+
+    Vertices are removed smallest triangle first; a vertex's significance
+    is the area of its triangle when removed, raised to the largest area
+    removed before it, so keeping every vertex above a threshold always
+    yields the same simplification Visvalingam-Whyatt would. End points
+    are infinitely significant. Runs in O(n log n) whatever the shape,
+    unlike Douglas-Peucker, which degrades to O(n^2) on regular zigzags.
+    """
+    n = len(xy)
+    significance = [0.0] * n
+    significance[0] = significance[-1] = math.inf
+    if n < 3:
+        return significance
+
+    prev = list(range(-1, n - 1))
+    next_ = list(range(1, n + 1))
+
+    def area(i: int) -> float:
+        (ax, ay), (bx, by), (cx, cy) = xy[prev[i]], xy[i], xy[next_[i]]
+        return abs((bx - ax) * (cy - ay) - (cx - ax) * (by - ay)) / 2
+
+    current = [0.0] + [area(i) for i in range(1, n - 1)] + [0.0]
+    heap = [(current[i], i) for i in range(1, n - 1)]
+    heapq.heapify(heap)
+    removed = [False] * n
+    largest = 0.0
+    while heap:
+        a, i = heapq.heappop(heap)
+        if removed[i] or a != current[i]:
+            continue
+        removed[i] = True
+        largest = max(largest, a)
+        significance[i] = largest
+        p, q = prev[i], next_[i]
+        next_[p], prev[q] = q, p
+        for j in (p, q):
+            if 0 < j < n - 1:
+                current[j] = area(j)
+                heapq.heappush(heap, (current[j], j))
+
+    return significance
+
+
+def _extent(coords: Sequence[Sequence[float]]) -> float:
+    lons = [c[0] for c in coords]
+    lats = [c[1] for c in coords]
+    return math.hypot(max(lons) - min(lons), max(lats) - min(lats))
+
+
+def _draw_line(
+    pixels: bytearray, width: int, x0: int, y0: int, x1: int, y1: int, colour: tuple[int, ...]
+) -> None:
+    """Draw an opaque line into an RGBA buffer (Bresenham)."""
+    rgba = bytes(colour) + b"\xff"
+    dx, dy = abs(x1 - x0), -abs(y1 - y0)
+    sx, sy = (1 if x0 < x1 else -1), (1 if y0 < y1 else -1)
+    error = dx + dy
+    while True:
+        offset = (y0 * width + x0) * 4
+        pixels[offset : offset + 4] = rgba
+        if x0 == x1 and y0 == y1:
+            return
+        e2 = 2 * error
+        if e2 >= dy:
+            error += dy
+            x0 += sx
+        if e2 <= dx:
+            error += dx
+            y0 += sy
+
+
+def _encode_png(width: int, height: int, pixels: bytearray) -> bytes:
+    """Encode an RGBA buffer as a PNG file."""
+    stride = width * 4
+    raw = b"".join(b"\x00" + bytes(pixels[y * stride : (y + 1) * stride]) for y in range(height))
+
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        body = kind + data
+        return struct.pack(">I", len(data)) + body + struct.pack(">I", zlib.crc32(body))
+
+    header = struct.pack(">IIBBBBB", width, height, 8, 6, 0, 0, 0)
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", header)
+        + chunk(b"IDAT", zlib.compress(raw, 9))
+        + chunk(b"IEND", b"")
+    )
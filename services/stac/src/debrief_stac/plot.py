@@ -5,13 +5,16 @@ This module provides functions for creating and reading plots,
 which are represented as STAC Items within a catalog.
 """
 
-import json
 import uuid
 from pathlib import Path
 
-from debrief_stac.catalog import _add_item_link, _save_catalog, open_catalog
+from debrief_stac.cache import read_json_cached
+from debrief_stac.catalog import _CatalogLinks
 from debrief_stac.exceptions import PlotNotFoundError
+from debrief_stac.index import _index_items
+from debrief_stac.locks import plot_lock
 from debrief_stac.models import PlotMetadata
+from debrief_stac.storage import read_json, write_json_atomic
 from debrief_stac.types import (
     STAC_VERSION,
     CatalogPath,
@@ -49,49 +52,25 @@ def create_plot(
     catalog_path = Path(catalog_path)
 
     # Load catalog (validates it exists)
-    catalog_data = open_catalog(catalog_path)
+    links = _CatalogLinks(catalog_path)
 
     # Generate plot ID if not provided
     if plot_id is None:
         plot_id = str(uuid.uuid4())
 
-    # Create plot directory
-    plot_dir = catalog_path / plot_id
-    plot_dir.mkdir(parents=True, exist_ok=True)
-
-    # Build STAC Item structure
-    item_data: STACItem = {
-        "type": "Feature",
-        "stac_version": STAC_VERSION,
-        "stac_extensions": [],
-        "id": plot_id,
-        "geometry": None,  # Updated when features are added
-        "bbox": None,  # Updated when features are added
-        "properties": {
-            "title": metadata.title,
-            "datetime": metadata.timestamp.isoformat(),
-        },
-        "links": [
-            {"rel": "root", "href": "../catalog.json", "type": "application/json"},
-            {"rel": "parent", "href": "../catalog.json", "type": "application/json"},
-            {"rel": "self", "href": "./item.json", "type": "application/geo+json"},
-        ],
-        "assets": {},
-    }
+    with plot_lock(catalog_path, plot_id):
+        # Create plot directory
+        plot_dir = catalog_path / plot_id
+        plot_dir.mkdir(parents=True, exist_ok=True)
 
-    # Add description if provided
-    if metadata.description:
-        item_data["properties"]["description"] = metadata.description
+        # Link the item from its catalog, then build the STAC Item structure
+        parent_href = links.add_item(plot_id)
+        item_data = _build_item(plot_id, metadata, parent_href)
 
-    # Write item.json
-    item_path = plot_dir / "item.json"
-    with open(item_path, "w") as f:
-        json.dump(item_data, f, indent=2)
-
-    # Update catalog links
-    item_href = f"./{plot_id}/item.json"
-    _add_item_link(catalog_data, plot_id, item_href)
-    _save_catalog(catalog_path, catalog_data)
+        # Write item.json before the catalog links to it
+        write_json_atomic(plot_dir / "item.json", item_data)
+        links.save()
+        _index_items(catalog_path, [item_data])
 
     return plot_id
 
@@ -103,6 +82,10 @@ def read_plot(catalog_path: CatalogPath, plot_id: str) -> STACItem:
         catalog_path: Path to the catalog directory
         plot_id: ID of the plot to read
 
+    The result is served from the process-wide read cache while item.json
+    is unchanged, and is shared with other callers: copy it before
+    modifying it.
+
     Returns:
         Dictionary containing the STAC Item data
 
@@ -114,19 +97,35 @@ def read_plot(catalog_path: CatalogPath, plot_id: str) -> STACItem:
         >>> print(f"Plot title: {item['properties']['title']}")
     """
     catalog_path = Path(catalog_path)
-    plot_dir = catalog_path / plot_id
-    item_path = plot_dir / "item.json"
+
+    try:
+        item_data: STACItem = read_json_cached(catalog_path / plot_id / "item.json")
+    except FileNotFoundError:
+        raise PlotNotFoundError(plot_id, str(catalog_path)) from None
+
+    return item_data
+
+
+def _load_plot(catalog_path: CatalogPath, plot_id: str) -> STACItem:
+    """Read a plot's item.json from disk, bypassing the read cache.
+
+    Internal function for callers that modify the returned item.
+
+    Raises:
+        PlotNotFoundError: If the plot doesn't exist
+    """
+    catalog_path = Path(catalog_path)
+    item_path = catalog_path / plot_id / "item.json"
 
     if not item_path.exists():
         raise PlotNotFoundError(plot_id, str(catalog_path))
 
-    with open(item_path) as f:
-        item_data: STACItem = json.load(f)
+    return read_json(item_path)
 
-    return item_data
 
-
-def _save_plot(catalog_path: CatalogPath, plot_id: str, item_data: STACItem) -> None:
+def _save_plot(
+    catalog_path: CatalogPath, plot_id: str, item_data: STACItem, index: bool = True
+) -> None:
     """Save plot data back to disk.
 
     Internal function used after modifying plot assets or properties.
@@ -135,10 +134,54 @@ def _save_plot(catalog_path: CatalogPath, plot_id: str, item_data: STACItem) ->
         catalog_path: Path to the catalog directory
         plot_id: ID of the plot
         item_data: Updated item data to save
+        index: Update the plot's listing index row (callers saving many
+            plots pass False and index them together)
     """
     catalog_path = Path(catalog_path)
     plot_dir = catalog_path / plot_id
     item_path = plot_dir / "item.json"
 
-    with open(item_path, "w") as f:
-        json.dump(item_data, f, indent=2)
+    write_json_atomic(item_path, item_data)
+    if index:
+        _index_items(catalog_path, [item_data])
+
+
+def _build_item(
+    plot_id: str, metadata: PlotMetadata, parent_href: str = "../catalog.json"
+) -> STACItem:
+    """Build the STAC Item structure for a new plot.
+
+    Internal function shared by create_plot() and write sessions.
+
+    Args:
+        plot_id: ID of the new plot
+        metadata: PlotMetadata with title, description, and timestamp
+        parent_href: Href of the catalog linking the item, relative to the plot directory
+
+    Returns:
+        STAC Item dictionary with no assets or geometry
+    """
+    item_data: STACItem = {
+        "type": "Feature",
+        "stac_version": STAC_VERSION,
+        "stac_extensions": [],
+        "id": plot_id,
+        "geometry": None,  # Updated when features are added
+        "bbox": None,  # Updated when features are added
+        "properties": {
+            "title": metadata.title,
+            "datetime": metadata.timestamp.isoformat(),
+        },
+        "links": [
+            {"rel": "root", "href": "../catalog.json", "type": "application/json"},
+            {"rel": "parent", "href": parent_href, "type": "application/json"},
+            {"rel": "self", "href": "./item.json", "type": "application/geo+json"},
+        ],
+        "assets": {},
+    }
+
+    # Add description if provided
+    if metadata.description:
+        item_data["properties"]["description"] = metadata.description
+
+    return item_data
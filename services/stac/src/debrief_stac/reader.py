@@ -0,0 +1,307 @@
+"""
+Streaming FeatureCollection reader for debrief-stac.
+
+This module provides functions for lazily iterating over the features
+stored in a plot's FeatureCollection asset. The file is parsed
+incrementally, one feature at a time, so callers that only need a
+subset of features (or a subset of their properties) never hold the
+whole collection in memory. FeatureCollections small enough for the
+read cache are parsed once and then served from memory. Chunked stores
+are read chunk by chunk.
+"""
+
+import json
+from collections.abc import Collection, Iterator
+from pathlib import Path
+from typing import IO, Any
+
+from debrief_stac.cache import get_cache, read_json_cached
+from debrief_stac.chunks import feature_files, is_chunked, manifest_count
+from debrief_stac.plot import read_plot
+from debrief_stac.storage import content_size, open_text
+from debrief_stac.types import CatalogPath, GeoJSONFeature
+
+# Number of characters read from disk per refill of the parse buffer
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = " \t\n\r"
+
+
+class _FeatureStream:
+    """Incremental scanner over a GeoJSON FeatureCollection text stream.
+
+    Walks the top-level object key by key. Values of keys other than
+    ``features`` are decoded and discarded; members of the ``features``
+    array are decoded and yielded one at a time. Only the feature being
+    decoded (plus at most one read chunk) is held in the buffer.
+    """
+
+    def __init__(self, fp: IO[str], chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self._fp = fp
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self, min_size: int | None = None) -> bool:
+        """Read more text into the buffer, compacting consumed input first.
+
+        Returns:
+            False if the end of the stream has been reached
+        """
+        if self._eof:
+            return False
+        if self._pos:
+            self._buf = self._buf[self._pos :]
+            self._pos = 0
+        chunk = self._fp.read(max(self._chunk_size, min_size or 0))
+        if not chunk:
+            self._eof = True
+            return False
+        self._buf += chunk
+        return True
+
+    def _peek(self) -> str:
+        """Return the next non-whitespace character without consuming it."""
+        while True:
+            while self._pos < len(self._buf) and self._buf[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                raise ValueError("Unexpected end of FeatureCollection")
+
+    def _expect(self, chars: str) -> str:
+        """Consume the next non-whitespace character, which must be one of chars."""
+        char = self._peek()
+        if char not in chars:
+            raise ValueError(f"Expected one of {chars!r} at offset {self._pos}, got {char!r}")
+        self._pos += 1
+        return char
+
+    def _decode(self) -> Any:
+        """Decode the next JSON value, reading more input until it is complete."""
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                # Value is (probably) truncated - grow the buffer geometrically
+                if not self._fill(len(self._buf) - self._pos):
+                    raise
+                continue
+            # A number at the very end of the buffer may itself be truncated
+            if end == len(self._buf) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+    def __iter__(self) -> Iterator[GeoJSONFeature]:
+        self._expect("{")
+        if self._peek() == "}":
+            return
+        while True:
+            key = self._decode()
+            self._expect(":")
+            if key == "features":
+                yield from self._iter_array()
+            else:
+                self._decode()
+            if self._expect(",}") == "}":
+                return
+
+    def _iter_array(self) -> Iterator[GeoJSONFeature]:
+        self._expect("[")
+        if self._peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield self._decode()
+            if self._expect(",]") == "]":
+                return
+
+
+def stream_feature_collection(
+    fp: IO[str], chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[GeoJSONFeature]:
+    """Lazily yield the features of a FeatureCollection from an open text stream.
+
+    Args:
+        fp: Text stream positioned at the start of a FeatureCollection document
+        chunk_size: Number of characters to read per refill
+
+    Yields:
+        Each GeoJSON Feature dictionary, in file order
+
+    Raises:
+        ValueError: If the stream is not a well-formed JSON object
+    """
+    return iter(_FeatureStream(fp, chunk_size))
+
+
+def iter_features(
+    catalog_path: CatalogPath,
+    plot_id: str,
+    *,
+    kinds: Collection[str] | None = None,
+    platform_ids: Collection[str] | None = None,
+    feature_ids: Collection[str] | None = None,
+    include_properties: Collection[str] | None = None,
+    exclude_properties: Collection[str] | None = None,
+    include_geometry: bool = True,
+) -> Iterator[GeoJSONFeature]:
+    """Lazily iterate over a plot's features with filtering and projection.
+
+    FeatureCollections that fit in the read cache are parsed once and
+    served from memory; larger ones are parsed incrementally, so peak
+    memory is bounded by the largest single feature rather than the whole
+    file. Yielded features may be shared with the cache: copy them
+    before modifying them.
+
+    Args:
+        catalog_path: Path to the catalog directory
+        plot_id: ID of the plot to read features from
+        kinds: Only yield features whose ``properties.kind`` is in this set
+        platform_ids: Only yield features whose ``properties.platform_id`` is in this set
+        feature_ids: Only yield features whose ``id`` is in this set
+        include_properties: If given, keep only these property keys
+        exclude_properties: Property keys to drop (e.g. ``["positions"]``)
+        include_geometry: Whether to keep the feature geometry
+
+    Yields:
+        Matching GeoJSON Feature dictionaries, projected as requested
+
+    Raises:
+        PlotNotFoundError: If the plot doesn't exist
+
+    Example:
+        >>> for feature in iter_features(
+        ...     "/data/catalog", "my-plot", kinds={"TRACK"}, exclude_properties=["positions"]
+        ... ):
+        ...     print(feature["id"], feature["properties"]["platform_id"])
+    """
+    features_path = _features_path(catalog_path, plot_id)
+    if features_path is None:
+        return
+
+    kinds = set(kinds) if kinds is not None else None
+    platform_ids = set(platform_ids) if platform_ids is not None else None
+    feature_ids = {str(i) for i in feature_ids} if feature_ids is not None else None
+
+    for feature in _load_features(features_path, feature_ids):
+        if not _matches(feature, kinds, platform_ids, feature_ids):
+            continue
+        yield _project(feature, include_properties, exclude_properties, include_geometry)
+
+
+def read_features(catalog_path: CatalogPath, plot_id: str, **kwargs: Any) -> list[GeoJSONFeature]:
+    """Read a plot's features into a list, with optional filtering and projection.
+
+    Convenience wrapper around iter_features(); accepts the same keyword
+    arguments.
+
+    Args:
+        catalog_path: Path to the catalog directory
+        plot_id: ID of the plot to read features from
+        **kwargs: Filter and projection options passed to iter_features()
+
+    Returns:
+        List of matching GeoJSON Feature dictionaries
+
+    Raises:
+        PlotNotFoundError: If the plot doesn't exist
+    """
+    return list(iter_features(catalog_path, plot_id, **kwargs))
+
+
+def count_features(features_path: Path) -> int:
+    """Count the features in a FeatureCollection file without retaining them.
+
+    Compressed files are decompressed as a stream. Chunked stores are
+    counted from their manifest.
+
+    Args:
+        features_path: Path to the FeatureCollection file or chunk manifest
+
+    Returns:
+        Number of features in the collection
+    """
+    if is_chunked(features_path):
+        return manifest_count(read_json_cached(features_path))
+    with open_text(features_path) as f:
+        return sum(1 for _ in stream_feature_collection(f))
+
+
+def _load_features(
+    features_path: Path, feature_ids: Collection[str] | None = None
+) -> Iterator[GeoJSONFeature]:
+    """Iterate a plot's features from the read cache, streaming files too large for it.
+
+    For chunked stores, only the chunks that can hold feature_ids (if
+    given) are read.
+    """
+    for path in feature_files(features_path, feature_ids):
+        if get_cache().fits(content_size(path, path.stat().st_size)):
+            yield from read_json_cached(path).get("features", [])
+            continue
+
+        with open_text(path) as f:
+            yield from stream_feature_collection(f)
+
+
+def _features_path(catalog_path: CatalogPath, plot_id: str) -> Path | None:
+    """Resolve the FeatureCollection file of a plot from its item assets.
+
+    Returns:
+        Path to the FeatureCollection file or chunk manifest, or None if the
+        plot has no features
+    """
+    item = read_plot(catalog_path, plot_id)
+    asset = item.get("assets", {}).get("features")
+    if asset is None:
+        return None
+
+    features_path = Path(catalog_path) / plot_id / asset.get("href", "")
+    if not features_path.exists():
+        return None
+    return features_path
+
+
+def _matches(
+    feature: GeoJSONFeature,
+    kinds: set[str] | None,
+    platform_ids: set[str] | None,
+    feature_ids: set[str] | None,
+) -> bool:
+    """Check a feature against the requested filters."""
+    if feature_ids is not None and str(feature.get("id")) not in feature_ids:
+        return False
+
+    properties = feature.get("properties") or {}
+    if kinds is not None and properties.get("kind") not in kinds:
+        return False
+    return platform_ids is None or properties.get("platform_id") in platform_ids
+
+
+def _project(
+    feature: GeoJSONFeature,
+    include_properties: Collection[str] | None,
+    exclude_properties: Collection[str] | None,
+    include_geometry: bool,
+) -> GeoJSONFeature:
+    """Apply property and geometry projection to a feature."""
+    if include_properties is None and not exclude_properties and include_geometry:
+        return feature
+
+    properties = feature.get("properties") or {}
+    if include_properties is not None:
+        properties = {k: v for k, v in properties.items() if k in include_properties}
+    if exclude_properties:
+        properties = {k: v for k, v in properties.items() if k not in exclude_properties}
+
+    projected = dict(feature)
+    projected["properties"] = properties
+    if not include_geometry:
+        projected["geometry"] = None
+    return projected
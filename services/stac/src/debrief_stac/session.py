@@ -0,0 +1,378 @@
+"""
+Batched write sessions for debrief-stac.
+
+A write session stages plot, feature and asset mutations in memory and
+flushes them when the session ends. Each touched file (FeatureCollections,
+item.json files, catalog.json) is written exactly once, via an atomic
+rename, regardless of how many operations touched it.
+
+Usage:
+    with session("/data/catalog") as s:
+        plot_id = s.create_plot(PlotMetadata(title="Exercise Alpha"))
+        s.add_features(plot_id, track_features)
+        s.add_features(plot_id, reference_features)
+        s.add_asset(plot_id, "/data/raw/alpha.rep")
+"""
+
+import copy
+import uuid
+from collections.abc import Iterable, Iterator, Sequence
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from filelock import FileLock, Timeout
+
+from debrief_stac.assets import _stage_asset
+from debrief_stac.blobstore import _StatCache, link_file
+from debrief_stac.catalog import (
+    _CatalogLinks,
+    feature_chunk_size,
+    feature_storage,
+    thumbnails_enabled,
+)
+from debrief_stac.columnar import _write_columns, build_columns
+from debrief_stac.exceptions import DebriefStacError, PlotExistsError, PlotLockedError
+from debrief_stac.features import (
+    _affects_derived,
+    _load_feature_collection,
+    _merge_features,
+    _remove_stored_features,
+    _store_features,
+    _stored_features_path,
+    _validate_feature,
+)
+from debrief_stac.index import _index_items
+from debrief_stac.locks import plot_lock
+from debrief_stac.models import PlotMetadata
+from debrief_stac.overview import _write_overview
+from debrief_stac.plot import _build_item, _load_plot, _save_plot
+from debrief_stac.tiles import _update_tiles
+from debrief_stac.types import (
+    AssetPath,
+    CatalogPath,
+    GeoJSONFeature,
+    GeoJSONFeatureCollection,
+    STACItem,
+)
+
+
+@dataclass
+class _StagedPlot:
+    """Pending state for one plot within a session."""
+
+    item: STACItem
+    is_new: bool = False
+    item_dirty: bool = False
+    features: GeoJSONFeatureCollection | None = None
+    features_dirty: bool = False
+    features_source: Path | None = None
+    appended: list[GeoJSONFeature] = field(default_factory=list)
+    links: list[tuple[Path, Path]] = field(default_factory=list)
+
+
+class CatalogSession:
+    """Stages mutations to a catalog and flushes them in a single pass.
+
+    Operations mirror the module-level functions (create_plot, add_features,
+    add_asset) but nothing except content-addressed blobs is written until
+    commit(). Discarding a session with rollback() leaves the catalog as it was.
+
+    Each plot the session touches is locked from first use until the
+    session closes, so other writers cannot change it underneath the
+    staged state; sessions working on different plots run concurrently.
+
+    Plot locks are only waited for in ascending plot ID order, so two
+    sessions cannot deadlock each other. The plots given when the session
+    is opened are locked up front, in that order. A plot first touched
+    later whose ID sorts before a plot already locked is taken only if it
+    is free; if another writer holds it, PlotLockedError is raised at once.
+    Sessions that share plots should therefore name them when opening.
+
+    Attributes:
+        catalog_path: Path to the catalog directory
+    """
+
+    def __init__(self, catalog_path: CatalogPath, plot_ids: Iterable[str] = ()):
+        self.catalog_path = Path(catalog_path)
+        self._links = _CatalogLinks(self.catalog_path)
+        self._compression, self._level = feature_storage(self._links.root)
+        self._chunk_size = feature_chunk_size(self._links.root)
+        self._thumbnails = thumbnails_enabled(self._links.root)
+        self._stat_cache = _StatCache(self.catalog_path)
+        self._plots: dict[str, _StagedPlot] = {}
+        self._locks: list[FileLock] = []
+        self._locked: set[str] = set()
+        self._closed = False
+        try:
+            for plot_id in sorted(set(plot_ids)):
+                self._lock(plot_id)
+        except BaseException:
+            self._close()
+            raise
+
+    def create_plot(self, metadata: PlotMetadata, plot_id: str | None = None) -> str:
+        """Stage a new plot (STAC Item).
+
+        Args:
+            metadata: PlotMetadata with title, description, and timestamp
+            plot_id: Optional custom ID (defaults to UUID)
+
+        Returns:
+            The plot ID (either provided or generated)
+
+        Raises:
+            PlotExistsError: If the plot was already created in this session
+        """
+        self._check_open()
+        if plot_id is None:
+            plot_id = str(uuid.uuid4())
+        if plot_id in self._plots and self._plots[plot_id].is_new:
+            raise PlotExistsError(plot_id)
+
+        self._lock(plot_id)
+        parent_href = self._links.add_item(plot_id)
+        self._plots[plot_id] = _StagedPlot(
+            item=_build_item(plot_id, metadata, parent_href), is_new=True, item_dirty=True
+        )
+        return plot_id
+
+    def read_plot(self, plot_id: str) -> STACItem:
+        """Return a plot's STAC Item including any staged changes.
+
+        Args:
+            plot_id: ID of the plot to read
+
+        Returns:
+            Copy of the staged (or on-disk) STAC Item
+
+        Raises:
+            PlotNotFoundError: If the plot doesn't exist
+        """
+        self._check_open()
+        return copy.deepcopy(self._stage(plot_id).item)
+
+    def add_features(self, plot_id: str, features: Sequence[GeoJSONFeature]) -> int:
+        """Stage GeoJSON features to append to a plot's FeatureCollection.
+
+        Args:
+            plot_id: ID of the plot to add features to
+            features: List of GeoJSON Feature dictionaries
+
+        Returns:
+            Total number of features in the staged FeatureCollection
+
+        Raises:
+            PlotNotFoundError: If the plot doesn't exist
+            ValueError: If features are invalid GeoJSON
+        """
+        self._check_open()
+        for feature in features:
+            _validate_feature(feature)
+
+        staged = self._stage(plot_id)
+        if staged.features is None:
+            staged.features_source = _stored_features_path(self.catalog_path, staged.item)
+            staged.features = _load_feature_collection(staged.features_source)
+        _merge_features(staged.item, staged.features, features, self._compression, self._chunk_size)
+        staged.appended.extend(features)
+        staged.features_dirty = True
+        staged.item_dirty = True
+        return len(staged.features["features"])
+
+    def add_asset(
+        self,
+        plot_id: str,
+        source_path: AssetPath,
+        asset_key: str | None = None,
+        media_type: str | None = None,
+        *,
+        sha256: str | None = None,
+    ) -> str:
+        """Stage a source file as an asset of a plot.
+
+        The file content is stored in the catalog's blob store immediately;
+        the plot's asset link and item entry are written on commit.
+
+        Args:
+            plot_id: ID of the plot to add asset to
+            source_path: Path to the source file
+            asset_key: Optional key for the asset (defaults to "source-{filename}")
+            media_type: Optional MIME type (auto-detected if not provided)
+            sha256: SHA-256 digest of the source file, if already computed
+                (avoids hashing it again)
+
+        Returns:
+            The asset key used
+
+        Raises:
+            PlotNotFoundError: If the plot doesn't exist
+            FileNotFoundError: If the source file doesn't exist
+        """
+        self._check_open()
+        source_path = Path(source_path)
+        if not source_path.exists():
+            raise FileNotFoundError(f"Source file not found: {source_path}")
+
+        staged = self._stage(plot_id)
+        if sha256 is None:
+            sha256 = self._stat_cache.digest(source_path)
+        asset_key, blob, dest_path = _stage_asset(
+            self.catalog_path, staged.item, source_path, asset_key, media_type, sha256
+        )
+        staged.links.append((blob, dest_path))
+        staged.item_dirty = True
+        return asset_key
+
+    def discard(self, plot_id: str) -> None:
+        """Drop a plot's staged changes, so commit() leaves it as it was.
+
+        A plot created in this session is unlinked from the catalog again.
+        The plot stays locked until the session closes. Does nothing if the
+        session has not touched the plot.
+
+        Args:
+            plot_id: ID of the plot to discard
+        """
+        self._check_open()
+        staged = self._plots.pop(plot_id, None)
+        if staged is not None and staged.is_new:
+            self._links.remove_item(plot_id)
+
+    def commit(self) -> None:
+        """Flush all staged changes to disk and close the session.
+
+        For each plot, the FeatureCollection and asset links are written
+        before the item.json that references them; catalog files are written
+        last, so the catalog never links to an item that is not on disk.
+        """
+        self._check_open()
+        try:
+            for plot_id, staged in self._plots.items():
+                plot_dir = self.catalog_path / plot_id
+                if staged.is_new:
+                    plot_dir.mkdir(parents=True, exist_ok=True)
+
+                features_path = _stored_features_path(self.catalog_path, staged.item)
+                derived = staged.features_dirty and _affects_derived(staged.appended)
+                if derived:
+                    tracks, columns = build_columns(staged.features["features"])
+                if staged.features_dirty:
+                    _store_features(
+                        staged.features_source,
+                        features_path,
+                        staged.features,
+                        staged.appended,
+                        self._compression,
+                        self._level,
+                        self._chunk_size,
+                    )
+                    if derived:
+                        _write_columns(plot_dir, staged.item, tracks, columns)
+                        _write_overview(
+                            plot_dir, staged.item, staged.features["features"], self._thumbnails
+                        )
+                    _update_tiles(
+                        plot_dir, staged.item, staged.features["features"], staged.appended
+                    )
+
+                for blob, dest_path in staged.links:
+                    dest_path.parent.mkdir(exist_ok=True)
+                    link_file(blob, dest_path)
+
+                if staged.item_dirty:
+                    _save_plot(self.catalog_path, plot_id, staged.item, index=False)
+
+                if staged.features_source not in (None, features_path):
+                    _remove_stored_features(staged.features_source)
+
+            self._links.save()
+            self._stat_cache.save()
+            _index_items(self.catalog_path, [s.item for s in self._plots.values() if s.item_dirty])
+        finally:
+            self._close()
+
+    def rollback(self) -> None:
+        """Discard all staged changes and close the session."""
+        self._close()
+
+    def __enter__(self) -> "CatalogSession":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if self._closed:
+            return
+        if exc_type is None:
+            self.commit()
+        else:
+            self.rollback()
+
+    def _stage(self, plot_id: str) -> _StagedPlot:
+        """Return the staged state for a plot, locking and loading it on first use."""
+        staged = self._plots.get(plot_id)
+        if staged is None:
+            self._lock(plot_id)
+            staged = _StagedPlot(item=_load_plot(self.catalog_path, plot_id))
+            self._plots[plot_id] = staged
+        return staged
+
+    def _lock(self, plot_id: str) -> None:
+        """Hold a plot's lock until the session closes.
+
+        Raises:
+            PlotLockedError: If the plot sorts before one already locked
+                and another writer holds it
+        """
+        if plot_id in self._locked:
+            return
+        lock = plot_lock(self.catalog_path, plot_id)
+        if self._locked and plot_id < max(self._locked):
+            try:
+                lock.acquire(timeout=0)
+            except Timeout as e:
+                raise PlotLockedError(plot_id) from e
+        else:
+            lock.acquire()
+        self._locks.append(lock)
+        self._locked.add(plot_id)
+
+    def _check_open(self) -> None:
+        if self._closed:
+            raise DebriefStacError("Session is closed")
+
+    def _close(self) -> None:
+        self._plots.clear()
+        for lock in reversed(self._locks):
+            lock.release()
+        self._locks.clear()
+        self._locked.clear()
+        self._closed = True
+
+
+@contextmanager
+def session(catalog_path: CatalogPath, plot_ids: Iterable[str] = ()) -> Iterator[CatalogSession]:
+    """Open a batched write session on a catalog.
+
+    Changes are committed when the block exits normally and discarded if it
+    raises.
+
+    Args:
+        catalog_path: Path to the catalog directory
+        plot_ids: Existing plots the session will change, locked up front
+            in lock order (see CatalogSession)
+
+    Yields:
+        CatalogSession for staging mutations
+
+    Raises:
+        CatalogNotFoundError: If the catalog doesn't exist
+        PlotLockedError: If a plot touched out of lock order is locked by
+            another writer
+
+    Example:
+        >>> with session("/data/catalog") as s:
+        ...     plot_id = s.create_plot(PlotMetadata(title="Day 1"))
+        ...     s.add_features(plot_id, features)
+    """
+    with CatalogSession(catalog_path, plot_ids) as s:
+        yield s
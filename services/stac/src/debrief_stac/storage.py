@@ -0,0 +1,211 @@
+"""
+File storage helpers for debrief-stac.
+
+All catalog, item and FeatureCollection files are written via a temp file
+and an atomic rename, so readers never observe a half-written file and a
+crash mid-write leaves the previous version intact.
+
+Files whose name ends in ``.gz`` or ``.zst`` are transparently gzip- or
+zstd-compressed on write and decompressed (as a stream) on read.
+"""
+
+import gzip
+import io
+import json
+import os
+import threading
+from pathlib import Path
+from typing import IO, Any
+
+# Catalog-relative directory for internal state (checkpoints, indexes)
+STATE_DIR = ".debrief"
+
+# Compression codecs for stored files
+COMPRESSION_NONE = "none"
+COMPRESSION_GZIP = "gzip"
+COMPRESSION_ZSTD = "zstd"
+
+# Filename suffix identifying each compression codec
+COMPRESSION_SUFFIXES = {COMPRESSION_GZIP: ".gz", COMPRESSION_ZSTD: ".zst"}
+
+# Level used when a store does not configure one
+DEFAULT_COMPRESSION_LEVELS = {COMPRESSION_GZIP: 6, COMPRESSION_ZSTD: 3}
+
+# Assumed expansion of compressed JSON, for sizing in-memory copies
+COMPRESSED_SIZE_RATIO = 10
+
+# Per-file counters bumped by every write from this process
+_generations: dict[str, int] = {}
+_generations_lock = threading.Lock()
+
+
+def write_json_atomic(
+    path: Path, data: Any, indent: int | None = 2, level: int | None = None
+) -> None:
+    """Write JSON data to a file atomically.
+
+    The data is written to a temp file in the same directory, flushed to
+    disk, and then renamed over the destination. Paths ending in ``.gz``
+    or ``.zst`` are written compressed.
+
+    Args:
+        path: Destination file path
+        data: JSON-serializable data
+        indent: Indentation passed to json.dump (None for compact output)
+        level: Compression level for compressed paths (codec default if None)
+    """
+    temp = _temp_path(path)
+    compression = compression_for(path)
+    try:
+        with open(temp, "wb") as raw:
+            stream = _compressor(raw, compression, level)
+            text = io.TextIOWrapper(stream, encoding="utf-8")
+            json.dump(data, text, indent=indent)
+            text.flush()
+            text.detach()
+            if stream is not raw:
+                stream.close()
+            raw.flush()
+            os.fsync(raw.fileno())
+        os.replace(temp, path)
+    finally:
+        temp.unlink(missing_ok=True)
+    _bump_generation(path)
+
+
+def write_bytes_atomic(path: Path, data: bytes) -> None:
+    """Write binary data to a file atomically (temp file, fsync, rename).
+
+    Args:
+        path: Destination file path
+        data: File content
+    """
+    temp = _temp_path(path)
+    try:
+        with open(temp, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp, path)
+    finally:
+        temp.unlink(missing_ok=True)
+    _bump_generation(path)
+
+
+def read_json(path: Path) -> Any:
+    """Read and parse a JSON file, decompressing it if needed.
+
+    Args:
+        path: File to read
+
+    Returns:
+        The parsed JSON data
+    """
+    with open_text(path) as f:
+        return json.load(f)
+
+
+def open_text(path: Path) -> IO[str]:
+    """Open a stored file for reading as UTF-8 text.
+
+    Compressed files (by suffix) are decompressed incrementally as the
+    returned stream is read.
+
+    Args:
+        path: File to open
+
+    Returns:
+        Readable text stream
+    """
+    compression = compression_for(path)
+    if compression == COMPRESSION_GZIP:
+        return gzip.open(path, "rt", encoding="utf-8")
+    if compression == COMPRESSION_ZSTD:
+        return _zstd().open(path, "rt", encoding="utf-8")
+    return open(path, encoding="utf-8")
+
+
+def compression_for(path: Path) -> str:
+    """Return the compression codec implied by a file's suffix."""
+    suffix = Path(path).suffix
+    for compression, codec_suffix in COMPRESSION_SUFFIXES.items():
+        if suffix == codec_suffix:
+            return compression
+    return COMPRESSION_NONE
+
+
+def content_size(path: Path, size: int) -> int:
+    """Estimate the uncompressed size of a stored file from its on-disk size."""
+    if compression_for(path) == COMPRESSION_NONE:
+        return size
+    return size * COMPRESSED_SIZE_RATIO
+
+
+def check_compression(compression: str) -> None:
+    """Validate a compression codec name and check it is available.
+
+    Raises:
+        ValueError: If the codec is not recognised
+        ImportError: If the codec's library is not installed
+    """
+    if compression not in (COMPRESSION_NONE, *COMPRESSION_SUFFIXES):
+        raise ValueError(f"Unknown compression: {compression}")
+    if compression == COMPRESSION_ZSTD:
+        _zstd()
+
+
+def write_generation(path: Path) -> int:
+    """Return how many times this process has written a file.
+
+    Read caches record the generation alongside a file's stat, so a write
+    made by this process invalidates cached copies even when the
+    filesystem's mtime resolution would not tell the versions apart.
+
+    Args:
+        path: File path
+
+    Returns:
+        Number of writes to the file via write_json_atomic() so far
+    """
+    return _generations.get(os.path.abspath(path), 0)
+
+
+def _compressor(raw: IO[bytes], compression: str, level: int | None) -> IO[bytes]:
+    """Return a binary stream compressing into raw (raw itself if uncompressed).
+
+    Closing the returned compressor finishes the compressed stream but
+    leaves raw open.
+    """
+    if compression == COMPRESSION_NONE:
+        return raw
+    if level is None:
+        level = DEFAULT_COMPRESSION_LEVELS[compression]
+    if compression == COMPRESSION_GZIP:
+        return gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=level, mtime=0)
+    return _zstd().ZstdFile(raw, "w", level=level)
+
+
+def _zstd() -> Any:
+    """Import the zstd codec (stdlib on Python 3.14+, else backports.zstd)."""
+    try:
+        from compression import zstd
+    except ImportError:
+        try:
+            from backports import zstd
+        except ImportError as e:
+            raise ImportError(
+                "zstd compression requires backports.zstd. "
+                "Install with: pip install debrief-stac[zstd]"
+            ) from e
+    return zstd
+
+
+def _bump_generation(path: Path) -> None:
+    key = os.path.abspath(path)
+    with _generations_lock:
+        _generations[key] = _generations.get(key, 0) + 1
+
+
+def _temp_path(path: Path) -> Path:
+    """Return a temp file path beside path, unique per process and thread."""
+    return path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
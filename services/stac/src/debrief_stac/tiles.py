@@ -0,0 +1,719 @@
+"""
+Vector tile pyramids for debrief-stac plots.
+
+Map views that draw a plot's whole FeatureCollection slow down once
+tracks reach millions of vertices. generate_tiles() cuts a plot's
+features into a z/x/y pyramid of Mapbox Vector Tiles
+(``tiles/{z}/{x}/{y}.mvt``) so a map fetches only the tiles in view.
+In each tile, geometry is clipped to the tile (plus a small buffer),
+simplified for the zoom level and quantized to a 4096-unit grid.
+
+The pyramid is built top-down: each tile's features are clipped from its
+parent's, so every vertex is visited about once per zoom level. Once a
+level holds enough tiles, the subtrees below it are built in parallel
+worker processes. When features are appended to a plot that has tiles,
+only the tiles the new features touch are rebuilt.
+
+A TileJSON manifest (``tiles/tilejson.json``) describing the pyramid is
+registered as the plot's ``tiles`` asset.
+"""
+
+import math
+import os
+import shutil
+import struct
+from collections.abc import Collection, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from debrief_stac.locks import plot_lock
+from debrief_stac.overview import _planar_significance
+from debrief_stac.plot import _load_plot, _save_plot
+from debrief_stac.reader import read_features
+from debrief_stac.storage import _temp_path, read_json, write_json_atomic
+from debrief_stac.types import (
+    ASSET_ROLE_TILES,
+    MEDIA_TYPE_JSON,
+    CatalogPath,
+    GeoJSONFeature,
+    STACItem,
+)
+
+# Plot-relative directory holding the pyramid, and its manifest within it
+TILES_DIR = "tiles"
+TILEJSON_FILENAME = "tilejson.json"
+
+# Name of the single layer in every tile
+TILE_LAYER = "features"
+
+# Tile coordinate grid size
+TILE_EXTENT = 4096
+
+DEFAULT_MAX_ZOOM = 14
+MAX_ZOOM_LIMIT = 24
+
+# Tile units of geometry kept beyond each tile edge, so lines don't end at seams
+_BUFFER = 64
+
+# Smallest effective area (square tile units) of a vertex kept by simplification
+_SIMPLIFY_AREA = 2.0
+
+# Plots with fewer vertices than this are tiled in-process by default
+_PARALLEL_MIN_VERTICES = 200_000
+
+# Subtrees handed to each worker process, to balance uneven subtrees
+_SUBTREES_PER_WORKER = 4
+
+# Web Mercator latitude limit
+_MAX_LATITUDE = 85.0511287798
+
+# MVT geometry types
+_POINT = 1
+_LINE = 2
+_POLYGON = 3
+
+# MVT geometry commands
+_MOVE_TO = 1
+_LINE_TO = 2
+_CLOSE_PATH = 7
+
+# A vertex in Web Mercator world coordinates (0-1, y down) with its significance
+_Vertex = tuple[float, float, float]
+_TileKey = tuple[int, int, int]
+
+
+class _TileFeature:
+    """A feature projected to world coordinates, clipped to a tile."""
+
+    __slots__ = ("kind", "parts", "outer", "properties", "bbox")
+
+    def __init__(
+        self,
+        kind: int,
+        parts: list[list[_Vertex]],
+        properties: dict[str, Any],
+        outer: list[bool] | None = None,
+    ):
+        self.kind = kind
+        # Points: one part; lines: one part per line; polygons: one part per ring
+        self.parts = parts
+        # Polygons only: whether each ring starts a new polygon
+        self.outer = outer
+        self.properties = properties
+        xs = [v[0] for part in parts for v in part]
+        ys = [v[1] for part in parts for v in part]
+        self.bbox = (min(xs), min(ys), max(xs), max(ys))
+
+
+def generate_tiles(
+    catalog_path: CatalogPath,
+    plot_id: str,
+    max_zoom: int = DEFAULT_MAX_ZOOM,
+    *,
+    workers: int | None = None,
+) -> int:
+    """Generate a vector tile pyramid for a plot's features.
+
+    Any existing pyramid is replaced. Afterwards, features appended with
+    add_features() or a write session update the pyramid incrementally.
+
+    Args:
+        catalog_path: Path to the catalog directory
+        plot_id: ID of the plot to tile
+        max_zoom: Deepest zoom level to generate (levels 0 to max_zoom are written)
+        workers: Number of worker processes (defaults to the CPU count for
+            large plots, and 1 otherwise)
+
+    Returns:
+        Number of tiles written
+
+    Raises:
+        PlotNotFoundError: If the plot doesn't exist
+        ValueError: If max_zoom is out of range
+
+    Example:
+        >>> generate_tiles("/data/catalog", "my-plot", max_zoom=12)
+        >>> # Tiles are now at /data/catalog/my-plot/tiles/{z}/{x}/{y}.mvt
+    """
+    if not 0 <= max_zoom <= MAX_ZOOM_LIMIT:
+        raise ValueError(f"max_zoom must be between 0 and {MAX_ZOOM_LIMIT}, got {max_zoom}")
+
+    catalog_path = Path(catalog_path)
+    with plot_lock(catalog_path, plot_id):
+        item = _load_plot(catalog_path, plot_id)
+        features = read_features(catalog_path, plot_id)
+        count = _write_tiles(catalog_path / plot_id, item, features, max_zoom, workers)
+        _save_plot(catalog_path, plot_id, item)
+    return count
+
+
+def _write_tiles(
+    plot_dir: Path,
+    item: STACItem,
+    features: Sequence[GeoJSONFeature],
+    max_zoom: int,
+    workers: int | None = None,
+) -> int:
+    """Build a plot's tile pyramid from scratch and register it as an item asset.
+
+    The pyramid is built beside the current one and swapped in when complete.
+
+    Returns:
+        Number of tiles written
+    """
+    tiles_dir = plot_dir / TILES_DIR
+    build_dir = _temp_path(tiles_dir)
+    old_dir = build_dir.with_name(build_dir.name + ".old")
+    shutil.rmtree(build_dir, ignore_errors=True)
+    build_dir.mkdir()
+    try:
+        count = _build_pyramid(build_dir, _project_all(features), max_zoom, workers)
+        write_json_atomic(build_dir / TILEJSON_FILENAME, _tilejson(item, max_zoom, features))
+        if tiles_dir.exists():
+            tiles_dir.rename(old_dir)
+        build_dir.rename(tiles_dir)
+    finally:
+        shutil.rmtree(build_dir, ignore_errors=True)
+        shutil.rmtree(old_dir, ignore_errors=True)
+
+    item["assets"]["tiles"] = {
+        "href": f"./{TILES_DIR}/{TILEJSON_FILENAME}",
+        "type": MEDIA_TYPE_JSON,
+        "title": "Vector tile pyramid (TileJSON)",
+        "roles": [ASSET_ROLE_TILES],
+    }
+    return count
+
+
+def _update_tiles(
+    plot_dir: Path,
+    item: STACItem,
+    features: Sequence[GeoJSONFeature],
+    appended: Sequence[GeoJSONFeature] | None = None,
+    removed: Sequence[GeoJSONFeature] = (),
+) -> None:
+    """Bring a plot's tile pyramid up to date after its features change.
+
+    Internal function called by add_features(), feature edits, write
+    sessions and verification repairs. Does nothing if the plot has no
+    pyramid.
+
+    Args:
+        plot_dir: The plot's directory
+        item: STAC Item dictionary (modified in place)
+        features: All features of the plot
+        appended: Features added since the pyramid was last written; only
+            the tiles they touch are rebuilt. None rebuilds every tile.
+        removed: Features (or previous versions of features) taken out
+            since the pyramid was last written; the tiles they touched are
+            rebuilt too
+    """
+    if "tiles" not in item.get("assets", {}):
+        return
+
+    manifest_path = plot_dir / TILES_DIR / TILEJSON_FILENAME
+    try:
+        manifest = read_json(manifest_path)
+        max_zoom = manifest["maxzoom"]
+    except (OSError, ValueError, KeyError):
+        manifest, max_zoom = None, DEFAULT_MAX_ZOOM
+
+    if manifest is None or appended is None:
+        _write_tiles(plot_dir, item, features, max_zoom)
+        return
+
+    changed = _project_all([*appended, *removed])
+    if not changed:
+        return
+    dirty = _touched_tiles(changed, max_zoom)
+    # Tiles left with no features are not rewritten, so clear them all first
+    for z, x, y in dirty:
+        _tile_path(plot_dir / TILES_DIR, z, x, y).unlink(missing_ok=True)
+    _build_pyramid(plot_dir / TILES_DIR, _project_all(features), max_zoom, None, dirty)
+    write_json_atomic(manifest_path, _tilejson(item, max_zoom, features))
+
+
+def _tilejson(item: STACItem, max_zoom: int, features: Sequence[GeoJSONFeature]) -> dict:
+    """Build the TileJSON manifest describing a plot's pyramid."""
+    fields: dict[str, str] = {}
+    for feature in features:
+        for key, value in _properties(feature).items():
+            if isinstance(value, bool):
+                fields.setdefault(key, "Boolean")
+            elif isinstance(value, str):
+                fields.setdefault(key, "String")
+            else:
+                fields.setdefault(key, "Number")
+
+    return {
+        "tilejson": "3.0.0",
+        "name": item["id"],
+        "tiles": ["{z}/{x}/{y}.mvt"],
+        "minzoom": 0,
+        "maxzoom": max_zoom,
+        "bounds": item.get("bbox") or [-180.0, -_MAX_LATITUDE, 180.0, _MAX_LATITUDE],
+        "vector_layers": [{"id": TILE_LAYER, "fields": fields, "minzoom": 0, "maxzoom": max_zoom}],
+    }
+
+
+def _build_pyramid(
+    tiles_dir: Path,
+    features: list[_TileFeature],
+    max_zoom: int,
+    workers: int | None = None,
+    dirty: Collection[_TileKey] | None = None,
+) -> int:
+    """Write the tiles of a pyramid, optionally only those in dirty.
+
+    Levels are built breadth-first in this process until there are enough
+    tiles to share out, then each remaining subtree goes to a worker.
+
+    Returns:
+        Number of tiles written
+    """
+    if not features:
+        return 0
+    if workers is None:
+        vertices = sum(len(part) for f in features for part in f.parts)
+        workers = (os.cpu_count() or 1) if vertices >= _PARALLEL_MIN_VERTICES else 1
+    if workers <= 1:
+        return _build_subtree(str(tiles_dir), 0, 0, 0, features, max_zoom, dirty)
+
+    count = 0
+    level = [(0, 0, 0, features)]
+    while level and len(level) < workers * _SUBTREES_PER_WORKER and level[0][0] < max_zoom:
+        next_level = []
+        for z, x, y, tile_features in level:
+            if dirty is not None and (z, x, y) not in dirty:
+                continue
+            count += _write_tile(tiles_dir, z, x, y, tile_features)
+            next_level.extend(_children(z, x, y, tile_features))
+        level = next_level
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(_build_subtree, str(tiles_dir), z, x, y, f, max_zoom, dirty)
+            for z, x, y, f in level
+        ]
+        count += sum(future.result() for future in futures)
+    return count
+
+
+def _build_subtree(
+    tiles_dir: str,
+    z: int,
+    x: int,
+    y: int,
+    features: list[_TileFeature],
+    max_zoom: int,
+    dirty: Collection[_TileKey] | None,
+) -> int:
+    """Write a tile and all its descendants (runs in worker processes)."""
+    count = 0
+    stack = [(z, x, y, features)]
+    while stack:
+        z, x, y, tile_features = stack.pop()
+        if dirty is not None and (z, x, y) not in dirty:
+            continue
+        count += _write_tile(Path(tiles_dir), z, x, y, tile_features)
+        if z < max_zoom:
+            stack.extend(_children(z, x, y, tile_features))
+    return count
+
+
+def _touched_tiles(features: list[_TileFeature], max_zoom: int) -> set[_TileKey]:
+    """Return the keys of all tiles any of the features fall in."""
+    touched = set()
+    stack = [(0, 0, 0, features)]
+    while stack:
+        z, x, y, tile_features = stack.pop()
+        touched.add((z, x, y))
+        if z < max_zoom:
+            stack.extend(_children(z, x, y, tile_features))
+    return touched
+
+
+def _children(
+    z: int, x: int, y: int, features: list[_TileFeature]
+) -> list[tuple[int, int, int, list[_TileFeature]]]:
+    """Clip a tile's features to each of its four child tiles, dropping empty ones."""
+    n = 2 ** (z + 1)
+    buffer = _BUFFER / TILE_EXTENT / n
+    children = []
+    for cx in (2 * x, 2 * x + 1):
+        column = _clip(features, cx / n - buffer, (cx + 1) / n + buffer, 0)
+        if not column:
+            continue
+        for cy in (2 * y, 2 * y + 1):
+            tile_features = _clip(column, cy / n - buffer, (cy + 1) / n + buffer, 1)
+            if tile_features:
+                children.append((z + 1, cx, cy, tile_features))
+    return children
+
+
+def _write_tile(tiles_dir: Path, z: int, x: int, y: int, features: list[_TileFeature]) -> bool:
+    """Encode and write one tile; returns False if nothing in it survived encoding.
+
+    Tiles are derived data, so they are replaced atomically but not fsynced.
+    """
+    data = _encode_tile(features, z, x, y)
+    if data is None:
+        return False
+    path = _tile_path(tiles_dir, z, x, y)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp = _temp_path(path)
+    try:
+        temp.write_bytes(data)
+        os.replace(temp, path)
+    finally:
+        temp.unlink(missing_ok=True)
+    return True
+
+
+def _tile_path(tiles_dir: Path, z: int, x: int, y: int) -> Path:
+    return tiles_dir / str(z) / str(x) / f"{y}.mvt"
+
+
+# --- Projection -------------------------------------------------------------
+
+
+def _project_all(features: Sequence[GeoJSONFeature]) -> list[_TileFeature]:
+    """Project GeoJSON features to world coordinates, skipping empty geometries."""
+    projected = []
+    for feature in features:
+        properties = _properties(feature)
+        projected.extend(_project(feature.get("geometry"), properties))
+    return projected
+
+
+def _project(geometry: dict | None, properties: dict[str, Any]) -> list[_TileFeature]:
+    if not geometry:
+        return []
+    kind = geometry.get("type")
+    coords = geometry.get("coordinates") or []
+
+    if kind == "GeometryCollection":
+        return [f for g in geometry.get("geometries", []) for f in _project(g, properties)]
+    if kind == "Point" and coords:
+        return [_TileFeature(_POINT, [[_vertex(coords)]], properties)]
+    if kind == "MultiPoint" and coords:
+        return [_TileFeature(_POINT, [[_vertex(c) for c in coords]], properties)]
+    if kind in ("LineString", "MultiLineString"):
+        lines = [coords] if kind == "LineString" else coords
+        parts = [_line(line) for line in lines if len(line) >= 2]
+        return [_TileFeature(_LINE, parts, properties)] if parts else []
+    if kind in ("Polygon", "MultiPolygon"):
+        polygons = [coords] if kind == "Polygon" else coords
+        parts, outer = [], []
+        for rings in polygons:
+            projected = [_ring(ring) for ring in rings]
+            if not projected or len(projected[0]) < 3:
+                continue
+            for i, ring in enumerate(projected):
+                if len(ring) >= 3:
+                    parts.append(ring)
+                    outer.append(i == 0)
+        return [_TileFeature(_POLYGON, parts, properties, outer)] if parts else []
+    return []
+
+
+def _properties(feature: GeoJSONFeature) -> dict[str, Any]:
+    """Return the scalar properties of a feature, with its ID as an ``id`` property."""
+    properties = {
+        key: value
+        for key, value in (feature.get("properties") or {}).items()
+        if isinstance(value, str | int | float)
+    }
+    if "id" in feature and "id" not in properties:
+        properties["id"] = feature["id"]
+    return properties
+
+
+def _world(coord: Sequence[float]) -> tuple[float, float]:
+    """Project a lon/lat position to Web Mercator world coordinates (0-1, y down)."""
+    lat = max(-_MAX_LATITUDE, min(_MAX_LATITUDE, coord[1]))
+    sin_lat = math.sin(math.radians(lat))
+    y = 0.5 - math.log((1 + sin_lat) / (1 - sin_lat)) / (4 * math.pi)
+    return coord[0] / 360 + 0.5, y
+
+
+def _vertex(coord: Sequence[float]) -> _Vertex:
+    x, y = _world(coord)
+    return (x, y, math.inf)
+
+
+def _line(coords: Sequence[Sequence[float]]) -> list[_Vertex]:
+    xy = [_world(c) for c in coords]
+    return [(x, y, s) for (x, y), s in zip(xy, _planar_significance(xy), strict=True)]
+
+
+def _ring(coords: Sequence[Sequence[float]]) -> list[_Vertex]:
+    """Project a ring, without its closing vertex."""
+    xy = [_world(c) for c in coords]
+    if len(xy) > 1 and xy[0] == xy[-1]:
+        xy.pop()
+    if len(xy) < 3:
+        return []
+    significance = _planar_significance([*xy, xy[0]])
+    return [(x, y, s) for (x, y), s in zip(xy, significance, strict=False)]
+
+
+# --- Clipping ---------------------------------------------------------------
+
+
+def _clip(features: list[_TileFeature], k1: float, k2: float, axis: int) -> list[_TileFeature]:
+    """Clip features to the band k1 <= coordinate <= k2 along an axis (0 = x, 1 = y)."""
+    clipped = []
+    for feature in features:
+        low, high = feature.bbox[axis], feature.bbox[axis + 2]
+        if low >= k1 and high <= k2:
+            clipped.append(feature)
+            continue
+        if high < k1 or low > k2:
+            continue
+
+        outer = None
+        if feature.kind == _POINT:
+            points = [v for v in feature.parts[0] if k1 <= v[axis] <= k2]
+            parts = [points] if points else []
+        elif feature.kind == _LINE:
+            parts = [line for part in feature.parts for line in _clip_line(part, k1, k2, axis)]
+        else:
+            parts, outer = [], []
+            keep = False
+            for ring, is_outer in zip(feature.parts, feature.outer or [], strict=True):
+                ring = _clip_ring(ring, k1, k2, axis)
+                if is_outer:
+                    keep = len(ring) >= 3
+                if keep and len(ring) >= 3:
+                    parts.append(ring)
+                    outer.append(is_outer)
+
+        if parts:
+            clipped.append(_TileFeature(feature.kind, parts, feature.properties, outer))
+    return clipped
+
+
+def _clip_line(points: list[_Vertex], k1: float, k2: float, axis: int) -> list[list[_Vertex]]:
+    """Clip a polyline to a band, splitting it where it leaves and re-enters."""
+    lines = []
+    current: list[_Vertex] = []
+    for a, b in zip(points, points[1:], strict=False):
+        ak, bk = a[axis], b[axis]
+        if k1 <= ak <= k2 and k1 <= bk <= k2:
+            if not current:
+                current = [a]
+            current.append(b)
+            continue
+        if ak == bk:
+            if not k1 <= ak <= k2:
+                if len(current) >= 2:
+                    lines.append(current)
+                current = []
+                continue
+            t0, t1 = 0.0, 1.0
+        else:
+            ta, tb = (k1 - ak) / (bk - ak), (k2 - ak) / (bk - ak)
+            t0, t1 = max(0.0, min(ta, tb)), min(1.0, max(ta, tb))
+            if t0 > t1:
+                if len(current) >= 2:
+                    lines.append(current)
+                current = []
+                continue
+
+        if t0 > 0:
+            if len(current) >= 2:
+                lines.append(current)
+            current = [_interpolate(a, b, t0)]
+        elif not current:
+            current = [a]
+        current.append(b if t1 >= 1 else _interpolate(a, b, t1))
+        if t1 < 1:
+            lines.append(current)
+            current = []
+
+    if len(current) >= 2:
+        lines.append(current)
+    return lines
+
+
+def _clip_ring(ring: list[_Vertex], k1: float, k2: float, axis: int) -> list[_Vertex]:
+    """Clip a closed ring to a band (Sutherland-Hodgman)."""
+    return _clip_half(_clip_half(ring, k1, axis, True), k2, axis, False)
+
+
+def _clip_half(ring: list[_Vertex], k: float, axis: int, above: bool) -> list[_Vertex]:
+    if not ring:
+        return ring
+    clipped = []
+    prev = ring[-1]
+    prev_in = prev[axis] >= k if above else prev[axis] <= k
+    for v in ring:
+        v_in = v[axis] >= k if above else v[axis] <= k
+        if v_in != prev_in:
+            clipped.append(_interpolate(prev, v, (k - prev[axis]) / (v[axis] - prev[axis])))
+        if v_in:
+            clipped.append(v)
+        prev, prev_in = v, v_in
+    return clipped
+
+
+def _interpolate(a: _Vertex, b: _Vertex, t: float) -> _Vertex:
+    """Point at fraction t along a-b; new vertices at tile edges are always kept."""
+    return (a[0] + (b[0] - a[0]) * t, a[1] + (b[1] - a[1]) * t, math.inf)
+
+
+# --- Encoding ---------------------------------------------------------------
+
+
+def _encode_tile(features: list[_TileFeature], z: int, x: int, y: int) -> bytes | None:
+    """Encode a tile's features as a Mapbox Vector Tile (version 2) protobuf message.
+
+    Returns:
+        The encoded tile, or None if no feature has geometry left at this zoom
+    """
+    scale = 2**z
+    tolerance = _SIMPLIFY_AREA / (TILE_EXTENT * scale) ** 2
+    keys: dict[str, int] = {}
+    values: dict[tuple[type, Any], int] = {}
+
+    encoded = []
+    for feature in features:
+        geometry = _encode_geometry(feature, scale, x, y, tolerance)
+        if not geometry:
+            continue
+        tags = []
+        for key, value in feature.properties.items():
+            tags.append(keys.setdefault(key, len(keys)))
+            tags.append(values.setdefault((type(value), value), len(values)))
+        body = _packed_field(2, tags) + _uint_field(3, feature.kind) + _packed_field(4, geometry)
+        encoded.append(_bytes_field(2, body))
+
+    if not encoded:
+        return None
+    layer = (
+        _uint_field(15, 2)
+        + _bytes_field(1, TILE_LAYER.encode())
+        + b"".join(encoded)
+        + b"".join(_bytes_field(3, key.encode()) for key in keys)
+        + b"".join(_bytes_field(4, _encode_value(value)) for _, value in values)
+        + _uint_field(5, TILE_EXTENT)
+    )
+    return _bytes_field(3, layer)
+
+
+def _encode_geometry(
+    feature: _TileFeature, scale: int, tx: int, ty: int, tolerance: float
+) -> list[int]:
+    """Quantize, simplify and encode a feature's geometry as MVT commands."""
+
+    def quantize(part: list[_Vertex]) -> list[tuple[int, int]]:
+        points: list[tuple[int, int]] = []
+        for v in part:
+            if v[2] < tolerance:
+                continue
+            q = (round((v[0] * scale - tx) * TILE_EXTENT), round((v[1] * scale - ty) * TILE_EXTENT))
+            if not points or points[-1] != q:
+                points.append(q)
+        return points
+
+    commands: list[int] = []
+    cursor = (0, 0)
+
+    def draw(points: list[tuple[int, int]]) -> None:
+        nonlocal cursor
+        for px, py in points:
+            commands.append(_zigzag(px - cursor[0]))
+            commands.append(_zigzag(py - cursor[1]))
+            cursor = (px, py)
+
+    if feature.kind == _POINT:
+        points = quantize(feature.parts[0])
+        commands.append(_command(_MOVE_TO, len(points)))
+        draw(points)
+    elif feature.kind == _LINE:
+        for part in feature.parts:
+            points = quantize(part)
+            if len(points) < 2:
+                continue
+            commands.append(_command(_MOVE_TO, 1))
+            draw(points[:1])
+            commands.append(_command(_LINE_TO, len(points) - 1))
+            draw(points[1:])
+    else:
+        keep = False
+        for part, is_outer in zip(feature.parts, feature.outer or [], strict=True):
+            points = quantize(part)
+            if len(points) > 1 and points[0] == points[-1]:
+                points.pop()
+            area = _ring_area(points) if len(points) >= 3 else 0
+            if is_outer:
+                keep = area != 0
+            if not keep or area == 0:
+                continue
+            # Exterior rings have positive area in tile coordinates, holes negative
+            if (area > 0) != is_outer:
+                points.reverse()
+            commands.append(_command(_MOVE_TO, 1))
+            draw(points[:1])
+            commands.append(_command(_LINE_TO, len(points) - 1))
+            draw(points[1:])
+            commands.append(_command(_CLOSE_PATH, 1))
+    return commands
+
+
+def _ring_area(points: list[tuple[int, int]]) -> int:
+    """Twice the signed area of a ring (surveyor's formula)."""
+    return sum(
+        x0 * y1 - x1 * y0
+        for (x0, y0), (x1, y1) in zip(points, points[1:] + points[:1], strict=True)
+    )
+
+
+def _encode_value(value: Any) -> bytes:
+    """Encode a property value as an MVT Value message."""
+    if isinstance(value, bool):
+        return _uint_field(7, int(value))
+    if isinstance(value, int) and 0 <= value < 2**64:
+        return _uint_field(5, value)
+    if isinstance(value, int) and -(2**63) <= value < 0:
+        return _uint_field(6, _zigzag(value))
+    if isinstance(value, int | float):
+        return _key(3, 1) + struct.pack("<d", float(value))
+    return _bytes_field(1, str(value).encode())
+
+
+def _command(command: int, count: int) -> int:
+    return (command & 0x7) | (count << 3)
+
+
+def _zigzag(value: int) -> int:
+    return (value << 1) ^ (value >> 63)
+
+
+def _varint(value: int) -> bytes:
+    out = bytearray()
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def _key(field: int, wire_type: int) -> bytes:
+    return _varint((field << 3) | wire_type)
+
+
+def _uint_field(field: int, value: int) -> bytes:
+    return _key(field, 0) + _varint(value)
+
+
+def _bytes_field(field: int, data: bytes) -> bytes:
+    return _key(field, 2) + _varint(len(data)) + data
+
+
+def _packed_field(field: int, values: list[int]) -> bytes:
+    if not values:
+        return b""
+    return _bytes_field(field, b"".join(_varint(v) for v in values))
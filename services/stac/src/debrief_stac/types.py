@@ -27,10 +27,18 @@ BoundingBox: TypeAlias = tuple[float, float, float, float]  # [minLon, minLat, m
 # STAC spec version
 STAC_VERSION = "1.0.0"
 
+# STAC extensions
+STAC_EXTENSION_FILE = "https://stac-extensions.github.io/file/v2.1.0/schema.json"
+
 # Asset roles
 ASSET_ROLE_DATA = "data"
 ASSET_ROLE_SOURCE = "source"
+ASSET_ROLE_OVERVIEW = "overview"
+ASSET_ROLE_THUMBNAIL = "thumbnail"
+ASSET_ROLE_TILES = "tiles"
 
 # Media types
 MEDIA_TYPE_GEOJSON = "application/geo+json"
 MEDIA_TYPE_JSON = "application/json"
+MEDIA_TYPE_PNG = "image/png"
+MEDIA_TYPE_MVT = "application/vnd.mapbox-vector-tile"
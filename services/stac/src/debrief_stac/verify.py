@@ -0,0 +1,396 @@
+"""
+Catalog integrity verification and repair for debrief-stac.
+
+verify_catalog() checks, for every plot:
+
+- the item link resolves to a readable item.json for the right plot
+- every asset file exists, and assets with a ``file:checksum`` still
+  hash to it (content is re-hashed in chunks; files shared through the
+  blob store are hashed once per run)
+- the item bbox matches the FeatureCollection
+- the columnar position sidecar matches the features
+
+It also reports plot directories that no catalog links to. Items are
+checked in parallel on a thread pool (hashing and file I/O release the
+GIL). In incremental mode, plots whose item and asset files are unchanged
+since they last verified clean are skipped; a store where that state
+cannot be written (e.g. read-only media) is verified in full each run.
+
+With repair enabled, links are added or removed, bboxes, position
+sidecars and the plot listing index are rebuilt, and damaged or missing assets are restored from the
+blob store where a blob with the recorded checksum exists.
+"""
+
+import contextlib
+import math
+import os
+import threading
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from debrief_stac.blobstore import blob_path, hash_file, link_file
+from debrief_stac.catalog import (
+    _CatalogLinks,
+    iter_item_paths,
+    open_catalog,
+    thumbnails_enabled,
+)
+from debrief_stac.chunks import feature_files
+from debrief_stac.columnar import _write_positions, count_rows
+from debrief_stac.features import (
+    _bbox_to_polygon,
+    _calculate_bbox,
+    _load_feature_collection,
+    _stored_features_path,
+)
+from debrief_stac.index import _index_path, rebuild_index
+from debrief_stac.locks import plot_lock
+from debrief_stac.models import VerifyIssue, VerifyReport
+from debrief_stac.overview import _write_overview
+from debrief_stac.plot import _load_plot, _save_plot
+from debrief_stac.reader import stream_feature_collection
+from debrief_stac.storage import STATE_DIR, open_text, read_json, write_json_atomic
+from debrief_stac.tiles import _update_tiles
+from debrief_stac.types import BoundingBox, CatalogPath, GeoJSONFeature, STACItem
+
+# Catalog-relative path of the incremental verification state
+STATE_FILE = "verify-state.json"
+
+# Issue kinds
+ISSUE_MISSING_ITEM = "missing_item"
+ISSUE_INVALID_ITEM = "invalid_item"
+ISSUE_UNLINKED_ITEM = "unlinked_item"
+ISSUE_MISSING_ASSET = "missing_asset"
+ISSUE_CHECKSUM_MISMATCH = "checksum_mismatch"
+ISSUE_BBOX_MISMATCH = "bbox_mismatch"
+ISSUE_STALE_POSITIONS = "stale_positions"
+
+# Absolute tolerance when comparing bbox coordinates (degrees)
+BBOX_TOLERANCE = 1e-9
+
+# Multihash prefix of a SHA-256 file:checksum
+_SHA256_MULTIHASH = "1220"
+
+# Directories in a catalog that never hold plots
+_RESERVED_DIRS = {".blobs", STATE_DIR, "shards"}
+
+
+class _DigestCache:
+    """Thread-safe digests of files already hashed in this run, keyed by inode."""
+
+    def __init__(self) -> None:
+        self._digests: dict[tuple[int, int], str] = {}
+        self._lock = threading.Lock()
+        self.files = 0
+        self.bytes = 0
+
+    def digest(self, path: Path) -> str:
+        st = path.stat()
+        key = (st.st_dev, st.st_ino)
+        with self._lock:
+            if key in self._digests:
+                return self._digests[key]
+        digest = hash_file(path)
+        with self._lock:
+            self._digests[key] = digest
+            self.files += 1
+            self.bytes += st.st_size
+        return digest
+
+
+def verify_catalog(
+    catalog_path: CatalogPath,
+    *,
+    workers: int | None = None,
+    incremental: bool = True,
+    repair: bool = False,
+) -> VerifyReport:
+    """Check a catalog's links, assets, bboxes and sidecars.
+
+    Args:
+        catalog_path: Path to the catalog directory
+        workers: Number of checking threads (defaults to CPU count + 4, max 32)
+        incremental: Skip plots unchanged since they last verified clean
+        repair: Fix the issues that can be fixed
+
+    Returns:
+        VerifyReport listing the issues found (and whether each was repaired)
+
+    Raises:
+        CatalogNotFoundError: If no catalog exists at the path
+
+    Example:
+        >>> report = verify_catalog("/data/catalog", repair=True)
+        >>> for issue in report.issues:
+        ...     print(issue.plot_id, issue.kind, issue.message)
+    """
+    catalog_path = Path(catalog_path)
+    started = time.perf_counter()
+    catalog_data = open_catalog(catalog_path)
+
+    state = _load_state(catalog_path) if incremental else {}
+    linked = {
+        item_path.parent.name: item_path
+        for item_path in iter_item_paths(catalog_path, catalog_data)
+    }
+    digests = _DigestCache()
+    report = VerifyReport()
+    next_state: dict[str, Any] = {}
+
+    links = _CatalogLinks(catalog_path) if repair else None
+
+    # Items the catalog links to
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(
+            lambda entry: _verify_plot(catalog_path, *entry, state, digests, repair),
+            linked.items(),
+        )
+        for plot_id, signature, issues, skipped in results:
+            if skipped:
+                report.items_skipped += 1
+            else:
+                report.items_checked += 1
+            report.issues.extend(issues)
+            if signature is not None and all(issue.repaired for issue in issues):
+                next_state[plot_id] = signature
+            if links is not None:
+                for issue in issues:
+                    if issue.kind == ISSUE_MISSING_ITEM:
+                        issue.repaired = links.remove_item(plot_id)
+
+    # Plot directories no catalog links to
+    for plot_dir in sorted(catalog_path.iterdir()):
+        if plot_dir.name in _RESERVED_DIRS or plot_dir.name in linked:
+            continue
+        if (plot_dir / "item.json").is_file():
+            issue = VerifyIssue(
+                plot_id=plot_dir.name,
+                kind=ISSUE_UNLINKED_ITEM,
+                message="Plot is not linked from the catalog",
+            )
+            if links is not None:
+                links.add_item(plot_dir.name)
+                issue.repaired = True
+            report.issues.append(issue)
+
+    if links is not None:
+        links.save()
+        if _index_path(catalog_path).exists():
+            rebuild_index(catalog_path)
+
+    _save_state(catalog_path, next_state)
+    report.assets_hashed = digests.files
+    report.bytes_hashed = digests.bytes
+    report.elapsed_seconds = time.perf_counter() - started
+    return report
+
+
+def _verify_plot(
+    catalog_path: Path,
+    plot_id: str,
+    item_path: Path,
+    state: dict[str, Any],
+    digests: _DigestCache,
+    repair: bool,
+) -> tuple[str, list | None, list[VerifyIssue], bool]:
+    """Verify one plot.
+
+    Returns:
+        Tuple of (plot ID, signature or None if the item is unreadable,
+        issues, whether the plot was skipped as unchanged)
+    """
+    try:
+        item = read_json(item_path)
+    except FileNotFoundError:
+        issue = _issue(plot_id, ISSUE_MISSING_ITEM, "Item link does not resolve")
+        return plot_id, None, [issue], False
+    except (OSError, ValueError) as e:
+        issue = _issue(plot_id, ISSUE_INVALID_ITEM, f"Unreadable item: {e}")
+        return plot_id, None, [issue], False
+
+    if item.get("id") != plot_id:
+        message = f"Item id {item.get('id')!r} does not match its directory"
+        return plot_id, None, [_issue(plot_id, ISSUE_INVALID_ITEM, message)], False
+
+    signature = _signature(item_path, item)
+    if state.get(plot_id) == signature:
+        return plot_id, signature, [], True
+
+    issues = _check_assets(catalog_path, item, digests, repair)
+    issues.extend(_check_features(catalog_path, item, repair))
+    if any(issue.repaired for issue in issues):
+        signature = _signature(item_path, _load_plot(catalog_path, plot_id))
+    return plot_id, signature, issues, False
+
+
+def _check_assets(
+    catalog_path: Path, item: STACItem, digests: _DigestCache, repair: bool
+) -> list[VerifyIssue]:
+    """Check that asset files exist and match their recorded checksums."""
+    plot_id = item["id"]
+    plot_dir = catalog_path / plot_id
+    issues = []
+
+    for key, asset in item.get("assets", {}).items():
+        path = plot_dir / asset.get("href", "")
+        checksum = asset.get("file:checksum", "")
+        expected = None
+        if checksum.startswith(_SHA256_MULTIHASH):
+            expected = checksum[len(_SHA256_MULTIHASH) :]
+
+        if not path.is_file():
+            issue = _issue(plot_id, ISSUE_MISSING_ASSET, f"Asset {key!r} file is missing")
+        elif expected is not None and digests.digest(path) != expected:
+            issue = _issue(plot_id, ISSUE_CHECKSUM_MISMATCH, f"Asset {key!r} checksum mismatch")
+        else:
+            continue
+
+        if repair and expected is not None:
+            issue.repaired = _restore_from_blob(catalog_path, expected, path, digests)
+        issues.append(issue)
+
+    return issues
+
+
+def _check_features(catalog_path: Path, item: STACItem, repair: bool) -> list[VerifyIssue]:
+    """Check the item bbox and position sidecar against the FeatureCollection."""
+    if "features" not in item.get("assets", {}):
+        return []
+    features_path = _stored_features_path(catalog_path, item)
+    if not features_path.is_file():
+        return []  # Reported as a missing asset
+
+    plot_id = item["id"]
+    missing = [path.name for path in feature_files(features_path) if not path.is_file()]
+    if missing:
+        message = f"Feature chunk files are missing: {', '.join(missing)}"
+        return [_issue(plot_id, ISSUE_MISSING_ASSET, message)]
+
+    bbox, positions = _scan_features(features_path)
+    issues = []
+
+    if not _bbox_equal(item.get("bbox"), bbox):
+        issues.append(_issue(plot_id, ISSUE_BBOX_MISMATCH, f"Item bbox does not match {bbox}"))
+
+    rows = _sidecar_rows(catalog_path, item)
+    if (rows or 0) != positions:
+        message = f"Position sidecar has {rows} rows, features have {positions} positions"
+        issues.append(_issue(plot_id, ISSUE_STALE_POSITIONS, message))
+
+    if repair and issues:
+        _rebuild_from_features(catalog_path, plot_id)
+        for issue in issues:
+            issue.repaired = True
+    return issues
+
+
+def _scan_features(features_path: Path) -> tuple[BoundingBox | None, int]:
+    """Stream a plot's features, returning their bbox and number of track positions."""
+    positions = 0
+
+    def features() -> Iterator[GeoJSONFeature]:
+        nonlocal positions
+        for path in feature_files(features_path):
+            with open_text(path) as f:
+                for feature in stream_feature_collection(f):
+                    positions += count_rows((feature.get("properties") or {}).get("positions"))
+                    yield feature
+
+    bbox = _calculate_bbox(features())
+    return bbox, positions
+
+
+def _rebuild_from_features(catalog_path: Path, plot_id: str) -> None:
+    """Recompute a plot's bbox, geometry and derived assets from its features."""
+    thumbnails = thumbnails_enabled(open_catalog(catalog_path))
+    with plot_lock(catalog_path, plot_id):
+        item = _load_plot(catalog_path, plot_id)
+        fc = _load_feature_collection(_stored_features_path(catalog_path, item))
+        bbox = _calculate_bbox(fc["features"])
+        item["bbox"] = list(bbox) if bbox else None
+        item["geometry"] = _bbox_to_polygon(bbox) if bbox else None
+        if not _write_positions(catalog_path / plot_id, item, fc["features"]):
+            item["assets"].pop("positions", None)
+        _write_overview(catalog_path / plot_id, item, fc["features"], thumbnails)
+        _update_tiles(catalog_path / plot_id, item, fc["features"])
+        _save_plot(catalog_path, plot_id, item)
+
+
+def _restore_from_blob(catalog_path: Path, digest: str, dest: Path, digests: _DigestCache) -> bool:
+    """Replace an asset file with the blob-store copy of its content, if intact.
+
+    A hardlinked asset shares its inode with the blob, so damage to one is
+    damage to both; the blob is re-checked before it is used.
+    """
+    blob = blob_path(catalog_path, digest)
+    if not blob.is_file() or digests.digest(blob) != digest:
+        return False
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    link_file(blob, dest)
+    return True
+
+
+def _sidecar_rows(catalog_path: Path, item: STACItem) -> int | None:
+    """Return the row count recorded by a plot's position sidecar, if any."""
+    asset = item.get("assets", {}).get("positions")
+    if asset is None:
+        return None
+    try:
+        return read_json(catalog_path / item["id"] / asset["href"]).get("rows")
+    except (OSError, ValueError):
+        return None
+
+
+def _bbox_equal(recorded: list | None, computed: tuple | None) -> bool:
+    if recorded is None or computed is None:
+        return recorded is None and computed is None
+    return len(recorded) == 4 and all(
+        math.isclose(a, b, rel_tol=0, abs_tol=BBOX_TOLERANCE)
+        for a, b in zip(recorded, computed, strict=True)
+    )
+
+
+def _signature(item_path: Path, item: STACItem) -> list:
+    """Stat-based fingerprint of an item and its asset files."""
+    paths = [item_path] + [
+        item_path.parent / asset.get("href", "") for asset in item.get("assets", {}).values()
+    ]
+    signature = []
+    for path in paths:
+        try:
+            st = path.stat()
+            signature.append([path.name, st.st_size, st.st_mtime_ns])
+        except OSError:
+            signature.append([path.name, None, None])
+    return signature
+
+
+def _issue(plot_id: str, kind: str, message: str) -> VerifyIssue:
+    return VerifyIssue(plot_id=plot_id, kind=kind, message=message)
+
+
+def _state_path(catalog_path: Path) -> Path:
+    return catalog_path / STATE_DIR / STATE_FILE
+
+
+def _load_state(catalog_path: Path) -> dict[str, Any]:
+    """Load the verification state, treating a missing or corrupt file as empty."""
+    try:
+        return read_json(_state_path(catalog_path)).get("plots", {})
+    except (OSError, ValueError, AttributeError):
+        return {}
+
+
+def _save_state(catalog_path: Path, plots: dict[str, Any]) -> None:
+    """Write the verification state atomically.
+
+    Stores that cannot be written keep no state, so the next run is a full
+    verification rather than a failure.
+    """
+    path = _state_path(catalog_path)
+    with contextlib.suppress(OSError):
+        os.makedirs(path.parent, exist_ok=True)
+        write_json_atomic(path, {"plots": plots}, indent=None)
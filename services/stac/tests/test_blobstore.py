@@ -0,0 +1,184 @@
+"""Tests for the content-addressed asset blob store."""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+from debrief_stac.assets import add_asset
+from debrief_stac.blobstore import (
+    BLOBS_DIR,
+    LINK_COPY,
+    LINK_HARDLINK,
+    LINK_REFLINK,
+    _StatCache,
+    blob_path,
+    hash_file,
+    link_file,
+    store_blob,
+)
+from debrief_stac.catalog import create_catalog
+from debrief_stac.models import PlotMetadata
+from debrief_stac.plot import create_plot, read_plot
+from debrief_stac.session import session
+
+
+def _blob_files(catalog_path: Path) -> list[Path]:
+    return [p for p in (catalog_path / BLOBS_DIR / "sha256").rglob("*") if p.is_file()]
+
+
+class TestHashFile:
+    def test_matches_hashlib(self, temp_dir: Path) -> None:
+        source = temp_dir / "data.bin"
+        source.write_bytes(b"x" * 10_000)
+
+        assert hash_file(source, chunk_size=333) == hashlib.sha256(b"x" * 10_000).hexdigest()
+
+
+class TestStoreBlob:
+    def test_stores_content_under_digest(self, temp_dir: Path) -> None:
+        catalog_path = create_catalog(temp_dir / "catalog")
+        source = temp_dir / "track.rep"
+        source.write_text("REP data")
+
+        digest, blob = store_blob(catalog_path, source)
+
+        assert blob == blob_path(catalog_path, digest)
+        assert blob.read_text() == "REP data"
+        assert digest == hashlib.sha256(b"REP data").hexdigest()
+
+    def test_same_content_stored_once(self, temp_dir: Path) -> None:
+        catalog_path = create_catalog(temp_dir / "catalog")
+        first = temp_dir / "a.rep"
+        second = temp_dir / "b.rep"
+        first.write_text("identical")
+        second.write_text("identical")
+
+        digest_a, _ = store_blob(catalog_path, first)
+        digest_b, _ = store_blob(catalog_path, second)
+
+        assert digest_a == digest_b
+        assert len(_blob_files(catalog_path)) == 1
+
+    def test_blob_never_shares_inode_with_source(self, temp_dir: Path) -> None:
+        catalog_path = create_catalog(temp_dir / "catalog")
+        source = temp_dir / "track.rep"
+        source.write_text("REP data")
+
+        _, blob = store_blob(catalog_path, source)
+
+        assert not os.path.samefile(source, blob)
+
+    def test_changed_source_is_rehashed(self, temp_dir: Path) -> None:
+        catalog_path = create_catalog(temp_dir / "catalog")
+        source = temp_dir / "track.rep"
+        source.write_text("version 1")
+        digest_1, _ = store_blob(catalog_path, source)
+
+        source.write_text("version two")
+        digest_2, _ = store_blob(catalog_path, source)
+
+        assert digest_1 != digest_2
+
+
+class TestStatCache:
+    def test_unchanged_source_is_not_rehashed(self, temp_dir: Path) -> None:
+        catalog_path = create_catalog(temp_dir / "catalog")
+        source = temp_dir / "track.rep"
+        source.write_text("REP data")
+        store_blob(catalog_path, source)
+
+        with patch("debrief_stac.blobstore.hash_file") as hashed:
+            store_blob(catalog_path, source)
+
+        hashed.assert_not_called()
+
+    def test_saved_once_per_session(
+        self, temp_dir: Path, sample_plot_metadata: PlotMetadata
+    ) -> None:
+        catalog_path = create_catalog(temp_dir / "catalog")
+        sources = []
+        for i in range(5):
+            source = temp_dir / f"boat{i}.rep"
+            source.write_text(f"recording {i}")
+            sources.append(source)
+
+        with patch("debrief_stac.blobstore._save_stat_cache") as saved, session(catalog_path) as s:
+            plot_id = s.create_plot(sample_plot_metadata)
+            for source in sources:
+                s.add_asset(plot_id, source, asset_key=source.stem)
+
+        saved.assert_called_once()
+        assert sorted(saved.call_args.args[1]) == sorted(str(p.absolute()) for p in sources)
+
+    def test_concurrent_writers_keep_each_others_entries(self, temp_dir: Path) -> None:
+        catalog_path = create_catalog(temp_dir / "catalog")
+        first = temp_dir / "a.rep"
+        second = temp_dir / "b.rep"
+        first.write_text("first")
+        second.write_text("second")
+        cache_a = _StatCache(catalog_path)
+        cache_b = _StatCache(catalog_path)
+
+        cache_a.digest(first)
+        cache_b.digest(second)
+        cache_a.save()
+        cache_b.save()
+
+        entries = json.loads((catalog_path / BLOBS_DIR / "stat-cache.json").read_text())
+        assert sorted(entries) == sorted([str(first.absolute()), str(second.absolute())])
+
+
+class TestLinkFile:
+    def test_links_content(self, temp_dir: Path) -> None:
+        source = temp_dir / "source"
+        source.write_text("content")
+        dest = temp_dir / "dest"
+
+        method = link_file(source, dest)
+
+        assert method in (LINK_REFLINK, LINK_HARDLINK, LINK_COPY)
+        assert dest.read_text() == "content"
+
+    def test_replaces_existing_dest(self, temp_dir: Path) -> None:
+        source = temp_dir / "source"
+        source.write_text("new")
+        dest = temp_dir / "dest"
+        dest.write_text("old")
+
+        link_file(source, dest)
+
+        assert dest.read_text() == "new"
+
+
+class TestAddAssetDeduplication:
+    def test_same_file_in_two_plots_stored_once(
+        self, temp_dir: Path, sample_plot_metadata: PlotMetadata
+    ) -> None:
+        catalog_path = create_catalog(temp_dir / "catalog")
+        plot_a = create_plot(catalog_path, sample_plot_metadata)
+        plot_b = create_plot(catalog_path, sample_plot_metadata)
+        source = temp_dir / "recording.rep"
+        source.write_text("large recording")
+
+        add_asset(catalog_path, plot_a, source)
+        add_asset(catalog_path, plot_b, source)
+
+        assert len(_blob_files(catalog_path)) == 1
+        assert (catalog_path / plot_a / "assets" / "recording.rep").read_text() == "large recording"
+        assert (catalog_path / plot_b / "assets" / "recording.rep").read_text() == "large recording"
+
+    def test_checksum_recorded(self, temp_dir: Path, sample_plot_metadata: PlotMetadata) -> None:
+        catalog_path = create_catalog(temp_dir / "catalog")
+        plot_id = create_plot(catalog_path, sample_plot_metadata)
+        source = temp_dir / "recording.rep"
+        source.write_text("content")
+        digest = hashlib.sha256(b"content").hexdigest()
+
+        key = add_asset(catalog_path, plot_id, source)
+
+        asset = read_plot(catalog_path, plot_id)["assets"][key]
+        assert asset["file:checksum"] == f"1220{digest}"
+        assert asset["file:size"] == len(b"content")
+        assert asset["debrief:provenance"]["sha256"] == digest
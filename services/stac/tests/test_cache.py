@@ -0,0 +1,140 @@
+"""Tests for the in-process read cache."""
+
+import json
+import os
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from debrief_stac.cache import ReadCache, get_cache
+from debrief_stac.catalog import create_catalog, list_plots, open_catalog
+from debrief_stac.features import add_features
+from debrief_stac.models import PlotMetadata
+from debrief_stac.plot import create_plot, read_plot
+from debrief_stac.reader import read_features
+from debrief_stac.storage import write_json_atomic
+from tests.fixtures import make_sample_track_feature
+
+
+@pytest.fixture
+def cache() -> Iterator[ReadCache]:
+    cache = get_cache()
+    max_bytes = cache.max_bytes
+    cache.clear()
+    yield cache
+    cache.max_bytes = max_bytes
+    cache.clear()
+
+
+class TestReadCache:
+    def test_repeated_reads_hit(self, temp_dir: Path) -> None:
+        path = temp_dir / "data.json"
+        write_json_atomic(path, {"a": 1})
+        cache = ReadCache()
+
+        first = cache.get(path)
+        second = cache.get(path)
+
+        assert first is second
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_own_write_invalidates(self, temp_dir: Path) -> None:
+        path = temp_dir / "data.json"
+        write_json_atomic(path, {"a": 1})
+        cache = ReadCache()
+        cache.get(path)
+
+        write_json_atomic(path, {"a": 2})
+
+        assert cache.get(path) == {"a": 2}
+
+    def test_external_change_invalidates(self, temp_dir: Path) -> None:
+        path = temp_dir / "data.json"
+        path.write_text(json.dumps({"a": 1}))
+        cache = ReadCache()
+        cache.get(path)
+
+        path.write_text(json.dumps({"a": 22}))
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+        assert cache.get(path) == {"a": 22}
+
+    def test_lru_eviction_by_size(self, temp_dir: Path) -> None:
+        paths = {}
+        for name in "abcde":
+            paths[name] = temp_dir / f"{name}.json"
+            paths[name].write_text("{}")
+        cache = ReadCache(max_bytes=8)
+
+        for name in "abcd":
+            cache.get(paths[name], cost=2)
+        cache.get(paths["a"], cost=2)
+        cache.get(paths["e"], cost=2)
+
+        assert cache.size == 8
+        hits = cache.hits
+        cache.get(paths["a"], cost=2)
+        assert cache.hits == hits + 1
+        cache.get(paths["b"], cost=2)
+        assert cache.misses == 6
+
+    def test_large_files_not_cached(self, temp_dir: Path) -> None:
+        path = temp_dir / "big.json"
+        path.write_text(json.dumps({"pad": "x" * 1000}))
+        cache = ReadCache(max_bytes=100)
+
+        cache.get(path)
+        cache.get(path)
+
+        assert cache.size == 0
+        assert cache.misses == 2
+
+    def test_missing_file(self, temp_dir: Path) -> None:
+        with pytest.raises(FileNotFoundError):
+            ReadCache().get(temp_dir / "missing.json")
+
+
+class TestCachedReads:
+    def test_read_plot_from_memory(self, temp_dir: Path, cache: ReadCache) -> None:
+        catalog_path = create_catalog(temp_dir / "catalog")
+        plot_id = create_plot(catalog_path, PlotMetadata(title="P"))
+
+        assert read_plot(catalog_path, plot_id) is read_plot(catalog_path, plot_id)
+        assert open_catalog(catalog_path) is open_catalog(catalog_path)
+
+    def test_writes_visible_to_readers(self, temp_dir: Path, cache: ReadCache) -> None:
+        catalog_path = create_catalog(temp_dir / "catalog")
+        plot_id = create_plot(catalog_path, PlotMetadata(title="P"))
+        assert list_plots(catalog_path)[0].feature_count == 0
+        assert read_features(catalog_path, plot_id) == []
+
+        add_features(catalog_path, plot_id, [make_sample_track_feature(feature_id="t1")])
+        add_features(catalog_path, plot_id, [make_sample_track_feature(feature_id="t2")])
+
+        assert "features" in read_plot(catalog_path, plot_id)["assets"]
+        assert [f["id"] for f in read_features(catalog_path, plot_id)] == ["t1", "t2"]
+        assert list_plots(catalog_path)[0].feature_count == 2
+
+    def test_mutating_writers_do_not_touch_cached_item(
+        self, temp_dir: Path, cache: ReadCache
+    ) -> None:
+        catalog_path = create_catalog(temp_dir / "catalog")
+        plot_id = create_plot(catalog_path, PlotMetadata(title="P"))
+        cached = read_plot(catalog_path, plot_id)
+
+        add_features(catalog_path, plot_id, [make_sample_track_feature()])
+
+        assert "features" not in cached["assets"]
+
+    def test_large_feature_collection_streamed(self, temp_dir: Path, cache: ReadCache) -> None:
+        catalog_path = create_catalog(temp_dir / "catalog")
+        plot_id = create_plot(catalog_path, PlotMetadata(title="P"))
+        add_features(catalog_path, plot_id, [make_sample_track_feature(feature_id="t1")])
+        cache.max_bytes = 1024
+
+        assert [f["id"] for f in read_features(catalog_path, plot_id)] == ["t1"]
+        assert [f["id"] for f in read_features(catalog_path, plot_id)] == ["t1"]
+        features_path = catalog_path / plot_id / "features.geojson"
+        assert not any(key[0] == str(features_path) for key in cache._entries)
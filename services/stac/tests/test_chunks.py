@@ -0,0 +1,296 @@
+"""Tests for the chunked feature store and single-feature edits."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from debrief_stac.catalog import create_catalog, list_plots, set_feature_chunking
+from debrief_stac.chunks import CHUNK_MANIFEST, CHUNKS_DIR
+from debrief_stac.cli import handle_request
+from debrief_stac.columnar import POSITIONS_DIR, read_positions
+from debrief_stac.exceptions import FeatureNotFoundError
+from debrief_stac.features import FEATURES_FILENAME, add_features, remove_feature, update_feature
+from debrief_stac.models import PlotMetadata
+from debrief_stac.plot import create_plot, read_plot
+from debrief_stac.reader import read_features
+from debrief_stac.session import session
+from debrief_stac.storage import read_json
+from debrief_stac.tiles import TILES_DIR, generate_tiles
+from debrief_stac.verify import verify_catalog
+from tests.fixtures import make_sample_reference_location, make_sample_track_feature
+
+
+def points(count: int, start: int = 0) -> list[dict]:
+    return [
+        make_sample_reference_location(f"ref-{i}", lon=-5.0 + i * 0.01, lat=50.0)
+        for i in range(start, start + count)
+    ]
+
+
+def manifest(catalog: Path, plot_id: str) -> dict:
+    return json.loads((catalog / plot_id / CHUNKS_DIR / CHUNK_MANIFEST).read_text())
+
+
+def chunk_files(catalog: Path, plot_id: str) -> dict[str, bytes]:
+    chunks_dir = catalog / plot_id / CHUNKS_DIR
+    return {p.name: p.read_bytes() for p in chunks_dir.iterdir() if p.name != CHUNK_MANIFEST}
+
+
+@pytest.fixture
+def catalog(temp_dir: Path) -> Path:
+    return create_catalog(temp_dir / "catalog", chunk_size=4)
+
+
+@pytest.fixture
+def plot_id(catalog: Path) -> str:
+    plot_id = create_plot(catalog, PlotMetadata(title="Test"))
+    add_features(catalog, plot_id, points(10))
+    return plot_id
+
+
+class TestChunkedStore:
+    def test_features_are_stored_in_chunks(self, catalog: Path, plot_id: str) -> None:
+        chunks = manifest(catalog, plot_id)
+        asset = read_plot(catalog, plot_id)["assets"]["features"]
+
+        assert asset["href"] == f"./{CHUNKS_DIR}/{CHUNK_MANIFEST}"
+        assert [c["count"] for c in chunks["chunks"]] == [4, 4, 2]
+        assert chunks["ids"]["ref-5"] == chunks["chunks"][1]["id"]
+        assert len(chunk_files(catalog, plot_id)) == 3
+        assert not (catalog / plot_id / FEATURES_FILENAME).exists()
+
+    def test_read_features_across_chunks(self, catalog: Path, plot_id: str) -> None:
+        features = read_features(catalog, plot_id)
+
+        assert [f["id"] for f in features] == [f"ref-{i}" for i in range(10)]
+        assert [f["id"] for f in read_features(catalog, plot_id, feature_ids=["ref-6"])] == [
+            "ref-6"
+        ]
+
+    def test_append_tops_up_last_chunk(self, catalog: Path, plot_id: str) -> None:
+        before = chunk_files(catalog, plot_id)
+
+        add_features(catalog, plot_id, points(3, start=10))
+
+        after = chunk_files(catalog, plot_id)
+        assert [c["count"] for c in manifest(catalog, plot_id)["chunks"]] == [4, 4, 4, 1]
+        # The two full chunks are untouched
+        assert len(set(before) & set(after)) == 2
+        assert list_plots(catalog)[0].feature_count == 13
+
+    def test_session_appends(self, catalog: Path, plot_id: str) -> None:
+        with session(catalog) as s:
+            s.add_features(plot_id, points(2, start=10))
+            new_plot = s.create_plot(PlotMetadata(title="New"))
+            s.add_features(new_plot, points(5))
+
+        assert [c["count"] for c in manifest(catalog, plot_id)["chunks"]] == [4, 4, 4]
+        assert [c["count"] for c in manifest(catalog, new_plot)["chunks"]] == [4, 1]
+        assert len(read_features(catalog, plot_id)) == 12
+
+    def test_compressed_chunks(self, temp_dir: Path) -> None:
+        catalog = create_catalog(temp_dir / "gz", compression="gzip", chunk_size=4)
+        plot_id = create_plot(catalog, PlotMetadata(title="Test"))
+        add_features(catalog, plot_id, points(6))
+        update_feature(catalog, plot_id, make_sample_reference_location("ref-1", name="Moved"))
+
+        assert all(name.endswith(".geojson.gz") for name in chunk_files(catalog, plot_id))
+        assert (
+            read_features(catalog, plot_id, feature_ids=["ref-1"])[0]["properties"]["name"]
+            == "Moved"
+        )
+
+    def test_invalid_chunk_size(self, temp_dir: Path) -> None:
+        with pytest.raises(ValueError, match="Chunk size"):
+            create_catalog(temp_dir / "bad", chunk_size=0)
+
+
+class TestUpdateFeature:
+    def test_rewrites_only_the_affected_chunk(self, catalog: Path, plot_id: str) -> None:
+        before = chunk_files(catalog, plot_id)
+        feature = make_sample_reference_location("ref-5", name="Renamed", lon=-4.95, lat=50.0)
+
+        update_feature(catalog, plot_id, feature)
+
+        after = chunk_files(catalog, plot_id)
+        assert len(set(before) - set(after)) == 1
+        assert len(set(after) - set(before)) == 1
+        assert read_features(catalog, plot_id)[5]["properties"]["name"] == "Renamed"
+
+    def test_updates_bbox(self, catalog: Path, plot_id: str) -> None:
+        update_feature(catalog, plot_id, make_sample_reference_location("ref-9", lon=3.0, lat=55.0))
+
+        item = read_plot(catalog, plot_id)
+        assert item["bbox"] == [-5.0, 50.0, 3.0, 55.0]
+        assert item["geometry"]["coordinates"][0][2] == [3.0, 55.0]
+
+    def test_rebuilds_positions_and_overview(self, catalog: Path) -> None:
+        plot_id = create_plot(catalog, PlotMetadata(title="Tracks"))
+        add_features(catalog, plot_id, [make_sample_track_feature("t1"), *points(4)])
+        track = make_sample_track_feature("t1", platform_name="Renamed")
+        track["properties"]["positions"] = track["properties"]["positions"][:2]
+
+        update_feature(catalog, plot_id, track)
+
+        overview = read_json(catalog / plot_id / "overview.geojson")
+        assert overview["features"][0]["properties"]["platform_name"] == "Renamed"
+        assert len(read_positions(catalog, plot_id)["time"]) == 2
+
+    def test_missing_feature(self, catalog: Path, plot_id: str) -> None:
+        with pytest.raises(FeatureNotFoundError, match="nope"):
+            update_feature(catalog, plot_id, make_sample_reference_location("nope"))
+
+    def test_feature_needs_id(self, catalog: Path, plot_id: str) -> None:
+        feature = make_sample_reference_location()
+        del feature["id"]
+
+        with pytest.raises(ValueError, match="id"):
+            update_feature(catalog, plot_id, feature)
+
+    def test_single_file_store(self, temp_dir: Path) -> None:
+        catalog = create_catalog(temp_dir / "flat")
+        plot_id = create_plot(catalog, PlotMetadata(title="Test"))
+        add_features(catalog, plot_id, points(3))
+
+        update_feature(catalog, plot_id, make_sample_reference_location("ref-1", name="Edited"))
+
+        assert read_features(catalog, plot_id)[1]["properties"]["name"] == "Edited"
+        assert (catalog / plot_id / FEATURES_FILENAME).exists()
+
+
+class TestRemoveFeature:
+    def test_removes_and_returns_remaining(self, catalog: Path, plot_id: str) -> None:
+        remaining = remove_feature(catalog, plot_id, "ref-9")
+
+        assert remaining == 9
+        assert "ref-9" not in manifest(catalog, plot_id)["ids"]
+        assert read_plot(catalog, plot_id)["bbox"][2] == pytest.approx(-4.92)
+        assert list_plots(catalog)[0].feature_count == 9
+
+    def test_emptied_chunk_is_dropped(self, catalog: Path, plot_id: str) -> None:
+        remove_feature(catalog, plot_id, "ref-8")
+        remove_feature(catalog, plot_id, "ref-9")
+
+        assert [c["count"] for c in manifest(catalog, plot_id)["chunks"]] == [4, 4]
+        assert len(chunk_files(catalog, plot_id)) == 2
+
+    def test_removing_last_feature_clears_bbox(self, catalog: Path) -> None:
+        plot_id = create_plot(catalog, PlotMetadata(title="Tracks"))
+        add_features(catalog, plot_id, [make_sample_track_feature("t1")])
+
+        assert remove_feature(catalog, plot_id, "t1") == 0
+
+        item = read_plot(catalog, plot_id)
+        assert item["bbox"] is None
+        assert "positions" not in item["assets"]
+        assert "overview" not in item["assets"]
+        assert not (catalog / plot_id / "overview.geojson").exists()
+        assert not (catalog / plot_id / POSITIONS_DIR).exists()
+
+    def test_missing_feature(self, catalog: Path, plot_id: str) -> None:
+        with pytest.raises(FeatureNotFoundError):
+            remove_feature(catalog, plot_id, "ref-99")
+
+    def test_tiles_match_full_rebuild(self, catalog: Path) -> None:
+        plot_id = create_plot(catalog, PlotMetadata(title="Tracks"))
+        add_features(catalog, plot_id, [make_sample_track_feature("t1"), *points(4)])
+        generate_tiles(catalog, plot_id, max_zoom=8)
+
+        remove_feature(catalog, plot_id, "ref-0")
+        update_feature(catalog, plot_id, make_sample_reference_location("ref-1", lon=1.0))
+        tiles_dir = catalog / plot_id / TILES_DIR
+        edited = {str(p.relative_to(tiles_dir)): p.read_bytes() for p in tiles_dir.rglob("*.mvt")}
+
+        generate_tiles(catalog, plot_id, max_zoom=8)
+        rebuilt = {str(p.relative_to(tiles_dir)): p.read_bytes() for p in tiles_dir.rglob("*.mvt")}
+
+        assert edited == rebuilt
+
+
+class TestChunkingSettings:
+    def test_enabling_converts_on_next_write(self, temp_dir: Path) -> None:
+        catalog = create_catalog(temp_dir / "catalog")
+        plot_id = create_plot(catalog, PlotMetadata(title="Test"))
+        add_features(catalog, plot_id, points(3))
+
+        set_feature_chunking(catalog, 2)
+        add_features(catalog, plot_id, points(2, start=3))
+
+        assert [c["count"] for c in manifest(catalog, plot_id)["chunks"]] == [2, 2, 1]
+        assert not (catalog / plot_id / FEATURES_FILENAME).exists()
+        assert len(read_features(catalog, plot_id)) == 5
+
+    def test_disabling_converts_on_next_edit(self, catalog: Path, plot_id: str) -> None:
+        set_feature_chunking(catalog, None)
+        remove_feature(catalog, plot_id, "ref-0")
+
+        assert not (catalog / plot_id / CHUNKS_DIR).exists()
+        assert read_plot(catalog, plot_id)["assets"]["features"]["href"] == f"./{FEATURES_FILENAME}"
+        assert len(read_features(catalog, plot_id)) == 9
+
+
+class TestVerifyChunked:
+    def test_clean_chunked_plot(self, catalog: Path, plot_id: str) -> None:
+        remove_feature(catalog, plot_id, "ref-0")
+
+        assert verify_catalog(catalog, incremental=False).issues == []
+
+    def test_missing_chunk_is_reported(self, catalog: Path, plot_id: str) -> None:
+        chunks_dir = catalog / plot_id / CHUNKS_DIR
+        (chunks_dir / manifest(catalog, plot_id)["chunks"][0]["href"]).unlink()
+
+        (issue,) = verify_catalog(catalog, incremental=False).issues
+        assert issue.kind == "missing_asset"
+
+
+class TestFeatureEditRPC:
+    def test_update_and_remove_methods(self, catalog: Path, plot_id: str) -> None:
+        updated = handle_request(
+            {
+                "jsonrpc": "2.0",
+                "id": 1,
+                "method": "update_feature",
+                "params": {
+                    "store_path": str(catalog),
+                    "plot_id": plot_id,
+                    "feature": make_sample_reference_location("ref-2", name="Edited"),
+                },
+            }
+        )
+        removed = handle_request(
+            {
+                "jsonrpc": "2.0",
+                "id": 2,
+                "method": "remove_feature",
+                "params": {"store_path": str(catalog), "plot_id": plot_id, "feature_id": "ref-3"},
+            }
+        )
+
+        assert updated["result"]["updated"] is True
+        assert removed["result"]["feature_count"] == 9
+
+    def test_missing_feature_error(self, catalog: Path, plot_id: str) -> None:
+        response = handle_request(
+            {
+                "jsonrpc": "2.0",
+                "id": 1,
+                "method": "remove_feature",
+                "params": {"store_path": str(catalog), "plot_id": plot_id, "feature_id": "x"},
+            }
+        )
+
+        assert response["error"]["code"] == -32004
+        assert response["error"]["data"]["type"] == "FeatureNotFoundError"
+
+    def test_init_catalog_chunk_size(self, temp_dir: Path) -> None:
+        handle_request(
+            {
+                "jsonrpc": "2.0",
+                "id": 1,
+                "method": "init_catalog",
+                "params": {"path": str(temp_dir / "rpc"), "name": "RPC", "chunk_size": 100},
+            }
+        )
+
+        assert read_json(temp_dir / "rpc" / "catalog.json")["debrief:chunk_size"] == 100
@@ -0,0 +1,253 @@
+"""Tests for the columnar position sidecar."""
+
+import json
+import math
+from pathlib import Path
+
+import pytest
+
+from debrief_stac import columnar as columnar_module
+from debrief_stac import features as features_module
+from debrief_stac import session as session_module
+from debrief_stac.catalog import create_catalog
+from debrief_stac.columnar import (
+    COLUMNS,
+    MANIFEST_FILENAME,
+    POSITIONS_DIR,
+    build_columns,
+    count_rows,
+    iter_positions,
+    read_positions,
+)
+from debrief_stac.features import add_features
+from debrief_stac.models import PlotMetadata
+from debrief_stac.plot import create_plot, read_plot
+from debrief_stac.session import session
+from debrief_stac.verify import verify_catalog
+from tests.fixtures import make_sample_reference_location, make_sample_track_feature
+
+
+@pytest.fixture
+def catalog(temp_dir: Path) -> Path:
+    return create_catalog(temp_dir / "catalog")
+
+
+def rep_style_track(feature_id: str) -> dict:
+    """A track whose positions use lat/lon keys, as produced by the REP parser."""
+    return {
+        "type": "Feature",
+        "id": feature_id,
+        "geometry": {"type": "LineString", "coordinates": [[-21.7, 22.2], [-21.8, 22.3]]},
+        "properties": {
+            "kind": "TRACK",
+            "positions": [
+                {"time": "1995-12-12T05:00:00+00:00", "lat": 22.2, "lon": -21.7, "depth": 5.0},
+                {"time": "1995-12-12T05:01:00+00:00", "lat": 22.3, "lon": -21.8, "depth": 6.0},
+            ],
+        },
+    }
+
+
+class TestBuildColumns:
+    def test_one_row_per_position(self) -> None:
+        tracks, columns = build_columns(
+            [make_sample_track_feature("a"), make_sample_reference_location(), rep_style_track("b")]
+        )
+
+        assert tracks == ["a", "b"]
+        assert list(columns["track"]) == [0, 0, 0, 1, 1]
+        assert list(columns["lon"]) == [-5.0, -5.1, -5.2, -21.7, -21.8]
+        assert columns["time"][1] - columns["time"][0] == 3_600_000
+        assert columns["time"][3] == 818744400000
+        assert math.isnan(columns["depth"][0])
+        assert math.isnan(columns["course"][3])
+
+    def test_malformed_positions_are_skipped(self) -> None:
+        track = rep_style_track("b")
+        good = track["properties"]["positions"][0]
+        track["properties"]["positions"] = [
+            {"lat": 22.0, "lon": -21.0},
+            {"time": good["time"], "lat": 22.0},
+            {"time": "yesterday", "lat": 22.0, "lon": -21.0},
+            {"time": good["time"], "coordinates": [-21.0]},
+            "not a position",
+            good,
+        ]
+        empty = rep_style_track("c")
+        empty["properties"]["positions"] = [{"lat": 1.0, "lon": 2.0}]
+
+        tracks, columns = build_columns([empty, track])
+
+        assert tracks == ["b"]
+        assert list(columns["lon"]) == [-21.7]
+        assert count_rows(track["properties"]["positions"]) == 1
+
+
+class TestPositionsSidecar:
+    def test_written_with_features(self, catalog: Path) -> None:
+        plot_id = create_plot(catalog, PlotMetadata(title="P"))
+        add_features(catalog, plot_id, [make_sample_track_feature("a")])
+
+        item = read_plot(catalog, plot_id)
+        assert item["assets"]["positions"]["href"] == f"./{POSITIONS_DIR}/{MANIFEST_FILENAME}"
+
+        columns = read_positions(catalog, plot_id, columns=["speed", "track"])
+        assert set(columns) == {"tracks", "speed", "track"}
+        assert list(columns["speed"]) == [12.0, 11.5, 13.0]
+
+    def test_appended_features_extend_columns(self, catalog: Path) -> None:
+        plot_id = create_plot(catalog, PlotMetadata(title="P"))
+        add_features(catalog, plot_id, [make_sample_track_feature("a")])
+        add_features(catalog, plot_id, [rep_style_track("b")])
+
+        columns = read_positions(catalog, plot_id)
+
+        assert columns["tracks"] == ["a", "b"]
+        assert len(columns["lat"]) == 5
+        assert list(columns["depth"])[3:] == [5.0, 6.0]
+
+    def test_rebuild_writes_new_column_files(self, catalog: Path) -> None:
+        plot_id = create_plot(catalog, PlotMetadata(title="P"))
+        add_features(catalog, plot_id, [make_sample_track_feature("a")])
+        positions_dir = catalog / plot_id / POSITIONS_DIR
+        lon = read_positions(catalog, plot_id, columns=["lon"])["lon"]
+
+        add_features(catalog, plot_id, [rep_style_track("b")])
+        add_features(catalog, plot_id, [rep_style_track("c")])
+
+        # The previous generation is kept for readers of the previous manifest
+        files = {p.name for p in positions_dir.glob("*.npy")}
+        assert files == {f"{name}.{revision}.npy" for name in COLUMNS for revision in (2, 3)}
+        manifest = json.loads((positions_dir / MANIFEST_FILENAME).read_text())
+        assert manifest["columns"]["lon"]["href"] == "./lon.3.npy"
+        # Columns mapped before the rebuild are left as they were
+        assert list(lon) == [-5.0, -5.1, -5.2]
+
+    def test_reader_of_a_replaced_manifest_reads_again(
+        self, catalog: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        plot_id = create_plot(catalog, PlotMetadata(title="P"))
+        add_features(catalog, plot_id, [make_sample_track_feature("a")])
+        manifest_path = catalog / plot_id / POSITIONS_DIR / MANIFEST_FILENAME
+        stale = json.loads(manifest_path.read_text())
+        add_features(catalog, plot_id, [rep_style_track("b")])
+        add_features(catalog, plot_id, [rep_style_track("c")])
+
+        reads = iter([stale])
+        read_json_cached = columnar_module.read_json_cached
+        monkeypatch.setattr(
+            columnar_module,
+            "read_json_cached",
+            lambda path: next(reads, None) or read_json_cached(path),
+        )
+
+        assert read_positions(catalog, plot_id)["tracks"] == ["a", "b", "c"]
+
+    def test_column_file_in_use_is_removed_later(
+        self, catalog: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        plot_id = create_plot(catalog, PlotMetadata(title="P"))
+        positions_dir = catalog / plot_id / POSITIONS_DIR
+        for track_id in ("a", "b"):
+            add_features(catalog, plot_id, [rep_style_track(track_id)])
+        unlink = Path.unlink
+
+        def unlink_unless_mapped(path: Path, missing_ok: bool = False) -> None:
+            if path.name == "lon.1.npy":
+                raise PermissionError("file is mapped")
+            unlink(path, missing_ok)
+
+        monkeypatch.setattr(Path, "unlink", unlink_unless_mapped)
+        add_features(catalog, plot_id, [rep_style_track("c")])
+        assert (positions_dir / "lon.1.npy").exists()
+        assert not (positions_dir / "lat.1.npy").exists()
+
+        monkeypatch.undo()
+        add_features(catalog, plot_id, [rep_style_track("d")])
+        assert not (positions_dir / "lon.1.npy").exists()
+
+    def test_malformed_positions_leave_plot_consistent(self, catalog: Path) -> None:
+        plot_id = create_plot(catalog, PlotMetadata(title="P"))
+        track = rep_style_track("b")
+        del track["properties"]["positions"][0]["time"]
+
+        assert add_features(catalog, plot_id, [track]) == 1
+
+        assert read_positions(catalog, plot_id)["tracks"] == ["b"]
+        assert read_plot(catalog, plot_id)["bbox"] is not None
+        assert verify_catalog(catalog).ok
+
+    def test_no_sidecar_without_positions(self, catalog: Path) -> None:
+        plot_id = create_plot(catalog, PlotMetadata(title="P"))
+        add_features(catalog, plot_id, [make_sample_reference_location()])
+
+        assert "positions" not in read_plot(catalog, plot_id)["assets"]
+        assert read_positions(catalog, plot_id) == {}
+
+    def test_close_unmaps_columns(self, catalog: Path) -> None:
+        plot_id = create_plot(catalog, PlotMetadata(title="P"))
+        add_features(catalog, plot_id, [make_sample_track_feature("a")])
+
+        with read_positions(catalog, plot_id, columns=["lat"]) as columns:
+            lat = columns["lat"]
+            assert list(lat) == [50.0, 50.1, 50.2]
+
+        assert not columns._maps
+        with pytest.raises(ValueError, match="released"):
+            lat[0]
+
+    def test_unknown_column(self, catalog: Path) -> None:
+        plot_id = create_plot(catalog, PlotMetadata(title="P"))
+        add_features(catalog, plot_id, [make_sample_track_feature("a")])
+
+        with pytest.raises(ValueError, match="heading"):
+            read_positions(catalog, plot_id, columns=["heading"])
+
+    def test_session_writes_sidecar(self, catalog: Path) -> None:
+        with session(catalog) as s:
+            plot_id = s.create_plot(PlotMetadata(title="P"))
+            s.add_features(plot_id, [make_sample_track_feature("a")])
+
+        assert len(read_positions(catalog, plot_id)["time"]) == 3
+
+    def test_appending_points_leaves_derived_files(
+        self, catalog: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        plot_id = create_plot(catalog, PlotMetadata(title="P"))
+        add_features(catalog, plot_id, [make_sample_track_feature("a")])
+
+        def rebuild(*args: object) -> bool:
+            raise AssertionError("derived files rebuilt")
+
+        for module in (features_module, session_module):
+            monkeypatch.setattr(module, "_write_columns", rebuild)
+            monkeypatch.setattr(module, "_write_overview", rebuild)
+
+        add_features(catalog, plot_id, [make_sample_reference_location("ref-1")])
+        with session(catalog) as s:
+            s.add_features(plot_id, [make_sample_reference_location("ref-2")])
+
+        assert read_positions(catalog, plot_id)["tracks"] == ["a"]
+
+    def test_catalog_scan(self, catalog: Path) -> None:
+        for plot_id in ("p1", "p2", "p3"):
+            create_plot(catalog, PlotMetadata(title=plot_id), plot_id=plot_id)
+        add_features(catalog, "p1", [make_sample_track_feature("a")])
+        add_features(catalog, "p3", [rep_style_track("b")])
+
+        scanned = {plot_id: len(cols["lon"]) for plot_id, cols in iter_positions(catalog, ["lon"])}
+
+        assert scanned == {"p1": 3, "p3": 2}
+
+    def test_readable_with_numpy(self, catalog: Path) -> None:
+        np = pytest.importorskip("numpy")
+        plot_id = create_plot(catalog, PlotMetadata(title="P"))
+        add_features(catalog, plot_id, [make_sample_track_feature("a")])
+
+        positions_dir = catalog / plot_id / POSITIONS_DIR
+        manifest = json.loads((positions_dir / MANIFEST_FILENAME).read_text())
+        lat = np.load(positions_dir / manifest["columns"]["lat"]["href"], mmap_mode="r")
+        time = np.load(positions_dir / manifest["columns"]["time"]["href"], mmap_mode="r")
+
+        assert lat.tolist() == [50.0, 50.1, 50.2]
+        assert time.dtype == np.int64
@@ -0,0 +1,155 @@
+"""Tests for compressed FeatureCollection storage."""
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from debrief_stac.cache import ReadCache, get_cache
+from debrief_stac.catalog import (
+    create_catalog,
+    feature_storage,
+    list_plots,
+    open_catalog,
+    set_feature_compression,
+)
+from debrief_stac.cli import handle_init_catalog
+from debrief_stac.features import add_features
+from debrief_stac.models import PlotMetadata
+from debrief_stac.plot import create_plot, read_plot
+from debrief_stac.reader import read_features
+from debrief_stac.session import session
+from debrief_stac.storage import (
+    COMPRESSION_GZIP,
+    COMPRESSION_NONE,
+    COMPRESSION_ZSTD,
+    compression_for,
+    read_json,
+    write_json_atomic,
+)
+from tests.fixtures import make_sample_track_feature
+
+
+def track_features(count: int) -> list[dict]:
+    return [make_sample_track_feature(feature_id=f"t{i}") for i in range(count)]
+
+
+@pytest.fixture
+def small_cache() -> Iterator[ReadCache]:
+    """Shrink the read cache so FeatureCollections are streamed from disk."""
+    cache = get_cache()
+    max_bytes = cache.max_bytes
+    cache.clear()
+    cache.max_bytes = 16
+    yield cache
+    cache.max_bytes = max_bytes
+    cache.clear()
+
+
+class TestCompressedFiles:
+    @pytest.mark.parametrize("suffix", [".gz", ".zst"])
+    def test_round_trip(self, temp_dir: Path, suffix: str) -> None:
+        path = temp_dir / f"data.json{suffix}"
+        data = {"features": [{"id": i} for i in range(100)]}
+
+        write_json_atomic(path, data, indent=None, level=1)
+
+        assert read_json(path) == data
+        assert path.read_bytes()[:1] != b"{"
+
+    def test_codec_from_suffix(self) -> None:
+        assert compression_for(Path("features.geojson")) == COMPRESSION_NONE
+        assert compression_for(Path("features.geojson.gz")) == COMPRESSION_GZIP
+        assert compression_for(Path("features.geojson.zst")) == COMPRESSION_ZSTD
+
+
+class TestCompressedCatalog:
+    @pytest.mark.parametrize(
+        ("compression", "filename"),
+        [(COMPRESSION_ZSTD, "features.geojson.zst"), (COMPRESSION_GZIP, "features.geojson.gz")],
+    )
+    def test_add_features_writes_compressed(
+        self, temp_dir: Path, compression: str, filename: str
+    ) -> None:
+        catalog_path = create_catalog(temp_dir / "catalog", compression=compression)
+        plot_id = create_plot(catalog_path, PlotMetadata(title="P"))
+
+        add_features(catalog_path, plot_id, track_features(3))
+        add_features(catalog_path, plot_id, track_features(2))
+
+        assert read_plot(catalog_path, plot_id)["assets"]["features"]["href"] == f"./{filename}"
+        assert (catalog_path / plot_id / filename).exists()
+        assert not (catalog_path / plot_id / "features.geojson").exists()
+        assert len(read_features(catalog_path, plot_id)) == 5
+        assert list_plots(catalog_path)[0].feature_count == 5
+
+    def test_compressed_is_smaller(self, temp_dir: Path) -> None:
+        plain = create_catalog(temp_dir / "plain")
+        packed = create_catalog(temp_dir / "packed", compression=COMPRESSION_ZSTD)
+        for catalog_path in (plain, packed):
+            create_plot(catalog_path, PlotMetadata(title="P"), plot_id="p")
+            add_features(catalog_path, "p", track_features(50))
+
+        plain_size = (plain / "p" / "features.geojson").stat().st_size
+        packed_size = (packed / "p" / "features.geojson.zst").stat().st_size
+        assert packed_size * 10 < plain_size
+
+    def test_streaming_read(self, temp_dir: Path, small_cache: ReadCache) -> None:
+        catalog_path = create_catalog(temp_dir / "catalog", compression=COMPRESSION_GZIP)
+        plot_id = create_plot(catalog_path, PlotMetadata(title="P"))
+        add_features(catalog_path, plot_id, track_features(4))
+
+        features = read_features(catalog_path, plot_id, feature_ids=["t2"])
+
+        assert [f["id"] for f in features] == ["t2"]
+        assert small_cache.size == 0
+
+    def test_level_stored_in_catalog(self, temp_dir: Path) -> None:
+        catalog_path = create_catalog(
+            temp_dir / "catalog", compression=COMPRESSION_ZSTD, compression_level=19
+        )
+
+        assert feature_storage(open_catalog(catalog_path)) == (COMPRESSION_ZSTD, 19)
+
+    def test_unknown_compression(self, temp_dir: Path) -> None:
+        with pytest.raises(ValueError, match="compression"):
+            create_catalog(temp_dir / "catalog", compression="lz4")
+
+    def test_changing_compression_converts_on_next_write(self, temp_dir: Path) -> None:
+        catalog_path = create_catalog(temp_dir / "catalog")
+        plot_id = create_plot(catalog_path, PlotMetadata(title="P"))
+        add_features(catalog_path, plot_id, track_features(2))
+
+        set_feature_compression(catalog_path, COMPRESSION_ZSTD)
+        assert len(read_features(catalog_path, plot_id)) == 2
+        add_features(catalog_path, plot_id, track_features(1))
+
+        assert not (catalog_path / plot_id / "features.geojson").exists()
+        assert len(read_features(catalog_path, plot_id)) == 3
+
+        set_feature_compression(catalog_path, COMPRESSION_NONE)
+        assert feature_storage(open_catalog(catalog_path)) == (COMPRESSION_NONE, None)
+
+    def test_session_writes_compressed(self, temp_dir: Path) -> None:
+        catalog_path = create_catalog(temp_dir / "catalog", compression=COMPRESSION_ZSTD)
+        plot_id = create_plot(catalog_path, PlotMetadata(title="P"))
+        add_features(catalog_path, plot_id, track_features(1))
+
+        with session(catalog_path) as s:
+            s.add_features(plot_id, track_features(2))
+
+        assert len(read_features(catalog_path, plot_id)) == 3
+        assert sorted(p.name for p in (catalog_path / plot_id).iterdir()) == [
+            "features.geojson.zst",
+            "item.json",
+            "overview.geojson",
+            "positions",
+        ]
+
+    def test_init_catalog_handler_accepts_compression(self, temp_dir: Path) -> None:
+        path = temp_dir / "catalog"
+        handle_init_catalog(
+            {"path": str(path), "name": "Store", "compression": "gzip", "compression_level": 9}
+        )
+
+        assert feature_storage(open_catalog(path)) == (COMPRESSION_GZIP, 9)
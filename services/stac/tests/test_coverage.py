@@ -1,5 +1,6 @@
 """Additional tests to increase code coverage."""
 
+import asyncio
 import json
 from pathlib import Path
 
@@ -223,10 +224,12 @@ class TestMCPTools:
         """Test calling create_catalog_tool directly."""
         from debrief_stac.mcp_server import create_catalog_tool
 
-        result = create_catalog_tool(
-            path=str(tmp_path / "mcp_cat"),
-            catalog_id="mcp-test",
-            description="MCP tool test",
+        result = asyncio.run(
+            create_catalog_tool(
+                path=str(tmp_path / "mcp_cat"),
+                catalog_id="mcp-test",
+                description="MCP tool test",
+            )
         )
         assert "path" in result
         assert Path(result["path"]).exists()
@@ -238,10 +241,12 @@ class TestMCPTools:
 
         catalog_path = create_catalog(tmp_path / "catalog")
 
-        result = create_plot_tool(
-            catalog_path=str(catalog_path),
-            title="MCP Plot",
-            description="Created via MCP tool",
+        result = asyncio.run(
+            create_plot_tool(
+                catalog_path=str(catalog_path),
+                title="MCP Plot",
+                description="Created via MCP tool",
+            )
         )
         assert "plot_id" in result
 
@@ -256,9 +261,11 @@ class TestMCPTools:
         metadata = PlotMetadata(title="Test")
         plot_id = create_plot(catalog_path, metadata)
 
-        result = read_plot_tool(
-            catalog_path=str(catalog_path),
-            plot_id=plot_id,
+        result = asyncio.run(
+            read_plot_tool(
+                catalog_path=str(catalog_path),
+                plot_id=plot_id,
+            )
         )
         assert "item" in result
         assert result["item"]["id"] == plot_id
@@ -274,16 +281,18 @@ class TestMCPTools:
         metadata = PlotMetadata(title="Test")
         plot_id = create_plot(catalog_path, metadata)
 
-        result = add_features_tool(
-            catalog_path=str(catalog_path),
-            plot_id=plot_id,
-            features=[
-                {
-                    "type": "Feature",
-                    "geometry": {"type": "Point", "coordinates": [0, 0]},
-                    "properties": {},
-                }
-            ],
+        result = asyncio.run(
+            add_features_tool(
+                catalog_path=str(catalog_path),
+                plot_id=plot_id,
+                features=[
+                    {
+                        "type": "Feature",
+                        "geometry": {"type": "Point", "coordinates": [0, 0]},
+                        "properties": {},
+                    }
+                ],
+            )
         )
         assert "feature_count" in result
         assert result["feature_count"] == 1
@@ -302,10 +311,12 @@ class TestMCPTools:
         source_file = tmp_path / "test.txt"
         source_file.write_text("content")
 
-        result = add_asset_tool(
-            catalog_path=str(catalog_path),
-            plot_id=plot_id,
-            source_path=str(source_file),
+        result = asyncio.run(
+            add_asset_tool(
+                catalog_path=str(catalog_path),
+                plot_id=plot_id,
+                source_path=str(source_file),
+            )
         )
         assert "asset_key" in result
 
@@ -320,7 +331,7 @@ class TestMCPTools:
         metadata = PlotMetadata(title="Test")
         create_plot(catalog_path, metadata)
 
-        result = list_plots_tool(catalog_path=str(catalog_path))
+        result = asyncio.run(list_plots_tool(catalog_path=str(catalog_path)))
         assert "plots" in result
         assert len(result["plots"]) == 1
 
@@ -335,10 +346,12 @@ class TestMCPTools:
         metadata = PlotMetadata(title="Test")
         plot_id = create_plot(catalog_path, metadata)
 
-        result = add_asset_tool(
-            catalog_path=str(catalog_path),
-            plot_id=plot_id,
-            source_path="/nonexistent/file.txt",
+        result = asyncio.run(
+            add_asset_tool(
+                catalog_path=str(catalog_path),
+                plot_id=plot_id,
+                source_path="/nonexistent/file.txt",
+            )
         )
         assert "error" in result
         assert "not found" in result["error"].lower()
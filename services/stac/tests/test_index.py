@@ -0,0 +1,237 @@
+"""Tests for the plot listing index and paginated listing."""
+
+import errno
+import json
+import shutil
+import sqlite3
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from debrief_stac import index as index_module
+from debrief_stac.catalog import LAYOUT_SHARDED, _CatalogLinks, create_catalog, list_plots
+from debrief_stac.cli import handle_list_plots
+from debrief_stac.exceptions import CatalogNotFoundError
+from debrief_stac.features import add_features
+from debrief_stac.index import INDEX_FILE, list_plots_page, rebuild_index
+from debrief_stac.mcp_server import mcp_list_plots
+from debrief_stac.models import PlotMetadata
+from debrief_stac.plot import _load_plot, create_plot
+from debrief_stac.session import session
+from debrief_stac.storage import STATE_DIR
+from tests.fixtures import make_sample_track_feature
+
+START = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+@pytest.fixture
+def catalog(temp_dir: Path) -> Path:
+    catalog_path = create_catalog(temp_dir / "catalog")
+    for i, title in enumerate(["Charlie", "alpha", "Bravo", "Delta", "Echo"]):
+        create_plot(
+            catalog_path,
+            PlotMetadata(title=title, timestamp=START + timedelta(hours=i)),
+            plot_id=f"plot-{i}",
+        )
+    return catalog_path
+
+
+def ids(page) -> list[str]:
+    return [p.id for p in page.plots]
+
+
+def all_pages(catalog: Path, **kwargs) -> list[list[str]]:
+    pages = []
+    cursor = None
+    while True:
+        page = list_plots_page(catalog, cursor=cursor, **kwargs)
+        pages.append(ids(page))
+        cursor = page.next_cursor
+        if cursor is None:
+            return pages
+
+
+class TestListPlotsPage:
+    def test_default_is_newest_first(self, catalog: Path) -> None:
+        page = list_plots_page(catalog)
+
+        assert ids(page) == ["plot-4", "plot-3", "plot-2", "plot-1", "plot-0"]
+        assert page.next_cursor is None
+        assert (catalog / STATE_DIR / INDEX_FILE).exists()
+
+    def test_matches_list_plots(self, catalog: Path) -> None:
+        add_features(catalog, "plot-2", [make_sample_track_feature("a")])
+
+        assert list_plots_page(catalog).plots == list_plots(catalog)
+
+    def test_pages(self, catalog: Path) -> None:
+        assert all_pages(catalog, limit=2) == [
+            ["plot-4", "plot-3"],
+            ["plot-2", "plot-1"],
+            ["plot-0"],
+        ]
+
+    def test_sort_by_title_is_case_insensitive(self, catalog: Path) -> None:
+        pages = all_pages(catalog, limit=3, sort="title")
+
+        assert pages == [["plot-1", "plot-2", "plot-0"], ["plot-3", "plot-4"]]
+
+    def test_sort_descending_by_id(self, catalog: Path) -> None:
+        assert ids(list_plots_page(catalog, limit=2, sort="-id")) == ["plot-4", "plot-3"]
+
+    def test_ties_are_broken_by_id(self, temp_dir: Path) -> None:
+        catalog = create_catalog(temp_dir / "ties")
+        for i in range(5):
+            create_plot(catalog, PlotMetadata(title="Same", timestamp=START), plot_id=f"p{i}")
+
+        pages = all_pages(catalog, limit=2, sort="title")
+
+        assert pages == [["p0", "p1"], ["p2", "p3"], ["p4"]]
+
+    def test_title_filter(self, catalog: Path) -> None:
+        assert ids(list_plots_page(catalog, title="PH")) == ["plot-1"]
+
+    def test_title_filter_escapes_wildcards(self, catalog: Path) -> None:
+        assert ids(list_plots_page(catalog, title="%")) == []
+
+    def test_time_filters(self, catalog: Path) -> None:
+        page = list_plots_page(
+            catalog, since=START + timedelta(hours=1), until="2026-01-01T03:00:00Z", sort="datetime"
+        )
+
+        assert ids(page) == ["plot-1", "plot-2", "plot-3"]
+
+    def test_filters_apply_across_pages(self, catalog: Path) -> None:
+        pages = all_pages(catalog, limit=1, since=START + timedelta(hours=3))
+
+        assert pages == [["plot-4"], ["plot-3"]]
+
+    def test_invalid_arguments(self, catalog: Path) -> None:
+        with pytest.raises(ValueError):
+            list_plots_page(catalog, limit=0)
+        with pytest.raises(ValueError):
+            list_plots_page(catalog, sort="size")
+        with pytest.raises(ValueError):
+            list_plots_page(catalog, cursor="not-a-cursor")
+
+    def test_cursor_is_bound_to_sort(self, catalog: Path) -> None:
+        cursor = list_plots_page(catalog, limit=1).next_cursor
+
+        with pytest.raises(ValueError):
+            list_plots_page(catalog, limit=1, cursor=cursor, sort="title")
+
+    def test_missing_catalog(self, temp_dir: Path) -> None:
+        with pytest.raises(CatalogNotFoundError):
+            list_plots_page(temp_dir / "missing")
+
+    def test_sharded_catalog(self, temp_dir: Path) -> None:
+        catalog = create_catalog(temp_dir / "sharded", layout=LAYOUT_SHARDED)
+        for i in range(4):
+            create_plot(catalog, PlotMetadata(title=f"P{i}"), plot_id=f"plot-{i}")
+
+        assert sorted(ids(list_plots_page(catalog))) == [f"plot-{i}" for i in range(4)]
+
+
+class TestIndexMaintenance:
+    def test_new_plots_are_indexed(self, catalog: Path) -> None:
+        list_plots_page(catalog)
+
+        create_plot(catalog, PlotMetadata(title="Foxtrot", timestamp=START + timedelta(days=1)))
+
+        assert list_plots_page(catalog, limit=1).plots[0].title == "Foxtrot"
+
+    def test_feature_counts_follow_writes(self, catalog: Path) -> None:
+        list_plots_page(catalog)
+
+        add_features(catalog, "plot-4", [make_sample_track_feature("a")])
+
+        assert list_plots_page(catalog, limit=1).plots[0].feature_count == 1
+
+    def test_session_writes_are_indexed(self, catalog: Path) -> None:
+        list_plots_page(catalog)
+
+        with session(catalog) as s:
+            s.create_plot(PlotMetadata(title="Golf", timestamp=START - timedelta(days=1)))
+
+        assert list_plots_page(catalog, sort="datetime", limit=1).plots[0].title == "Golf"
+
+    def test_unlinked_plots_are_dropped(self, catalog: Path) -> None:
+        list_plots_page(catalog)
+        links = _CatalogLinks(catalog)
+        links.remove_item("plot-4")
+        links.save()
+
+        assert "plot-4" not in ids(list_plots_page(catalog))
+
+    def test_rebuild_picks_up_external_edits(self, catalog: Path) -> None:
+        list_plots_page(catalog)
+        item_path = catalog / "plot-0" / "item.json"
+        item = _load_plot(catalog, "plot-0")
+        item["properties"]["title"] = "Zulu"
+        item_path.write_text(json.dumps(item))
+
+        assert rebuild_index(catalog) == 5
+        assert ids(list_plots_page(catalog, sort="-title", limit=1)) == ["plot-0"]
+
+    def test_corrupt_index_is_rebuilt(self, catalog: Path) -> None:
+        list_plots_page(catalog)
+        (catalog / STATE_DIR / INDEX_FILE).write_bytes(b"not a database")
+
+        assert len(list_plots_page(catalog).plots) == 5
+
+    def test_read_only_store_is_listed_without_an_index(
+        self, catalog: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        def read_only(self: Path, *args: object, **kwargs: object) -> None:
+            raise OSError(errno.EROFS, "Read-only file system", str(self))
+
+        # An archived store, copied without its state directory
+        shutil.rmtree(catalog / STATE_DIR)
+        monkeypatch.setattr(Path, "mkdir", read_only)
+
+        assert ids(list_plots_page(catalog, sort="title", limit=2)) == ["plot-1", "plot-2"]
+        assert not (catalog / STATE_DIR).exists()
+
+    def test_unwritable_index_falls_back_to_a_scan(
+        self, catalog: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        list_plots_page(catalog)
+        create_plot(catalog, PlotMetadata(title="Foxtrot", timestamp=START), plot_id="plot-5")
+        connect = index_module._connect
+
+        def read_only(index_path: Path | str) -> sqlite3.Connection:
+            if index_path != ":memory:":
+                raise sqlite3.OperationalError("attempt to write a readonly database")
+            return connect(index_path)
+
+        monkeypatch.setattr(index_module, "_connect", read_only)
+
+        assert len(list_plots_page(catalog).plots) == 6
+
+
+class TestListPlotsHandlers:
+    def test_json_rpc_pages(self, catalog: Path) -> None:
+        first = handle_list_plots({"store_path": str(catalog), "limit": 3})
+        rest = handle_list_plots(
+            {"store_path": str(catalog), "limit": 3, "cursor": first["next_cursor"]}
+        )
+
+        assert [p["id"] for p in first["plots"]] == ["plot-4", "plot-3", "plot-2"]
+        assert [p["id"] for p in rest["plots"]] == ["plot-1", "plot-0"]
+        assert rest["next_cursor"] is None
+
+    def test_json_rpc_lists_all_without_limit(self, catalog: Path) -> None:
+        result = handle_list_plots({"store_path": str(catalog)})
+
+        assert len(result["plots"]) == 5
+        assert result["next_cursor"] is None
+
+    def test_mcp_pages(self, catalog: Path) -> None:
+        result = mcp_list_plots(str(catalog), limit=2, sort="title")
+
+        assert [p["title"] for p in result["plots"]] == ["alpha", "Bravo"]
+        assert result["next_cursor"]
+
+    def test_mcp_invalid_sort(self, catalog: Path) -> None:
+        assert "error" in mcp_list_plots(str(catalog), sort="size")
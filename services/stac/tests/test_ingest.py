@@ -0,0 +1,211 @@
+"""Tests for bulk import."""
+
+from datetime import UTC, datetime
+from itertools import islice
+from pathlib import Path
+
+import pytest
+
+from debrief_stac import ingest as ingest_module
+from debrief_stac.catalog import LAYOUT_SHARDED, create_catalog, list_plots
+from debrief_stac.exceptions import CatalogNotFoundError
+from debrief_stac.ingest import CHECKPOINT_FILE, _earliest_time, discover_sources, import_sources
+from debrief_stac.locks import LOCKS_DIR, plot_lock
+from debrief_stac.plot import read_plot
+from debrief_stac.reader import read_features
+from debrief_stac.session import CatalogSession
+from debrief_stac.storage import STATE_DIR
+
+pytest.importorskip("debrief_io")
+
+
+def write_rep(path: Path, platform: str, points: int = 10, minute_offset: int = 0) -> Path:
+    """Write a small single-track REP file."""
+    lines = []
+    for i in range(points):
+        minute = minute_offset + i
+        lines.append(
+            f"951212 05{minute:02d}00.000 {platform:<8} @C   22 11 {10 + i % 50:05.2f} N "
+            f"21 41 52.37 W 269.7   2.0      0 "
+        )
+    path.write_text("\n".join(lines) + "\n")
+    return path
+
+
+@pytest.fixture
+def archive(temp_dir: Path) -> Path:
+    root = temp_dir / "archive"
+    (root / "day1").mkdir(parents=True)
+    write_rep(root / "day1" / "alpha.rep", "ALPHA", points=10)
+    write_rep(root / "day1" / "bravo.rep", "BRAVO", points=5)
+    write_rep(root / "charlie.rep", "CHARLIE", points=3)
+    (root / "notes.txt").write_text("not a recording")
+    return root
+
+
+@pytest.fixture
+def catalog(temp_dir: Path) -> Path:
+    return create_catalog(temp_dir / "catalog")
+
+
+class TestDiscoverSources:
+    def test_recurses_and_filters_extensions(self, archive: Path) -> None:
+        names = [p.name for p in discover_sources([archive])]
+        assert names == ["charlie.rep", "alpha.rep", "bravo.rep"]
+
+    def test_explicit_file_always_included(self, archive: Path) -> None:
+        assert discover_sources([archive / "notes.txt"]) == [archive / "notes.txt"]
+
+    def test_missing_source(self, temp_dir: Path) -> None:
+        with pytest.raises(FileNotFoundError):
+            discover_sources([temp_dir / "missing"])
+
+
+class TestImportSources:
+    def test_imports_one_plot_per_file(self, catalog: Path, archive: Path) -> None:
+        report = import_sources(catalog, [archive], workers=1)
+
+        assert report.files_total == 3
+        assert report.files_imported == 3
+        assert report.positions == 18
+        assert report.positions_per_second > 0
+        assert sorted(p.id for p in list_plots(catalog)) == sorted(report.plot_ids)
+
+        plot_id = next(p for p in report.plot_ids if p.startswith("alpha-"))
+        item = read_plot(catalog, plot_id)
+        assert item["properties"]["title"] == "alpha"
+        assert item["properties"]["datetime"].startswith("1995-12-12T05:00:00")
+        assert "source-alpha" in item["assets"]
+        assert len(read_features(catalog, plot_id)) == 1
+
+    def test_parallel_workers(self, catalog: Path, archive: Path) -> None:
+        report = import_sources(catalog, [archive], workers=2, batch_size=2)
+
+        assert report.files_imported == 3
+        assert len(list_plots(catalog)) == 3
+
+    def test_rerun_resumes_from_checkpoint(self, catalog: Path, archive: Path) -> None:
+        import_sources(catalog, [archive], workers=1)
+        assert (catalog / STATE_DIR / CHECKPOINT_FILE).exists()
+
+        report = import_sources(catalog, [archive], workers=1)
+
+        assert report.files_imported == 0
+        assert report.files_skipped == 3
+        assert len(list_plots(catalog)) == 3
+
+    def test_changed_file_reimported(self, catalog: Path, archive: Path) -> None:
+        import_sources(catalog, [archive], workers=1)
+        write_rep(archive / "charlie.rep", "CHARLIE", points=4)
+
+        report = import_sources(catalog, [archive], workers=1)
+
+        assert report.files_imported == 1
+        assert report.positions == 4
+
+    def test_existing_plots_not_duplicated_without_checkpoint(
+        self, catalog: Path, archive: Path
+    ) -> None:
+        import_sources(catalog, [archive], workers=1)
+
+        report = import_sources(catalog, [archive], workers=1, resume=False)
+
+        assert report.files_imported == 0
+        assert len(list_plots(catalog)) == 3
+
+    def test_duplicate_content_imported_once(self, catalog: Path, archive: Path) -> None:
+        copy = archive / "alpha-copy.rep"
+        copy.write_bytes((archive / "day1" / "alpha.rep").read_bytes())
+
+        report = import_sources(catalog, [archive], workers=1)
+
+        assert report.files_imported == 3
+        assert report.files_skipped == 1
+
+    def test_failures_reported_and_retried(self, catalog: Path, archive: Path) -> None:
+        bad = archive / "notes.txt"
+
+        report = import_sources(catalog, [archive, bad], workers=1)
+
+        assert report.files_failed == 1
+        assert report.failures[0].source_path == str(bad)
+        assert "UnsupportedFormatError" in report.failures[0].message
+
+        retry = import_sources(catalog, [bad], workers=1)
+        assert retry.files_failed == 1
+
+    @pytest.mark.parametrize("layout", ["flat", LAYOUT_SHARDED])
+    def test_staging_failure_skips_only_that_file(
+        self, temp_dir: Path, archive: Path, layout: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        catalog = create_catalog(temp_dir / "store", layout=layout)
+        add_asset = CatalogSession.add_asset
+
+        def failing_add_asset(self, plot_id, source_path, *args, **kwargs):
+            if Path(source_path).name == "bravo.rep":
+                raise OSError("disk full")
+            return add_asset(self, plot_id, source_path, *args, **kwargs)
+
+        monkeypatch.setattr(CatalogSession, "add_asset", failing_add_asset)
+        report = import_sources(catalog, [archive], workers=1)
+
+        assert report.files_imported == 2
+        assert report.files_failed == 1
+        assert report.failures[0].message == "OSError: disk full"
+        plot_ids = sorted(p.id for p in list_plots(catalog))
+        assert plot_ids == sorted(report.plot_ids)
+        assert not any(p.startswith("bravo-") for p in plot_ids)
+
+        monkeypatch.setattr(CatalogSession, "add_asset", add_asset)
+        retry = import_sources(catalog, [archive], workers=1)
+        assert retry.files_imported == 1
+
+    def test_error_rolls_back_open_batch(
+        self, catalog: Path, archive: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        parse_all = ingest_module._parse_all
+
+        def parse_then_crash(paths, workers):
+            yield from islice(parse_all(paths, workers), 1)
+            raise RuntimeError("parser crashed")
+
+        monkeypatch.setattr(ingest_module, "_parse_all", parse_then_crash)
+        # The traceback keeps the import's session alive, locks and all
+        with pytest.raises(RuntimeError) as excinfo:
+            import_sources(catalog, [archive], workers=1)
+
+        assert list_plots(catalog) == []
+        lock_files = list((catalog / STATE_DIR / LOCKS_DIR).glob("plot-*.lock"))
+        assert lock_files
+        for lock_file in lock_files:
+            plot_id = lock_file.stem.removeprefix("plot-")
+            assert not plot_lock(catalog, plot_id).is_locked
+        assert excinfo.value.args == ("parser crashed",)
+
+    def test_progress_called_per_batch(self, catalog: Path, archive: Path) -> None:
+        seen: list[int] = []
+
+        import_sources(
+            catalog,
+            [archive],
+            workers=1,
+            batch_size=1,
+            progress=lambda r: seen.append(r.files_imported),
+        )
+
+        assert seen[:3] == [1, 2, 3]
+
+    def test_missing_catalog(self, temp_dir: Path, archive: Path) -> None:
+        with pytest.raises(CatalogNotFoundError):
+            import_sources(temp_dir / "missing", [archive])
+
+
+class TestEarliestTime:
+    def test_naive_times_are_utc(self) -> None:
+        features = [
+            {"properties": {"start_time": "1995-12-12T06:00:00+01:00"}},
+            {"properties": {"start_time": "1995-12-12T05:30:00"}},
+            {"properties": {}},
+        ]
+
+        assert _earliest_time(features) == datetime(1995, 12, 12, 5, 0, tzinfo=UTC)
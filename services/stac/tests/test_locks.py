@@ -0,0 +1,253 @@
+"""Tests for concurrent writers."""
+
+import threading
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+from filelock import Timeout
+
+from debrief_stac.catalog import LAYOUT_SHARDED, _CatalogLinks, create_catalog, list_plots
+from debrief_stac.exceptions import CatalogNotFoundError, PlotLockedError
+from debrief_stac.features import add_features
+from debrief_stac.locks import LOCK_TIMEOUT, catalog_lock, plot_lock
+from debrief_stac.models import PlotMetadata
+from debrief_stac.plot import create_plot
+from debrief_stac.reader import read_features
+from debrief_stac.session import session
+from debrief_stac.storage import STATE_DIR
+from tests.fixtures import make_sample_track_feature
+
+
+def import_plots(catalog_path: str, worker: int, count: int) -> list[str]:
+    """Create plots with features, as one ingest worker would."""
+    plot_ids = []
+    for i in range(count):
+        plot_id = create_plot(catalog_path, PlotMetadata(title=f"W{worker} P{i}"))
+        add_features(catalog_path, plot_id, [make_sample_track_feature(f"track-{i}")])
+        plot_ids.append(plot_id)
+    return plot_ids
+
+
+@pytest.fixture(params=["flat", LAYOUT_SHARDED])
+def catalog(request, temp_dir: Path) -> Path:
+    return create_catalog(temp_dir / "catalog", layout=request.param)
+
+
+class TestLocks:
+    def test_lock_files_live_in_state_dir(self, catalog: Path) -> None:
+        with catalog_lock(catalog), plot_lock(catalog, "p1"):
+            pass
+
+        assert sorted(p.name for p in (catalog / STATE_DIR / "locks").iterdir()) == [
+            "catalog.lock",
+            "plot-p1.lock",
+        ]
+
+    def test_reentrant_within_a_thread(self, catalog: Path) -> None:
+        with catalog_lock(catalog), catalog_lock(catalog):
+            assert catalog_lock(catalog).is_locked
+
+    def test_exclusive_between_threads(self, catalog: Path) -> None:
+        result = []
+
+        def try_lock() -> None:
+            try:
+                plot_lock(catalog, "p1").acquire(timeout=0)
+            except Timeout:
+                result.append("timeout")
+
+        with plot_lock(catalog, "p1"):
+            thread = threading.Thread(target=try_lock)
+            thread.start()
+            thread.join()
+
+        assert result == ["timeout"]
+
+    def test_missing_catalog(self, temp_dir: Path) -> None:
+        with pytest.raises(CatalogNotFoundError):
+            catalog_lock(temp_dir / "missing")
+        assert not (temp_dir / "missing").exists()
+
+
+class TestConcurrentWriters:
+    def test_concurrent_link_updates_are_merged(self, catalog: Path) -> None:
+        first = _CatalogLinks(catalog)
+        second = _CatalogLinks(catalog)
+        first.add_item("plot-a")
+        second.add_item("plot-b")
+
+        first.save()
+        second.save()
+
+        links = _CatalogLinks(catalog)
+        assert links.remove_item("plot-a")
+        assert links.remove_item("plot-b")
+
+    def test_create_plot_indexes_under_plot_lock(
+        self, catalog: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        held = []
+        monkeypatch.setattr(
+            "debrief_stac.plot._index_items",
+            lambda catalog_path, items: held.append(plot_lock(catalog_path, "p1").is_locked),
+        )
+
+        create_plot(catalog, PlotMetadata(title="Test"), plot_id="p1")
+
+        assert held == [True]
+
+    def test_threads_ingesting_different_plots(self, catalog: Path) -> None:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = executor.map(lambda w: import_plots(str(catalog), w, 5), range(8))
+            created = [plot_id for plot_ids in results for plot_id in plot_ids]
+
+        plots = list_plots(catalog)
+        assert sorted(p.id for p in plots) == sorted(created)
+        assert all(p.feature_count == 1 for p in plots)
+
+    def test_processes_ingesting_different_plots(self, catalog: Path) -> None:
+        with ProcessPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(import_plots, str(catalog), w, 5) for w in range(4)]
+            created = [plot_id for f in futures for plot_id in f.result()]
+
+        assert sorted(p.id for p in list_plots(catalog)) == sorted(created)
+
+    def test_threads_appending_to_one_plot(self, catalog: Path) -> None:
+        plot_id = create_plot(catalog, PlotMetadata(title="Shared"))
+
+        def append(i: int) -> None:
+            add_features(catalog, plot_id, [make_sample_track_feature(f"track-{i}")])
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(append, range(16)))
+
+        assert len(read_features(catalog, plot_id)) == 16
+
+    def test_concurrent_sessions(self, catalog: Path) -> None:
+        def write(worker: int) -> None:
+            with session(catalog) as s:
+                for i in range(5):
+                    plot_id = s.create_plot(PlotMetadata(title=f"W{worker} P{i}"))
+                    s.add_features(plot_id, [make_sample_track_feature()])
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(write, range(4)))
+
+        assert len(list_plots(catalog)) == 20
+
+    def test_session_holds_plot_locks_until_closed(self, catalog: Path) -> None:
+        plot_id = create_plot(catalog, PlotMetadata(title="Test"))
+        attempts = []
+
+        def try_lock() -> None:
+            try:
+                with plot_lock(catalog, plot_id).acquire(timeout=0):
+                    attempts.append("acquired")
+            except Timeout:
+                attempts.append("timeout")
+
+        with session(catalog) as s:
+            s.add_features(plot_id, [make_sample_track_feature()])
+            thread = threading.Thread(target=try_lock)
+            thread.start()
+            thread.join()
+
+        thread = threading.Thread(target=try_lock)
+        thread.start()
+        thread.join()
+
+        assert attempts == ["timeout", "acquired"]
+
+
+class TestSessionLockOrder:
+    @pytest.fixture
+    def held(self, catalog: Path) -> Iterator[Callable[[str], None]]:
+        """Hold plot locks from another thread until the test ends."""
+        release = threading.Event()
+        threads = []
+
+        def hold(plot_id: str) -> None:
+            acquired = threading.Event()
+
+            def run() -> None:
+                with plot_lock(catalog, plot_id):
+                    acquired.set()
+                    release.wait()
+
+            thread = threading.Thread(target=run)
+            thread.start()
+            acquired.wait()
+            threads.append(thread)
+
+        yield hold
+        release.set()
+        for thread in threads:
+            thread.join()
+
+    @pytest.fixture
+    def plots(self, catalog: Path) -> tuple[str, str]:
+        for plot_id in ("p1", "p2"):
+            create_plot(catalog, PlotMetadata(title=plot_id), plot_id=plot_id)
+        return "p1", "p2"
+
+    def test_out_of_order_lock_is_taken_when_free(
+        self, catalog: Path, plots: tuple[str, str]
+    ) -> None:
+        with session(catalog) as s:
+            s.add_features("p2", [make_sample_track_feature("a")])
+            s.add_features("p1", [make_sample_track_feature("b")])
+
+        assert len(read_features(catalog, "p1")) == len(read_features(catalog, "p2")) == 1
+
+    def test_out_of_order_lock_held_elsewhere_fails_at_once(
+        self, catalog: Path, plots: tuple[str, str], held: Callable[[str], None]
+    ) -> None:
+        held("p1")
+
+        with pytest.raises(PlotLockedError, match="p1"), session(catalog) as s:
+            s.add_features("p2", [make_sample_track_feature("a")])
+            s.add_features("p1", [make_sample_track_feature("b")])
+
+        # The failed session released its locks and wrote nothing
+        with plot_lock(catalog, "p2").acquire(timeout=0):
+            assert read_features(catalog, "p2") == []
+
+    def test_named_plots_are_locked_up_front(self, catalog: Path, plots: tuple[str, str]) -> None:
+        with session(catalog, plot_ids=["p2", "p1"]) as s:
+            s.add_features("p2", [make_sample_track_feature("a")])
+            locked = []
+
+            def try_lock(plot_id: str) -> None:
+                try:
+                    with plot_lock(catalog, plot_id).acquire(timeout=0):
+                        locked.append(False)
+                except Timeout:
+                    locked.append(True)
+
+            for plot_id in plots:
+                thread = threading.Thread(target=try_lock, args=(plot_id,))
+                thread.start()
+                thread.join()
+
+        assert locked == [True, True]
+
+    def test_crossed_sessions_do_not_deadlock(self, catalog: Path, plots: tuple[str, str]) -> None:
+        both_started = threading.Barrier(2)
+
+        def write(first: str, second: str) -> str:
+            try:
+                with session(catalog) as s:
+                    s.add_features(first, [make_sample_track_feature(f"{first}-{second}")])
+                    both_started.wait()
+                    s.add_features(second, [make_sample_track_feature(f"{second}-{first}")])
+            except PlotLockedError:
+                return "retry"
+            return "committed"
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = [executor.submit(write, "p1", "p2"), executor.submit(write, "p2", "p1")]
+            outcomes = sorted(r.result(timeout=LOCK_TIMEOUT / 2) for r in results)
+
+        assert outcomes == ["committed", "retry"]
@@ -1,5 +1,8 @@
 """Tests for MCP tool exposure (User Story 7)."""
 
+import asyncio
+import threading
+import time
 from pathlib import Path
 
 from debrief_stac.mcp_server import TOOL_NAMES, mcp
@@ -168,3 +171,85 @@ class TestMCPToolIntegration:
         assert "plots" in list_result
         assert len(list_result["plots"]) == 1
         assert list_result["plots"][0]["id"] == plot_id
+
+
+class TestMCPConcurrency:
+    """Tests for non-blocking tool execution."""
+
+    def test_tools_are_coroutines(self) -> None:
+        """Test that registered tools run asynchronously."""
+        from debrief_stac import mcp_server
+
+        for name in TOOL_NAMES:
+            assert asyncio.iscoroutinefunction(getattr(mcp_server, f"{name}_tool"))
+
+    def test_read_not_blocked_by_slow_write(self, tmp_path: Path, monkeypatch) -> None:
+        """Test that reading one plot proceeds while another plot is being written."""
+        from debrief_stac import mcp_server
+        from debrief_stac.catalog import create_catalog
+        from debrief_stac.models import PlotMetadata
+        from debrief_stac.plot import create_plot
+
+        catalog_path = str(create_catalog(tmp_path / "catalog"))
+        slow_id = create_plot(catalog_path, PlotMetadata(title="Big"))
+        other_id = create_plot(catalog_path, PlotMetadata(title="Other"))
+        release = threading.Event()
+
+        def slow_add_features(*args):
+            release.wait(timeout=10)
+            return {"feature_count": 0}
+
+        monkeypatch.setattr(mcp_server, "mcp_add_features", slow_add_features)
+
+        async def scenario() -> dict:
+            write = asyncio.create_task(mcp_server.add_features_tool(catalog_path, slow_id, []))
+            read = await asyncio.wait_for(
+                mcp_server.read_plot_tool(catalog_path, other_id), timeout=5
+            )
+            assert not write.done()
+            release.set()
+            await write
+            return read
+
+        assert asyncio.run(scenario())["item"]["id"] == other_id
+
+    def test_writes_to_one_plot_are_serialized(self, tmp_path: Path, monkeypatch) -> None:
+        """Test that writes to the same plot never overlap but other plots run alongside."""
+        from debrief_stac import mcp_server
+
+        active: dict[str, int] = {}
+        peak: dict[str, int] = {}
+        lock = threading.Lock()
+
+        def tracked_add_features(catalog_path, plot_id, features):
+            with lock:
+                active[plot_id] = active.get(plot_id, 0) + 1
+                peak[plot_id] = max(peak.get(plot_id, 0), active[plot_id])
+                peak["total"] = max(peak.get("total", 0), sum(active.values()))
+            time.sleep(0.02)
+            with lock:
+                active[plot_id] -= 1
+            return {"feature_count": len(features)}
+
+        monkeypatch.setattr(mcp_server, "mcp_add_features", tracked_add_features)
+
+        async def scenario() -> list[dict]:
+            return await asyncio.gather(
+                *(
+                    mcp_server.add_features_tool(str(tmp_path), plot_id, [])
+                    for plot_id in ["a", "b"] * 4
+                )
+            )
+
+        results = asyncio.run(scenario())
+
+        assert len(results) == 8
+        assert peak == {"a": 1, "b": 1, "total": 2}
+
+    def test_tool_errors_are_returned(self, tmp_path: Path) -> None:
+        """Test that async tools still return error dictionaries."""
+        from debrief_stac.mcp_server import add_features_tool
+
+        result = asyncio.run(add_features_tool(str(tmp_path / "missing"), "plot", []))
+
+        assert "error" in result
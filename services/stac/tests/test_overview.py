@@ -0,0 +1,209 @@
+"""Tests for plot overview geometry and thumbnails."""
+
+import json
+import math
+import struct
+import zlib
+from pathlib import Path
+
+import pytest
+
+from debrief_stac.catalog import create_catalog, set_thumbnails
+from debrief_stac.features import add_features
+from debrief_stac.models import PlotMetadata
+from debrief_stac.overview import (
+    OVERVIEW_FILENAME,
+    THUMBNAIL_FILENAME,
+    build_overview,
+    render_thumbnail,
+)
+from debrief_stac.plot import create_plot, read_plot
+from debrief_stac.session import session
+from tests.fixtures import make_sample_reference_location, make_sample_track_feature
+
+
+def spiral_track(feature_id: str, vertices: int, lon: float = 0.0) -> dict:
+    coords = [
+        [lon + 0.001 * i * math.cos(i / 10), 50 + 0.001 * i * math.sin(i / 10)]
+        for i in range(vertices)
+    ]
+    return {
+        "type": "Feature",
+        "id": feature_id,
+        "geometry": {"type": "LineString", "coordinates": coords},
+        "properties": {"kind": "TRACK", "platform_name": feature_id, "positions": []},
+    }
+
+
+def straight_track(feature_id: str, vertices: int) -> dict:
+    coords = [[-1.0 + 0.001 * i, 49.0] for i in range(vertices)]
+    return {
+        "type": "Feature",
+        "id": feature_id,
+        "geometry": {"type": "LineString", "coordinates": coords},
+        "properties": {},
+    }
+
+
+def png_size(data: bytes) -> tuple[int, int]:
+    assert data.startswith(b"\x89PNG\r\n\x1a\n")
+    return struct.unpack(">II", data[16:24])
+
+
+def vertex_count(overview: dict) -> int:
+    return sum(len(f["geometry"]["coordinates"]) for f in overview["features"])
+
+
+class TestBuildOverview:
+    def test_respects_vertex_budget(self) -> None:
+        overview = build_overview([spiral_track("a", 5000), spiral_track("b", 3000)], budget=100)
+
+        assert vertex_count(overview) == 100
+        assert [f["id"] for f in overview["features"]] == ["a", "b"]
+
+    def test_keeps_end_points(self) -> None:
+        track = spiral_track("a", 1000)
+        coords = track["geometry"]["coordinates"]
+
+        simplified = build_overview([track], budget=10)["features"][0]["geometry"]["coordinates"]
+
+        assert simplified[0] == [round(c, 5) for c in coords[0]]
+        assert simplified[-1] == [round(c, 5) for c in coords[-1]]
+
+    def test_straight_tracks_get_little_of_the_budget(self) -> None:
+        overview = build_overview(
+            [straight_track("straight", 1000), spiral_track("spiral", 1000)], budget=50
+        )
+        straight, spiral = overview["features"]
+
+        assert len(straight["geometry"]["coordinates"]) < 5
+        assert len(spiral["geometry"]["coordinates"]) > 45
+
+    def test_short_tracks_are_kept_whole(self) -> None:
+        overview = build_overview([make_sample_track_feature()])
+
+        assert overview["features"][0]["geometry"]["coordinates"] == [
+            [-5.0, 50.0],
+            [-5.1, 50.1],
+            [-5.2, 50.2],
+        ]
+
+    def test_too_many_tracks_keeps_the_largest(self) -> None:
+        features = [spiral_track(f"t{i}", 10 + i) for i in range(10)]
+
+        overview = build_overview(features, budget=6)
+
+        assert [f["id"] for f in overview["features"]] == ["t9", "t8", "t7"]
+        assert vertex_count(overview) == 6
+
+    def test_ignores_non_tracks_and_positions(self) -> None:
+        overview = build_overview(
+            [make_sample_reference_location(), make_sample_track_feature("t")]
+        )
+
+        assert len(overview["features"]) == 1
+        assert overview["features"][0]["properties"] == {
+            "platform_id": "VESSEL-A",
+            "platform_name": "HMS Example",
+        }
+
+    def test_regular_zigzag(self) -> None:
+        coords = [[-5.0 + i * 1e-4, 50.0 + 0.001 * (i % 2)] for i in range(50_000)]
+        track = {
+            "type": "Feature",
+            "geometry": {"type": "LineString", "coordinates": coords},
+            "properties": {},
+        }
+
+        assert vertex_count(build_overview([track], budget=64)) == 64
+
+    def test_multilinestring_parts(self) -> None:
+        feature = {
+            "type": "Feature",
+            "geometry": {
+                "type": "MultiLineString",
+                "coordinates": [[[0, 0], [1, 1]], [[2, 2], [3, 3]]],
+            },
+            "properties": {},
+        }
+
+        assert len(build_overview([feature])["features"]) == 2
+
+
+class TestRenderThumbnail:
+    def test_valid_png_with_aspect_ratio(self) -> None:
+        overview = {
+            "type": "FeatureCollection",
+            "features": [
+                {"geometry": {"type": "LineString", "coordinates": [[0.0, 0.0], [2.0, 1.0]]}}
+            ],
+        }
+
+        data = render_thumbnail(overview, size=64)
+        width, height = png_size(data)
+
+        assert width == 64
+        assert 30 < height < 40
+        # IDAT decompresses to one filter byte plus RGBA per pixel, per row
+        idat_len = struct.unpack(">I", data[33:37])[0]
+        raw = zlib.decompress(data[41 : 41 + idat_len])
+        assert len(raw) == height * (1 + width * 4)
+        assert any(raw[i] == 0xFF for i in range(4, len(raw), 4))
+
+    def test_empty_overview(self) -> None:
+        data = render_thumbnail({"type": "FeatureCollection", "features": []})
+
+        assert png_size(data) == (1, 1)
+
+
+class TestOverviewAssets:
+    @pytest.fixture
+    def catalog(self, temp_dir: Path) -> Path:
+        return create_catalog(temp_dir / "catalog")
+
+    def test_add_features_writes_overview(self, catalog: Path) -> None:
+        plot_id = create_plot(catalog, PlotMetadata(title="Test"))
+        add_features(catalog, plot_id, [spiral_track("a", 5000)])
+
+        item = read_plot(catalog, plot_id)
+        overview_path = catalog / plot_id / OVERVIEW_FILENAME
+
+        assert item["assets"]["overview"]["href"] == f"./{OVERVIEW_FILENAME}"
+        assert item["assets"]["overview"]["roles"] == ["overview"]
+        assert "thumbnail" not in item["assets"]
+        assert overview_path.stat().st_size < 8 * 1024
+        assert vertex_count(json.loads(overview_path.read_text())) <= 256
+
+    def test_overview_covers_appended_tracks(self, catalog: Path) -> None:
+        plot_id = create_plot(catalog, PlotMetadata(title="Test"))
+        add_features(catalog, plot_id, [spiral_track("a", 100)])
+        add_features(catalog, plot_id, [spiral_track("b", 100, lon=1.0)])
+
+        overview = json.loads((catalog / plot_id / OVERVIEW_FILENAME).read_text())
+
+        assert [f["id"] for f in overview["features"]] == ["a", "b"]
+
+    def test_no_overview_without_tracks(self, catalog: Path) -> None:
+        plot_id = create_plot(catalog, PlotMetadata(title="Test"))
+        add_features(catalog, plot_id, [make_sample_reference_location()])
+
+        assert "overview" not in read_plot(catalog, plot_id)["assets"]
+
+    def test_thumbnails(self, temp_dir: Path) -> None:
+        catalog = create_catalog(temp_dir / "catalog", thumbnails=True)
+        plot_id = create_plot(catalog, PlotMetadata(title="Test"))
+        add_features(catalog, plot_id, [spiral_track("a", 1000)])
+
+        item = read_plot(catalog, plot_id)
+
+        assert item["assets"]["thumbnail"]["type"] == "image/png"
+        assert max(png_size((catalog / plot_id / THUMBNAIL_FILENAME).read_bytes())) == 128
+
+    def test_set_thumbnails(self, catalog: Path) -> None:
+        set_thumbnails(catalog, True)
+        with session(catalog) as s:
+            plot_id = s.create_plot(PlotMetadata(title="Test"))
+            s.add_features(plot_id, [spiral_track("a", 100)])
+
+        assert (catalog / plot_id / THUMBNAIL_FILENAME).exists()
+        assert "thumbnail" in read_plot(catalog, plot_id)["assets"]
@@ -0,0 +1,156 @@
+"""Tests for the streaming FeatureCollection reader."""
+
+import io
+import json
+from pathlib import Path
+
+import pytest
+
+from debrief_stac.catalog import create_catalog
+from debrief_stac.cli import handle_read_features
+from debrief_stac.exceptions import PlotNotFoundError
+from debrief_stac.features import add_features
+from debrief_stac.models import PlotMetadata
+from debrief_stac.plot import create_plot
+from debrief_stac.reader import count_features, iter_features, stream_feature_collection
+from tests.fixtures import make_sample_reference_location, make_sample_track_feature
+
+
+@pytest.fixture
+def populated_plot(temp_dir: Path, sample_plot_metadata: PlotMetadata) -> tuple[Path, str]:
+    """Create a plot with two tracks and one reference location."""
+    catalog_path = create_catalog(temp_dir / "catalog")
+    plot_id = create_plot(catalog_path, sample_plot_metadata)
+
+    track_a = make_sample_track_feature(feature_id="track-a", platform_id="ALPHA")
+    track_a["properties"]["kind"] = "TRACK"
+    track_b = make_sample_track_feature(feature_id="track-b", platform_id="BRAVO")
+    track_b["properties"]["kind"] = "TRACK"
+    ref = make_sample_reference_location(feature_id="ref-1")
+    ref["properties"]["kind"] = "POINT"
+
+    add_features(catalog_path, plot_id, [track_a, track_b, ref])
+    return catalog_path, plot_id
+
+
+class TestStreamFeatureCollection:
+    """Tests for the incremental parser."""
+
+    def test_yields_features_in_order(self) -> None:
+        fc = {"type": "FeatureCollection", "features": [{"id": i} for i in range(50)]}
+        stream = io.StringIO(json.dumps(fc, indent=2))
+
+        ids = [f["id"] for f in stream_feature_collection(stream, chunk_size=7)]
+
+        assert ids == list(range(50))
+
+    def test_features_key_after_other_members(self) -> None:
+        text = '{"bbox": [1, 2, 3, 4], "features": [{"id": "a"}], "type": "FeatureCollection"}'
+
+        features = list(stream_feature_collection(io.StringIO(text), chunk_size=3))
+
+        assert features == [{"id": "a"}]
+
+    def test_feature_larger_than_chunk(self) -> None:
+        big = {"id": "big", "properties": {"positions": list(range(5000))}}
+        text = json.dumps({"type": "FeatureCollection", "features": [big]})
+
+        features = list(stream_feature_collection(io.StringIO(text), chunk_size=16))
+
+        assert features == [big]
+
+    def test_empty_collection(self) -> None:
+        text = '{"type": "FeatureCollection", "features": []}'
+        assert list(stream_feature_collection(io.StringIO(text))) == []
+
+    def test_truncated_input_raises(self) -> None:
+        text = '{"type": "FeatureCollection", "features": [{"id": 1}, {"id":'
+        with pytest.raises(ValueError):
+            list(stream_feature_collection(io.StringIO(text), chunk_size=8))
+
+    def test_is_lazy(self) -> None:
+        text = '{"features": [{"id": 1}, not-json'
+        stream = stream_feature_collection(io.StringIO(text), chunk_size=4)
+
+        assert next(stream) == {"id": 1}
+
+
+class TestIterFeatures:
+    """Tests for iter_features() filtering and projection."""
+
+    def test_iterates_all_features(self, populated_plot: tuple[Path, str]) -> None:
+        catalog_path, plot_id = populated_plot
+        ids = [f["id"] for f in iter_features(catalog_path, plot_id)]
+        assert ids == ["track-a", "track-b", "ref-1"]
+
+    def test_filter_by_kind(self, populated_plot: tuple[Path, str]) -> None:
+        catalog_path, plot_id = populated_plot
+        ids = [f["id"] for f in iter_features(catalog_path, plot_id, kinds=["POINT"])]
+        assert ids == ["ref-1"]
+
+    def test_filter_by_platform_id(self, populated_plot: tuple[Path, str]) -> None:
+        catalog_path, plot_id = populated_plot
+        ids = [f["id"] for f in iter_features(catalog_path, plot_id, platform_ids={"BRAVO"})]
+        assert ids == ["track-b"]
+
+    def test_filter_by_feature_id(self, populated_plot: tuple[Path, str]) -> None:
+        catalog_path, plot_id = populated_plot
+        ids = [f["id"] for f in iter_features(catalog_path, plot_id, feature_ids=["track-a"])]
+        assert ids == ["track-a"]
+
+    def test_exclude_positions(self, populated_plot: tuple[Path, str]) -> None:
+        catalog_path, plot_id = populated_plot
+        features = list(iter_features(catalog_path, plot_id, exclude_properties=["positions"]))
+
+        assert all("positions" not in f["properties"] for f in features)
+        assert features[0]["properties"]["platform_id"] == "ALPHA"
+
+    def test_include_properties_and_drop_geometry(self, populated_plot: tuple[Path, str]) -> None:
+        catalog_path, plot_id = populated_plot
+        feature = next(
+            iter_features(
+                catalog_path, plot_id, include_properties=["kind"], include_geometry=False
+            )
+        )
+
+        assert feature["properties"] == {"kind": "TRACK"}
+        assert feature["geometry"] is None
+
+    def test_plot_without_features(
+        self, temp_dir: Path, sample_plot_metadata: PlotMetadata
+    ) -> None:
+        catalog_path = create_catalog(temp_dir / "catalog")
+        plot_id = create_plot(catalog_path, sample_plot_metadata)
+        assert list(iter_features(catalog_path, plot_id)) == []
+
+    def test_missing_plot_raises(self, temp_dir: Path) -> None:
+        catalog_path = create_catalog(temp_dir / "catalog")
+        with pytest.raises(PlotNotFoundError):
+            list(iter_features(catalog_path, "nope"))
+
+    def test_count_features(self, populated_plot: tuple[Path, str]) -> None:
+        catalog_path, plot_id = populated_plot
+        assert count_features(catalog_path / plot_id / "features.geojson") == 3
+
+
+class TestHandleReadFeatures:
+    """Tests for the read_features JSON-RPC handler."""
+
+    def test_returns_projected_features(self, populated_plot: tuple[Path, str]) -> None:
+        catalog_path, plot_id = populated_plot
+        result = handle_read_features(
+            {
+                "store_path": str(catalog_path),
+                "plot_id": plot_id,
+                "kinds": ["TRACK"],
+                "exclude_properties": ["positions"],
+            }
+        )
+
+        assert result["count"] == 2
+        assert all("positions" not in f["properties"] for f in result["features"])
+
+    def test_requires_plot_id(self, populated_plot: tuple[Path, str]) -> None:
+        catalog_path, _ = populated_plot
+        with pytest.raises(ValueError, match="plot_id"):
+            handle_read_features({"store_path": str(catalog_path)})
@@ -0,0 +1,180 @@
+"""Tests for batched write sessions."""
+
+import json
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from debrief_stac.catalog import create_catalog, list_plots, open_catalog
+from debrief_stac.columnar import COLUMNS, MANIFEST_FILENAME, POSITIONS_DIR
+from debrief_stac.exceptions import DebriefStacError, PlotExistsError, PlotNotFoundError
+from debrief_stac.features import add_features
+from debrief_stac.models import PlotMetadata
+from debrief_stac.plot import create_plot, read_plot
+from debrief_stac.session import CatalogSession, session
+from tests.fixtures import make_sample_reference_location, make_sample_track_feature
+
+
+class TestSessionCommit:
+    def test_full_import_is_visible_after_commit(
+        self, temp_dir: Path, sample_plot_metadata: PlotMetadata
+    ) -> None:
+        catalog_path = create_catalog(temp_dir / "catalog")
+        source = temp_dir / "track.rep"
+        source.write_text("REP data")
+
+        with session(catalog_path) as s:
+            plot_id = s.create_plot(sample_plot_metadata)
+            s.add_features(plot_id, [make_sample_track_feature()])
+            count = s.add_features(plot_id, [make_sample_reference_location(lon=-6.0)])
+            key = s.add_asset(plot_id, source)
+
+        assert count == 2
+        item = read_plot(catalog_path, plot_id)
+        assert item["bbox"][0] == pytest.approx(-6.0)
+        assert key in item["assets"]
+        assert (catalog_path / plot_id / "assets" / "track.rep").read_text() == "REP data"
+        with open(catalog_path / plot_id / "features.geojson") as f:
+            assert len(json.load(f)["features"]) == 2
+        assert [p.id for p in list_plots(catalog_path)] == [plot_id]
+
+    def test_nothing_written_before_commit(
+        self, temp_dir: Path, sample_plot_metadata: PlotMetadata
+    ) -> None:
+        catalog_path = create_catalog(temp_dir / "catalog")
+
+        s = CatalogSession(catalog_path)
+        plot_id = s.create_plot(sample_plot_metadata)
+        s.add_features(plot_id, [make_sample_track_feature()])
+
+        assert not (catalog_path / plot_id).exists()
+        assert open_catalog(catalog_path)["links"][-1]["rel"] != "item"
+
+        s.commit()
+        assert (catalog_path / plot_id / "item.json").exists()
+
+    def test_each_file_written_once(
+        self, temp_dir: Path, sample_plot_metadata: PlotMetadata
+    ) -> None:
+        catalog_path = create_catalog(temp_dir / "catalog")
+        written: list[str] = []
+        original = os.replace
+
+        def recording_replace(src, dst) -> None:
+            written.append(Path(dst).relative_to(catalog_path).as_posix())
+            original(src, dst)
+
+        with (
+            patch("debrief_stac.storage.os.replace", recording_replace),
+            session(catalog_path) as s,
+        ):
+            plot_id = s.create_plot(sample_plot_metadata)
+            for i in range(5):
+                s.add_features(plot_id, [make_sample_track_feature(feature_id=f"t{i}")])
+
+        positions = [f"{plot_id}/{POSITIONS_DIR}/{name}.1.npy" for name in COLUMNS]
+        assert sorted(written) == sorted(
+            [
+                "catalog.json",
+                f"{plot_id}/features.geojson",
+                f"{plot_id}/item.json",
+                f"{plot_id}/overview.geojson",
+                f"{plot_id}/{POSITIONS_DIR}/{MANIFEST_FILENAME}",
+                *positions,
+            ]
+        )
+
+    def test_appends_to_existing_plot(
+        self, temp_dir: Path, sample_plot_metadata: PlotMetadata
+    ) -> None:
+        catalog_path = create_catalog(temp_dir / "catalog")
+        plot_id = create_plot(catalog_path, sample_plot_metadata)
+        add_features(catalog_path, plot_id, [make_sample_track_feature()])
+
+        with session(catalog_path) as s:
+            assert s.add_features(plot_id, [make_sample_reference_location()]) == 2
+
+
+class TestSessionRollback:
+    def test_exception_discards_changes(
+        self, temp_dir: Path, sample_plot_metadata: PlotMetadata
+    ) -> None:
+        catalog_path = create_catalog(temp_dir / "catalog")
+
+        with pytest.raises(RuntimeError), session(catalog_path) as s:
+            plot_id = s.create_plot(sample_plot_metadata)
+            raise RuntimeError("import failed")
+
+        assert not (catalog_path / plot_id).exists()
+        assert list_plots(catalog_path) == []
+
+    def test_invalid_feature_raises_without_writing(
+        self, temp_dir: Path, sample_plot_metadata: PlotMetadata
+    ) -> None:
+        catalog_path = create_catalog(temp_dir / "catalog")
+
+        with pytest.raises(ValueError), session(catalog_path) as s:
+            plot_id = s.create_plot(sample_plot_metadata)
+            s.add_features(plot_id, [{"type": "Nope"}])
+
+        assert list_plots(catalog_path) == []
+
+    def test_discard_drops_one_plot(
+        self, temp_dir: Path, sample_plot_metadata: PlotMetadata
+    ) -> None:
+        catalog_path = create_catalog(temp_dir / "catalog")
+        existing = create_plot(catalog_path, sample_plot_metadata)
+
+        with session(catalog_path) as s:
+            kept = s.create_plot(sample_plot_metadata)
+            dropped = s.create_plot(sample_plot_metadata)
+            s.add_features(dropped, [make_sample_track_feature()])
+            s.add_features(existing, [make_sample_track_feature()])
+            s.discard(dropped)
+            s.discard(existing)
+
+        assert sorted(p.id for p in list_plots(catalog_path)) == sorted([existing, kept])
+        assert not (catalog_path / dropped).exists()
+        assert "features" not in read_plot(catalog_path, existing)["assets"]
+
+    def test_closed_session_rejects_operations(
+        self, temp_dir: Path, sample_plot_metadata: PlotMetadata
+    ) -> None:
+        catalog_path = create_catalog(temp_dir / "catalog")
+        s = CatalogSession(catalog_path)
+        s.rollback()
+
+        with pytest.raises(DebriefStacError):
+            s.create_plot(sample_plot_metadata)
+
+
+class TestSessionErrors:
+    def test_unknown_plot(self, temp_dir: Path) -> None:
+        catalog_path = create_catalog(temp_dir / "catalog")
+        with pytest.raises(PlotNotFoundError), session(catalog_path) as s:
+            s.add_features("missing", [make_sample_track_feature()])
+
+    def test_duplicate_plot_id(self, temp_dir: Path, sample_plot_metadata: PlotMetadata) -> None:
+        catalog_path = create_catalog(temp_dir / "catalog")
+        with pytest.raises(PlotExistsError), session(catalog_path) as s:
+            s.create_plot(sample_plot_metadata, plot_id="same")
+            s.create_plot(sample_plot_metadata, plot_id="same")
+
+    def test_missing_asset_source(self, temp_dir: Path, sample_plot_metadata: PlotMetadata) -> None:
+        catalog_path = create_catalog(temp_dir / "catalog")
+        with pytest.raises(FileNotFoundError), session(catalog_path) as s:
+            plot_id = s.create_plot(sample_plot_metadata)
+            s.add_asset(plot_id, temp_dir / "missing.rep")
+
+    def test_read_plot_returns_staged_copy(
+        self, temp_dir: Path, sample_plot_metadata: PlotMetadata
+    ) -> None:
+        catalog_path = create_catalog(temp_dir / "catalog")
+        with session(catalog_path) as s:
+            plot_id = s.create_plot(sample_plot_metadata)
+            item = s.read_plot(plot_id)
+            item["properties"]["title"] = "mutated"
+
+        assert read_plot(catalog_path, plot_id)["properties"]["title"] == "Test Plot"
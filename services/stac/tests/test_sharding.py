@@ -0,0 +1,102 @@
+"""Tests for the sharded catalog layout."""
+
+from pathlib import Path
+
+import pytest
+
+from debrief_stac.catalog import (
+    LAYOUT_SHARDED,
+    SHARDS_DIR,
+    _shard_key,
+    create_catalog,
+    iter_item_paths,
+    list_plots,
+    open_catalog,
+)
+from debrief_stac.cli import handle_init_catalog
+from debrief_stac.features import add_features
+from debrief_stac.models import PlotMetadata
+from debrief_stac.plot import create_plot, read_plot
+from debrief_stac.session import session
+from debrief_stac.storage import read_json
+from tests.fixtures import make_sample_track_feature
+
+
+@pytest.fixture
+def sharded_catalog(temp_dir: Path) -> Path:
+    return create_catalog(temp_dir / "catalog", layout=LAYOUT_SHARDED)
+
+
+class TestShardedLayout:
+    def test_catalog_records_layout(self, sharded_catalog: Path) -> None:
+        assert open_catalog(sharded_catalog)["debrief:layout"] == LAYOUT_SHARDED
+
+    def test_unknown_layout_rejected(self, temp_dir: Path) -> None:
+        with pytest.raises(ValueError, match="layout"):
+            create_catalog(temp_dir / "catalog", layout="bogus")
+
+    def test_item_link_goes_to_shard(self, sharded_catalog: Path) -> None:
+        create_plot(sharded_catalog, PlotMetadata(title="P"), plot_id="plot-1")
+
+        shard = _shard_key("plot-1")
+        root = open_catalog(sharded_catalog)
+        assert not [link for link in root["links"] if link["rel"] == "item"]
+        assert {"rel": "child", "href": f"./{SHARDS_DIR}/{shard}/catalog.json"}.items() <= (
+            root["links"][-1].items()
+        )
+
+        shard_catalog = read_json(sharded_catalog / SHARDS_DIR / shard / "catalog.json")
+        item_links = [link for link in shard_catalog["links"] if link["rel"] == "item"]
+        assert item_links[0]["href"] == "../../plot-1/item.json"
+
+    def test_item_parent_is_shard(self, sharded_catalog: Path) -> None:
+        create_plot(sharded_catalog, PlotMetadata(title="P"), plot_id="plot-1")
+
+        item = read_plot(sharded_catalog, "plot-1")
+        parent = next(link for link in item["links"] if link["rel"] == "parent")
+        resolved = (sharded_catalog / "plot-1" / parent["href"]).resolve()
+        assert resolved == (sharded_catalog / SHARDS_DIR / _shard_key("plot-1") / "catalog.json")
+
+    def test_root_catalog_size_bounded(self, sharded_catalog: Path) -> None:
+        for i in range(300):
+            create_plot(sharded_catalog, PlotMetadata(title=f"P{i}"), plot_id=f"plot-{i}")
+
+        root = open_catalog(sharded_catalog)
+        assert len(root["links"]) <= 2 + 256
+
+    def test_list_plots_follows_shards(self, sharded_catalog: Path) -> None:
+        for i in range(20):
+            create_plot(sharded_catalog, PlotMetadata(title=f"P{i}"), plot_id=f"plot-{i}")
+        add_features(sharded_catalog, "plot-3", [make_sample_track_feature()])
+
+        plots = {p.id: p for p in list_plots(sharded_catalog)}
+
+        assert len(plots) == 20
+        assert plots["plot-3"].feature_count == 1
+
+    def test_recreating_plot_does_not_duplicate_link(self, sharded_catalog: Path) -> None:
+        create_plot(sharded_catalog, PlotMetadata(title="P"), plot_id="plot-1")
+        create_plot(sharded_catalog, PlotMetadata(title="P"), plot_id="plot-1")
+
+        assert len(list(iter_item_paths(sharded_catalog))) == 1
+
+    def test_session_writes_shards(self, sharded_catalog: Path) -> None:
+        with session(sharded_catalog) as s:
+            for i in range(10):
+                s.create_plot(PlotMetadata(title=f"P{i}"), plot_id=f"plot-{i}")
+
+        assert len(list_plots(sharded_catalog)) == 10
+
+
+class TestFlatLayout:
+    def test_iter_item_paths(self, temp_dir: Path) -> None:
+        catalog_path = create_catalog(temp_dir / "catalog")
+        create_plot(catalog_path, PlotMetadata(title="P"), plot_id="plot-1")
+
+        assert list(iter_item_paths(catalog_path)) == [catalog_path / "plot-1" / "item.json"]
+
+    def test_init_catalog_handler_accepts_layout(self, temp_dir: Path) -> None:
+        path = temp_dir / "catalog"
+        handle_init_catalog({"path": str(path), "name": "Store", "layout": "sharded"})
+
+        assert open_catalog(path)["debrief:layout"] == LAYOUT_SHARDED
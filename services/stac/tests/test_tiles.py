@@ -0,0 +1,322 @@
+"""Tests for vector tile pyramids."""
+
+import json
+import math
+from pathlib import Path
+
+import pytest
+
+from debrief_stac.catalog import create_catalog
+from debrief_stac.cli import handle_request
+from debrief_stac.exceptions import PlotNotFoundError
+from debrief_stac.features import add_features
+from debrief_stac.models import PlotMetadata
+from debrief_stac.plot import create_plot, read_plot
+from debrief_stac.session import session
+from debrief_stac.tiles import TILE_EXTENT, TILEJSON_FILENAME, TILES_DIR, generate_tiles
+from tests.fixtures import make_sample_reference_location
+
+
+def wiggly_track(feature_id: str, vertices: int, lon: float = -5.0, lat: float = 50.0) -> dict:
+    coords = [
+        [lon + i * 0.5 / vertices, lat + 0.01 * math.sin(i / 5) + i * 0.2 / vertices]
+        for i in range(vertices)
+    ]
+    return {
+        "type": "Feature",
+        "id": feature_id,
+        "geometry": {"type": "LineString", "coordinates": coords},
+        "properties": {"kind": "TRACK", "platform_name": feature_id, "positions": []},
+    }
+
+
+def square_zone() -> dict:
+    return {
+        "type": "Feature",
+        "id": "zone",
+        "geometry": {
+            "type": "Polygon",
+            "coordinates": [
+                [[-4.0, 50.0], [-4.0, 50.5], [-3.5, 50.5], [-3.5, 50.0], [-4.0, 50.0]],
+                [[-3.9, 50.1], [-3.6, 50.1], [-3.6, 50.4], [-3.9, 50.4], [-3.9, 50.1]],
+            ],
+        },
+        "properties": {"kind": "ZONE", "active": True, "depth": -20},
+    }
+
+
+def tile_for(lon: float, lat: float, z: int) -> tuple[int, int]:
+    n = 2**z
+    sin_lat = math.sin(math.radians(lat))
+    y = 0.5 - math.log((1 + sin_lat) / (1 - sin_lat)) / (4 * math.pi)
+    return int((lon / 360 + 0.5) * n), int(y * n)
+
+
+def read_tiles(plot_dir: Path) -> dict[str, bytes]:
+    tiles_dir = plot_dir / TILES_DIR
+    return {str(p.relative_to(tiles_dir)): p.read_bytes() for p in tiles_dir.rglob("*.mvt")}
+
+
+def _varint(data: bytes, pos: int) -> tuple[int, int]:
+    value = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        shift += 7
+        if byte < 0x80:
+            return value, pos
+
+
+def _fields(data: bytes) -> list[tuple[int, int | bytes]]:
+    fields = []
+    pos = 0
+    while pos < len(data):
+        key, pos = _varint(data, pos)
+        field, wire_type = key >> 3, key & 0x7
+        if wire_type == 0:
+            value, pos = _varint(data, pos)
+        elif wire_type == 1:
+            value, pos = data[pos : pos + 8], pos + 8
+        else:
+            length, pos = _varint(data, pos)
+            value, pos = data[pos : pos + length], pos + length
+        fields.append((field, value))
+    return fields
+
+
+def _packed(data: bytes) -> list[int]:
+    values, pos = [], 0
+    while pos < len(data):
+        value, pos = _varint(data, pos)
+        values.append(value)
+    return values
+
+
+def _unzigzag(value: int) -> int:
+    return (value >> 1) ^ -(value & 1)
+
+
+def decode_tile(data: bytes) -> dict:
+    """Decode the single layer of an MVT tile into a readable structure."""
+    (field, layer_data), *rest = _fields(data)
+    assert field == 3 and not rest
+
+    layer = {"features": [], "keys": [], "values": []}
+    for field, value in _fields(layer_data):
+        if field == 1:
+            layer["name"] = value.decode()
+        elif field == 5:
+            layer["extent"] = value
+        elif field == 15:
+            layer["version"] = value
+        elif field == 3:
+            layer["keys"].append(value.decode())
+        elif field == 4:
+            ((kind, raw),) = _fields(value)
+            layer["values"].append(
+                raw.decode()
+                if kind == 1
+                else bool(raw)
+                if kind == 7
+                else _unzigzag(raw)
+                if kind == 6
+                else raw
+            )
+        elif field == 2:
+            layer["features"].append(dict(_fields(value)))
+
+    features = []
+    for raw in layer["features"]:
+        tags = _packed(raw.get(2, b""))
+        properties = {
+            layer["keys"][k]: layer["values"][v] for k, v in zip(tags[::2], tags[1::2], strict=True)
+        }
+        features.append(
+            {"type": raw[3], "properties": properties, "parts": _decode_geometry(_packed(raw[4]))}
+        )
+    layer["features"] = features
+    return layer
+
+
+def _decode_geometry(commands: list[int]) -> list[list[tuple[int, int]]]:
+    parts, pos, x, y = [], 0, 0, 0
+    while pos < len(commands):
+        command, count = commands[pos] & 0x7, commands[pos] >> 3
+        pos += 1
+        if command == 7:
+            continue
+        if command == 1:
+            parts.append([])
+        for _ in range(count):
+            x += _unzigzag(commands[pos])
+            y += _unzigzag(commands[pos + 1])
+            pos += 2
+            parts[-1].append((x, y))
+    return parts
+
+
+def ring_area(ring: list[tuple[int, int]]) -> int:
+    return sum(
+        x0 * y1 - x1 * y0 for (x0, y0), (x1, y1) in zip(ring, ring[1:] + ring[:1], strict=True)
+    )
+
+
+@pytest.fixture
+def catalog(temp_dir: Path) -> Path:
+    return create_catalog(temp_dir / "catalog")
+
+
+@pytest.fixture
+def plot_id(catalog: Path) -> str:
+    plot_id = create_plot(catalog, PlotMetadata(title="Test"))
+    add_features(catalog, plot_id, [wiggly_track("a", 3000), make_sample_reference_location()])
+    return plot_id
+
+
+class TestGenerateTiles:
+    def test_writes_pyramid_and_manifest(self, catalog: Path, plot_id: str) -> None:
+        count = generate_tiles(catalog, plot_id, max_zoom=10)
+
+        plot_dir = catalog / plot_id
+        tiles = read_tiles(plot_dir)
+        manifest = json.loads((plot_dir / TILES_DIR / TILEJSON_FILENAME).read_text())
+        asset = read_plot(catalog, plot_id)["assets"]["tiles"]
+
+        assert count == len(tiles)
+        assert "0/0/0.mvt" in tiles
+        assert {int(name.split("/")[0]) for name in tiles} == set(range(11))
+        assert asset["href"] == f"./{TILES_DIR}/{TILEJSON_FILENAME}"
+        assert asset["roles"] == ["tiles"]
+        assert manifest["maxzoom"] == 10
+        assert manifest["tiles"] == ["{z}/{x}/{y}.mvt"]
+        assert manifest["vector_layers"][0]["fields"]["platform_name"] == "String"
+
+    def test_only_tiles_with_features_are_written(self, catalog: Path, plot_id: str) -> None:
+        generate_tiles(catalog, plot_id, max_zoom=10)
+        tiles = read_tiles(catalog / plot_id)
+
+        x, y = tile_for(-4.8, 50.04, 10)
+        assert f"10/{x}/{y}.mvt" in tiles
+        x, y = tile_for(10.0, 60.0, 10)
+        assert f"10/{x}/{y}.mvt" not in tiles
+
+    def test_tile_content(self, catalog: Path, plot_id: str) -> None:
+        generate_tiles(catalog, plot_id, max_zoom=10)
+
+        layer = decode_tile((catalog / plot_id / TILES_DIR / "0/0/0.mvt").read_bytes())
+        line, point = layer["features"]
+
+        assert layer["name"] == "features"
+        assert layer["extent"] == TILE_EXTENT
+        assert layer["version"] == 2
+        assert line["type"] == 2
+        assert line["properties"] == {"kind": "TRACK", "platform_name": "a", "id": "a"}
+        # 3000 vertices within a few world-tile units collapse to a handful
+        assert len(line["parts"][0]) < 10
+        assert point["type"] == 1
+        assert point["properties"]["id"] == "ref-001"
+
+    def test_deep_tiles_are_clipped_and_detailed(self, catalog: Path, plot_id: str) -> None:
+        generate_tiles(catalog, plot_id, max_zoom=12)
+
+        vertices = 0
+        for path in (catalog / plot_id / TILES_DIR / "12").rglob("*.mvt"):
+            for feature in decode_tile(path.read_bytes())["features"]:
+                for part in feature["parts"]:
+                    vertices += len(part)
+                    assert all(-64 <= c <= TILE_EXTENT + 64 for point in part for c in point)
+
+        assert vertices > 500
+
+    def test_polygons(self, catalog: Path) -> None:
+        plot_id = create_plot(catalog, PlotMetadata(title="Zones"))
+        add_features(catalog, plot_id, [square_zone()])
+        generate_tiles(catalog, plot_id, max_zoom=6)
+
+        (zone,) = decode_tile((catalog / plot_id / TILES_DIR / "6/31/21.mvt").read_bytes())[
+            "features"
+        ]
+
+        assert zone["type"] == 3
+        assert zone["properties"] == {"kind": "ZONE", "active": True, "depth": -20, "id": "zone"}
+        exterior, hole = zone["parts"]
+        assert ring_area(exterior) > 0
+        assert ring_area(hole) < 0
+
+    def test_parallel_matches_serial(self, catalog: Path, plot_id: str) -> None:
+        generate_tiles(catalog, plot_id, max_zoom=10, workers=1)
+        serial = read_tiles(catalog / plot_id)
+
+        generate_tiles(catalog, plot_id, max_zoom=10, workers=2)
+
+        assert read_tiles(catalog / plot_id) == serial
+
+    def test_regenerate_replaces_pyramid(self, catalog: Path, plot_id: str) -> None:
+        generate_tiles(catalog, plot_id, max_zoom=10)
+        generate_tiles(catalog, plot_id, max_zoom=4)
+
+        assert {int(name.split("/")[0]) for name in read_tiles(catalog / plot_id)} == set(range(5))
+        assert [p.name for p in (catalog / plot_id).iterdir() if p.name.startswith(".")] == []
+
+    def test_invalid_zoom(self, catalog: Path, plot_id: str) -> None:
+        with pytest.raises(ValueError, match="max_zoom"):
+            generate_tiles(catalog, plot_id, max_zoom=30)
+
+    def test_plot_not_found(self, catalog: Path) -> None:
+        with pytest.raises(PlotNotFoundError):
+            generate_tiles(catalog, "missing")
+
+
+class TestIncrementalTiles:
+    def test_append_matches_full_rebuild(self, catalog: Path, plot_id: str) -> None:
+        generate_tiles(catalog, plot_id, max_zoom=10)
+        add_features(catalog, plot_id, [wiggly_track("b", 500, lon=-4.7, lat=50.1)])
+        appended = read_tiles(catalog / plot_id)
+
+        generate_tiles(catalog, plot_id, max_zoom=10)
+
+        assert appended == read_tiles(catalog / plot_id)
+
+    def test_append_only_rewrites_touched_tiles(self, catalog: Path, plot_id: str) -> None:
+        generate_tiles(catalog, plot_id, max_zoom=10)
+        lon, lat = wiggly_track("a", 3000)["geometry"]["coordinates"][2700]
+        x, y = tile_for(lon, lat, 10)
+        untouched = catalog / plot_id / TILES_DIR / f"10/{x}/{y}.mvt"
+        before = untouched.stat().st_mtime_ns
+
+        add_features(catalog, plot_id, [wiggly_track("b", 100, lon=20.0, lat=40.0)])
+
+        assert untouched.stat().st_mtime_ns == before
+
+    def test_session_appends_update_tiles(self, catalog: Path, plot_id: str) -> None:
+        generate_tiles(catalog, plot_id, max_zoom=8)
+        with session(catalog) as s:
+            s.add_features(plot_id, [wiggly_track("b", 200, lon=20.0, lat=40.0)])
+
+        x, y = tile_for(20.05, 40.01, 8)
+        tile = catalog / plot_id / TILES_DIR / f"8/{x}/{y}.mvt"
+        names = [f["properties"]["id"] for f in decode_tile(tile.read_bytes())["features"]]
+
+        assert names == ["b"]
+
+    def test_plots_without_tiles_are_untouched(self, catalog: Path, plot_id: str) -> None:
+        add_features(catalog, plot_id, [wiggly_track("b", 100)])
+
+        assert not (catalog / plot_id / TILES_DIR).exists()
+        assert "tiles" not in read_plot(catalog, plot_id)["assets"]
+
+
+class TestGenerateTilesRPC:
+    def test_generate_tiles_method(self, catalog: Path, plot_id: str) -> None:
+        response = handle_request(
+            {
+                "jsonrpc": "2.0",
+                "id": 1,
+                "method": "generate_tiles",
+                "params": {"store_path": str(catalog), "plot_id": plot_id, "max_zoom": 3},
+            }
+        )
+
+        assert response["result"]["tile_count"] == 4
+        assert response["result"]["max_zoom"] == 3
@@ -0,0 +1,210 @@
+"""Tests for catalog integrity verification and repair."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from debrief_stac.assets import add_asset
+from debrief_stac.catalog import _CatalogLinks, create_catalog, list_plots
+from debrief_stac.columnar import MANIFEST_FILENAME, POSITIONS_DIR
+from debrief_stac.exceptions import CatalogNotFoundError
+from debrief_stac.features import add_features
+from debrief_stac.models import PlotMetadata
+from debrief_stac.plot import _load_plot, _save_plot, create_plot
+from debrief_stac.verify import (
+    ISSUE_BBOX_MISMATCH,
+    ISSUE_CHECKSUM_MISMATCH,
+    ISSUE_MISSING_ASSET,
+    ISSUE_MISSING_ITEM,
+    ISSUE_STALE_POSITIONS,
+    ISSUE_UNLINKED_ITEM,
+    verify_catalog,
+)
+from tests.fixtures import make_sample_track_feature
+
+
+@pytest.fixture
+def catalog(temp_dir: Path) -> Path:
+    return create_catalog(temp_dir / "catalog")
+
+
+@pytest.fixture
+def plot_id(catalog: Path, temp_dir: Path) -> str:
+    plot_id = create_plot(catalog, PlotMetadata(title="Exercise"))
+    add_features(catalog, plot_id, [make_sample_track_feature("track-1")])
+    source = temp_dir / "boat1.rep"
+    source.write_text("951212 050000.000 ALPHA @C 22 11 10.63 N 21 41 52.37 W 269.7 2.0 0\n")
+    add_asset(catalog, plot_id, source, asset_key="source")
+    return plot_id
+
+
+def kinds(report) -> list[str]:
+    return sorted(issue.kind for issue in report.issues)
+
+
+class TestVerifyCatalog:
+    def test_clean_catalog(self, catalog: Path, plot_id: str) -> None:
+        report = verify_catalog(catalog)
+
+        assert report.ok
+        assert report.issues == []
+        assert report.items_checked == 1
+        assert report.assets_hashed == 1
+        assert report.bytes_hashed > 0
+
+    def test_missing_catalog(self, temp_dir: Path) -> None:
+        with pytest.raises(CatalogNotFoundError):
+            verify_catalog(temp_dir / "missing")
+
+    def test_second_run_skips_unchanged_plots(self, catalog: Path, plot_id: str) -> None:
+        verify_catalog(catalog)
+
+        report = verify_catalog(catalog)
+
+        assert report.items_checked == 0
+        assert report.items_skipped == 1
+        assert report.assets_hashed == 0
+
+    def test_full_run_rechecks_unchanged_plots(self, catalog: Path, plot_id: str) -> None:
+        verify_catalog(catalog)
+
+        report = verify_catalog(catalog, incremental=False)
+
+        assert report.items_checked == 1
+        assert report.items_skipped == 0
+
+    def test_unwritable_state_falls_back_to_full_run(
+        self, catalog: Path, plot_id: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        def read_only(*args, **kwargs):
+            raise PermissionError("read-only file system")
+
+        monkeypatch.setattr("debrief_stac.verify.write_json_atomic", read_only)
+        assert verify_catalog(catalog).ok
+
+        report = verify_catalog(catalog)
+
+        assert report.ok
+        assert report.items_checked == 1
+        assert report.items_skipped == 0
+
+    def test_changed_plot_is_rechecked(self, catalog: Path, plot_id: str) -> None:
+        verify_catalog(catalog)
+        add_features(catalog, plot_id, [make_sample_track_feature("track-2")])
+
+        report = verify_catalog(catalog)
+
+        assert report.items_checked == 1
+        assert report.ok
+
+    def test_missing_item(self, catalog: Path, plot_id: str) -> None:
+        (catalog / plot_id / "item.json").unlink()
+
+        report = verify_catalog(catalog)
+
+        assert kinds(report) == [ISSUE_MISSING_ITEM]
+        assert not report.ok
+
+    def test_repair_removes_dangling_link(self, catalog: Path, plot_id: str) -> None:
+        (catalog / plot_id / "item.json").unlink()
+
+        report = verify_catalog(catalog, repair=True)
+
+        assert report.ok
+        assert list_plots(catalog) == []
+        assert verify_catalog(catalog, incremental=False).issues == []
+
+    def test_unlinked_plot(self, catalog: Path, plot_id: str) -> None:
+        links = _CatalogLinks(catalog)
+        links.remove_item(plot_id)
+        links.save()
+
+        report = verify_catalog(catalog)
+        assert kinds(report) == [ISSUE_UNLINKED_ITEM]
+
+        report = verify_catalog(catalog, repair=True)
+        assert report.ok
+        assert [p.id for p in list_plots(catalog)] == [plot_id]
+
+    def test_corrupted_asset_is_restored_from_blob(self, catalog: Path, plot_id: str) -> None:
+        asset = catalog / plot_id / "assets" / "boat1.rep"
+        original = asset.read_bytes()
+        # Replace rather than rewrite in place: the asset may share its inode with the blob
+        asset.unlink()
+        asset.write_text("tampered")
+
+        report = verify_catalog(catalog, repair=True)
+
+        assert kinds(report) == [ISSUE_CHECKSUM_MISMATCH]
+        assert report.ok
+        assert asset.read_bytes() == original
+
+    def test_missing_asset_is_restored_from_blob(self, catalog: Path, plot_id: str) -> None:
+        asset = catalog / plot_id / "assets" / "boat1.rep"
+        asset.unlink()
+
+        report = verify_catalog(catalog, repair=True)
+
+        assert kinds(report) == [ISSUE_MISSING_ASSET]
+        assert report.ok
+        assert asset.is_file()
+
+    def test_unrecoverable_asset_stays_unrepaired(self, catalog: Path, plot_id: str) -> None:
+        asset = catalog / plot_id / "assets" / "boat1.rep"
+        asset.unlink()
+        for blob in (catalog / ".blobs").rglob("*"):
+            if blob.is_file():
+                blob.unlink()
+
+        report = verify_catalog(catalog, repair=True)
+
+        assert kinds(report) == [ISSUE_MISSING_ASSET]
+        assert not report.ok
+
+    def test_bbox_mismatch_is_rebuilt(self, catalog: Path, plot_id: str) -> None:
+        item = _load_plot(catalog, plot_id)
+        expected = item["bbox"]
+        item["bbox"] = [0.0, 0.0, 1.0, 1.0]
+        _save_plot(catalog, plot_id, item)
+
+        report = verify_catalog(catalog)
+        assert kinds(report) == [ISSUE_BBOX_MISMATCH]
+
+        report = verify_catalog(catalog, repair=True)
+        assert report.ok
+        assert _load_plot(catalog, plot_id)["bbox"] == expected
+
+    def test_stale_positions_are_rebuilt(self, catalog: Path, plot_id: str) -> None:
+        manifest_path = catalog / plot_id / POSITIONS_DIR / MANIFEST_FILENAME
+        manifest = json.loads(manifest_path.read_text())
+        rows = manifest["rows"]
+        manifest["rows"] = rows - 1
+        manifest_path.write_text(json.dumps(manifest))
+
+        report = verify_catalog(catalog, repair=True)
+
+        assert kinds(report) == [ISSUE_STALE_POSITIONS]
+        assert report.ok
+        assert json.loads(manifest_path.read_text())["rows"] == rows
+
+    def test_issues_are_not_recorded_as_clean(self, catalog: Path, plot_id: str) -> None:
+        item = _load_plot(catalog, plot_id)
+        item["bbox"] = [0.0, 0.0, 1.0, 1.0]
+        _save_plot(catalog, plot_id, item)
+        verify_catalog(catalog)
+
+        report = verify_catalog(catalog)
+
+        assert report.items_checked == 1
+        assert kinds(report) == [ISSUE_BBOX_MISMATCH]
+
+    def test_workers(self, catalog: Path) -> None:
+        for i in range(6):
+            plot_id = create_plot(catalog, PlotMetadata(title=f"Plot {i}"))
+            add_features(catalog, plot_id, [make_sample_track_feature(f"track-{i}")])
+
+        report = verify_catalog(catalog, workers=3)
+
+        assert report.items_checked == 6
+        assert report.ok
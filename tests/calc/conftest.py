@@ -0,0 +1,55 @@
+"""Shared fixtures for the debrief-calc tests."""
+
+import pytest
+from debrief_calc.models import ContextType, SelectionContext
+
+# 2024-01-15T08:00:00Z, the start time of the fixture tracks
+START_MS = 1705305600000
+
+
+def _track(
+    feature_id="track-001",
+    points=20,
+    lon=-4.5,
+    lat=50.0,
+    dlon=0.01,
+    dlat=0.005,
+    start_ms=START_MS,
+    step_ms=60_000,
+    name=None,
+):
+    return {
+        "type": "Feature",
+        "id": feature_id,
+        "properties": {"kind": "track", "name": name or feature_id},
+        "geometry": {
+            "type": "LineString",
+            "coordinates": [
+                [lon + i * dlon, lat + i * dlat, 0, start_ms + i * step_ms] for i in range(points)
+            ],
+        },
+    }
+
+
+def _context(*features):
+    if len(features) == 1:
+        return SelectionContext(type=ContextType.SINGLE, features=list(features))
+    return SelectionContext(type=ContextType.MULTI, features=list(features))
+
+
+@pytest.fixture
+def make_track():
+    """
+    Factory for timed GeoJSON track features.
+
+    make_track(feature_id, points, lon, lat, dlon, dlat, start_ms, step_ms, name)
+    gives a LineString of ``points`` positions, moving ``dlon``/``dlat``
+    degrees and ``step_ms`` milliseconds per position.
+    """
+    return _track
+
+
+@pytest.fixture
+def make_context():
+    """Factory for a selection of features: single for one feature, multi for more."""
+    return _context
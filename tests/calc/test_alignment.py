@@ -0,0 +1,95 @@
+"""Unit tests for debrief-calc track time alignment."""
+
+import numpy as np
+import pytest
+from debrief_calc.alignment import (
+    align_tracks,
+    interpolate_track,
+    merge_epochs,
+    resample_epochs,
+    track_arrays,
+)
+
+
+class TestTrackArrays:
+    """Tests for splitting timed tracks into arrays."""
+
+    def test_splits_columns(self):
+        times, lons, lats = track_arrays([[1.0, 2.0, 0, 100], [3.0, 4.0, 0, 200]])
+
+        np.testing.assert_array_equal(times, [100, 200])
+        np.testing.assert_array_equal(lons, [1.0, 3.0])
+        np.testing.assert_array_equal(lats, [2.0, 4.0])
+
+    def test_sorts_by_time(self):
+        times, lons, _ = track_arrays([[3.0, 0.0, 0, 300], [1.0, 0.0, 0, 100], [2.0, 0.0, 0, 200]])
+
+        np.testing.assert_array_equal(times, [100, 200, 300])
+        np.testing.assert_array_equal(lons, [1.0, 2.0, 3.0])
+
+    def test_requires_timestamps(self):
+        with pytest.raises(ValueError, match="timestamps"):
+            track_arrays([[1.0, 2.0, 0, 100], [3.0, 4.0]])
+
+
+class TestEpochs:
+    """Tests for building the shared time base."""
+
+    def test_merge_keeps_distinct_epochs_in_overlap(self):
+        epochs = merge_epochs(np.array([0.0, 10, 20, 30]), np.array([5.0, 10, 25, 40]))
+
+        np.testing.assert_array_equal(epochs, [5, 10, 20, 25, 30])
+
+    def test_merge_without_overlap(self):
+        assert merge_epochs(np.array([0.0, 1]), np.array([2.0, 3])).size == 0
+        assert merge_epochs(np.array([]), np.array([2.0, 3])).size == 0
+
+    def test_resample_grid(self):
+        epochs = resample_epochs(np.array([0.0, 100]), np.array([10.0, 95]), 20)
+
+        np.testing.assert_array_equal(epochs, [10, 30, 50, 70, 90])
+
+    def test_resample_rejects_bad_interval(self):
+        with pytest.raises(ValueError, match="positive"):
+            resample_epochs(np.array([0.0, 100]), np.array([0.0, 100]), 0)
+
+
+class TestInterpolation:
+    """Tests for interpolating track positions."""
+
+    def test_linear(self):
+        lon, lat = interpolate_track(
+            np.array([0.0, 10]), np.array([0.0, 1]), np.array([50.0, 51]), np.array([5.0])
+        )
+
+        assert lon[0] == pytest.approx(0.5)
+        assert lat[0] == pytest.approx(50.5)
+
+    def test_across_antimeridian(self):
+        lon, _ = interpolate_track(
+            np.array([0.0, 10]), np.array([179.0, -179.0]), np.array([0.0, 0]), np.array([5.0])
+        )
+
+        assert abs(lon[0]) == pytest.approx(180.0)
+
+    def test_align_tracks(self):
+        track1 = [[0.0, 50.0, 0, 0], [1.0, 50.0, 0, 10_000]]
+        track2 = [[0.0, 51.0, 0, 5_000], [0.0, 52.0, 0, 15_000]]
+
+        epochs, lon1, _, _, lat2 = align_tracks(track1, track2)
+
+        np.testing.assert_array_equal(epochs, [5_000, 10_000])
+        np.testing.assert_allclose(lon1, [0.5, 1.0])
+        np.testing.assert_allclose(lat2, [51.0, 51.5])
+
+    def test_large_tracks(self):
+        n = 200_000
+        times = np.arange(n) * 1000.0
+        track1 = np.column_stack((np.linspace(-5, -4, n), np.full(n, 50.0), np.zeros(n), times))
+        track2 = np.column_stack(
+            (np.linspace(-4, -5, n), np.full(n, 50.1), np.zeros(n), times + 500)
+        )
+
+        epochs, *_ = align_tracks(track1, track2)
+
+        assert epochs.size == 2 * n - 2
@@ -0,0 +1,86 @@
+"""Unit tests for debrief-calc batch execution."""
+
+import pytest
+from debrief_calc.executor import run_batch
+from debrief_calc.models import BatchJob
+
+
+@pytest.fixture
+def track_context(make_track, make_context):
+    def build(index):
+        track = make_track(f"track-{index:03d}", points=3, lat=50.2 + index * 0.01)
+        return make_context(track)
+
+    return build
+
+
+class TestRunBatch:
+    """Tests for run_batch()."""
+
+    def test_process_pool(self, track_context):
+        jobs = [("track-stats", track_context(i)) for i in range(20)]
+
+        batch = run_batch(jobs, workers=2, chunk_size=3)
+        completed = dict(batch)
+
+        assert sorted(completed) == list(range(20))
+        for index, result in completed.items():
+            assert result.success
+            provenance = result.features[0]["properties"]["provenance"]
+            assert provenance["sources"][0]["id"] == f"track-{index:03d}"
+        assert batch.summary.total == 20
+        assert batch.summary.succeeded == 20
+        assert batch.summary.jobs_per_second > 0
+
+    def test_results_in_job_order(self, track_context):
+        jobs = [BatchJob(tool="track-stats", context=track_context(i)) for i in range(6)]
+
+        results = run_batch(jobs, workers=2).results()
+
+        assert [r.features[0]["properties"]["source_track"] for r in results] == [
+            f"track-{i:03d}" for i in range(6)
+        ]
+
+    def test_failures_are_counted(self, track_context):
+        jobs = [
+            ("track-stats", track_context(0)),
+            ("no-such-tool", track_context(1)),
+            ("range-bearing", track_context(2)),
+            ("no-such-tool", track_context(3), {"x": 1}),
+        ]
+
+        batch = run_batch(jobs, workers=1)
+        results = batch.results()
+
+        assert results[0].success
+        assert results[1].error.code == "TOOL_NOT_FOUND"
+        assert results[2].error.code == "INVALID_CONTEXT"
+        assert batch.summary.failed == 3
+        assert batch.summary.errors == {"TOOL_NOT_FOUND": 2, "INVALID_CONTEXT": 1}
+
+    def test_serial_matches_pool(self, track_context):
+        jobs = [("track-stats", track_context(i)) for i in range(4)]
+
+        serial = run_batch(jobs, workers=1).results()
+        pooled = run_batch(jobs, workers=2, chunk_size=1).results()
+
+        assert [r.features[0]["properties"]["statistics"] for r in serial] == [
+            r.features[0]["properties"]["statistics"] for r in pooled
+        ]
+
+    def test_empty_batch(self):
+        batch = run_batch([])
+
+        assert batch.results() == []
+        assert batch.summary.total == 0
+
+    def test_iterates_once(self, track_context):
+        batch = run_batch([("track-stats", track_context(0))], workers=1)
+        list(batch)
+
+        with pytest.raises(RuntimeError):
+            list(batch)
+
+    def test_invalid_chunk_size(self, track_context):
+        with pytest.raises(ValueError, match="chunk_size"):
+            run_batch([("track-stats", track_context(0))], chunk_size=-1)
@@ -0,0 +1,227 @@
+"""Unit tests for the debrief-calc result cache."""
+
+import copy
+import os
+
+import pytest
+from debrief_calc.cache import ResultCache, cache_key
+from debrief_calc.executor import run
+from debrief_calc.models import ContextType, Tool
+from debrief_calc.registry import registry
+
+
+@pytest.fixture
+def track_context(make_track, make_context):
+    def build(name="track-001", lat=50.2):
+        return make_context(make_track(name, points=2, lat=lat, dlon=0.1, dlat=0.1))
+
+    return build
+
+
+@pytest.fixture
+def pair_context(make_track, make_context):
+    def build():
+        return make_context(make_track("a", lat=50.2), make_track("b", lat=50.3))
+
+    return build
+
+
+class TestCacheKey:
+    """Tests for cache_key()."""
+
+    def test_stable_for_equal_input(self, track_context):
+        tool = registry.get_tool("track-stats")
+
+        assert cache_key(tool, track_context(), {}) == cache_key(tool, track_context(), {})
+
+    def test_changes_with_features(self, track_context):
+        tool = registry.get_tool("track-stats")
+
+        assert cache_key(tool, track_context(lat=50.2), {}) != cache_key(
+            tool, track_context(lat=50.3), {}
+        )
+
+    def test_defaults_and_number_types_are_canonical(self, pair_context):
+        tool = registry.get_tool("cpa")
+        context = pair_context()
+
+        assert cache_key(tool, context, {}) == cache_key(
+            tool, context, {"max_range_nm": 20, "threshold_nm": 2}
+        )
+        assert cache_key(tool, context, {}) != cache_key(tool, context, {"threshold_nm": 3})
+
+    def test_coordinates_are_hashed_as_floats(self, make_track, make_context):
+        tool = registry.get_tool("track-stats")
+        track = make_track(points=3, lon=-4, lat=50, dlon=1, dlat=1)
+        as_floats = copy.deepcopy(track)
+        as_floats["geometry"]["coordinates"] = [
+            [float(v) for v in position] for position in track["geometry"]["coordinates"]
+        ]
+        moved = copy.deepcopy(as_floats)
+        moved["geometry"]["coordinates"][1][0] += 1e-9
+
+        key = cache_key(tool, make_context(track), {})
+        assert key == cache_key(tool, make_context(as_floats), {})
+        assert key != cache_key(tool, make_context(moved), {})
+
+    def test_ragged_coordinates(self, make_context):
+        tool = registry.get_tool("track-stats")
+        ring = [[0, 0], [1, 0], [1, 1], [0, 0]]
+        hole = [[0.2, 0.2], [0.4, 0.2], [0.2, 0.2]]
+
+        def polygon(rings):
+            return {
+                "type": "Feature",
+                "id": "p",
+                "properties": {"kind": "zone"},
+                "geometry": {"type": "Polygon", "coordinates": rings},
+            }
+
+        key = cache_key(tool, make_context(polygon([ring, hole])), {})
+        assert key == cache_key(tool, make_context(polygon([ring, hole])), {})
+        assert key != cache_key(tool, make_context(polygon([ring])), {})
+
+    def test_changes_with_version(self, track_context):
+        tool = registry.get_tool("track-stats")
+        newer = tool.model_copy(update={"version": "9.9.9"})
+
+        assert cache_key(tool, track_context(), {}) != cache_key(newer, track_context(), {})
+
+
+class TestRunWithCache:
+    """Tests for run() with a ResultCache."""
+
+    def test_hit_returns_original_provenance(self, track_context):
+        cache = ResultCache()
+
+        first = run("track-stats", track_context(), cache=cache)
+        second = run("track-stats", track_context(), cache=cache)
+
+        assert not first.cached
+        assert second.cached
+        assert second.features == first.features
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.memory_hits) == (1, 1, 1)
+        assert stats.hit_rate == 0.5
+
+    def test_cached_results_are_copies(self, track_context):
+        cache = ResultCache()
+        run("track-stats", track_context(), cache=cache)
+
+        run("track-stats", track_context(), cache=cache).features[0]["properties"].clear()
+
+        assert run("track-stats", track_context(), cache=cache).features[0]["properties"]
+
+    def test_failures_are_not_cached(self, track_context):
+        cache = ResultCache()
+
+        run("range-bearing", track_context(), cache=cache)
+        result = run("range-bearing", track_context(), cache=cache)
+
+        assert result.error.code == "INVALID_CONTEXT"
+        assert cache.stats().memory_entries == 0
+
+    def test_unvalidated_results_are_not_cached(self, track_context):
+        registry.register(
+            Tool(
+                name="test-invalid-output",
+                description="Returns a feature without a geometry type",
+                input_kinds=["track"],
+                output_kind="broken",
+                context_type=ContextType.SINGLE,
+                handler=lambda context, params: [{"type": "Feature", "geometry": {}}],
+            )
+        )
+        cache = ResultCache()
+        try:
+            unvalidated = run(
+                "test-invalid-output", track_context(), validate_output=False, cache=cache
+            )
+            validated = run("test-invalid-output", track_context(), cache=cache)
+        finally:
+            registry._tools.pop("test-invalid-output")
+
+        assert unvalidated.success
+        assert not validated.success
+        assert validated.error.code == "VALIDATION_FAILED"
+        assert cache.stats().memory_entries == 0
+
+    def test_memory_lru_limit(self, track_context):
+        cache = ResultCache(max_entries=2)
+
+        for lat in (50.0, 51.0, 52.0):
+            run("track-stats", track_context(lat=lat), cache=cache)
+
+        stats = cache.stats()
+        assert stats.memory_entries == 2
+        assert stats.evictions == 1
+        assert not run("track-stats", track_context(lat=50.0), cache=cache).cached
+        assert run("track-stats", track_context(lat=52.0), cache=cache).cached
+
+
+class TestDiskTier:
+    """Tests for the on-disk cache tier."""
+
+    def test_survives_a_new_cache(self, tmp_path, track_context):
+        first = run("track-stats", track_context(), cache=ResultCache(directory=tmp_path))
+
+        cache = ResultCache(directory=tmp_path)
+        second = run("track-stats", track_context(), cache=cache)
+
+        assert second.cached
+        assert second.features == first.features
+        assert cache.stats().disk_hits == 1
+        assert run("track-stats", track_context(), cache=cache).cached
+        assert cache.stats().memory_hits == 1
+
+    def test_size_limit_removes_least_recently_used(self, tmp_path, track_context):
+        cache = ResultCache(max_entries=0, directory=tmp_path)
+        run("track-stats", track_context(lat=50.0), cache=cache)
+        cache.max_disk_bytes = int(cache.stats().disk_bytes * 2.5)
+        run("track-stats", track_context(lat=51.0), cache=cache)
+        oldest, newer = sorted(tmp_path.glob("*.json"), key=os.path.getmtime)
+        os.utime(oldest, (0, 0))
+        os.utime(newer, (1, 1))
+
+        # Reading the oldest makes it the most recently used
+        assert run("track-stats", track_context(lat=50.0), cache=cache).cached
+        run("track-stats", track_context(lat=52.0), cache=cache)
+
+        assert cache.stats().disk_entries == 2
+        assert oldest.exists()
+        assert not newer.exists()
+
+    def test_corrupt_file_is_a_miss(self, tmp_path, track_context):
+        cache = ResultCache(directory=tmp_path)
+        run("track-stats", track_context(), cache=cache)
+        cache.clear()
+        tool = registry.get_tool("track-stats")
+        (tmp_path / f"{cache_key(tool, track_context(), {})}.json").write_text("{not json")
+
+        assert not run("track-stats", track_context(), cache=cache).cached
+        assert run("track-stats", track_context(), cache=cache).cached
+
+    def test_write_failure_does_not_fail_the_run(self, tmp_path, track_context, monkeypatch):
+        cache = ResultCache(directory=tmp_path)
+
+        def full_disk(key, result):
+            raise OSError(28, "No space left on device")
+
+        monkeypatch.setattr(cache, "_write", full_disk)
+        result = run("track-stats", track_context(), cache=cache)
+
+        assert result.success
+        assert not result.cached
+
+    def test_clear(self, tmp_path, track_context):
+        cache = ResultCache(directory=tmp_path)
+        run("track-stats", track_context(), cache=cache)
+
+        cache.clear()
+
+        assert cache.stats().disk_entries == 0
+        assert cache.stats().memory_entries == 0
+
+    def test_rejects_negative_limits(self):
+        with pytest.raises(ValueError):
+            ResultCache(max_entries=-1)
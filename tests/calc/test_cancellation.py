@@ -0,0 +1,201 @@
+"""Unit tests for cancellation, deadlines and async execution."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from debrief_calc.cancellation import (
+    CancellationToken,
+    active_token,
+    check_cancelled,
+    current_token,
+    report_progress,
+)
+from debrief_calc.exceptions import ToolCancelledError, ToolTimeoutError
+from debrief_calc.executor import run, run_async
+from debrief_calc.models import ContextType, SelectionContext, Tool
+from debrief_calc.registry import registry
+
+stopped = threading.Event()
+
+
+def spin(context, params):
+    """Poll for cancellation for up to five seconds, reporting progress."""
+    try:
+        for step in range(500):
+            check_cancelled()
+            report_progress(step / 500, "spinning")
+            time.sleep(0.01)
+    finally:
+        stopped.set()
+    return []
+
+
+@pytest.fixture(autouse=True)
+def spin_tool():
+    registry.register(
+        Tool(
+            name="test-spin",
+            description="Spin until cancelled",
+            input_kinds=["track"],
+            output_kind="nothing",
+            context_type=ContextType.SINGLE,
+            handler=spin,
+        )
+    )
+    stopped.clear()
+    yield
+    registry._tools.pop("test-spin")
+
+
+@pytest.fixture
+def context():
+    feature = {
+        "type": "Feature",
+        "id": "track-001",
+        "properties": {"kind": "track"},
+        "geometry": {
+            "type": "LineString",
+            "coordinates": [[-4.5, 50.2, 0, 1705305600000], [-4.4, 50.3, 0, 1705309200000]],
+        },
+    }
+    return SelectionContext(type=ContextType.SINGLE, features=[feature])
+
+
+class TestCancellationToken:
+    """Tests for CancellationToken."""
+
+    def test_cancel(self):
+        token = CancellationToken()
+        assert not token.cancelled
+
+        token.cancel()
+
+        assert token.cancelled
+        with pytest.raises(ToolCancelledError):
+            token.raise_if_cancelled()
+
+    def test_deadline(self):
+        token = CancellationToken(timeout=0)
+
+        assert token.expired
+        assert token.remaining() == 0.0
+        with pytest.raises(ToolTimeoutError):
+            token.raise_if_cancelled()
+
+    def test_no_deadline(self):
+        assert CancellationToken().remaining() is None
+
+    def test_progress_is_clamped(self):
+        reports = []
+        token = CancellationToken(progress=lambda f, m: reports.append((f, m)))
+
+        token.report(1.5, "done")
+
+        assert reports == [(1.0, "done")]
+
+    def test_helpers_without_a_token(self):
+        assert current_token() is None
+        check_cancelled()
+        report_progress(0.5)
+
+    def test_active_token(self):
+        token = CancellationToken()
+
+        with active_token(token):
+            assert current_token() is token
+        assert current_token() is None
+
+
+class TestRunWithToken:
+    """Tests for run() with a CancellationToken."""
+
+    def test_cancelled_before_start(self, context):
+        token = CancellationToken()
+        token.cancel()
+
+        result = run("test-spin", context, token=token)
+
+        assert result.error.code == "CANCELLED"
+        assert not stopped.is_set()
+
+    def test_deadline_stops_handler(self, context):
+        started = time.perf_counter()
+
+        result = run("test-spin", context, token=CancellationToken(timeout=0.1))
+
+        assert result.error.code == "TIMEOUT"
+        assert time.perf_counter() - started < 1
+
+    def test_cancelled_from_another_thread(self, context):
+        token = CancellationToken()
+        threading.Timer(0.05, token.cancel).start()
+
+        result = run("test-spin", context, token=token)
+
+        assert result.error.code == "CANCELLED"
+
+
+class TestRunAsync:
+    """Tests for run_async()."""
+
+    def test_success(self, context):
+        result = asyncio.run(run_async("track-stats", context))
+
+        assert result.success
+        assert result.features[0]["properties"]["kind"] == "track-statistics"
+
+    def test_timeout_returns_at_deadline(self, context):
+        started = time.perf_counter()
+
+        result = asyncio.run(run_async("test-spin", context, timeout=0.1))
+
+        assert result.error.code == "TIMEOUT"
+        assert time.perf_counter() - started < 1
+        assert stopped.wait(1)
+
+    def test_task_cancellation_stops_handler(self, context):
+        async def cancel_soon():
+            task = asyncio.create_task(run_async("test-spin", context))
+            await asyncio.sleep(0.05)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(cancel_soon())
+
+        assert stopped.wait(1)
+
+    def test_progress_on_loop_thread(self, context):
+        reports = []
+
+        def on_progress(fraction, message):
+            reports.append((threading.current_thread(), fraction, message))
+
+        async def main():
+            await run_async("test-spin", context, timeout=0.1, progress=on_progress)
+            await asyncio.sleep(0.05)
+
+        asyncio.run(main())
+
+        assert reports
+        assert all(thread is threading.main_thread() for thread, _, _ in reports)
+        assert reports[0][1:] == (0.0, "spinning")
+
+    def test_does_not_block_the_loop(self, context):
+        ticks = []
+
+        async def ticker():
+            while True:
+                ticks.append(time.perf_counter())
+                await asyncio.sleep(0.01)
+
+        async def main():
+            task = asyncio.create_task(ticker())
+            await run_async("test-spin", context, timeout=0.2)
+            task.cancel()
+
+        asyncio.run(main())
+
+        assert len(ticks) > 5
@@ -0,0 +1,129 @@
+"""Unit tests for debrief-calc geodesy kernels."""
+
+import math
+
+import numpy as np
+import pytest
+from debrief_calc.geodesy import (
+    EARTH_RADIUS_NM,
+    coordinate_column,
+    cross_track_distance,
+    destination_point,
+    haversine_distance,
+    initial_bearing,
+    path_length,
+)
+
+
+def scalar_haversine(lon1, lat1, lon2, lat2):
+    lon1, lat1, lon2, lat2 = map(math.radians, [lon1, lat1, lon2, lat2])
+    a = (
+        math.sin((lat2 - lat1) / 2) ** 2
+        + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    )
+    return 2 * math.asin(math.sqrt(a)) * EARTH_RADIUS_NM
+
+
+class TestHaversineDistance:
+    """Tests for the vectorized haversine kernel."""
+
+    def test_scalar(self):
+        assert haversine_distance(0.0, 50.0, 0.0, 51.0) == pytest.approx(60.04, abs=0.01)
+
+    def test_matches_scalar_formula_over_arrays(self):
+        rng = np.random.default_rng(1)
+        lon1, lon2 = rng.uniform(-180, 180, (2, 1000))
+        lat1, lat2 = rng.uniform(-80, 80, (2, 1000))
+
+        expected = [scalar_haversine(*args) for args in zip(lon1, lat1, lon2, lat2, strict=True)]
+
+        np.testing.assert_allclose(haversine_distance(lon1, lat1, lon2, lat2), expected)
+
+    def test_broadcasts_against_a_point(self):
+        distances = haversine_distance([0.0, 0.0, 1.0], [50.0, 51.0, 50.0], 0.0, 50.0)
+
+        assert distances.shape == (3,)
+        assert distances[0] == 0.0
+
+    def test_antipodes(self):
+        assert haversine_distance(0.0, 0.0, 180.0, 0.0) == pytest.approx(math.pi * EARTH_RADIUS_NM)
+
+
+class TestInitialBearing:
+    """Tests for the vectorized bearing kernel."""
+
+    def test_cardinal_directions(self):
+        bearings = initial_bearing(0.0, 50.0, [0.0, 1.0, 0.0, -1.0], [51.0, 50.0, 49.0, 50.0])
+
+        np.testing.assert_allclose(bearings, [0.0, 90.0, 180.0, 270.0], atol=0.5)
+
+    def test_range_is_0_to_360(self):
+        rng = np.random.default_rng(2)
+        bearings = initial_bearing(0.0, 0.0, rng.uniform(-10, 10, 500), rng.uniform(-10, 10, 500))
+
+        assert ((bearings >= 0) & (bearings < 360)).all()
+
+
+class TestDestinationPoint:
+    """Tests for the vectorized destination kernel."""
+
+    def test_north_one_degree(self):
+        lon, lat = destination_point(0.0, 50.0, 0.0, 60.04)
+
+        assert lon == pytest.approx(0.0, abs=1e-9)
+        assert lat == pytest.approx(51.0, abs=1e-3)
+
+    def test_round_trip_with_distance_and_bearing(self):
+        rng = np.random.default_rng(3)
+        lon, lat = rng.uniform(-170, 170, 200), rng.uniform(-70, 70, 200)
+        bearing, distance = rng.uniform(0, 360, 200), rng.uniform(1, 500, 200)
+
+        lon2, lat2 = destination_point(lon, lat, bearing, distance)
+
+        np.testing.assert_allclose(haversine_distance(lon, lat, lon2, lat2), distance)
+        np.testing.assert_allclose(initial_bearing(lon, lat, lon2, lat2), bearing, atol=1e-6)
+
+    def test_longitude_wraps(self):
+        lon, _ = destination_point(179.9, 0.0, 90.0, 60.0)
+
+        assert lon == pytest.approx(-179.1, abs=1e-3)
+
+
+class TestCrossTrackDistance:
+    """Tests for the vectorized cross-track kernel."""
+
+    def test_sign_follows_side_of_path(self):
+        # Path due north along the meridian; points east (right) and west (left)
+        xtd = cross_track_distance([0.5, -0.5, 0.0], 50.5, 0.0, 50.0, 0.0, 51.0)
+
+        assert xtd[0] > 0
+        assert xtd[1] < 0
+        assert xtd[2] == pytest.approx(0.0, abs=1e-9)
+        assert xtd[0] == pytest.approx(-xtd[1])
+
+    def test_distance_off_the_equator(self):
+        # Along the equator, the distance of a point is its latitude in arc
+        xtd = cross_track_distance(5.0, -1.0, 0.0, 0.0, 10.0, 0.0)
+
+        assert xtd == pytest.approx(haversine_distance(5.0, -1.0, 5.0, 0.0))
+
+
+class TestPathHelpers:
+    """Tests for path length and coordinate extraction."""
+
+    def test_path_length(self):
+        assert path_length([0.0, 0.0, 0.0], [50.0, 51.0, 52.0]) == pytest.approx(120.08, abs=0.01)
+
+    def test_short_paths(self):
+        assert path_length([], []) == 0.0
+        assert path_length([1.0], [2.0]) == 0.0
+
+    def test_coordinate_column_handles_mixed_lengths(self):
+        coordinates = [[1.0, 2.0], [3.0, 4.0, 0.0, 1000.0], [5.0, 6.0, 0.0]]
+
+        np.testing.assert_array_equal(coordinate_column(coordinates, 1), [2.0, 4.0, 6.0])
+
+    def test_coordinate_column_accepts_arrays(self):
+        coordinates = np.array([[1.0, 2.0], [3.0, 4.0]])
+
+        np.testing.assert_array_equal(coordinate_column(coordinates, 0), [1.0, 3.0])
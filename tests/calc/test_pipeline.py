@@ -0,0 +1,210 @@
+"""Unit tests for debrief-calc pipelines."""
+
+import threading
+import time
+import uuid
+
+import pytest
+from debrief_calc.cache import ResultCache
+from debrief_calc.models import ContextType, PipelineStep, Tool
+from debrief_calc.pipeline import Pipeline
+from debrief_calc.registry import registry
+
+calls = []
+seen = []
+
+
+def thin(context, params):
+    """Keep every other position of a track."""
+    calls.append("test-thin")
+    (feature,) = context.features
+    seen.append(feature)
+    return [
+        {
+            "type": "Feature",
+            "id": f"thin-{uuid.uuid4().hex[:8]}",
+            "properties": {"name": feature["properties"].get("name")},
+            "geometry": {
+                "type": "LineString",
+                "coordinates": feature["geometry"]["coordinates"][::2],
+            },
+        }
+    ]
+
+
+def slow(context, params):
+    calls.append(threading.current_thread().name)
+    time.sleep(0.2)
+    return []
+
+
+@pytest.fixture(autouse=True)
+def test_tools():
+    tools = [
+        Tool(
+            name="test-thin",
+            description="Thin a track",
+            input_kinds=["track"],
+            output_kind="track",
+            context_type=ContextType.SINGLE,
+            handler=thin,
+        ),
+        Tool(
+            name="test-slow",
+            description="Take a while",
+            input_kinds=["track"],
+            output_kind="nothing",
+            context_type=ContextType.MULTI,
+            handler=slow,
+        ),
+    ]
+    for tool in tools:
+        registry.register(tool)
+    calls.clear()
+    seen.clear()
+    yield
+    for tool in tools:
+        registry._tools.pop(tool.name)
+
+
+@pytest.fixture
+def tracks_context(make_track, make_context):
+    def build(lon=-4.5):
+        return make_context(
+            make_track("alpha", points=7, lon=lon, dlat=0.01, step_ms=600_000),
+            make_track("bravo", points=7, lon=lon + 0.02, dlat=0.01, step_ms=600_000),
+        )
+
+    return build
+
+
+class TestPipeline:
+    """Tests for Pipeline.run()."""
+
+    def test_chained_steps(self, tracks_context):
+        pipeline = (
+            Pipeline()
+            .add("thin", "test-thin")
+            .add("cpa", "cpa", inputs=["thin"])
+            .add("stats", "track-stats", inputs=["thin"])
+        )
+
+        result = pipeline.run(tracks_context())
+
+        assert result.success
+        # The single-feature steps run once per track
+        assert calls == ["test-thin", "test-thin"]
+        assert len(result.steps["thin"].features) == 2
+        assert len(result.steps["stats"].features) == 2
+        stats = result.steps["stats"].features[0]["properties"]["statistics"]
+        assert stats["point_count"] == 4
+
+    def test_outputs_are_passed_without_copying(self, tracks_context):
+        pipeline = Pipeline().add("thin", "test-thin").add("again", "test-thin", ["thin"])
+        context = tracks_context()
+
+        result = pipeline.run(context)
+
+        assert seen[0] is context.features[0]
+        assert {id(f) for f in seen[2:]} == {id(f) for f in result.steps["thin"].features}
+
+    def test_sources_name_the_producing_tool(self, tracks_context):
+        pipeline = Pipeline().add("thin", "test-thin").add("stats", "track-stats", ["thin"])
+
+        result = pipeline.run(tracks_context())
+
+        thinned_ids = [f["id"] for f in result.steps["thin"].features]
+        sources = [
+            f["properties"]["provenance"]["sources"][0] for f in result.steps["stats"].features
+        ]
+        assert [s["id"] for s in sources] == thinned_ids
+        assert all(s["tool"] == "test-thin" for s in sources)
+
+    def test_provenance_chains_to_the_selection(self, tracks_context):
+        pipeline = Pipeline().add("thin", "test-thin").add("stats", "track-stats", ["thin"])
+
+        result = pipeline.run(tracks_context())
+
+        by_id = {f["id"]: f for f in result.steps["thin"].features}
+        stats = result.steps["stats"].features[0]
+        (source,) = stats["properties"]["provenance"]["sources"]
+        (origin,) = by_id[source["id"]]["properties"]["provenance"]["sources"]
+        assert origin == {"id": "alpha", "kind": "track"}
+
+    def test_independent_branches_run_concurrently(self, tracks_context):
+        pipeline = Pipeline().add("a", "test-slow").add("b", "test-slow").add("c", "test-slow")
+
+        started = time.perf_counter()
+        result = pipeline.run(tracks_context(), max_workers=3)
+
+        assert result.success
+        assert time.perf_counter() - started < 0.5
+        assert len(set(calls)) == 3
+
+    def test_failed_step_skips_downstream(self, tracks_context):
+        pipeline = (
+            Pipeline()
+            .add("missing", "no-such-tool")
+            .add("after", "track-stats", ["missing"])
+            .add("later", "track-stats", ["after"])
+            .add("other", "test-thin")
+        )
+
+        result = pipeline.run(tracks_context())
+
+        assert not result.success
+        assert result.steps["missing"].error.code == "TOOL_NOT_FOUND"
+        assert result.steps["after"].error.code == "UPSTREAM_FAILED"
+        assert result.steps["later"].error.code == "UPSTREAM_FAILED"
+        assert result.steps["other"].success
+        assert list(result.steps) == ["missing", "after", "later", "other"]
+
+    def test_unsuitable_input_count(self, make_context, make_track):
+        pipeline = Pipeline().add("cpa", "cpa").add("pairs", "cpa", ["cpa"])
+
+        result = Pipeline().add("cpa", "cpa").run(make_context(make_track("alpha", points=7)))
+        assert result.steps["cpa"].error.code == "INVALID_CONTEXT"
+        assert pipeline.steps["pairs"].inputs == ["cpa"]
+
+    def test_cache_reruns_only_changed_branches(self, tracks_context):
+        cache = ResultCache()
+        pipeline = (
+            Pipeline()
+            .add("thin", "test-thin")
+            .add("stats", "track-stats", ["thin"])
+            .add("cpa", "cpa", ["input"])
+        )
+        context = tracks_context()
+
+        first = pipeline.run(context, cache=cache)
+        second = pipeline.run(context, cache=cache)
+        assert not any(r.cached for r in first.steps.values())
+        assert all(r.cached for r in second.steps.values())
+        assert second.steps["stats"].features == first.steps["stats"].features
+
+        changed = Pipeline(
+            [
+                PipelineStep(name="thin", tool="test-thin"),
+                PipelineStep(name="stats", tool="track-stats", inputs=["thin"]),
+                PipelineStep(name="cpa", tool="cpa", params={"threshold_nm": 5}),
+            ]
+        ).run(context, cache=cache)
+        assert changed.steps["thin"].cached
+        assert changed.steps["stats"].cached
+        assert not changed.steps["cpa"].cached
+
+
+class TestPipelineDefinition:
+    """Tests for building pipelines."""
+
+    def test_duplicate_names(self):
+        pipeline = Pipeline().add("a", "track-stats")
+
+        with pytest.raises(ValueError, match="already in use"):
+            pipeline.add("a", "track-stats")
+        with pytest.raises(ValueError, match="already in use"):
+            pipeline.add("input", "track-stats")
+
+    def test_inputs_must_be_earlier_steps(self):
+        with pytest.raises(ValueError, match="unknown inputs"):
+            Pipeline().add("a", "track-stats", ["b"])
@@ -0,0 +1,173 @@
+"""Unit tests for debrief-calc execution profiling and metrics."""
+
+import pytest
+from debrief_calc.cache import ResultCache
+from debrief_calc.executor import run
+from debrief_calc.models import ContextType, SelectionContext, ToolError, ToolResult
+from debrief_calc.profiling import MetricsRegistry, count_vertices, metrics
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics():
+    metrics.reset()
+    yield
+    metrics.reset()
+
+
+@pytest.fixture
+def context():
+    feature = {
+        "type": "Feature",
+        "id": "track-001",
+        "properties": {"kind": "track"},
+        "geometry": {
+            "type": "LineString",
+            "coordinates": [
+                [-4.5 + i * 0.01, 50.2, 0, 1705305600000 + i * 60_000] for i in range(50)
+            ],
+        },
+    }
+    return SelectionContext(type=ContextType.SINGLE, features=[feature])
+
+
+def result(tool, duration_ms, code=None):
+    if code:
+        return ToolResult(
+            tool=tool,
+            success=False,
+            error=ToolError(code=code, message="failed"),
+            duration_ms=duration_ms,
+        )
+    return ToolResult(tool=tool, success=True, features=[], duration_ms=duration_ms)
+
+
+class TestExecutionProfile:
+    """Tests for the profile attached by run()."""
+
+    def test_phases_and_counts(self, context):
+        profile = run("track-stats", context).profile
+
+        assert list(profile.phases_ms) == [
+            "validate_input",
+            "handler",
+            "provenance",
+            "validate_output",
+        ]
+        assert all(ms >= 0 for ms in profile.phases_ms.values())
+        assert profile.input_features == 1
+        assert profile.input_vertices == 50
+        assert profile.output_features == 1
+        assert profile.output_vertices == 1
+        assert profile.peak_memory_bytes is None
+
+    def test_no_output_validation_phase(self, context):
+        profile = run("track-stats", context, validate_output=False).profile
+
+        assert "validate_output" not in profile.phases_ms
+
+    def test_cache_hit_skips_handler(self, context):
+        cache = ResultCache()
+        run("track-stats", context, cache=cache)
+
+        profile = run("track-stats", context, cache=cache).profile
+
+        assert list(profile.phases_ms) == ["validate_input", "cache_lookup"]
+        assert profile.output_features == 1
+
+    def test_trace_memory(self, context):
+        profile = run("track-stats", context, trace_memory=True).profile
+
+        assert profile.peak_memory_bytes > 0
+
+    def test_failure_has_profile(self, context):
+        profile = run("no-such-tool", context).profile
+
+        assert profile.input_features == 1
+        assert profile.output_features == 0
+
+
+class TestMetrics:
+    """Tests for the process-wide metrics recorded by run()."""
+
+    def test_runs_are_recorded(self, context):
+        for _ in range(5):
+            run("track-stats", context)
+        run("range-bearing", context)
+
+        summary = metrics.summary()
+
+        assert set(summary) == {"track-stats", "range-bearing"}
+        stats = summary["track-stats"]
+        assert stats.runs == 5
+        assert stats.failures == 0
+        assert set(stats.duration_ms) == {"p50", "p90", "p99", "mean", "max"}
+        assert "handler" in stats.phases_ms
+        assert stats.mean_input_vertices == 50
+        assert summary["range-bearing"].errors == {"INVALID_CONTEXT": 1}
+
+    def test_summary_of_one_tool(self, context):
+        run("track-stats", context)
+
+        assert list(metrics.summary("track-stats")) == ["track-stats"]
+        assert metrics.summary("cpa") == {}
+
+
+class TestMetricsRegistry:
+    """Tests for MetricsRegistry aggregation."""
+
+    def test_percentiles(self):
+        registry = MetricsRegistry()
+        for ms in range(1, 101):
+            registry.record(result("tool", float(ms)))
+
+        durations = registry.summary()["tool"].duration_ms
+
+        assert durations["p50"] == pytest.approx(50.5)
+        assert durations["p99"] == pytest.approx(99.01)
+        assert durations["max"] == 100.0
+
+    def test_window_bounds_percentiles_not_counts(self):
+        registry = MetricsRegistry(window=10)
+        for ms in range(100):
+            registry.record(result("tool", float(ms)))
+
+        metrics_ = registry.summary()["tool"]
+
+        assert metrics_.runs == 100
+        assert metrics_.duration_ms["p50"] == pytest.approx(94.5)
+
+    def test_counts_failures_and_cache_hits(self):
+        registry = MetricsRegistry()
+        registry.record(result("tool", 1.0, code="TIMEOUT"))
+        registry.record(result("tool", 1.0).model_copy(update={"cached": True}))
+
+        metrics_ = registry.summary()["tool"]
+
+        assert (metrics_.runs, metrics_.failures, metrics_.cache_hits) == (2, 1, 1)
+        assert metrics_.errors == {"TIMEOUT": 1}
+
+
+class TestCountVertices:
+    """Tests for count_vertices()."""
+
+    def test_geometry_types(self):
+        features = [
+            {"geometry": {"type": "Point", "coordinates": [0, 0]}},
+            {"geometry": {"type": "LineString", "coordinates": [[0, 0], [1, 1]]}},
+            {"geometry": {"type": "Polygon", "coordinates": [[[0, 0], [1, 0], [1, 1], [0, 0]]]}},
+            {
+                "geometry": {
+                    "type": "MultiPolygon",
+                    "coordinates": [[[[0, 0], [1, 0], [0, 0]]], [[[2, 2], [3, 2], [2, 2]]]],
+                }
+            },
+            {
+                "geometry": {
+                    "type": "GeometryCollection",
+                    "geometries": [{"type": "Point", "coordinates": [0, 0]}],
+                }
+            },
+            {"geometry": None},
+        ]
+
+        assert count_vertices(features) == 1 + 2 + 4 + 6 + 1
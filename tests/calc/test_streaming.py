@@ -0,0 +1,231 @@
+"""Unit tests for streaming tool execution."""
+
+import numpy as np
+import pytest
+from debrief_calc.cancellation import CancellationToken
+from debrief_calc.executor import run, run_stream
+from debrief_calc.geodesy import destination_point
+from debrief_calc.models import ContextType, SelectionContext
+from debrief_calc.profiling import metrics
+from debrief_calc.registry import registry, tool
+from debrief_calc.streaming import FeatureStream, StreamingContext, position_array
+
+
+@pytest.fixture
+def echo_tool():
+    """A streaming-only tool yielding one point per input chunk."""
+
+    @tool(
+        name="test-chunk-points",
+        description="One point per chunk",
+        input_kinds=["track"],
+        output_kind="chunk-point",
+        context_type=ContextType.SINGLE,
+        streaming=True,
+    )
+    def chunk_points(context, params):
+        for chunk in context.features[0].chunks():
+            if params.get("fail_after") == 0:
+                raise RuntimeError("boom")
+            if params.get("invalid"):
+                yield {"type": "Point", "geometry": None}
+            yield {
+                "type": "Feature",
+                "id": "p",
+                "properties": {"size": int(chunk.shape[0])},
+                "geometry": {"type": "Point", "coordinates": chunk[0, :2].tolist()},
+            }
+
+    yield chunk_points
+    registry._tools.pop("test-chunk-points")
+
+
+class TestFeatureStream:
+    """Tests for FeatureStream."""
+
+    def test_chunks_of_in_memory_feature(self, make_track):
+        stream = FeatureStream.from_feature(make_track(points=10), chunk_size=4)
+
+        chunks = list(stream.chunks())
+
+        assert [c.shape for c in chunks] == [(4, 4), (4, 4), (2, 4)]
+        assert stream.positions_read == 10
+        # Streams can be read again from the start
+        assert len(list(stream.chunks())) == 3
+
+    def test_to_feature_round_trip(self, make_track):
+        feature = make_track(points=5)
+        feature["geometry"]["coordinates"][2] = [-4.48, 50.01]
+
+        restored = FeatureStream.from_feature(feature, chunk_size=2).to_feature()
+
+        assert restored["geometry"] == feature["geometry"]
+        assert restored["id"] == "track-001"
+
+    def test_out_of_core_source(self):
+        def chunks():
+            for start in range(0, 1000, 100):
+                yield np.column_stack([np.arange(start, start + 100), np.zeros(100)])
+
+        stream = FeatureStream("big", {"kind": "track"}, chunks)
+
+        assert sum(c.shape[0] for c in stream.chunks()) == 1000
+        assert stream.kind == "track"
+
+    def test_rejects_unstreamable_geometry(self):
+        feature = {"type": "Feature", "geometry": {"type": "Polygon", "coordinates": []}}
+
+        with pytest.raises(ValueError, match="Polygon"):
+            FeatureStream.from_feature(feature)
+
+    def test_position_array_pads_short_positions(self):
+        array = position_array([[1.0, 2.0], [3.0, 4.0, 0.0, 5.0]])
+
+        assert array.shape == (2, 4)
+        assert np.isnan(array[0, 3])
+
+
+class TestStreamingContext:
+    """Tests for StreamingContext."""
+
+    def test_requirements(self, make_track):
+        stream = FeatureStream.from_feature(make_track())
+
+        with pytest.raises(ValueError):
+            StreamingContext(type=ContextType.MULTI, features=[stream])
+
+    def test_selection_round_trip(self, make_track):
+        context = SelectionContext(type=ContextType.SINGLE, features=[make_track()])
+
+        streaming = StreamingContext.from_selection(context)
+
+        assert streaming.get_kinds() == {"track"}
+        assert streaming.to_selection().features[0]["geometry"] == make_track()["geometry"]
+
+
+class TestRunStream:
+    """Tests for run_stream()."""
+
+    def test_matches_run(self, make_track):
+        context = SelectionContext(type=ContextType.SINGLE, features=[make_track(points=50)])
+
+        (streamed,) = list(run_stream("track-stats", context, chunk_size=7))
+        (classic,) = run("track-stats", context).features
+
+        assert streamed["properties"]["statistics"] == classic["properties"]["statistics"]
+        np.testing.assert_allclose(
+            streamed["geometry"]["coordinates"], classic["geometry"]["coordinates"]
+        )
+        assert streamed["properties"]["provenance"]["sources"] == [
+            {"id": "track-001", "kind": "track"}
+        ]
+
+    def test_track_larger_than_one_chunk_is_never_materialized(self):
+        total = 1_000_000
+
+        def chunks():
+            for start in range(0, total, 50_000):
+                minutes = np.arange(start, start + 50_000)
+                lons, lats = destination_point(0.0, 50.0, 90.0, minutes / 6)
+                yield np.column_stack([lons, lats, np.zeros(minutes.size), minutes * 60_000])
+
+        stream = FeatureStream("huge", {"kind": "track"}, chunks)
+        context = StreamingContext(type=ContextType.SINGLE, features=[stream])
+
+        result = run_stream("track-stats", context)
+        (feature,) = list(result)
+
+        stats = feature["properties"]["statistics"]
+        assert stats["point_count"] == total
+        assert stats["average_speed_kts"] == pytest.approx(10.0, abs=0.01)
+        assert result.success
+        assert result.profile.input_vertices == total
+
+    def test_classic_tool_is_adapted(self, make_track):
+        context = SelectionContext(
+            type=ContextType.MULTI, features=[make_track("a"), make_track("b", points=30)]
+        )
+
+        stream = run_stream("range-bearing", context, chunk_size=8)
+        features = list(stream)
+
+        assert stream.success
+        assert stream.count == len(features) == 3
+
+    def test_streaming_only_tool_through_run(self, echo_tool, make_track):
+        context = SelectionContext(type=ContextType.SINGLE, features=[make_track(points=10)])
+
+        result = run("test-chunk-points", context)
+
+        assert result.success
+        assert len(result.features) == 1
+        assert result.features[0]["properties"]["kind"] == "chunk-point"
+        assert registry.describe("test-chunk-points")["streaming"]
+
+    def test_outputs_are_validated_as_they_are_yielded(self, echo_tool, make_track):
+        context = SelectionContext(type=ContextType.SINGLE, features=[make_track(points=10)])
+
+        stream = run_stream("test-chunk-points", context, params={"invalid": True})
+
+        assert list(stream) == []
+        assert stream.error.code == "VALIDATION_FAILED"
+        assert not stream.success
+
+    def test_incremental_output(self, echo_tool, make_track):
+        context = SelectionContext(type=ContextType.SINGLE, features=[make_track(points=10)])
+
+        stream = iter(run_stream("test-chunk-points", context, chunk_size=3))
+        first = next(stream)
+
+        assert first["properties"]["size"] == 3
+        assert "provenance" in first["properties"]
+        assert len(list(stream)) == 3
+
+    def test_closed_early_is_not_a_success(self, echo_tool, make_track):
+        metrics.reset()
+        context = SelectionContext(type=ContextType.SINGLE, features=[make_track(points=10)])
+        stream = run_stream("test-chunk-points", context, chunk_size=2)
+
+        for _ in stream:
+            break
+
+        assert stream.count == 1
+        assert not stream.success
+        assert stream.error.code == "CANCELLED"
+        summary = metrics.summary("test-chunk-points")["test-chunk-points"]
+        assert (summary.runs, summary.failures) == (1, 1)
+
+    def test_handler_error(self, echo_tool, make_track):
+        context = SelectionContext(type=ContextType.SINGLE, features=[make_track()])
+
+        stream = run_stream("test-chunk-points", context, params={"fail_after": 0})
+        list(stream)
+
+        assert stream.error.code == "EXECUTION_ERROR"
+        assert "boom" in stream.error.message
+
+    def test_unknown_tool(self, make_track):
+        context = SelectionContext(type=ContextType.SINGLE, features=[make_track()])
+
+        stream = run_stream("no-such-tool", context)
+
+        assert list(stream) == []
+        assert stream.error.code == "TOOL_NOT_FOUND"
+
+    def test_cancelled(self, make_track):
+        context = SelectionContext(type=ContextType.SINGLE, features=[make_track()])
+        token = CancellationToken()
+        token.cancel()
+
+        stream = run_stream("track-stats", context, token=token)
+
+        assert list(stream) == []
+        assert stream.error.code == "CANCELLED"
+
+    def test_iterates_once(self, make_track):
+        context = SelectionContext(type=ContextType.SINGLE, features=[make_track()])
+        stream = run_stream("track-stats", context)
+        list(stream)
+
+        with pytest.raises(RuntimeError):
+            list(stream)
@@ -0,0 +1,237 @@
+"""Unit tests for array-backed track features."""
+
+import numpy as np
+import pytest
+from debrief_calc.cache import ResultCache, cache_key
+from debrief_calc.executor import run
+from debrief_calc.models import ContextType, SelectionContext, Tool
+from debrief_calc.registry import registry
+from debrief_calc.streaming import FeatureStream
+from debrief_calc.tracks import TrackArray
+
+# Positions of a large track; only the memory matters, not the values
+MILLION = (1_000_000, 4)
+
+
+def coordinates(feature):
+    return np.array(feature["geometry"]["coordinates"], dtype=float)
+
+
+@pytest.fixture
+def positions(make_track):
+    """Factory for the position array of a make_track() track."""
+
+    def build(points=20):
+        return coordinates(make_track(points=points))
+
+    return build
+
+
+@pytest.fixture
+def capture_tool():
+    """A tool recording the features its handler receives."""
+    seen = []
+
+    def handler(context, params):
+        seen.extend(context.features)
+        return []
+
+    registry.register(
+        Tool(
+            name="test-capture",
+            description="Record the input",
+            input_kinds=["track"],
+            output_kind="nothing",
+            context_type=ContextType.SINGLE,
+            handler=handler,
+        )
+    )
+    yield seen
+    registry._tools.pop("test-capture")
+
+
+class TestTrackArray:
+    """Tests for TrackArray."""
+
+    def test_wraps_float_array_without_copying(self, positions):
+        array = positions()
+        track = TrackArray(array, id="t1")
+        assert track.positions is array
+        assert np.shares_memory(track.lons, array)
+        assert np.shares_memory(track.times, array)
+
+    def test_columns(self, positions):
+        array = positions()
+        track = TrackArray(array)
+        np.testing.assert_array_equal(track.lons, array[:, 0])
+        np.testing.assert_array_equal(track.lats, array[:, 1])
+        np.testing.assert_array_equal(track.elevations, array[:, 2])
+        np.testing.assert_array_equal(track.times, array[:, 3])
+        assert track.point_count == 20
+
+    def test_untimed_track_has_no_times(self, positions):
+        track = TrackArray(positions()[:, :2])
+        assert track.times is None
+        assert track.elevations is None
+
+    def test_from_columns_gives_contiguous_columns(self):
+        lons, lats = np.linspace(0, 1, 5), np.linspace(50, 51, 5)
+        track = TrackArray.from_columns(lons, lats, times=np.arange(5) * 1000.0)
+        assert track.positions.shape == (5, 4)
+        assert track.lons.flags.c_contiguous
+        assert track.times.flags.c_contiguous
+        np.testing.assert_array_equal(track.elevations, 0.0)
+        np.testing.assert_array_equal(track.lats, lats)
+
+    def test_from_columns_rejects_mismatched_lengths(self):
+        with pytest.raises(ValueError, match="5 values"):
+            TrackArray.from_columns(np.zeros(5), np.zeros(4))
+
+    @pytest.mark.parametrize("shape", [(10,), (10, 1), (10, 5), (2, 3, 4)])
+    def test_rejects_bad_shapes(self, shape):
+        with pytest.raises(ValueError, match="shape"):
+            TrackArray(np.zeros(shape))
+
+    def test_reads_as_geojson_feature(self, positions):
+        track = TrackArray(positions(), id="t1", properties={"kind": "track", "name": "Alpha"})
+        assert track["type"] == "Feature"
+        assert track.get("id") == "t1"
+        assert track["properties"]["name"] == "Alpha"
+        assert track["geometry"]["type"] == "LineString"
+        assert track["geometry"]["coordinates"] is track.positions
+        assert set(track) == {"type", "id", "properties", "geometry"}
+
+    def test_missing_id_uses_default(self, positions):
+        track = TrackArray(positions())
+        assert track.get("id", "unknown") == "unknown"
+        assert "id" not in track
+        assert track.properties == {"kind": "track"}
+
+    def test_feature_round_trip(self, make_track):
+        feature = make_track("t1", points=5)
+        track = TrackArray.from_feature(feature)
+        assert track.id == "t1"
+        assert track.to_feature() == feature
+
+    def test_from_feature_rejects_other_geometries(self):
+        with pytest.raises(ValueError, match="Point"):
+            TrackArray.from_feature({"geometry": {"type": "Point", "coordinates": [0, 0]}})
+
+
+class TestSelectionContext:
+    """Tests for TrackArrays in a SelectionContext."""
+
+    def test_track_is_carried_as_is(self):
+        track = TrackArray(np.zeros(MILLION), id="big")
+        context = SelectionContext(type=ContextType.SINGLE, features=[track])
+        assert context.features[0] is track
+
+    def test_mixed_with_dict_features(self, positions, make_track):
+        track = TrackArray(positions(), id="t1")
+        feature = make_track("t2")
+        context = SelectionContext(type=ContextType.MULTI, features=[track, feature])
+        assert context.features[0] is track
+        assert context.features[1] == feature
+        assert context.get_kinds() == {"track"}
+
+    def test_dumps_as_geojson(self, positions):
+        array = positions(3)
+        context = SelectionContext(type=ContextType.SINGLE, features=[TrackArray(array, id="t")])
+        dumped = context.model_dump(mode="json")
+        assert dumped["features"][0] == {
+            "type": "Feature",
+            "id": "t",
+            "properties": {"kind": "track"},
+            "geometry": {"type": "LineString", "coordinates": array.tolist()},
+        }
+
+
+class TestTools:
+    """Tests for tools run on TrackArrays."""
+
+    def test_handler_gets_views_of_million_point_track(self, capture_tool):
+        array = np.zeros(MILLION)
+        track = TrackArray(array, id="big")
+        result = run("test-capture", SelectionContext(type=ContextType.SINGLE, features=[track]))
+
+        assert result.success
+        assert capture_tool[0] is track
+        received = capture_tool[0]["geometry"]["coordinates"]
+        assert np.shares_memory(received[:, 0], array)
+        assert result.profile.input_vertices == 1_000_000
+
+    def test_track_stats_matches_geojson(self, make_track, make_context):
+        feature = make_track("t1", points=50)
+        from_dict = run("track-stats", make_context(feature))
+        from_track = run("track-stats", make_context(TrackArray(coordinates(feature), id="t1")))
+        assert from_track.success
+        expected = from_dict.features[0]["properties"]["statistics"]
+        assert from_track.features[0]["properties"]["statistics"] == expected
+        assert from_track.features[0]["geometry"] == from_dict.features[0]["geometry"]
+        sources = from_track.features[0]["properties"]["provenance"]["sources"]
+        assert sources[0]["id"] == "t1"
+
+    @pytest.mark.parametrize(
+        ("tool_name", "params"),
+        [
+            ("cpa", {"threshold_nm": 5.0}),
+            ("range-bearing", {"sample_points": "all"}),
+            ("range-bearing", {"sample_points": "time-aligned"}),
+        ],
+    )
+    def test_two_track_tools_match_geojson(self, tool_name, params, make_track, make_context):
+        first = make_track("a", points=60)
+        second = make_track("b", points=60, lon=-4.45, lat=50.02, dlon=-0.005, dlat=-0.0025)
+
+        def properties(features):
+            result = run(tool_name, make_context(*features), params)
+            assert result.success, result.error
+            return [
+                {k: v for k, v in f["properties"].items() if k != "provenance"}
+                for f in result.features
+            ]
+
+        expected = properties([first, second])
+        assert expected
+        tracks = [TrackArray(coordinates(first), id="a"), TrackArray(coordinates(second), id="b")]
+        assert properties(tracks) == expected
+
+
+class TestCaching:
+    """Tests for caching runs on TrackArrays."""
+
+    def key(self, track):
+        tool = registry.get_tool("track-stats")
+        return cache_key(tool, SelectionContext(type=ContextType.SINGLE, features=[track]), {})
+
+    def test_key_follows_position_values(self, positions):
+        array = positions()
+        changed = array.copy()
+        changed[5, 1] += 1e-9
+        assert self.key(TrackArray(array, id="t")) == self.key(TrackArray(array.copy(), id="t"))
+        assert self.key(TrackArray(array, id="t")) != self.key(TrackArray(changed, id="t"))
+
+    def test_key_ignores_memory_layout(self, positions):
+        array = positions()
+        fortran = TrackArray(np.asfortranarray(array), id="t")
+        assert self.key(TrackArray(array, id="t")) == self.key(fortran)
+
+    def test_cached_run(self, positions):
+        cache = ResultCache()
+        context = SelectionContext(
+            type=ContextType.SINGLE, features=[TrackArray(positions(), id="t")]
+        )
+        run("track-stats", context, cache=cache)
+        assert run("track-stats", context, cache=cache).cached
+
+
+class TestStreaming:
+    """Tests for streaming TrackArrays."""
+
+    def test_chunks_are_views(self, positions):
+        array = positions(10)
+        stream = FeatureStream.from_feature(TrackArray(array, id="t"), chunk_size=4)
+        chunks = list(stream.chunks())
+        assert [chunk.shape[0] for chunk in chunks] == [4, 4, 2]
+        assert all(np.shares_memory(chunk, array) for chunk in chunks)
+        assert stream.id == "t"
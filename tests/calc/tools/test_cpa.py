@@ -0,0 +1,244 @@
+"""Unit tests for the cpa tool."""
+
+import time
+
+import numpy as np
+import pytest
+from debrief_calc import run
+from debrief_calc.cancellation import CancellationToken, active_token
+from debrief_calc.exceptions import ToolCancelledError
+from debrief_calc.geodesy import destination_point, haversine_distance
+from debrief_calc.models import ContextType, SelectionContext
+from debrief_calc.tools.cpa import _candidate_pairs, cpa
+
+HOUR_MS = 3_600_000
+
+
+def straight_track(feature_id, lon, lat, course, speed_kts, hours=1.0, step_s=60, start_ms=0):
+    """A constant-velocity track with a fix every step_s seconds."""
+    steps = int(hours * 3600 / step_s) + 1
+    elapsed_h = np.arange(steps) * step_s / 3600
+    lons, lats = destination_point(lon, lat, course, speed_kts * elapsed_h)
+    times = start_ms + (elapsed_h * HOUR_MS).astype(int)
+    return {
+        "type": "Feature",
+        "id": feature_id,
+        "properties": {"kind": "track"},
+        "geometry": {
+            "type": "LineString",
+            "coordinates": [
+                [float(x), float(y), 0, int(t)] for x, y, t in zip(lons, lats, times, strict=True)
+            ],
+        },
+    }
+
+
+def context(*features):
+    return SelectionContext(type=ContextType.MULTI, features=list(features))
+
+
+class TestCpa:
+    """Tests for the cpa tool handler."""
+
+    def test_crossing_tracks(self):
+        # A heads east and B heads north; both pass (0, 50) at half an hour
+        a = straight_track("a", -0.078, 50.0, 90, 6)
+        b = straight_track("b", 0.0, 49.95, 0, 6)
+
+        (result,) = cpa(context(a, b), {"interval_seconds": 60})
+
+        props = result["properties"]
+        assert props["from_track"] == "a"
+        assert props["to_track"] == "b"
+        assert props["cpa_range_nm"] < 0.05
+        assert abs(props["cpa_time"] - HOUR_MS / 2) < 60_000
+
+    def test_refines_between_samples(self):
+        # Head-on tracks meeting between two 10-minute samples
+        a = straight_track("a", -0.2, 50.0, 90, 10, step_s=60)
+        b = straight_track("b", 0.2, 50.001, 270, 10, step_s=60)
+
+        (coarse,) = cpa(context(a, b), {"interval_seconds": 600})
+        (fine,) = cpa(context(a, b), {"interval_seconds": 1})
+
+        assert coarse["properties"]["cpa_range_nm"] == pytest.approx(
+            fine["properties"]["cpa_range_nm"], abs=0.01
+        )
+        assert abs(coarse["properties"]["cpa_time"] - fine["properties"]["cpa_time"]) < 5_000
+
+    def test_episodes_under_threshold(self):
+        # Parallel tracks 1 nm apart for the first hour, then B turns away
+        a = straight_track("a", 0.0, 50.0, 0, 10, hours=2)
+        b1 = straight_track("b", 0.026, 50.0, 0, 10, hours=1)
+        lon, lat = b1["geometry"]["coordinates"][-1][:2]
+        b2 = straight_track("b", lon, lat, 90, 10, hours=1, start_ms=HOUR_MS + 60_000)
+        b1["geometry"]["coordinates"].extend(b2["geometry"]["coordinates"])
+
+        (result,) = cpa(context(a, b1), {"threshold_nm": 2.0, "interval_seconds": 60})
+
+        (episode,) = result["properties"]["episodes"]
+        assert episode["start_time"] == 0
+        assert HOUR_MS < episode["end_time"] < HOUR_MS + 10 * 60_000
+        assert episode["min_range_nm"] == pytest.approx(1.0, abs=0.05)
+
+    def test_distant_pairs_are_not_reported(self):
+        a = straight_track("a", 0.0, 50.0, 0, 10)
+        b = straight_track("b", 0.01, 50.0, 0, 10)
+        far = straight_track("far", 5.0, 50.0, 0, 10)
+
+        results = cpa(context(a, b, far), {"max_range_nm": 20})
+
+        assert [(r["properties"]["from_track"], r["properties"]["to_track"]) for r in results] == [
+            ("a", "b")
+        ]
+
+    def test_high_latitude_pair_with_distant_low_latitude_track(self):
+        # 13.3 nm apart at 70N; a track at 20N must not stretch the pruning scale
+        a = straight_track("a", 10.0, 70.0, 0, 5)
+        b = straight_track("b", 10.0 + 13.3 / (60 * np.cos(np.radians(70))), 70.0, 0, 5)
+        low = straight_track("low", 10.0, 20.0, 0, 5)
+
+        pairs = [
+            (r["properties"]["from_track"], r["properties"]["to_track"])
+            for r in cpa(context(a, b, low), {"max_range_nm": 20})
+        ]
+
+        assert pairs == [("a", "b")]
+
+    def test_pair_across_antimeridian(self):
+        # 6 nm apart either side of 180 degrees, with another track at 0 degrees
+        origin = straight_track("origin", 0.0, 0.0, 0, 5)
+        east = straight_track("east", 179.95, 0.0, 0, 5)
+        west = straight_track("west", -179.95, 0.0, 0, 5)
+
+        (result,) = cpa(context(origin, east, west), {"max_range_nm": 20})
+
+        assert (result["properties"]["from_track"], result["properties"]["to_track"]) == (
+            "east",
+            "west",
+        )
+        assert result["properties"]["cpa_range_nm"] == pytest.approx(6.0, abs=0.1)
+
+    def test_tracks_must_overlap_in_time(self):
+        a = straight_track("a", 0.0, 50.0, 0, 10)
+        b = straight_track("b", 0.0, 50.0, 0, 10, start_ms=5 * HOUR_MS)
+
+        assert cpa(context(a, b), {}) == []
+
+    def test_matches_brute_force(self):
+        rng = np.random.default_rng(7)
+        tracks = [
+            straight_track(
+                f"t{i}",
+                float(rng.uniform(-0.5, 0.5)),
+                float(rng.uniform(49.7, 50.3)),
+                float(rng.uniform(0, 360)),
+                float(rng.uniform(5, 20)),
+            )
+            for i in range(8)
+        ]
+
+        results = cpa(context(*tracks), {"max_range_nm": 30, "interval_seconds": 60})
+
+        found = {
+            (r["properties"]["from_track"], r["properties"]["to_track"]): r["properties"]
+            for r in results
+        }
+        for i in range(len(tracks)):
+            for j in range(i + 1, len(tracks)):
+                ci = np.array(tracks[i]["geometry"]["coordinates"])
+                cj = np.array(tracks[j]["geometry"]["coordinates"])
+                brute = haversine_distance(ci[:, 0], ci[:, 1], cj[:, 0], cj[:, 1]).min()
+                key = (f"t{i}", f"t{j}")
+                if brute <= 30:
+                    assert found[key]["cpa_range_nm"] <= round(brute, 2) + 0.01
+                else:
+                    assert key not in found
+
+    def test_fifty_tracks_over_twelve_hours(self):
+        rng = np.random.default_rng(11)
+        tracks = [
+            straight_track(
+                f"t{i}",
+                float(rng.uniform(-3, 3)),
+                float(rng.uniform(48, 52)),
+                float(rng.uniform(0, 360)),
+                float(rng.uniform(5, 25)),
+                hours=12,
+                step_s=10,
+            )
+            for i in range(50)
+        ]
+
+        started = time.perf_counter()
+        results = cpa(context(*tracks), {"interval_seconds": 10})
+
+        assert time.perf_counter() - started < 30
+        assert all(r["properties"]["cpa_range_nm"] <= 20 for r in results)
+
+    def test_requires_timestamps(self):
+        feature = {
+            "type": "Feature",
+            "id": "a",
+            "properties": {"kind": "track"},
+            "geometry": {"type": "LineString", "coordinates": [[0.0, 50.0], [0.1, 50.0]]},
+        }
+
+        with pytest.raises(ValueError, match="timestamps"):
+            cpa(context(feature, feature), {})
+
+    def test_runs_through_executor(self):
+        a = straight_track("a", 0.0, 50.0, 0, 10)
+        b = straight_track("b", 0.01, 50.0, 0, 10)
+
+        result = run("cpa", context(a, b))
+
+        assert result.success
+        assert result.features[0]["properties"]["kind"] == "cpa"
+
+
+class TestCandidatePairs:
+    """Tests for the bounding-box sweep."""
+
+    def test_only_nearby_boxes_pair_up(self):
+        x = np.array([[0.0, 1.0], [2.0, 3.0], [50.0, 51.0], [np.nan, np.nan]])
+        y = np.array([[0.0, 0.0], [0.0, 1.0], [0.0, 0.0], [np.nan, np.nan]])
+
+        assert _candidate_pairs(x, y, 5.0) == [(0, 1)]
+
+    def test_separated_in_y(self):
+        x = np.array([[0.0, 1.0], [0.0, 1.0]])
+        y = np.array([[0.0, 0.0], [100.0, 100.0]])
+
+        assert _candidate_pairs(x, y, 5.0) == []
+
+    def test_pairs_across_the_period(self):
+        x = np.array([[1.0, 2.0], [357.0, 358.0], [180.0, 181.0]])
+        y = np.zeros((3, 2))
+
+        assert _candidate_pairs(x, y, 5.0) == []
+        assert _candidate_pairs(x, y, 5.0, period=360.0) == [(0, 1)]
+
+
+class TestCpaCancellation:
+    """Tests for cancellation polling in the cpa tool."""
+
+    def test_polls_for_cancellation(self):
+        a = straight_track("a", 0.0, 50.0, 0, 10)
+        b = straight_track("b", 0.01, 50.0, 0, 10)
+        token = CancellationToken()
+        token.cancel()
+
+        with active_token(token), pytest.raises(ToolCancelledError):
+            cpa(context(a, b), {})
+
+    def test_reports_progress(self):
+        a = straight_track("a", 0.0, 50.0, 0, 10)
+        b = straight_track("b", 0.01, 50.0, 0, 10)
+        reports = []
+
+        with active_token(CancellationToken(progress=lambda f, m: reports.append(f))):
+            cpa(context(a, b), {})
+
+        assert reports[0] == 0.0
+        assert reports[-1] == 1.0
@@ -155,3 +155,98 @@ class TestRangeBearingEdgeCases:
 
         results = range_bearing(context, {})
         assert results == []
+
+
+@pytest.fixture
+def timed_track(make_track):
+    def build(feature_id, start_ms, step_ms, count, lat=50.0, dlon=0.001):
+        return make_track(
+            feature_id,
+            points=count,
+            lon=-5.0,
+            lat=lat,
+            dlon=dlon,
+            dlat=0,
+            start_ms=start_ms,
+            step_ms=step_ms,
+        )
+
+    return build
+
+
+class TestTimeAlignedRangeBearing:
+    """Tests for the time-aligned range-bearing series."""
+
+    def test_series_covers_every_shared_epoch(self, timed_track):
+        # Fixes every 10s and every 15s, overlapping from t=30s to t=90s
+        track1 = timed_track("a", 0, 10_000, 10)
+        track2 = timed_track("b", 30_000, 15_000, 5, lat=50.1)
+        context = SelectionContext(type=ContextType.MULTI, features=[track1, track2])
+
+        (result,) = range_bearing(context, {"sample_points": "time-aligned"})
+
+        props = result["properties"]
+        assert props["measurement_type"] == "time-series"
+        assert props["times"] == [
+            30_000,
+            40_000,
+            45_000,
+            50_000,
+            60_000,
+            70_000,
+            75_000,
+            80_000,
+            90_000,
+        ]
+        assert len(props["range_nm"]) == len(props["bearing_deg"]) == len(props["times"])
+
+    def test_interpolates_between_fixes(self, timed_track):
+        # Same path, track b one fix behind: at t=5s track a is midway between fixes
+        track1 = timed_track("a", 0, 10_000, 3, dlon=0.1)
+        track2 = timed_track("b", 5_000, 10_000, 3, dlon=0.1)
+        context = SelectionContext(type=ContextType.MULTI, features=[track1, track2])
+
+        (result,) = range_bearing(context, {"sample_points": "time-aligned"})
+
+        # Track a is 0.05 degrees of longitude ahead, due east of track b
+        expected = _calculate_range(-5.0, 50.0, -4.95, 50.0)
+        assert result["properties"]["range_nm"][0] == pytest.approx(expected, abs=0.01)
+        assert result["properties"]["bearing_deg"][0] == pytest.approx(270.0, abs=0.1)
+
+    def test_resampled_grid(self, timed_track):
+        track1 = timed_track("a", 0, 1_000, 601)
+        track2 = timed_track("b", 0, 7_000, 90, lat=50.2)
+        context = SelectionContext(type=ContextType.MULTI, features=[track1, track2])
+
+        (result,) = range_bearing(
+            context, {"sample_points": "time-aligned", "interval_seconds": 60}
+        )
+
+        assert result["properties"]["times"] == [i * 60_000 for i in range(11)]
+
+    def test_closest_approach(self, multi_track_context):
+        (result,) = range_bearing(multi_track_context, {"sample_points": "time-aligned"})
+
+        props = result["properties"]
+        assert props["min_range_nm"] == min(props["range_nm"])
+        assert props["min_range_time"] in props["times"]
+        assert result["geometry"]["type"] == "LineString"
+
+    def test_no_overlap(self, timed_track):
+        track1 = timed_track("a", 0, 1_000, 10)
+        track2 = timed_track("b", 100_000, 1_000, 10)
+        context = SelectionContext(type=ContextType.MULTI, features=[track1, track2])
+
+        assert range_bearing(context, {"sample_points": "time-aligned"}) == []
+
+    def test_requires_timestamps(self):
+        feature = {
+            "type": "Feature",
+            "id": "track-1",
+            "properties": {"kind": "track"},
+            "geometry": {"type": "LineString", "coordinates": [[-4.0, 50.0], [-3.9, 50.1]]},
+        }
+        context = SelectionContext(type=ContextType.MULTI, features=[feature, feature])
+
+        with pytest.raises(ValueError, match="timestamps"):
+            range_bearing(context, {"sample_points": "time-aligned"})
@@ -1,6 +1,7 @@
 """Tests for CLI catalog commands."""
 
 import json
+import sys
 
 import pytest
 from click.testing import CliRunner
@@ -114,6 +115,117 @@ class TestCatalogGet:
         assert "item-001" in result.output
 
 
+class TestCatalogImport:
+    """Tests for 'catalog import' command."""
+
+    @pytest.fixture
+    def rep_file(self, tmp_path):
+        path = tmp_path / "alpha.rep"
+        path.write_text(
+            "951212 050000.000 ALPHA    @C   22 11 10.63 N 21 41 52.37 W 269.7   2.0      0\n"
+            "951212 050100.000 ALPHA    @C   22 11 10.58 N 21 42  2.98 W 269.7   2.0      0\n"
+        )
+        return path
+
+    def test_import_to_path(self, runner, tmp_path, rep_file):
+        from debrief_stac.catalog import create_catalog, list_plots
+
+        catalog_path = create_catalog(tmp_path / "catalog")
+
+        result = runner.invoke(
+            cli,
+            ["--json", "catalog", "import", str(rep_file), "--path", str(catalog_path)],
+        )
+
+        assert result.exit_code == 0
+        data = json.loads(result.output)
+        assert data["files_imported"] == 1
+        assert data["positions"] == 2
+        assert "positions_per_second" in data
+        assert [p.id for p in list_plots(catalog_path)] == data["plot_ids"]
+
+    def test_import_requires_destination(self, runner, rep_file):
+        result = runner.invoke(cli, ["catalog", "import", str(rep_file)])
+
+        assert result.exit_code == 2
+
+    def test_import_unknown_store(self, runner, config_with_stores, rep_file):
+        result = runner.invoke(cli, ["catalog", "import", str(rep_file), "--store", "nope"])
+
+        assert result.exit_code == 5
+
+    def test_import_missing_catalog(self, runner, tmp_path, rep_file):
+        result = runner.invoke(
+            cli, ["catalog", "import", str(rep_file), "--path", str(tmp_path / "missing")]
+        )
+
+        assert result.exit_code == 5
+
+    def test_import_without_catalog_extra(self, runner, tmp_path, rep_file, monkeypatch):
+        monkeypatch.setitem(sys.modules, "debrief_stac.ingest", None)
+
+        result = runner.invoke(
+            cli, ["--json", "catalog", "import", str(rep_file), "--path", str(tmp_path)]
+        )
+
+        assert result.exit_code == 4
+        data = json.loads(result.output)
+        assert data["code"] == "MISSING_DEPENDENCY"
+        assert "debrief-cli[catalog]" in data["message"]
+
+
+class TestCatalogVerify:
+    """Tests for 'catalog verify' command."""
+
+    @pytest.fixture
+    def catalog_path(self, tmp_path):
+        from debrief_stac.catalog import create_catalog
+        from debrief_stac.models import PlotMetadata
+        from debrief_stac.plot import create_plot
+
+        catalog_path = create_catalog(tmp_path / "catalog")
+        create_plot(catalog_path, PlotMetadata(title="Exercise"))
+        return catalog_path
+
+    def test_verify_clean(self, runner, catalog_path):
+        result = runner.invoke(cli, ["--json", "catalog", "verify", "--path", str(catalog_path)])
+
+        assert result.exit_code == 0
+        data = json.loads(result.output)
+        assert data["ok"] is True
+        assert data["items_checked"] == 1
+
+    def test_verify_reports_issues(self, runner, catalog_path):
+        for item in catalog_path.glob("*/item.json"):
+            item.unlink()
+
+        result = runner.invoke(cli, ["--json", "catalog", "verify", "--path", str(catalog_path)])
+
+        assert result.exit_code == 3
+        assert json.loads(result.output)["issues"][0]["kind"] == "missing_item"
+
+    def test_verify_repair(self, runner, catalog_path):
+        for item in catalog_path.glob("*/item.json"):
+            item.unlink()
+
+        result = runner.invoke(
+            cli, ["--json", "catalog", "verify", "--path", str(catalog_path), "--repair"]
+        )
+
+        assert result.exit_code == 0
+        assert json.loads(result.output)["issues"][0]["repaired"] is True
+
+    def test_verify_requires_destination(self, runner):
+        result = runner.invoke(cli, ["catalog", "verify"])
+
+        assert result.exit_code == 2
+
+    def test_verify_missing_catalog(self, runner, tmp_path):
+        result = runner.invoke(cli, ["catalog", "verify", "--path", str(tmp_path / "missing")])
+
+        assert result.exit_code == 5
+
+
 class TestCatalogHelp:
     """Tests for catalog --help."""
 
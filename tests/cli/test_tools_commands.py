@@ -165,3 +165,45 @@ class TestHelpText:
         assert result.exit_code == 0
         assert "--input" in result.output
         assert "--param" in result.output
+
+
+class TestToolsProfile:
+    """Tests for 'tools profile' command."""
+
+    def test_profile_table(self, runner, single_track_path):
+        result = runner.invoke(
+            cli, ["tools", "profile", "track-stats", "--input", str(single_track_path), "-n", "3"]
+        )
+
+        assert result.exit_code == 0
+        assert "handler" in result.output
+        assert "3 runs" in result.output
+
+    def test_profile_json(self, runner, single_track_path):
+        result = runner.invoke(
+            cli,
+            [
+                "--json",
+                "tools",
+                "profile",
+                "track-stats",
+                "--input",
+                str(single_track_path),
+                "--repeat",
+                "2",
+                "--memory",
+            ],
+        )
+
+        assert result.exit_code == 0
+        data = json.loads(result.output)
+        assert data["runs"] == 2
+        assert "p90" in data["duration_ms"]
+        assert data["peak_memory_bytes"] > 0
+
+    def test_profile_failing_tool(self, runner, tracks_pair_path):
+        result = runner.invoke(
+            cli, ["tools", "profile", "track-stats", "--input", str(tracks_pair_path)]
+        )
+
+        assert result.exit_code == 2